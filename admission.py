@@ -0,0 +1,159 @@
+# ======================== admission.py ========================
+"""
+Bellek bütçesine göre iş kabulü (admission control)
+
+Sabit sayıda paralel işçi karışık girdilerde tehlikelidir: binlerce
+küçük resmi rahat işleyen makine, aynı anda on tane 200 MP TIFF ile
+belleği tüketir.
+
+Bu dosya:
+- her işin tepe belleğini dosya başlığındaki boyut ve moddan, reçetedeki
+  işlemcilerin MEMORY_EXPANSION değerleriyle tahmin etmeyi
+- sadece bütçeye sığan işleri başlatmayı
+- büyük bir iş beklerken arkasındaki küçük işleri araya almayı (backfill)
+- araya alma sayısını sınırlayarak büyük işlerin sonsuza kadar
+  beklemesini önlemeyi
+sağlar.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from PIL import Image
+
+from config import AppConfig
+from logger import log_event
+from memory_manager import image_nbytes
+
+
+logger = logging.getLogger("ImageProcessingApp.admission")
+
+MB = 1024 * 1024
+
+
+def estimate_peak_bytes(input_path: str, processors) -> int:
+    """
+    Bir dosyaya reçete uygulanırken ayrılacak en fazla görüntü belleği.
+
+    Sadece dosya başlığı okunur (piksel verisi decode edilmez). Zincirde
+    her adımın girdisi ve ayırdığı bellek birlikte yaşar; önceki adımların
+    sonuçları serbest kalır. Bu yüzden tepe, en büyük genişlemeli adımdır.
+    """
+    with Image.open(input_path) as image:
+        buffer_bytes = image_nbytes(image)
+
+    expansion = max((processor.MEMORY_EXPANSION for processor in processors), default=0.0)
+    # Decode edilen girdi + adımın ayırdığı bellek + kaydederken yapılan
+    # olası mod dönüşümü
+    return int(buffer_bytes * (2 + expansion))
+
+
+class AdmissionController:
+    """
+    İşleri bellek bütçesine sığdıkça havuza veren zamanlayıcı.
+
+    Kullanım:
+        admission = AdmissionController(budget_bytes=8 * 1024 ** 3)
+        tasks = [(path, estimate_peak_bytes(path, processors), process_file, args)]
+        for key, result in admission.run(pool, tasks, slots=4):
+            ...
+
+    Bütçeden büyük bir iş, başka hiçbir iş çalışmıyorken tek başına
+    başlatılır; aksi halde hiç çalışamazdı.
+    """
+
+    def __init__(self, budget_bytes: int = None, max_bypass: int = None):
+        """
+        Parametreler:
+            budget_bytes (int): Aynı anda çalışan işlerin tahmini toplam belleği
+            max_bypass (int): Sıradaki ilk iş en fazla bu kadar kez atlanır;
+                              sonra o başlayana kadar yeni iş alınmaz
+        """
+        self.budget_bytes = (
+            AppConfig.ADMISSION_BUDGET_MB * MB if budget_bytes is None else budget_bytes
+        )
+        self.max_bypass = (
+            AppConfig.ADMISSION_MAX_BYPASS if max_bypass is None else max_bypass
+        )
+        self.reserved_bytes = 0
+        self.stats = {
+            "admitted": 0,
+            "backfilled": 0,
+            "oversized": 0,
+            "peak_reserved_bytes": 0,
+            "peak_running": 0,
+            "waiting_seconds": 0.0,
+        }
+
+    def fits(self, estimate: int, running: int) -> bool:
+        """İş şu an başlatılabilir mi?"""
+        if running == 0:
+            # Bütçeden büyük işler tek başına çalışır
+            return True
+        return self.reserved_bytes + estimate <= self.budget_bytes
+
+    def run(self, pool, tasks, slots: int):
+        """
+        Görevleri bütçeye göre havuza verir, bittikçe sonuçları döner.
+
+        Parametreler:
+            pool: concurrent.futures executor
+            tasks: (anahtar, tahmini_bayt, fonksiyon, argümanlar) dörtlüleri
+            slots (int): Aynı anda çalışabilecek en fazla görev (işçi sayısı)
+
+        Dönüş (generator):
+            (anahtar, sonuç) ikilileri, bitiş sırasıyla
+        """
+        queue = list(tasks)
+        running = {}
+        head_bypassed = 0
+
+        while queue or running:
+            started_any = False
+
+            index = 0
+            while index < len(queue) and len(running) < slots:
+                key, estimate, function, args = queue[index]
+
+                if not self.fits(estimate, len(running)):
+                    if index == 0 and head_bypassed >= self.max_bypass:
+                        # Sıradaki büyük iş için bellek boşalmasını bekle
+                        break
+                    index += 1
+                    continue
+
+                if index == 0:
+                    head_bypassed = 0
+                else:
+                    head_bypassed += 1
+                    self.stats["backfilled"] += 1
+                if estimate > self.budget_bytes:
+                    self.stats["oversized"] += 1
+
+                queue.pop(index)
+                running[pool.submit(function, *args)] = (key, estimate)
+                self.reserved_bytes += estimate
+                self.stats["admitted"] += 1
+                started_any = True
+
+                self.stats["peak_reserved_bytes"] = max(
+                    self.stats["peak_reserved_bytes"], self.reserved_bytes
+                )
+                self.stats["peak_running"] = max(self.stats["peak_running"], len(running))
+
+            if queue and not started_any and len(running) < slots:
+                log_event(
+                    logger, "admission_waiting",
+                    queued=len(queue), running=len(running),
+                    reserved_mb=self.reserved_bytes // MB,
+                )
+
+            wait_start = time.perf_counter()
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            self.stats["waiting_seconds"] += time.perf_counter() - wait_start
+
+            for future in done:
+                key, estimate = running.pop(future)
+                self.reserved_bytes -= estimate
+                yield key, future.result()
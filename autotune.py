@@ -0,0 +1,334 @@
+# ======================== autotune.py ========================
+"""
+Makineye göre performans ayarlarının ölçülmesi (autotune)
+
+Uygulama çok farklı donanımlarda çalışıyor; her makinede thread / process
+sayılarını, bant boyutlarını ve önbellek sınırlarını elle ayarlamak
+sürdürülemez.
+
+Bu dosya:
+- bant paralelliği için thread sayısını, bant sayısını ve bölme eşiğini
+- akış (streaming) bant satır sayısını
+- "throughput" profilindeki işçi process sayısını ve I/O thread sayısını
+- bellek ve disk boyutuna göre önbellek / bütçe sınırlarını
+- filtre başına en hızlı backend'i (backends.py kalibrasyonu)
+ölçer ve sonucu performans profili olarak diske yazar.
+
+Profil config.py import edilirken yüklenir (bkz. apply_performance_profile);
+her ayar IMAGEPROC_<AYAR> ortam değişkeniyle ezilebilir.
+"""
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from config import AppConfig, ConcurrencyConfig
+
+
+MB = 1024 * 1024
+
+# Daha fazla kaynak kullanan seçenek ancak bu oranda hızlıysa seçilir
+MIN_GAIN = 1.10
+
+
+def _best_time(function, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _doubling(limit: int) -> list:
+    """1, 2, 4... limit (limit dahil)"""
+    values = [1]
+    while values[-1] * 2 <= limit:
+        values.append(values[-1] * 2)
+    if values[-1] != limit:
+        values.append(limit)
+    return values
+
+
+def _prefer_smaller(timings: dict):
+    """
+    En küçük seçenekten başlayıp ancak MIN_GAIN kadar hızlanma getiren
+    büyük seçeneğe geçer (ölçüm gürültüsüyle kaynak israfı önlenir).
+    """
+    choice = min(timings)
+    for option in sorted(timings):
+        if timings[choice] / timings[option] >= MIN_GAIN:
+            choice = option
+    return choice
+
+
+def _random_image(mode: str, width: int, height: int) -> Image.Image:
+    rng = np.random.default_rng(0)
+    shape = (height, width) if mode == "L" else (height, width, len(mode))
+    return Image.fromarray(rng.integers(0, 256, shape, dtype=np.uint8), mode)
+
+
+def total_memory_mb() -> int:
+    """Fiziksel bellek (ölçülemezse 0)"""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // MB
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+class Autotuner:
+    """
+    Mikro benchmark'larla performans profili üreten sınıf.
+
+    Kullanım:
+        profile = Autotuner().run()
+        Autotuner.save(profile)
+
+    megapixels ölçüm görüntülerinin boyutudur; küçük değer (örn: 0.5)
+    hızlı ama daha gürültülü sonuç verir.
+    """
+
+    def __init__(self, megapixels: float = None, repeats: int = None, cpu_count: int = None):
+        self.megapixels = megapixels or AppConfig.AUTOTUNE_MEGAPIXELS
+        self.repeats = repeats or AppConfig.AUTOTUNE_REPEATS
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+        self.measurements = {}
+
+    def _size(self, megapixels: float = None):
+        pixels = (megapixels or self.megapixels) * 1_000_000
+        width = int((pixels * 4 / 3) ** 0.5)
+        return width, max(1, int(width * 3 / 4))
+
+    # ------------------------------------------------------------------
+    # Ölçümler
+    # ------------------------------------------------------------------
+    def tune_band_parallel(self) -> dict:
+        """Bant paralelliği: thread sayısı, thread başına bant, bölme eşiği"""
+        from filters import SharpenFilter
+        from parallel import BandParallelExecutor
+
+        processor = SharpenFilter()
+        image = _random_image("RGB", *self._size())
+
+        def measure(threads, bands_per_thread, sample=image):
+            executor = BandParallelExecutor(
+                threads=threads, min_pixels=0, bands_per_thread=bands_per_thread
+            )
+            try:
+                return _best_time(lambda: executor.process(processor, sample), self.repeats)
+            finally:
+                executor.shutdown()
+
+        thread_timings = {
+            threads: measure(threads, AppConfig.PARALLEL_BANDS_PER_THREAD)
+            for threads in _doubling(self.cpu_count)
+        }
+        threads = _prefer_smaller(thread_timings)
+        self.measurements["band_threads"] = thread_timings
+
+        if threads == 1:
+            # Bölmek hiçbir boyutta kazandırmıyor
+            return {
+                "PARALLEL_THREADS": 1,
+                "PARALLEL_BANDS_PER_THREAD": AppConfig.PARALLEL_BANDS_PER_THREAD,
+                "PARALLEL_MIN_PIXELS": AppConfig.PARALLEL_MIN_PIXELS,
+            }
+
+        band_timings = {bands: measure(threads, bands) for bands in (1, 2, 4)}
+        bands_per_thread = min(band_timings, key=band_timings.get)
+        self.measurements["bands_per_thread"] = band_timings
+
+        # Bölmenin kazandırdığı en küçük görüntü boyutu
+        min_pixels = None
+        for fraction in (0.0625, 0.125, 0.25, 0.5, 1.0):
+            sample = image.resize(self._size(self.megapixels * fraction))
+            serial = measure(1, 1, sample)
+            split = measure(threads, bands_per_thread, sample)
+            if serial / split >= MIN_GAIN:
+                min_pixels = sample.width * sample.height
+                break
+
+        return {
+            "PARALLEL_THREADS": threads,
+            "PARALLEL_BANDS_PER_THREAD": bands_per_thread,
+            "PARALLEL_MIN_PIXELS": min_pixels or image.width * image.height * 2,
+        }
+
+    def tune_stream_band_rows(self) -> dict:
+        """Akışta bant başına satır sayısı (bant maliyeti / önbellek dengesi)"""
+        from streaming import stream_recipe
+
+        width, height = self._size()
+        timings = {}
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "in.npy")
+            np.save(source, np.asarray(_random_image("RGB", width, height)))
+
+            for rows in (64, 128, 256, 512, 1024):
+                if rows > height:
+                    break
+                output = os.path.join(directory, f"out{rows}.npy")
+                timings[rows] = _best_time(
+                    lambda: stream_recipe(source, output, ["sepia"], band_rows=rows),
+                    self.repeats,
+                )
+
+        self.measurements["stream_band_rows"] = timings
+        if not timings:
+            return {}
+        return {"STREAM_BAND_ROWS": min(timings, key=timings.get)}
+
+    def tune_worker_processes(self) -> dict:
+        """Toplu işte işçi process sayısı (saniyedeki görüntü)"""
+        from batch_processor import BatchProcessor
+        from concurrency import ConcurrencyController
+
+        images = [
+            _random_image("RGB", *self._size(self.megapixels / 8))
+            for _ in range(max(4, 2 * self.cpu_count))
+        ]
+        timings = {}
+        for workers in _doubling(self.cpu_count):
+            controller = ConcurrencyController(
+                ConcurrencyConfig(worker_processes=workers, name="autotune")
+            )
+            processor = BatchProcessor("blur,sepia", controller)
+            timings[workers] = _best_time(lambda: processor.process_images(images), 1)
+
+        self.measurements["worker_processes"] = timings
+        return {"THROUGHPUT_WORKER_PROCESSES": _prefer_smaller(timings)}
+
+    def tune_io_threads(self) -> dict:
+        """Okuma / yazma thread sayısı (PNG decode, GIL dışında)"""
+        timings = {}
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index in range(8):
+                path = os.path.join(directory, f"{index}.png")
+                _random_image("RGB", *self._size(self.megapixels / 8)).save(path, compress_level=1)
+                paths.append(path)
+
+            def read_all(pool):
+                def load(path):
+                    with Image.open(path) as image:
+                        image.load()
+                list(pool.map(load, paths))
+
+            for threads in _doubling(min(8, 2 * self.cpu_count)):
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    timings[threads] = _best_time(lambda: read_all(pool), self.repeats)
+
+        self.measurements["io_threads"] = timings
+        threads = _prefer_smaller(timings)
+        return {"IO_THREADS": threads, "PIPELINE_QUEUE_SIZE": max(4, 2 * threads)}
+
+    @staticmethod
+    def tune_cache_sizes(memory_mb: int = None, free_disk_mb: int = None) -> dict:
+        """Bellek ve disk boyutuna göre bütçeler / önbellek sınırları"""
+        memory_mb = total_memory_mb() if memory_mb is None else memory_mb
+        if free_disk_mb is None:
+            directory = AppConfig.CACHE_DIR
+            while not os.path.exists(directory):
+                directory = os.path.dirname(directory)
+            free_disk_mb = shutil.disk_usage(directory).free // MB
+
+        settings = {
+            "RESULT_STORE_MAX_MB": int(min(AppConfig.AUTOTUNE_MAX_STORE_MB, free_disk_mb * 0.1)),
+        }
+        if memory_mb:
+            settings.update({
+                # GUI geçmişi / önbellekleri
+                "MEMORY_BUDGET_MB": int(memory_mb * 0.25),
+                "DERIVED_PLANE_CACHE_MB": int(min(1024, memory_mb * 0.03)),
+                # Toplu işlerin aynı anda ayırabileceği görüntü belleği
+                "ADMISSION_BUDGET_MB": int(memory_mb * 0.6),
+                "DISPLAY_CACHE_ENTRIES": int(min(32, max(4, memory_mb // 1024))),
+            })
+        return settings
+
+    def tune_backends(self, calibration_file: str = None, quick: bool = False) -> str:
+        """
+        Filtre başına backend kalibrasyonu (bkz. backends.main).
+
+        quick=True ise büyük boyut sınıfı atlanır ve her backend bir kez
+        ölçülür (AUTOTUNE_QUICK_CALIBRATION_SIZES).
+        """
+        from backends import BackendDispatcher, calibration_filters
+
+        dispatcher = BackendDispatcher(calibration_file or AppConfig.BACKEND_CALIBRATION_FILE)
+        if quick:
+            dispatcher.calibrate(
+                calibration_filters(),
+                size_classes=AppConfig.AUTOTUNE_QUICK_CALIBRATION_SIZES,
+                repeats=1,
+            )
+        else:
+            dispatcher.calibrate(calibration_filters())
+        BackendDispatcher._instance = dispatcher
+        return dispatcher.calibration_file
+
+    # ------------------------------------------------------------------
+    # Profil
+    # ------------------------------------------------------------------
+    def run(self, backends: bool = True, calibration_file: str = None, on_step=None,
+            quick: bool = False) -> dict:
+        """
+        Tüm ölçümleri çalıştırır. quick backend kalibrasyonunu kısaltır
+        (bkz. tune_backends).
+
+        Dönüş:
+            dict: created_at, host, cpu_count, memory_mb, settings,
+                  measurements, backend_calibration
+        """
+        settings = {}
+        steps = [
+            ("band parallelism", self.tune_band_parallel),
+            ("stream band rows", self.tune_stream_band_rows),
+            ("worker processes", self.tune_worker_processes),
+            ("io threads", self.tune_io_threads),
+            ("cache sizes", self.tune_cache_sizes),
+        ]
+        for name, step in steps:
+            if on_step is not None:
+                on_step(name)
+            settings.update(step())
+
+        calibration = None
+        if backends:
+            if on_step is not None:
+                on_step("backends")
+            calibration = self.tune_backends(calibration_file, quick=quick)
+
+        return {
+            "created_at": time.time(),
+            "host": socket.gethostname(),
+            "cpu_count": self.cpu_count,
+            "memory_mb": total_memory_mb(),
+            "settings": settings,
+            "measurements": {
+                name: {str(option): seconds for option, seconds in timings.items()}
+                for name, timings in self.measurements.items()
+            },
+            "backend_calibration": calibration,
+        }
+
+    @staticmethod
+    def save(profile: dict, path: str = None) -> str:
+        """Profili (atomik olarak) diske yazar"""
+        path = path or AppConfig.PERFORMANCE_PROFILE_FILE
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
+        return path
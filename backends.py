@@ -0,0 +1,255 @@
+# ======================== backends.py ========================
+"""
+Filtreler için backend (PIL / OpenCV / NumPy) seçim mekanizması
+
+Aynı filtre birden fazla kütüphane ile uygulanabilir ve hangisinin
+daha hızlı olduğu görüntü boyutuna ve moduna göre değişir.
+
+Bu dosya:
+- görüntüyü boyut sınıfına ayırmayı
+- diskte saklanan kalibrasyon tablosuna göre backend seçmeyi
+- kalibrasyonu (yeniden) çalıştırmayı
+- debug için backend zorlamayı
+sağlar.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+from config import AppConfig
+from derived_planes import DerivedPlaneCache
+from exceptions import FilterError
+
+
+class BackendDispatcher:
+    """
+    Filtre + boyut sınıfı + mod kombinasyonu için en hızlı
+    backend'i seçen sınıf.
+
+    Kalibrasyon tablosu anahtarları:
+        "<backend_key>|<size_class>|<mode>" -> "<backend>"
+    """
+
+    _instance = None
+
+    def __init__(self, calibration_file: str = AppConfig.BACKEND_CALIBRATION_FILE):
+        self.calibration_file = calibration_file
+        self.table = self._load_table()
+
+    @classmethod
+    def instance(cls):
+        """Uygulama genelinde paylaşılan dispatcher nesnesi"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # Seçim
+    # ------------------------------------------------------------------
+    @staticmethod
+    def size_class(width: int, height: int) -> str:
+        """Görüntü boyutunu megapiksel sınırlarına göre sınıflandırır"""
+        megapixels = (width * height) / 1_000_000
+
+        for name, limit in AppConfig.BACKEND_SIZE_CLASSES:
+            if megapixels <= limit:
+                return name
+
+        return AppConfig.BACKEND_SIZE_CLASSES[-1][0]
+
+    @staticmethod
+    def forced_backend():
+        """Ortam değişkeni veya AppConfig ile zorlanan backend"""
+        return os.environ.get(AppConfig.FORCED_BACKEND_ENV) or AppConfig.FORCED_BACKEND
+
+    def select(self, filter_obj, image) -> str:
+        """
+        Verilen filtre ve görüntü için kullanılacak backend adını döner.
+
+        Öncelik sırası:
+        1. Filtre nesnesinde zorlanan backend (filter_obj.backend)
+        2. Global olarak zorlanan backend (ortam değişkeni / AppConfig)
+        3. Kalibrasyon tablosu
+        4. Filtrenin ilk (varsayılan) backend'i
+        """
+        forced = filter_obj.backend or self.forced_backend()
+        if forced:
+            if forced in filter_obj.BACKENDS:
+                return forced
+            # Global zorlama her filtreye uymayabilir, sadece
+            # filtreye özel zorlama hata sayılır
+            if filter_obj.backend:
+                raise FilterError(
+                    f"{filter_obj.name} does not support backend '{forced}'"
+                )
+
+        candidates = filter_obj.supported_backends(image.mode)
+        if not candidates:
+            # Hiçbiri desteklemiyorsa varsayılan backend kendi hatasını verir
+            return filter_obj.BACKENDS[0]
+
+        size_class = self.size_class(*image.size)
+        calibrated = self._lookup(filter_obj.backend_key(), size_class, image.mode)
+
+        if calibrated in candidates:
+            return calibrated
+
+        return candidates[0]
+
+    def _lookup(self, backend_key, size_class, mode):
+        """
+        Tabloda bu boyut sınıfı yoksa bir küçük sınıfın sonucu kullanılır
+        (örn: "huge" kalibre edilmez, "large" sonucu geçerlidir).
+        """
+        names = [name for name, _ in AppConfig.BACKEND_SIZE_CLASSES]
+        index = names.index(size_class)
+
+        for name in reversed(names[:index + 1]):
+            backend = self.table.get(f"{backend_key}|{name}|{mode}")
+            if backend:
+                return backend
+
+        return None
+
+    # ------------------------------------------------------------------
+    # Kalibrasyon
+    # ------------------------------------------------------------------
+    def calibrate(self, filters, size_classes=None, modes=None, repeats=None):
+        """
+        Her filtrenin her backend'ini örnek görüntüler üzerinde ölçer,
+        en hızlısını tabloya yazar ve tabloyu diske kaydeder.
+
+        Dönüş:
+            dict: anahtar -> {"backend": ..., "timings": {backend: saniye}}
+        """
+        size_classes = size_classes or list(AppConfig.BACKEND_CALIBRATION_SIZES)
+        modes = modes or AppConfig.BACKEND_CALIBRATION_MODES
+        repeats = repeats or AppConfig.BACKEND_CALIBRATION_REPEATS
+
+        report = {}
+        for size_class in size_classes:
+            width, height = AppConfig.BACKEND_CALIBRATION_SIZES[size_class]
+
+            for mode in modes:
+                sample = self._sample_image(mode, width, height)
+
+                for filter_obj in filters:
+                    timings = self._time_backends(filter_obj, sample, repeats)
+                    if not timings:
+                        continue
+
+                    best = min(timings, key=timings.get)
+                    key = f"{filter_obj.backend_key()}|{size_class}|{mode}"
+
+                    self.table[key] = best
+                    report[key] = {"backend": best, "timings": timings}
+
+        self.save()
+        return report
+
+    @staticmethod
+    def _time_backends(filter_obj, sample, repeats):
+        """
+        Filtrenin görüntü modunu destekleyen backend'lerini ölçer.
+
+        Şimdiye kadarki en hızlı backend'den yavaş kalan backend'in kalan
+        tekrarları atlanır; tek ölçüm kazanamayacağını göstermeye yeter.
+        """
+        timings = {}
+
+        for backend in filter_obj.calibration_backends(sample.mode):
+            run = filter_obj.backend_function(backend)
+            best = float("inf")
+            fastest = min(timings.values(), default=float("inf"))
+
+            try:
+                for _ in range(repeats):
+                    # Önbellekteki düzlemler (derived_planes.py) ölçümü bozmasın
+                    DerivedPlaneCache.instance().invalidate(sample)
+                    start = time.perf_counter()
+                    run(sample)
+                    best = min(best, time.perf_counter() - start)
+                    if best > fastest:
+                        break
+            except Exception:
+                # Bu mod / boyutta çalışmayan backend seçilmez
+                continue
+
+            timings[backend] = best
+
+        return timings
+
+    @staticmethod
+    def _sample_image(mode, width, height):
+        """Kalibrasyon için tekrarlanabilir rastgele görüntü üretir"""
+        rng = np.random.default_rng(0)
+        channels = len(mode)
+        shape = (height, width) if channels == 1 else (height, width, channels)
+
+        return Image.fromarray(rng.integers(0, 256, shape, dtype=np.uint8), mode)
+
+    # ------------------------------------------------------------------
+    # Disk işlemleri
+    # ------------------------------------------------------------------
+    def _load_table(self):
+        """Kalibrasyon dosyası yoksa veya bozuksa boş tablo döner"""
+        try:
+            with open(self.calibration_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Kalibrasyon tablosunu diske yazar"""
+        directory = os.path.dirname(self.calibration_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(self.calibration_file, "w", encoding="utf-8") as f:
+            json.dump(self.table, f, indent=2, sort_keys=True)
+
+    def clear(self):
+        """Kalibrasyonu siler, varsayılan backend'lere dönülür"""
+        self.table = {}
+        if os.path.exists(self.calibration_file):
+            os.remove(self.calibration_file)
+
+
+def calibration_filters():
+    """Kalibrasyonda ölçülen filtre nesneleri"""
+    from factories import FilterFactory
+    from filters import MedianFilter
+
+    factory = FilterFactory()
+    filters = [factory.create_filter(name) for name in factory.get_available_filters()]
+
+    # Median her kernel sınıfı için ayrı ölçülür
+    filters = [f for f in filters if not isinstance(f, MedianFilter)]
+    filters += [
+        MedianFilter(kernel_size)
+        for _, kernel_size in AppConfig.MEDIAN_KERNEL_CLASSES
+    ]
+    return filters
+
+
+def main():
+    """Kalibrasyonu komut satırından yeniden çalıştırır"""
+    dispatcher = BackendDispatcher.instance()
+    report = dispatcher.calibrate(calibration_filters())
+
+    for key, entry in sorted(report.items()):
+        timings = ", ".join(
+            f"{backend}={seconds * 1000:.2f}ms"
+            for backend, seconds in sorted(entry["timings"].items())
+        )
+        print(f"{key:45s} -> {entry['backend']:8s} ({timings})")
+
+    print(f"Calibration saved: {dispatcher.calibration_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,22 @@ Amaç:
 - Filtre ve iyileştirme sınıflarını standartlaştırmak
 """
 
+import json
 from abc import ABC, abstractmethod
 
+from PIL import Image
+
+from backends import BackendDispatcher
+from derived_planes import ycbcr
+
+
+def _intersect(box, other):
+    """İki (sol, üst, sağ, alt) kutusunun kesişimi"""
+    return (
+        max(box[0], other[0]), max(box[1], other[1]),
+        min(box[2], other[2]), min(box[3], other[3]),
+    )
+
 
 class ImageProcessor(ABC):
     """
@@ -19,8 +33,35 @@ class ImageProcessor(ABC):
     Bu sınıf sayesinde:
     - Her işlemci aynı process() metoduna sahip olur
     - GUI ve ImageManager, hangi sınıfla çalıştığını bilmeden işlem yapabilir
+
+    POINT_OPERATION: Çıktı pikseli sadece aynı konumdaki girdi pikseline
+    bağlıysa True (invert, sepia...). Bu işlemler görüntünün parçalarına
+    (satır bantlarına) ayrı ayrı uygulanabilir (bkz. streaming.py).
+
+    HALO: Çekirdek (kernel) kullanan işlemlerde bir çıktı satırının
+    ihtiyaç duyduğu komşu satır sayısı (çekirdek yarıçapı). None ise
+    işlem görüntünün tamamına bağlıdır (kontrast, Canny...) ve bantlara
+    bölünemez (bkz. parallel.py).
+
+    MEMORY_EXPANSION: İşlem sırasında girdiye ek olarak ayrılan en fazla
+    bellek (çıktı dahil), girdi tamponunun katı olarak. Backend'e göre
+    değişiyorsa en kötü durum yazılır. Kabul kontrolü (bkz. admission.py)
+    tepe belleği bununla tahmin eder.
+
+    LUMA_MODE: İşlem sadece YCbCr'nin parlaklık (Y) düzlemine uygulanabiliyorsa
+    (bkz. LumaProcessor) "merge" (sonuç renk düzlemleriyle birleştirilir)
+    veya "plane" (sonuç tek kanallı L kalır); desteklenmiyorsa None.
     """
 
+    POINT_OPERATION = False
+    HALO = None
+    MEMORY_EXPANSION = 1.0
+    LUMA_MODE = None
+
+    # İmplementasyon sonucu değiştirecek şekilde güncellenirse artırılır;
+    # diskteki eski sonuçlar (bkz. result_store.py) geçersiz olur
+    CACHE_VERSION = 1
+
     @abstractmethod
     def process(self, image):
         """
@@ -34,22 +75,161 @@ class ImageProcessor(ABC):
         """
         pass
 
+    def band_halo(self):
+        """
+        Bantlara bölerek işlerken her banda eklenecek komşu satır sayısı.
+
+        Parametreye bağlı olan işlemler (örn: kernel boyutu) override eder.
+        """
+        if self.POINT_OPERATION:
+            return 0
+        return self.HALO
+
+    def process_region(self, image, box=None, mask=None, process=None):
+        """
+        İşlemi sadece seçili bölgeye (ROI) uygular.
+
+        Sadece bölge ve çekirdeğin ihtiyaç duyduğu komşu pikseller (halo)
+        işlenir; bölge içindeki sonuç, işlemin tüm görüntüye uygulanmasıyla
+        aynıdır. Görüntünün tamamına bağlı işlemler (HALO = None: kontrast,
+        Canny...) sadece bölgenin kendisini görür.
+
+        Parametreler:
+            image (PIL.Image): Kaynak görüntü (değiştirilmez)
+            box (tuple): (sol, üst, sağ, alt); verilmezse maskenin sınırları
+            mask (PIL.Image): Görüntü boyutunda "1" / "L" maske; 0 dışındaki
+                              pikseller (yumuşak maskede oranında) değişir
+            process: İşlemi uygulayan fonksiyon (varsayılan: self.process)
+
+        Dönüş:
+            (PIL.Image, tuple): bölgenin yeni içeriği (kaynakla aynı modda)
+                                ve bölge; değişecek piksel yoksa (None, None)
+        """
+        process = process or self.process
+        width, height = image.size
+
+        if mask is not None:
+            if mask.size != image.size:
+                raise ValueError(f"Mask size {mask.size} does not match image size {image.size}")
+            mask = mask.convert("L")
+            mask_box = mask.getbbox()
+            if mask_box is None:
+                return None, None
+            box = mask_box if box is None else _intersect(box, mask_box)
+        if box is None:
+            box = (0, 0, width, height)
+
+        left, top, right, bottom = _intersect(box, (0, 0, width, height))
+        if right <= left or bottom <= top:
+            return None, None
+        box = (left, top, right, bottom)
+
+        halo = self.band_halo()
+        if halo is None:
+            source_box = box
+        else:
+            source_box = (
+                max(0, left - halo), max(0, top - halo),
+                min(width, right + halo), min(height, bottom + halo),
+            )
+
+        source = image.crop(source_box)
+        result = process(source)
+        if result.size != source.size:
+            raise ValueError("Region processing requires size-preserving operations")
+
+        offset_x, offset_y = left - source_box[0], top - source_box[1]
+        patch = result.crop((offset_x, offset_y, offset_x + right - left, offset_y + bottom - top))
+        if patch.mode != image.mode:
+            patch = patch.convert(image.mode)
+
+        if mask is not None:
+            # Yumuşak maskede kaynak ve sonuç maske oranında karıştırılır
+            patch = Image.composite(patch, image.crop(box), mask.crop(box))
+
+        return patch, box
+
+    def cache_key(self) -> str:
+        """
+        İşlemi ve parametrelerini tek anlamlı olarak temsil eden metin.
+
+        Örnek:
+            'GaussianBlurFilter:1:{"radius": 120}'
+
+        Görünen ad ve backend anahtara girmez; backend'ler aynı sonucu üretir.
+        """
+        params = {
+            key: value for key, value in vars(self).items()
+            if key not in ("name", "backend")
+        }
+        return (
+            f"{type(self).__name__}:{self.CACHE_VERSION}:"
+            f"{json.dumps(params, sort_keys=True, default=repr)}"
+        )
+
 
 class Filter(ImageProcessor):
     """
     Tüm filtre sınıfları için temel sınıf.
 
     Blur, Sharpen, Grayscale gibi filtreler bu sınıftan türetilir.
+
+    Bir filtre birden fazla backend ile (PIL, OpenCV, NumPy) uygulanabilir:
+    - BACKENDS: desteklenen backend isimleri, ilki varsayılandır
+    - BACKEND_MODES: backend'in desteklediği görüntü modları
+                     (listede olmayan backend tüm modları destekler)
+    - Her backend için _process_<backend>(image) metodu yazılır
+
+    process() çağrıldığında BackendDispatcher en hızlı backend'i seçer.
     """
 
-    def __init__(self, name: str):
+    BACKENDS = ()
+    BACKEND_MODES = {}
+
+    def __init__(self, name: str, backend: str = None):
         """
         Filtrenin adını tutar.
 
         name parametresi, GUI tarafında filtre ismini göstermek
         ve loglama yapmak için kullanılır.
+
+        backend parametresi verilirse (debug amaçlı) otomatik seçim
+        yapılmaz, her zaman bu backend kullanılır.
         """
         self.name = name
+        self.backend = backend
+
+    def process(self, image):
+        """Seçilen backend ile filtreyi uygular"""
+        backend = BackendDispatcher.instance().select(self, image)
+        return self.backend_function(backend)(image)
+
+    def backend_function(self, backend: str):
+        """Backend adına karşılık gelen _process_<backend> metodunu döner"""
+        return getattr(self, f"_process_{backend}")
+
+    def supported_backends(self, mode: str):
+        """Verilen görüntü modunu destekleyen backend'ler (öncelik sırasıyla)"""
+        return [
+            backend for backend in self.BACKENDS
+            if mode in self.BACKEND_MODES.get(backend, (mode,))
+        ]
+
+    def calibration_backends(self, mode: str):
+        """
+        Kalibrasyonda ölçülecek backend'ler. Bu modda kazanma şansı
+        olmayan (ölçümü çok uzun süren) backend'ler çıkarılabilir.
+        """
+        return self.supported_backends(mode)
+
+    def backend_key(self):
+        """
+        Kalibrasyon tablosunda bu filtreyi temsil eden anahtar.
+
+        Performansı parametreye bağlı olan filtreler (örn: kernel boyutu)
+        bu metodu override edebilir.
+        """
+        return type(self).__name__
 
     def __str__(self):
         """
@@ -67,6 +247,9 @@ class ImageEnhancement(ImageProcessor):
     temel sınıf.
     """
 
+    # ImageEnhance referans (degenerate) görüntü ve çıktı ayırır
+    MEMORY_EXPANSION = 2.0
+
     def __init__(self, name: str, factor: float):
         """
         Parametreler:
@@ -85,3 +268,57 @@ class ImageEnhancement(ImageProcessor):
             'Brightness Enhancement (factor=1.2)'
         """
         return f"{self.name} Enhancement (factor={self.factor})"
+
+
+class LumaProcessor(ImageProcessor):
+    """
+    Bir işlemi sadece parlaklık (Y) düzlemine uygulayan sarmalayıcı.
+
+    Reçetede adımın sonuna ":luma" eklenerek seçilir ("sharpen:luma",
+    "gaussian_blur:3:luma"). RGB görüntü YCbCr'ye bir kez çevrilir, işlem
+    tek düzlemde çalışır ve sonuç dokunulmamış Cb / Cr ile birleştirilip
+    RGB'ye geri çevrilir. Üç kanal yerine tek kanal işlendiği için kernel
+    filtreleri daha hızlıdır ve fotoğraflarda renk saçağı (color fringing)
+    oluşmaz.
+
+    RGBA'da alfa kanalı korunur; L görüntü doğrudan işlenir. Diğer modlar
+    (P, CMYK...) için işlem tüm görüntüye normal şekilde uygulanır.
+    """
+
+    # YCbCr görüntü, Y düzlemi, işlenmiş Y ve birleştirilmiş sonuç
+    MEMORY_EXPANSION_BASE = 3.0
+
+    def __init__(self, processor: ImageProcessor):
+        if processor.LUMA_MODE is None:
+            raise ValueError(f"{processor} does not support luma mode")
+
+        self.processor = processor
+        self.name = f"{processor.name} (luma)"
+        self.MEMORY_EXPANSION = (
+            self.MEMORY_EXPANSION_BASE + processor.MEMORY_EXPANSION / 3
+        )
+
+    def process(self, image):
+        if image.mode not in ("RGB", "RGBA"):
+            # L zaten parlaklık düzlemidir
+            return self.processor.process(image)
+
+        y, cb, cr = ycbcr(image).split()
+        result = self.processor.process(y)
+        if self.processor.LUMA_MODE == "plane":
+            return result
+
+        result = Image.merge("YCbCr", (result, cb, cr)).convert("RGB")
+        if image.mode == "RGBA":
+            result.putalpha(image.getchannel("A"))
+        return result
+
+    def band_halo(self):
+        # Renk dönüşümü piksel bazlıdır; komşuluk sadece işlemin kendisinden gelir
+        return self.processor.band_halo()
+
+    def cache_key(self) -> str:
+        return f"{type(self).__name__}:{self.CACHE_VERSION}:{self.processor.cache_key()}"
+
+    def __str__(self):
+        return f"{self.processor} (luma)"
@@ -0,0 +1,326 @@
+# ======================== batch_processor.py ========================
+"""
+Toplu (batch) görüntü işleme
+
+Bu dosya:
+- bir reçeteyi çok sayıda dosyaya process havuzu ile uygulamayı
+- bellekteki görüntüleri paylaşımlı bellek üzerinden işçilere göndermeyi
+sağlar.
+
+Dosya ile çalışırken işçiler dosyayı kendileri okur / yazar; kuyruktan
+sadece dosya yolları geçer. Bellekteki görüntüler ise
+SharedMemoryExecutor ile kopyalanmadan (pickle edilmeden) taşınır.
+"""
+
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import as_completed
+
+from PIL import Image
+
+from admission import AdmissionController, estimate_peak_bytes
+from concurrency import ConcurrencyController
+from dedup import DuplicateDetector, fingerprint_file, sha256_file
+from image_manager import ImageManager
+from logger import configure_worker_logging, log_event
+from recipe import Recipe
+from result_store import ResultStore
+from shared_memory_transport import SharedMemoryExecutor
+from streaming import can_stream, stream_recipe
+
+
+logger = logging.getLogger("ImageProcessingApp.batch")
+
+
+def _load_image(input_path: str):
+    with Image.open(input_path) as image:
+        image.load()
+        return image
+
+
+def process_file(input_path: str, output_path: str, steps, stream: bool = False,
+                 result_store: dict = None) -> dict:
+    """
+    İşçi process'te çalışır: dosyayı okur, reçeteyi uygular, kaydeder.
+
+    stream=True ise ve reçete sadece nokta işlemlerinden oluşuyorsa dosya
+    satır bantları halinde işlenir (bkz. streaming.py).
+
+    result_store verilirse (ResultStore.for_directory argümanları, örn:
+    {"root": "cache/"}) reçetenin diskte hazır olan en uzun öneki kullanılır;
+    sonuçta reused_steps alanı hazır bulunan adım sayısıdır.
+
+    Hata durumunda exception fırlatmak yerine sonuç sözlüğüne yazılır;
+    böylece tek bir bozuk dosya bütün işi durdurmaz.
+    """
+    start = time.perf_counter()
+    result = {
+        "input": input_path,
+        "output": output_path,
+        "status": "done",
+        "error": None,
+    }
+
+    try:
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if stream and can_stream(steps, output_path):
+            stream_recipe(input_path, output_path, steps)
+        elif result_store:
+            store = ResultStore.for_directory(**result_store)
+            processed, info = store.apply(
+                Recipe.cached(steps),
+                lambda: _load_image(input_path),
+                sha256_file(input_path),
+            )
+            result["reused_steps"] = info["reused_steps"]
+
+            ImageManager.prepare_for_save(processed, output_path).save(output_path)
+        else:
+            processed = Recipe.cached(steps).apply(_load_image(input_path))
+
+            ImageManager.prepare_for_save(processed, output_path).save(output_path)
+
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["seconds"] = time.perf_counter() - start
+
+    log_event(
+        logger, "image_processed",
+        level=logging.DEBUG if result["status"] == "done" else logging.WARNING,
+        input=input_path, recipe=",".join(steps), status=result["status"],
+        seconds=round(result["seconds"], 6), error=result["error"],
+    )
+    return result
+
+
+class BatchProcessor:
+    """Bir reçeteyi çok sayıda görüntüye paralel olarak uygular"""
+
+    def __init__(self, recipe, controller: ConcurrencyController = None, log_queue=None,
+                 log_settings: dict = None):
+        """
+        Parametreler:
+            recipe (Recipe | str | list[str]): Uygulanacak reçete
+            controller: Havuz boyutlarını belirleyen eşzamanlılık kontrolcüsü
+                        (varsayılan: "throughput" profili)
+            log_queue: İşçi loglarının iletileceği kuyruk
+                       (AppLogger(asynchronous=True).worker_queue())
+            log_settings (dict): İşçilerdeki log seviyesi ve hız sınırı
+                                 (AppLogger.worker_settings())
+        """
+        self.recipe = recipe if isinstance(recipe, Recipe) else Recipe(recipe)
+        self.controller = controller or ConcurrencyController.from_preset("throughput")
+        self.log_queue = log_queue
+        self.log_settings = log_settings
+        self.admission_stats = None
+
+    def _process_pool(self):
+        """İşçi havuzu; log kuyruğu verildiyse işçi logları ana process'e iletilir"""
+        if self.log_queue is None:
+            return self.controller.process_pool()
+        return self.controller.process_pool(
+            initializer=configure_worker_logging, initargs=(self.log_queue, self.log_settings)
+        )
+
+    @staticmethod
+    def output_path_for(input_path: str, output_dir: str, output_format: str = None):
+        """Girdi dosyası için çıktı yolunu üretir"""
+        name, ext = os.path.splitext(os.path.basename(input_path))
+        if output_format:
+            ext = "." + output_format.lower().lstrip(".")
+        return os.path.join(output_dir, name + ext)
+
+    def process_files(self, input_paths, output_dir: str, output_format: str = None,
+                      deduplicate: bool = False, stream: bool = False,
+                      result_store: dict = None, memory_budget: int = None):
+        """
+        Dosyaları işler ve her dosya için bir sonuç sözlüğü döner.
+
+        deduplicate=True ise:
+        - birebir aynı dosyalar tekrar işlenmez, ilk çıktının kopyası yazılır
+          (status="duplicate", duplicate_of=ilk girdi)
+        - algısal olarak çok benzer dosyalar işlenir ama near_duplicates
+          alanında raporlanır
+
+        stream=True ise nokta işlemi reçeteleri sabit bellekle, satır
+        bantları halinde uygulanır (çok büyük dosyalar için)
+
+        result_store verilirse (örn: {"root": "cache/", "keep_intermediate": True})
+        sonuçlar içerik adresli depoya yazılır, tekrar çalıştırmada sadece
+        değişen adımlar hesaplanır (bkz. result_store.py)
+
+        memory_budget (bayt) verilirse dosyalar tahmini tepe belleklerine
+        göre, toplamı bütçeyi aşmayacak şekilde başlatılır
+        (bkz. admission.py); son kabul istatistikleri self.admission_stats'e
+        yazılır
+
+        Dönüş:
+            list[dict]: input, output, status ("done" / "failed" / "duplicate"),
+                        error, seconds
+        """
+        steps = self.recipe.steps
+        input_paths = list(input_paths)
+
+        with self._process_pool() as pool:
+            if deduplicate:
+                fingerprints = list(pool.map(fingerprint_file, input_paths))
+                detector = DuplicateDetector()
+                classes = [detector.classify(fp) for fp in fingerprints]
+            else:
+                classes = [None] * len(input_paths)
+
+            tasks = [
+                (path, (
+                    path,
+                    self.output_path_for(path, output_dir, output_format),
+                    steps,
+                    stream,
+                    result_store,
+                ))
+                for path, info in zip(input_paths, classes)
+                if not (info and info["duplicate_of"])
+            ]
+
+            if memory_budget is not None:
+                results = self._run_admitted(pool, tasks, memory_budget)
+            else:
+                futures = {path: pool.submit(process_file, *args) for path, args in tasks}
+                results = {path: future.result() for path, future in futures.items()}
+
+        return [
+            self._result_for(path, info, results, output_dir, output_format)
+            for path, info in zip(input_paths, classes)
+        ]
+
+    def _run_admitted(self, pool, tasks, memory_budget: int) -> dict:
+        """Görevleri bellek bütçesine göre havuza verir"""
+        processors = self.recipe.processors
+        admission = AdmissionController(memory_budget)
+
+        def estimate(path):
+            try:
+                return estimate_peak_bytes(path, processors)
+            except Exception:
+                # Okunamayan dosya işçide "failed" olarak raporlanır
+                return 0
+
+        results = dict(admission.run(
+            pool,
+            [(path, estimate(path), process_file, args) for path, args in tasks],
+            slots=self.controller.config.worker_processes,
+        ))
+        self.admission_stats = admission.stats
+        return results
+
+    def process_job(self, journal, job_name: str, input_paths, output_dir: str,
+                    output_format: str = None, retry_failed: bool = False,
+                    stream: bool = False, result_store: dict = None):
+        """
+        Dosyaları iş günlüğüne (bkz. job_journal.py) kaydederek işler.
+
+        Aynı isimli iş daha önce başlatıldıysa sadece bitmemiş girdiler
+        işlenir; retry_failed=True ise başarısız olanlar da tekrar denenir.
+        Her sonuç bittiği anda günlüğe yazılır (tamponlu). stream ve
+        result_store iş kaydına yazılır; devam ettirirken oradan okunur
+        (bkz. cli.py resume).
+
+        Dönüş:
+            list[dict]: Bu çalıştırmada işlenen girdilerin sonuçları
+        """
+        # Devam ettirme başka bir dizinden yapılabilir
+        input_paths = [os.path.abspath(path) for path in input_paths]
+        output_dir = os.path.abspath(output_dir)
+        if result_store is not None:
+            result_store = dict(result_store, root=os.path.abspath(result_store["root"]))
+        job = journal.start_job(
+            job_name, str(self.recipe), output_dir, output_format, input_paths,
+            [self.output_path_for(path, output_dir, output_format) for path in input_paths],
+            options={"stream": stream, "result_store": result_store},
+        )
+        todo = journal.unfinished(job["id"], retry_failed)
+        journal.mark_running(job["id"], todo)
+
+        results = []
+        try:
+            with self._process_pool() as pool:
+                futures = [
+                    pool.submit(
+                        process_file,
+                        path,
+                        self.output_path_for(path, job["output_dir"], job["output_format"]),
+                        self.recipe.steps,
+                        stream,
+                        result_store,
+                    )
+                    for path in todo
+                ]
+                for future in as_completed(futures):
+                    result = future.result()
+                    journal.record(job["id"], result)
+                    results.append(result)
+        finally:
+            journal.flush()
+
+        return results
+
+    def process_pipelined(self, input_paths, output_dir: str, output_format: str = None,
+                          decode_threads: int = None, encode_threads: int = None,
+                          queue_size: int = None):
+        """
+        Dosyaları decode / compute / encode aşamaları ayrı havuzlarda
+        çalışan boru hattıyla işler (bkz. pipeline.py).
+
+        Dönüş:
+            (list[dict], dict): process_files ile aynı sonuçlar ve aşama
+                                istatistikleri
+        """
+        from pipeline import PipelineExecutor
+
+        executor = PipelineExecutor(self, decode_threads, encode_threads, queue_size)
+        results = executor.run(input_paths, output_dir, output_format)
+        return results, executor.stats
+
+    def _result_for(self, path, info, results, output_dir, output_format):
+        """Dedup bilgisini sonuca ekler; birebir tekrarlar için çıktıyı kopyalar"""
+        if info is None:
+            return results[path]
+
+        if info["duplicate_of"] is None:
+            result = dict(results[path])
+            result["near_duplicates"] = info["near_duplicates"]
+            return result
+
+        original = results[info["duplicate_of"]]
+        output_path = self.output_path_for(path, output_dir, output_format)
+        result = {
+            "input": path,
+            "output": output_path,
+            "status": "duplicate",
+            "error": original["error"],
+            "seconds": 0.0,
+            "duplicate_of": info["duplicate_of"],
+            "near_duplicates": [],
+        }
+
+        if original["status"] != "done":
+            result["status"] = original["status"]
+        elif output_path != original["output"]:
+            shutil.copyfile(original["output"], output_path)
+
+        return result
+
+    def process_images(self, images):
+        """
+        Bellekteki PIL görüntülerini işler, sonuçları aynı sırayla döner.
+
+        Görüntüler paylaşımlı bellek üzerinden taşınır.
+        """
+        with SharedMemoryExecutor(self._process_pool()) as executor:
+            return executor.map(images, self.recipe.steps)
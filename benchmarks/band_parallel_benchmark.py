@@ -0,0 +1,72 @@
+# ======================== band_parallel_benchmark.py ========================
+"""
+Tek görüntüde bant paralel işlemenin thread sayısıyla ölçeklenmesi
+
+40 MP bir görüntüye her filtre 1, 2, 4... thread ile uygulanır ve tek
+thread'e göre hızlanma yazdırılır.
+
+Çalıştırma (proje kök dizininden):
+    python benchmarks/band_parallel_benchmark.py [megapiksel]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filters import BlurFilter, GaussianBlurFilter, MedianFilter, SharpenFilter  # noqa: E402
+from parallel import BandParallelExecutor  # noqa: E402
+
+REPEATS = 3
+
+
+def _thread_counts():
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def _measure(executor, processor, image):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        executor.process(processor, image)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    megapixels = float(sys.argv[1]) if len(sys.argv) > 1 else 40
+    width = int((megapixels * 1_000_000 * 4 / 3) ** 0.5)
+    height = int(width * 3 / 4)
+    image = Image.fromarray(
+        np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    )
+
+    counts = _thread_counts()
+    print(f"{width}x{height} RGB, threads: {counts}")
+
+    for processor in (SharpenFilter(), BlurFilter(), MedianFilter(), GaussianBlurFilter()):
+        timings = []
+        for threads in counts:
+            executor = BandParallelExecutor(threads=threads, min_pixels=0)
+            timings.append(_measure(executor, processor, image))
+            executor.shutdown()
+
+        cells = " | ".join(
+            f"{t:>2}: {seconds * 1000:>7.1f}ms {timings[0] / seconds:>4.2f}x"
+            for t, seconds in zip(counts, timings)
+        )
+        print(f"{processor.name:<14} | {cells}")
+
+
+if __name__ == "__main__":
+    main()
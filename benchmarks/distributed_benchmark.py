@@ -0,0 +1,87 @@
+# ======================== distributed_benchmark.py ========================
+"""
+Paylaşılan kuyrukta işçi sayısıyla ölçeklenme
+
+Aynı girdi kümesi 1, 2, 4... yerel işçi process ile işlenir; saniyedeki
+görüntü sayısı ve tek işçiye göre hızlanma yazdırılır. Birden fazla makine
+aynı kuyruk dizinini gördüğünde işçiler aynı şekilde eklenir.
+
+Çalıştırma (proje kök dizininden):
+    python benchmarks/distributed_benchmark.py [görüntü_sayısı] [reçete]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from distributed import Coordinator, run_worker  # noqa: E402
+
+
+def _worker_counts():
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def _create_inputs(directory, count):
+    rng = np.random.default_rng(0)
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"img{index:04d}.png")
+        Image.fromarray(rng.integers(0, 256, (768, 1024, 3), dtype=np.uint8)).save(
+            path, compress_level=1
+        )
+        paths.append(path)
+    return paths
+
+
+def _run(root, inputs, recipe, workers):
+    queue_dir = os.path.join(root, f"queue{workers}")
+    coordinator = Coordinator(queue_dir, recipe, os.path.join(root, f"out{workers}"), batch_size=4)
+    coordinator.submit(inputs)
+
+    start = time.perf_counter()
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(queue_dir, f"w{index}"))
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    coordinator.wait(poll_interval=0.05)
+    for process in processes:
+        process.join()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    recipe = sys.argv[2] if len(sys.argv) > 2 else "blur,sharpen,sepia"
+
+    with tempfile.TemporaryDirectory() as root:
+        inputs = _create_inputs(root, count)
+        counts = _worker_counts()
+        print(f"{count} images 1024x768, recipe '{recipe}', workers: {counts}")
+
+        baseline = None
+        for workers in counts:
+            seconds = _run(root, inputs, recipe, workers)
+            baseline = baseline or seconds
+            print(
+                f"{workers:>3} workers: {count / seconds:>7.1f} img/s "
+                f"{baseline / seconds:>5.2f}x ({seconds:.2f} s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# ======================== luma_benchmark.py ========================
+"""
+Parlaklık (":luma") modu ile tam RGB işlemenin karşılaştırması
+
+Her reçete aynı görüntüye bir kez tüm RGB kanallarında, bir kez her adımı
+sadece Y düzleminde çalıştırarak uygulanır. Sürelerin yanında, luma
+sonucunun tam RGB sonucundan ortalama sapması da yazılır.
+
+Çalıştırma (proje kök dizininden):
+    python benchmarks/luma_benchmark.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from derived_planes import DerivedPlaneCache  # noqa: E402
+from recipe import Recipe  # noqa: E402
+
+WIDTH, HEIGHT = 4000, 3000
+REPEATS = 3
+RECIPES = [
+    "sharpen",
+    "blur",
+    "gaussian_blur:3",
+    "median_filter:5",
+    "sharpness_up",
+    "contrast_up",
+    "gaussian_blur:3,sharpen,sharpness_up",
+    "median_filter:5,gaussian_blur:2,sharpen,contrast_up",
+]
+
+
+def _photo(width, height):
+    """Yumuşak gradyanlar ve gürültüden oluşan fotoğraf benzeri görüntü"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, width)[None, :]
+    y = np.linspace(0, 1, height)[:, None]
+    base = np.stack(np.broadcast_arrays(x * 200 + 30, y * 180 + 40, (1 - x) * 150 + 60), axis=2)
+    noise = rng.normal(0, 12, (height, width, 3))
+    return Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8), "RGB")
+
+
+def _measure(recipe, image):
+    best = float("inf")
+    for _ in range(REPEATS):
+        # Aynı görüntü tekrar işlendiği için önbellekteki düzlemler silinir
+        DerivedPlaneCache.instance().clear()
+        start = time.perf_counter()
+        result = recipe.apply(image)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    image = _photo(WIDTH, HEIGHT)
+    print(f"{WIDTH}x{HEIGHT} RGB, best of {REPEATS}")
+    print(f"{'recipe':<52} | {'rgb':>7} | {'luma':>7} | speedup | mean diff")
+
+    for steps in RECIPES:
+        luma_steps = ",".join(f"{step}:luma" for step in steps.split(","))
+        rgb_seconds, rgb_result = _measure(Recipe(steps), image)
+        luma_seconds, luma_result = _measure(Recipe(luma_steps), image)
+
+        difference = np.abs(
+            np.asarray(rgb_result, dtype=np.int16) - np.asarray(luma_result, dtype=np.int16)
+        ).mean()
+        print(
+            f"{steps:<52} | {rgb_seconds:>6.3f}s | {luma_seconds:>6.3f}s | "
+            f"{rgb_seconds / luma_seconds:>6.2f}x | {difference:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# ======================== shared_memory_benchmark.py ========================
+"""
+Paylaşımlı bellek taşıması ile pickle taşımasının karşılaştırması
+
+Her boyut için bir görüntü işçi process'e gönderilir ve geri alınır
+(gidiş-dönüş). İşçi görüntü üzerinde işlem yapmaz, sadece taşıma
+maliyeti ölçülür.
+
+Çalıştırma (proje kök dizininden):
+    python benchmarks/shared_memory_benchmark.py
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared_memory_transport import (  # noqa: E402
+    SharedFrameTransport,
+    read_array,
+    write_array,
+)
+
+# Megapiksel -> (genişlik, yükseklik)
+SIZES = {
+    1: (1000, 1000),
+    12: (4000, 3000),
+    48: (8000, 6000),
+}
+REPEATS = 5
+
+
+def echo_pickle(array):
+    """Diziyi pickle ile alır ve pickle ile geri gönderir"""
+    return array
+
+
+def echo_shared(descriptor):
+    """Diziyi paylaşımlı bellekten okur ve yeni segmente yazar"""
+    array = read_array(descriptor)
+    segment, result = write_array(array, descriptor.mode)
+    segment.close()
+    return result
+
+
+def _measure(function):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'size':>6} | {'pickle':>10} | {'shared':>10} | speedup")
+
+    with ProcessPoolExecutor(max_workers=1) as pool, SharedFrameTransport() as transport:
+        # İşçiyi ısıt (process başlatma süresi ölçüme girmesin)
+        pool.submit(echo_pickle, None).result()
+
+        for megapixels, (width, height) in SIZES.items():
+            frame = np.random.default_rng(0).integers(
+                0, 256, (height, width, 3), dtype=np.uint8
+            )
+
+            def pickle_round_trip():
+                pool.submit(echo_pickle, frame).result()
+
+            def shared_round_trip():
+                descriptor = transport.put_array(frame, "RGB")
+                output = pool.submit(echo_shared, descriptor).result()
+                transport.release(descriptor)
+                transport.adopt(output)
+                transport.get_array(output)
+
+            pickle_time = _measure(pickle_round_trip)
+            shared_time = _measure(shared_round_trip)
+
+            print(
+                f"{megapixels:>4}MP | {pickle_time * 1000:>8.1f}ms | "
+                f"{shared_time * 1000:>8.1f}ms | {pickle_time / shared_time:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,505 @@
+# ======================== cli.py ========================
+"""
+Komut satırı giriş noktası
+
+GUI dışında (gözetimsiz) çalışan modlar buradan başlatılır:
+    python cli.py batch --recipe blur,sepia --output out/ a.jpg b.png
+    python cli.py batch --journal --job nightly --recipe blur --output out/ *.jpg
+    python cli.py resume nightly
+    python cli.py coordinator --queue /mnt/shared/q --recipe blur --output /mnt/shared/out *.jpg
+    python cli.py worker --queue /mnt/shared/q --processes 4
+    python cli.py video --recipe blur,sepia input.mp4 output.mp4
+    python cli.py watch --recipe blur,sepia --output out/ incoming/
+    python cli.py profile --recipe sepia,canny_edge photo.jpg
+    python cli.py calibrate
+    python cli.py autotune
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+
+from batch_processor import BatchProcessor
+from concurrency import ConcurrencyController
+from config import AppConfig, ConcurrencyConfig
+
+
+def _create_logger(args):
+    """Asenkron AppLogger; işçi process'lerin logları da aynı dosyaya yazılır"""
+    from logger import AppLogger
+
+    if not args.log_file:
+        return None
+
+    return AppLogger(
+        args.log_file, asynchronous=True, json_format=args.log_json,
+        max_per_second=args.log_rate,
+    )
+
+
+def _worker_logging(app_logger):
+    """İşçi process'lerin log kuyruğu ve ayarları (logger yoksa boş)"""
+    if app_logger is None:
+        return {}
+    return {"log_queue": app_logger.worker_queue(), "log_settings": app_logger.worker_settings()}
+
+
+def _run_batch(args):
+    app_logger = _create_logger(args)
+    controller = ConcurrencyController.from_preset(args.preset).apply()
+    processor = BatchProcessor(args.recipe, controller, **_worker_logging(app_logger))
+
+    result_store = _result_store_options(args)
+
+    if args.pipeline:
+        from pipeline import format_stage_stats
+
+        if args.dedup or args.stream or result_store is not None or args.journal is not None:
+            print("--pipeline cannot be combined with --dedup/--stream/--cache/--journal",
+                  file=sys.stderr)
+            return 2
+
+        results, stats = processor.process_pipelined(args.inputs, args.output, args.format)
+        failed = [r for r in results if r["status"] == "failed"]
+        for result in failed:
+            print(f"FAILED {result['input']}: {result['error']}", file=sys.stderr)
+        print(f"{len(results) - len(failed)}/{len(results)} images processed")
+        print(format_stage_stats(stats))
+        return 1 if failed else 0
+
+    if args.journal is not None:
+        from job_journal import JobJournal
+
+        if args.dedup or args.memory_budget is not None:
+            print("--journal cannot be combined with --dedup/--memory-budget", file=sys.stderr)
+            return 2
+
+        job_name = args.job or f"{args.recipe} -> {os.path.abspath(args.output)}"
+        with JobJournal(args.journal or None) as journal:
+            try:
+                processor.process_job(
+                    journal, job_name, args.inputs, args.output, args.format,
+                    retry_failed=args.retry_failed, stream=args.stream,
+                    result_store=result_store,
+                )
+            except ValueError as e:
+                # Aynı isimli iş farklı reçeteyle başlatılmış
+                print(e, file=sys.stderr)
+                return 2
+            return _print_job_summary(journal, journal.get_job(job_name))
+
+    memory_budget = (
+        AppConfig.ADMISSION_BUDGET_MB if args.memory_budget is None else args.memory_budget
+    )
+    results = processor.process_files(
+        args.inputs, args.output, args.format, deduplicate=args.dedup, stream=args.stream,
+        result_store=result_store,
+        memory_budget=memory_budget * 1024 * 1024 if memory_budget else None,
+    )
+
+    failed = [r for r in results if r["status"] == "failed"]
+    for result in failed:
+        print(f"FAILED {result['input']}: {result['error']}", file=sys.stderr)
+
+    duplicates = [r for r in results if r["status"] == "duplicate"]
+    for result in results:
+        for near in result.get("near_duplicates", []):
+            print(f"NEAR-DUPLICATE {result['input']} ~ {near['input']} (distance={near['distance']})")
+
+    print(
+        f"{len(results) - len(failed)}/{len(results)} images processed"
+        f" ({len(duplicates)} exact duplicates reused)"
+    )
+    if result_store is not None:
+        reused = sum(r.get("reused_steps", 0) for r in results)
+        total = len(results) * len(processor.recipe)
+        print(f"Result store: {reused}/{total} steps reused from {result_store['root']}")
+    if processor.admission_stats is not None:
+        stats = processor.admission_stats
+        print(
+            f"Admission: peak {stats['peak_reserved_bytes'] / 1024 ** 2:.0f} MB reserved, "
+            f"{stats['peak_running']} running at most, {stats['backfilled']} backfilled, "
+            f"{stats['oversized']} over budget"
+        )
+    return 1 if failed else 0
+
+
+def _result_store_options(args):
+    """--cache argümanlarından ResultStore ayarları (kullanılmıyorsa None)"""
+    if args.cache is None:
+        return None
+    return {
+        "root": args.cache or AppConfig.RESULT_STORE_DIR,
+        "keep_intermediate": args.cache_intermediate,
+    }
+
+
+def _print_job_summary(journal, job):
+    summary = journal.summary(job["id"])
+    for item in journal.items(job["id"], "failed"):
+        print(f"FAILED {item['input']}: {item['error']}", file=sys.stderr)
+
+    print(
+        f"Job '{job['name']}': {summary['done']}/{summary['total']} done, "
+        f"{summary['failed']} failed, {summary['pending'] + summary['running']} unfinished"
+    )
+    return 0 if summary["done"] == summary["total"] else 1
+
+
+def _run_resume(args):
+    from job_journal import JobJournal
+
+    with JobJournal(args.journal) as journal:
+        job = journal.get_job(args.job)
+        if job is None:
+            print(f"Unknown job: {args.job}", file=sys.stderr)
+            return 2
+
+        if not args.status:
+            app_logger = _create_logger(args)
+            controller = ConcurrencyController.from_preset(args.preset).apply()
+            processor = BatchProcessor(job["recipe"], controller, **_worker_logging(app_logger))
+            # İlk çalıştırmanın --stream / --cache ayarları
+            options = job["options"]
+            processor.process_job(
+                journal, job["name"], [], job["output_dir"], job["output_format"],
+                retry_failed=args.retry_failed, stream=options.get("stream", False),
+                result_store=options.get("result_store"),
+            )
+
+        return _print_job_summary(journal, job)
+
+
+def _run_coordinator(args):
+    from distributed import Coordinator
+
+    coordinator = Coordinator(
+        args.queue, args.recipe, args.output, args.format,
+        batch_size=args.batch_size, lease_seconds=args.lease,
+    )
+    batches = coordinator.submit(args.inputs)
+    print(f"Queued {len(args.inputs)} images in {batches} batches at {args.queue}")
+    if args.no_wait:
+        return 0
+
+    summary = coordinator.wait()
+    for result in summary["failed"]:
+        print(f"FAILED {result['input']}: {result['error']}", file=sys.stderr)
+
+    total = summary["done"] + len(summary["failed"])
+    print(
+        f"{summary['done']}/{total} images processed by {len(summary['workers'])} workers"
+        f" in {summary['seconds']:.1f} s"
+    )
+    return 1 if summary["failed"] else 0
+
+
+def _run_worker(args):
+    import multiprocessing
+    from distributed import run_worker
+
+    exit_when_idle = not args.keep_running
+    if args.processes <= 1:
+        processed = run_worker(args.queue, exit_when_idle=exit_when_idle)
+        print(f"Processed {processed} images")
+        return 0
+
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(args.queue, None, exit_when_idle))
+        for _ in range(args.processes)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return 0 if all(worker.exitcode == 0 for worker in workers) else 1
+
+
+def _run_video(args):
+    from video import VideoProcessor
+
+    app_logger = _create_logger(args)
+    controller = ConcurrencyController.from_preset(args.preset).apply()
+    processor = VideoProcessor(args.recipe, controller, window=args.window, fourcc=args.fourcc)
+
+    def show_progress(frames, total):
+        if frames % 100 == 0:
+            print(f"{frames}/{total or '?'} frames", file=sys.stderr)
+
+    report = processor.process(args.input, args.output, on_progress=show_progress)
+    print(
+        f"{report['frames']} frames in {report['seconds']:.1f} s "
+        f"({report['fps']:.1f} fps, source {report['source_fps']:.2f} fps)"
+    )
+    return 0
+
+
+def _run_watch(args):
+    from watch_folder import WatchFolderDaemon
+
+    app_logger = _create_logger(args)
+    controller = ConcurrencyController.from_preset(args.preset).apply()
+    daemon = WatchFolderDaemon(
+        args.input, args.output, args.recipe, controller, args.format,
+        poll_interval=args.interval, stable_polls=args.stable_polls,
+        **_worker_logging(app_logger),
+    )
+
+    # Ctrl+C / SIGTERM: kuyruktaki işler bitirilip düzgün kapanılır
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: daemon.stop())
+
+    def write_metrics(metrics):
+        if args.metrics_file:
+            temp_path = args.metrics_file + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(metrics, f, indent=1)
+            os.replace(temp_path, args.metrics_file)
+
+    daemon.run(on_poll=write_metrics)
+    return 0
+
+
+def _run_profile(args):
+    from image_manager import ImageManager
+    from profiling import MemoryProfiler
+    from recipe import Recipe
+
+    profiler = MemoryProfiler.instance().start()
+
+    for recipe_text in args.recipe:
+        recipe = Recipe(recipe_text)
+        with profiler.recipe(str(recipe)):
+            for path in args.inputs:
+                # GUI akışı: yükle, her adımı uygula (geçmiş kopyaları dahil)
+                manager = ImageManager()
+                manager.load_image(path)
+                for processor in recipe.processors:
+                    manager.apply_processor(processor)
+
+    print(profiler.format_report())
+    return 0
+
+
+def _run_autotune(args):
+    from autotune import Autotuner
+
+    if args.show:
+        applied = AppConfig.PERFORMANCE_PROFILE_APPLIED
+        print(f"Profile: {AppConfig.PERFORMANCE_PROFILE_FILE}")
+        for name in AppConfig.TUNABLE_SETTINGS:
+            source = applied.get(name, {}).get("source", "default")
+            print(f"  {name:30s} {getattr(AppConfig, name)!s:>12} ({source})")
+        return 0
+
+    tuner = Autotuner(megapixels=1.0 if args.quick else None, repeats=1 if args.quick else None)
+    profile = tuner.run(
+        backends=not args.skip_backends,
+        quick=args.quick,
+        on_step=lambda name: print(f"Measuring {name}...", file=sys.stderr),
+    )
+    path = Autotuner.save(profile, args.output)
+
+    for name, value in sorted(profile["settings"].items()):
+        print(f"  {name:30s} {value}")
+    print(f"Performance profile saved: {path}")
+    return 0
+
+
+def _run_calibrate(args):
+    import backends
+    backends.main()
+    return 0
+
+
+def _add_logging_arguments(parser, default_file=None):
+    parser.add_argument("--log-file", default=default_file, help="Log file")
+    parser.add_argument("--log-json", action="store_true", help="Write JSON lines to the log file")
+    parser.add_argument(
+        "--log-rate", type=float, default=None,
+        help="Max per-image events per second in each process (excess events are counted, "
+             "not written)",
+    )
+
+
+def build_parser():
+    """Alt komutları tanımlar"""
+    parser = argparse.ArgumentParser(description="OOP Image Processing CLI")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="Apply a recipe to many files")
+    batch.add_argument("inputs", nargs="+", help="Input image files")
+    batch.add_argument("--recipe", required=True, help="Comma separated steps, e.g. blur,sepia")
+    batch.add_argument("--output", required=True, help="Output directory")
+    batch.add_argument("--format", default=None, help="Output format (png, jpg...)")
+    batch.add_argument(
+        "--preset", default="throughput", choices=ConcurrencyConfig.PRESETS,
+        help="Concurrency preset",
+    )
+    batch.add_argument(
+        "--dedup", action="store_true",
+        help="Reuse outputs of exact duplicates and report near-duplicates",
+    )
+    batch.add_argument(
+        "--stream", action="store_true",
+        help="Process point-operation recipes in row bands with constant memory "
+             "(.png/.tif/.npy output)",
+    )
+    batch.add_argument(
+        "--cache", nargs="?", const="", default=None, metavar="DIR",
+        help="Reuse results of unchanged inputs / recipe prefixes from a "
+             "content-addressed store (default dir: ~/.oop_image_processing/results)",
+    )
+    batch.add_argument(
+        "--cache-intermediate", action="store_true",
+        help="Also store the result of every recipe step",
+    )
+    batch.add_argument(
+        "--journal", nargs="?", const="", default=None, metavar="DB",
+        help="Record per-file progress in a SQLite job journal so the job can be "
+             "resumed (default: ~/.oop_image_processing/jobs.sqlite3)",
+    )
+    batch.add_argument("--job", default=None, help="Job name in the journal")
+    batch.add_argument(
+        "--memory-budget", type=int, default=None, metavar="MB",
+        help="Only start files whose estimated peak memory fits in this budget; "
+             "small files backfill around large ones (default: ADMISSION_BUDGET_MB, "
+             "0: off; not combined with --journal)",
+    )
+    batch.add_argument(
+        "--pipeline", action="store_true",
+        help="Overlap decode, compute and encode in separate pools and report "
+             "per-stage utilisation (not combined with --dedup/--stream/--cache/--journal)",
+    )
+    batch.add_argument(
+        "--retry-failed", action="store_true",
+        help="With --journal: also retry files that failed in an earlier run",
+    )
+    _add_logging_arguments(batch)
+    batch.set_defaults(handler=_run_batch)
+
+    resume = commands.add_parser("resume", help="Continue an interrupted journaled batch job")
+    resume.add_argument("job", help="Job name")
+    resume.add_argument("--journal", default=None, help="Job journal database")
+    resume.add_argument("--retry-failed", action="store_true", help="Also retry failed files")
+    resume.add_argument("--status", action="store_true", help="Only print the job status")
+    resume.add_argument(
+        "--preset", default="throughput", choices=ConcurrencyConfig.PRESETS,
+        help="Concurrency preset",
+    )
+    _add_logging_arguments(resume)
+    resume.set_defaults(handler=_run_resume)
+
+    coordinator = commands.add_parser(
+        "coordinator", help="Queue files for workers sharing a filesystem"
+    )
+    coordinator.add_argument("inputs", nargs="+", help="Input image files")
+    coordinator.add_argument("--queue", required=True, help="Queue directory on the shared filesystem")
+    coordinator.add_argument("--recipe", required=True, help="Comma separated steps, e.g. blur,sepia")
+    coordinator.add_argument("--output", required=True, help="Output directory")
+    coordinator.add_argument("--format", default=None, help="Output format (png, jpg...)")
+    coordinator.add_argument(
+        "--batch-size", type=int, default=AppConfig.DISTRIBUTED_BATCH_SIZE,
+        help="Images per queued batch",
+    )
+    coordinator.add_argument(
+        "--lease", type=float, default=AppConfig.DISTRIBUTED_LEASE_SECONDS,
+        help="Seconds without a heartbeat before a batch is re-queued",
+    )
+    coordinator.add_argument(
+        "--no-wait", action="store_true", help="Only queue the batches, do not wait",
+    )
+    coordinator.set_defaults(handler=_run_coordinator)
+
+    worker = commands.add_parser("worker", help="Process batches from a shared queue")
+    worker.add_argument("--queue", required=True, help="Queue directory on the shared filesystem")
+    worker.add_argument(
+        "--processes", type=int, default=1, help="Worker processes to start on this host",
+    )
+    worker.add_argument(
+        "--keep-running", action="store_true",
+        help="Keep polling when the queue is empty instead of exiting",
+    )
+    worker.set_defaults(handler=_run_worker)
+
+    video = commands.add_parser("video", help="Apply a recipe to every frame of a video")
+    video.add_argument("input", help="Input video file")
+    video.add_argument("output", help="Output video file")
+    video.add_argument("--recipe", required=True, help="Comma separated steps, e.g. blur,sepia")
+    video.add_argument(
+        "--preset", default="throughput", choices=ConcurrencyConfig.PRESETS,
+        help="Concurrency preset",
+    )
+    video.add_argument(
+        "--window", type=int, default=None,
+        help="Frames kept in the reorder buffer (default: workers x VIDEO_FRAMES_PER_WORKER)",
+    )
+    video.add_argument(
+        "--fourcc", default=AppConfig.VIDEO_FOURCC, help="Output codec, e.g. mp4v, MJPG, XVID",
+    )
+    _add_logging_arguments(video)
+    video.set_defaults(handler=_run_video)
+
+    watch = commands.add_parser("watch", help="Process new files dropped into a folder")
+    watch.add_argument("input", help="Folder to watch")
+    watch.add_argument("--recipe", required=True, help="Comma separated steps, e.g. blur,sepia")
+    watch.add_argument("--output", required=True, help="Output directory")
+    watch.add_argument("--format", default=None, help="Output format (png, jpg...)")
+    watch.add_argument(
+        "--preset", default="throughput", choices=ConcurrencyConfig.PRESETS,
+        help="Concurrency preset",
+    )
+    watch.add_argument(
+        "--interval", type=float, default=AppConfig.WATCH_POLL_SECONDS,
+        help="Seconds between folder scans",
+    )
+    watch.add_argument(
+        "--stable-polls", type=int, default=AppConfig.WATCH_STABLE_POLLS,
+        help="Scans a file size must stay unchanged before processing",
+    )
+    watch.add_argument("--metrics-file", default=None, help="Write queue/latency metrics JSON here")
+    _add_logging_arguments(watch, default_file="image_processing.log")
+    watch.set_defaults(handler=_run_watch)
+
+    profile = commands.add_parser(
+        "profile", help="Report peak memory per processor for one or more recipes"
+    )
+    profile.add_argument("inputs", nargs="+", help="Input image files")
+    profile.add_argument(
+        "--recipe", required=True, action="append",
+        help="Comma separated steps; repeat to compare recipes",
+    )
+    profile.set_defaults(handler=_run_profile)
+
+    calibrate = commands.add_parser("calibrate", help="Re-run backend calibration")
+    calibrate.set_defaults(handler=_run_calibrate)
+
+    autotune = commands.add_parser(
+        "autotune", help="Benchmark this machine and save a performance profile"
+    )
+    autotune.add_argument(
+        "--output", default=None,
+        help="Profile file (default: IMAGEPROC_PERFORMANCE_PROFILE or "
+             "~/.oop_image_processing/performance_profile.json)",
+    )
+    autotune.add_argument("--quick", action="store_true", help="Smaller samples, one repeat")
+    autotune.add_argument(
+        "--skip-backends", action="store_true", help="Keep the current backend calibration",
+    )
+    autotune.add_argument(
+        "--show", action="store_true", help="Print the effective settings and their source",
+    )
+    autotune.set_defaults(handler=_run_autotune)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
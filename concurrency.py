@@ -0,0 +1,142 @@
+# ======================== concurrency.py ========================
+"""
+Eşzamanlılık (concurrency) kontrolü
+
+CannyEdgeFilter / MedianFilter gibi OpenCV çağrıları kendi thread havuzunu,
+SepiaFilter'daki dot çarpımı ise çok thread'li BLAS kütüphanesini kullanabilir.
+Üzerine bir de process havuzu eklenince makine aşırı yüklenir.
+
+Bu dosya:
+- OpenCV ve BLAS thread sınırlarını tek noktadan ayarlamayı
+- ayarları her işçi process başlarken uygulamayı
+- ConcurrencyConfig ile uyumlu process / thread havuzları oluşturmayı
+sağlar.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+
+from config import ConcurrencyConfig
+
+
+# BLAS / OpenMP kütüphanelerinin okuduğu ortam değişkenleri.
+# Kütüphane yüklenmeden önce ayarlanırsa etkili olurlar.
+BLAS_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def apply_thread_limits(settings: dict):
+    """
+    Verilen ayarları içinde bulunulan process'e uygular.
+
+    settings, ConcurrencyConfig.as_dict() çıktısıdır (process havuzuna
+    initializer argümanı olarak pickle edilebilmesi için sözlük kullanılır).
+    """
+    blas_threads = str(settings["blas_threads"])
+    for name in BLAS_THREAD_ENV_VARS:
+        os.environ[name] = blas_threads
+
+    # cv2 burada import edilir ki ortam değişkenleri numpy / BLAS
+    # yüklenmeden önce ayarlanmış olsun (spawn ile başlayan işçiler)
+    import cv2
+    cv2.setNumThreads(settings["opencv_threads"])
+
+    # threadpoolctl opsiyoneldir; kuruluysa zaten yüklenmiş BLAS
+    # kütüphanelerinin thread sayısı da çalışma anında sınırlanır
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+
+    threadpool_limits(limits=settings["blas_threads"])
+
+
+def worker_initializer(settings: dict, extra_initializer=None, extra_args=()):
+    """
+    Process havuzundaki her işçi başlarken çağrılır.
+
+    extra_initializer: İşçiye özel ek kurulum (örn: log yönlendirme)
+    """
+    apply_thread_limits(settings)
+
+    if extra_initializer is not None:
+        extra_initializer(*extra_args)
+
+
+class ConcurrencyController:
+    """
+    ConcurrencyConfig'i uygulayan ve ona uygun havuzlar üreten sınıf.
+
+    Kullanım:
+        controller = ConcurrencyController.from_preset("throughput")
+        controller.apply()
+        with controller.process_pool() as pool:
+            ...
+    """
+
+    _active = None
+
+    def __init__(self, config: ConcurrencyConfig = None):
+        self.config = config or ConcurrencyConfig.from_preset()
+
+    @classmethod
+    def from_preset(cls, name: str = None):
+        """Hazır profile göre controller oluşturur"""
+        return cls(ConcurrencyConfig.from_preset(name))
+
+    @classmethod
+    def active(cls):
+        """En son apply() edilen controller (yoksa varsayılan profil)"""
+        if cls._active is None:
+            cls._active = cls()
+        return cls._active
+
+    def apply(self):
+        """
+        Ayarları mevcut (koordinatör) process'e uygular.
+
+        Koordinatör process, işçi havuzu varken kendisi hesaplama yapmadığı
+        için process sayısı > 1 ise tek thread'e sınırlanır.
+        """
+        settings = self.config.as_dict()
+        if self.config.worker_processes > 1:
+            settings["opencv_threads"] = 1
+            settings["blas_threads"] = 1
+
+        apply_thread_limits(settings)
+        ConcurrencyController._active = self
+        return self
+
+    def process_pool(self, max_workers: int = None, initializer=None, initargs=()):
+        """
+        Her işçisi thread sınırlarını başlarken uygulayan process havuzu döner.
+
+        Parametreler:
+            max_workers (int): Varsayılan olarak config.worker_processes
+            initializer: İşçiye özel ek başlangıç fonksiyonu
+        """
+        # İşçiler koordinatörün resource tracker'ını paylaşsın
+        # (paylaşımlı bellek segmentlerinin ömrü tek yerden takip edilir)
+        resource_tracker.ensure_running()
+
+        return ProcessPoolExecutor(
+            max_workers=max_workers or self.config.worker_processes,
+            initializer=worker_initializer,
+            initargs=(self.config.as_dict(), initializer, initargs),
+        )
+
+    def io_pool(self, max_workers: int = None):
+        """Dosya okuma / yazma işleri için thread havuzu"""
+        return ThreadPoolExecutor(
+            max_workers=max_workers or self.config.io_threads,
+            thread_name_prefix="imageproc-io",
+        )
+
+    def __repr__(self):
+        return f"ConcurrencyController({self.config!r})"
@@ -8,6 +8,10 @@ Bu dosyanın ayrı tutulma amacı:
 - Uygulamanın kolayca yapılandırılabilir olmasını sağlamak
 """
 
+import json
+import logging
+import os
+
 
 class AppConfig:
     """
@@ -35,13 +39,212 @@ class AppConfig:
     MAX_DISPLAY_WIDTH = 480
     MAX_DISPLAY_HEIGHT = 380
     DEFAULT_IMAGE_FORMAT = "PNG"
+    # Ekran boyutuna küçültülmüş bitmap önbelleğinin kayıt sayısı
+    DISPLAY_CACHE_ENTRIES = 8
+    # Pencere yeniden boyutlanırken yeniden çizim için bekleme süresi (ms)
+    DISPLAY_RESIZE_DEBOUNCE_MS = 120
 
     # ===================== Filtre Parametreleri =====================
     # Bu değerler filtre sınıfları tarafından kullanılır
     GAUSSIAN_BLUR_RADIUS = 2
+    # Bu yarıçaptan itibaren Gaussian blur kutu geçişleriyle (sabit süreli)
+    # hesaplanır (bkz. FastGaussianBlurFilter)
+    FAST_GAUSSIAN_MIN_RADIUS = 10
+    # Kutu geçişi sayısı (doğruluk seviyesi): 3 PIL ile aynı, 4-5 daha doğru
+    FAST_GAUSSIAN_PASSES = 3
     MEDIAN_FILTER_KERNEL = 5
     SOLARIZE_THRESHOLD = 128
 
+    # ===================== Önbellek / Çalışma Dizini =====================
+    # Kalibrasyon sonuçları gibi diske yazılan yardımcı dosyaların dizini
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".oop_image_processing")
+
+    # ===================== Performans Profili =====================
+    # Makineye göre ölçülmüş ayarlar (bkz. autotune.py). config.py import
+    # edilirken yüklenir; böylece GUI, CLI ve işçi process'lerin hepsi aynı
+    # değerlerle çalışır. Her ayar IMAGEPROC_<AYAR> ortam değişkeniyle
+    # ezilebilir (örn: IMAGEPROC_STREAM_BAND_ROWS=512).
+    PERFORMANCE_PROFILE_FILE = os.environ.get("IMAGEPROC_PERFORMANCE_PROFILE") or os.path.join(
+        CACHE_DIR, "performance_profile.json"
+    )
+    # Profil ve ortam değişkenleriyle ayarlanabilen sabitler
+    TUNABLE_SETTINGS = (
+        "PARALLEL_THREADS",
+        "PARALLEL_MIN_PIXELS",
+        "PARALLEL_BANDS_PER_THREAD",
+        "STREAM_BAND_ROWS",
+        "THROUGHPUT_WORKER_PROCESSES",
+        "IO_THREADS",
+        "PIPELINE_QUEUE_SIZE",
+        "DISPLAY_CACHE_ENTRIES",
+        "MEMORY_BUDGET_MB",
+        "DERIVED_PLANE_CACHE_MB",
+        "ADMISSION_BUDGET_MB",
+        "RESULT_STORE_MAX_MB",
+    )
+    # Yüklenen değerler ve kaynakları ("profile" / "env"); bkz. apply_performance_profile
+    PERFORMANCE_PROFILE_APPLIED = {}
+    # Ölçüm görüntülerinin boyutu ve tekrar sayısı
+    AUTOTUNE_MEGAPIXELS = 4.0
+    AUTOTUNE_REPEATS = 3
+    # --quick: backend kalibrasyonu sadece bu boyut sınıflarında, tek tekrarla
+    AUTOTUNE_QUICK_CALIBRATION_SIZES = ["small", "medium"]
+    # Sonuç deposu en fazla boş diskin %10'u, en fazla bu kadar olur
+    AUTOTUNE_MAX_STORE_MB = 20480
+
+    # ===================== Backend Seçimi =====================
+    # Filtreler birden fazla kütüphane (PIL / OpenCV / NumPy) ile
+    # çalışabilir. En hızlısı kalibrasyon sonucuna göre seçilir.
+    BACKEND_CALIBRATION_FILE = os.path.join(CACHE_DIR, "backend_calibration.json")
+
+    # Debug amaçlı tüm filtreler için backend zorlamak (örn: "opencv")
+    # Ortam değişkeni ile de verilebilir: IMAGEPROC_BACKEND=pil
+    FORCED_BACKEND = None
+    FORCED_BACKEND_ENV = "IMAGEPROC_BACKEND"
+
+    # Boyut sınıfları: (isim, üst sınır megapiksel)
+    BACKEND_SIZE_CLASSES = [
+        ("small", 0.25),
+        ("medium", 2.0),
+        ("large", 12.0),
+        ("huge", float("inf")),
+    ]
+
+    # Kalibrasyonda her boyut sınıfı için kullanılan örnek çözünürlük
+    BACKEND_CALIBRATION_SIZES = {
+        "small": (320, 240),
+        "medium": (1280, 960),
+        "large": (3000, 2000),
+    }
+    BACKEND_CALIBRATION_MODES = ["L", "RGB", "RGBA"]
+    BACKEND_CALIBRATION_REPEATS = 3
+
+    # Median filtrede backend'lerin sıralaması kernel boyutuna bağlıdır.
+    # Kernel sınıfları: (isim, en büyük kernel); her sınıf için kalibrasyonda
+    # sınıfın üst sınırındaki kernel ölçülür (son sınıf için 31).
+    MEDIAN_KERNEL_CLASSES = [
+        ("k5", 5),
+        ("k15", 15),
+        ("k31+", 31),
+    ]
+
+    # ===================== Arka Plan İşleri =====================
+    # GUI işlemleri Tk thread'i dışında JobScheduler ile çalıştırılır.
+    # İşçilerden biri her zaman önizleme (interactive) işlerine ayrılır.
+    SCHEDULER_WORKERS = 2
+    # Tk thread'inin biten işleri kontrol etme aralığı (ms)
+    SCHEDULER_POLL_MS = 20
+
+    # ===================== Tekrar Eden Girdiler (Dedup) =====================
+    # Algısal hash yöntemi: "ahash", "dhash" veya "phash"
+    DEDUP_HASH_METHOD = "phash"
+    # Hash için görüntü bu boyuta küçültülerek decode edilir
+    DEDUP_DECODE_SIZE = 128
+    # 64 bitlik hash'ler arasında bu mesafe ve altı "yakın tekrar" sayılır
+    DEDUP_NEAR_DISTANCE = 8
+
+    # ===================== Klasör İzleme (Watch Folder) =====================
+    # Klasörün taranma aralığı (saniye)
+    WATCH_POLL_SECONDS = 2.0
+    # Dosya boyutu bu kadar tarama boyunca değişmezse yazılması bitmiş sayılır
+    WATCH_STABLE_POLLS = 2
+
+    # ===================== Akış (Streaming) =====================
+    # Nokta işlemlerinde dosya bu kadar satırlık bantlarla okunup yazılır
+    STREAM_BAND_ROWS = 256
+    # Akış ile yazılan PNG'lerin zlib sıkıştırma seviyesi (0-9)
+    STREAM_PNG_COMPRESSION = 6
+
+    # ===================== Eşzamanlılık =====================
+    # "throughput" profilindeki işçi process sayısı (0: çekirdek sayısı)
+    THROUGHPUT_WORKER_PROCESSES = 0
+    # Okuma / yazma thread'leri (tüm eşzamanlılık profilleri)
+    IO_THREADS = 2
+
+    # ===================== Bant Paralelliği =====================
+    # Tek bir büyük görüntü yatay bantlara bölünüp thread havuzunda işlenir
+    # (bkz. parallel.py). Thread sayısı 0 ise cv2.getNumThreads() kullanılır;
+    # böylece "throughput" profilindeki tek thread'li işçiler bölmez.
+    PARALLEL_THREADS = 0
+    # Bundan küçük görüntüler bölünmez (thread maliyeti kazançtan büyük)
+    PARALLEL_MIN_PIXELS = 2_000_000
+    # Yük dengesi için thread başına bant sayısı
+    PARALLEL_BANDS_PER_THREAD = 2
+
+    # ===================== Sonuç Deposu =====================
+    # Reçete sonuçları girdi içeriği + zincir önekinin özetiyle diske
+    # yazılır; tekrar çalıştırmada en uzun hazır önek kullanılır
+    # (bkz. result_store.py)
+    RESULT_STORE_DIR = os.path.join(CACHE_DIR, "results")
+    RESULT_STORE_MAX_MB = 2048
+    # Ara adımların sonuçları da saklansın mı (tek adımı değişen
+    # reçetelerde önceki adımlar tekrar hesaplanmaz)
+    RESULT_STORE_INTERMEDIATE = False
+    # "raw": sıkıştırmasız, en hızlı; "png": kayıpsız, daha küçük
+    RESULT_STORE_FORMAT = "raw"
+
+    # ===================== İş Günlüğü =====================
+    # Toplu işlerin girdi bazında ilerlemesi SQLite'ta tutulur; çöken iş
+    # kaldığı yerden devam ettirilebilir (bkz. job_journal.py)
+    JOURNAL_FILE = os.path.join(CACHE_DIR, "jobs.sqlite3")
+    # Sonuçlar bu kadar birikince veya bu kadar saniye geçince yazılır
+    JOURNAL_BATCH_SIZE = 500
+    JOURNAL_FLUSH_SECONDS = 1.0
+
+    # ===================== İş Kabulü =====================
+    # Aynı anda çalışan toplu işlerin tahmini toplam görüntü belleği
+    # (bkz. admission.py). 0: kabul kontrolü kapalı, işçi sayısı kadar iş
+    # aynı anda çalışır
+    ADMISSION_BUDGET_MB = 0
+    # Sıradaki büyük iş, arkasındaki küçük işlere en fazla bu kadar kez
+    # yol verir; sonra bellek boşalana kadar yeni iş başlatılmaz
+    ADMISSION_MAX_BYPASS = 16
+
+    # ===================== Boru Hattı (Pipeline) =====================
+    # decode → compute → encode aşamaları arasındaki kuyruk kapasitesi
+    # (bkz. pipeline.py); bellekte aynı anda bekleyen kare sayısını sınırlar
+    PIPELINE_QUEUE_SIZE = 8
+    # 0: ConcurrencyConfig.io_threads kullanılır
+    PIPELINE_DECODE_THREADS = 0
+    PIPELINE_ENCODE_THREADS = 0
+
+    # ===================== Video =====================
+    # Sıralama tamponunda işçi başına bekleyen kare sayısı (bkz. video.py);
+    # bellekte aynı anda en fazla işçi sayısı x bu değer kadar kare bulunur
+    VIDEO_FRAMES_PER_WORKER = 4
+    # Çıktı codec'i (cv2.VideoWriter_fourcc)
+    VIDEO_FOURCC = "mp4v"
+    # Kaynak dosya kare hızını bildirmiyorsa kullanılır
+    VIDEO_DEFAULT_FPS = 25.0
+
+    # ===================== Dağıtık İşleme =====================
+    # Paylaşılan dosya sistemindeki kuyruk (bkz. distributed.py).
+    # Parti başına girdi sayısı: küçük partiler yükü daha iyi dağıtır,
+    # büyük partiler kuyruk dizinindeki dosya işlemlerini azaltır
+    DISTRIBUTED_BATCH_SIZE = 8
+    # İşçi bu kadar saniye kirayı tazelemezse partisi kuyruğa geri konur
+    DISTRIBUTED_LEASE_SECONDS = 120
+    # İşçi görüntü işlerken kirayı bir kira süresinde bu kadar kez tazeler
+    # (arka plan thread'i); tek bir görüntü kira süresinden uzun sürebilir
+    DISTRIBUTED_HEARTBEATS_PER_LEASE = 4
+    # Boş kuyrukta / ilerleme takibinde bekleme aralığı
+    DISTRIBUTED_POLL_SECONDS = 0.5
+
+    # ===================== Bellek Bütçesi =====================
+    # Görüntü tamponlarının (geçmiş, önbellekler...) bellekte tutulabileceği
+    # toplam boyut. Aşılınca en eski kullanılan tamponlar diske taşınır.
+    MEMORY_BUDGET_MB = 1024
+    # Diske taşınan tamponların ham (raw) olarak yazıldığı dizin
+    MEMORY_SCRATCH_DIR = os.path.join(CACHE_DIR, "scratch")
+    # Türetilmiş düzlem önbelleğinin (parlaklık, histogram, YCbCr...)
+    # üst sınırı (bkz. derived_planes.py); aşılınca eski düzlemler silinir
+    DERIVED_PLANE_CACHE_MB = 256
+
+    # ===================== Bellek Profili =====================
+    # Açıkken her process() çağrısı ve ImageManager işlemi için tepe bellek
+    # ayırması (tracemalloc) ve RSS farkı kaydedilir (bkz. profiling.py)
+    PROFILE_MEMORY = os.environ.get("IMAGEPROC_PROFILE_MEMORY") == "1"
+
     # ===================== Enhancement Parametreleri =====================
     # Factor değerleri ImageEnhancement sınıflarında kullanılır
     BRIGHTNESS_INCREASE_FACTOR = 1.3
@@ -73,6 +276,18 @@ class AppConfig:
         ("TIFF", "*.tiff"),
     ]
 
+    # Kaydederken çıktı modu politikası:
+    #   "auto": mod korunur, format desteklemiyorsa en yakın moda çevrilir
+    #   "keep": mod hiç değiştirilmez
+    #   "rgb":  her zaman RGB olarak kaydedilir (eski davranış)
+    SAVE_OUTPUT_MODE = "auto"
+    SAVE_OUTPUT_MODES = ("auto", "keep", "rgb")
+    # Formatların yazabildiği modlar (listede olmayan format tüm modları yazar)
+    SAVE_FORMAT_MODES = {
+        "JPEG": ("L", "RGB", "CMYK"),
+        "BMP": ("1", "L", "P", "RGB"),
+    }
+
     # ===================== UI Metinleri =====================
     TITLE_TEXT = "OOP Image Processing Application"
     ORIGINAL_LABEL = "Original Image"
@@ -88,3 +303,136 @@ class AppConfig:
     STATUS_IMAGE_SAVED = "Image saved: {}"
     STATUS_IMAGE_RESET = "Image reset"
     STATUS_ERROR = "Error: {}"
+
+
+class ConcurrencyConfig:
+    """
+    OpenCV thread'leri, BLAS thread'leri ve işçi (worker) havuzlarının
+    birlikte ayarlandığı eşzamanlılık yapılandırması.
+
+    Amaç: process havuzu * process başına thread sayısı, çekirdek
+    sayısını aşmasın (oversubscription olmasın).
+
+    Hazır profiller:
+    - "latency"    : tek görüntü, tek process, tüm thread'ler
+    - "throughput" : çok görüntü, çekirdek başına bir process, process başına tek thread
+    - "balanced"   : ikisinin arası
+    """
+
+    PRESET_ENV = "IMAGEPROC_CONCURRENCY"
+    DEFAULT_PRESET = "latency"
+    PRESETS = ("latency", "throughput", "balanced")
+
+    def __init__(
+        self,
+        worker_processes: int = 1,
+        opencv_threads: int = 1,
+        blas_threads: int = 1,
+        io_threads: int = 2,
+        name: str = "custom",
+    ):
+        """
+        Parametreler:
+            worker_processes (int): Process havuzundaki işçi sayısı
+            opencv_threads (int): Her process'te cv2.setNumThreads değeri
+            blas_threads (int): Her process'te BLAS / OpenMP thread sınırı
+            io_threads (int): Okuma / yazma için thread sayısı
+        """
+        self.name = name
+        self.worker_processes = max(1, worker_processes)
+        self.opencv_threads = max(1, opencv_threads)
+        self.blas_threads = max(1, blas_threads)
+        self.io_threads = max(1, io_threads)
+
+    @classmethod
+    def from_preset(cls, name: str = None, cpu_count: int = None):
+        """Hazır profilden (veya IMAGEPROC_CONCURRENCY değişkeninden) yapılandırma üretir"""
+        name = (name or os.environ.get(cls.PRESET_ENV) or cls.DEFAULT_PRESET).lower()
+        # Ölçülmüş işçi sayısı sadece çekirdek sayısı verilmediğinde kullanılır
+        tuned_workers = None if cpu_count else AppConfig.THROUGHPUT_WORKER_PROCESSES
+        cores = cpu_count or os.cpu_count() or 1
+        io_threads = AppConfig.IO_THREADS
+
+        if name == "latency":
+            return cls(1, cores, cores, io_threads, name)
+
+        if name == "throughput":
+            return cls(tuned_workers or cores, 1, 1, io_threads, name)
+
+        if name == "balanced":
+            processes = max(1, cores // 2)
+            threads = max(1, cores // processes)
+            return cls(processes, threads, threads, io_threads, name)
+
+        raise ValueError(f"Unknown concurrency preset: {name}")
+
+    @property
+    def threads_per_worker(self) -> int:
+        """Bir işçinin aynı anda kullanabileceği en fazla hesaplama thread'i"""
+        return max(self.opencv_threads, self.blas_threads)
+
+    def as_dict(self) -> dict:
+        """İşçi process'lere aktarmak için (pickle edilebilir) sözlük"""
+        return {
+            "name": self.name,
+            "worker_processes": self.worker_processes,
+            "opencv_threads": self.opencv_threads,
+            "blas_threads": self.blas_threads,
+            "io_threads": self.io_threads,
+        }
+
+    def __repr__(self):
+        return (
+            f"ConcurrencyConfig({self.name}: processes={self.worker_processes}, "
+            f"opencv={self.opencv_threads}, blas={self.blas_threads}, "
+            f"io={self.io_threads})"
+        )
+
+
+def apply_performance_profile(path: str = None) -> dict:
+    """
+    Performans profilini (bkz. autotune.py) AppConfig'e uygular.
+
+    Öncelik: ortam değişkeni (IMAGEPROC_<AYAR>) > profil dosyası >
+    AppConfig'teki varsayılan. Dosya yoksa veya bozuksa sadece ortam
+    değişkenleri uygulanır. Tipine çevrilemeyen değer (örn:
+    IMAGEPROC_IO_THREADS=abc) uyarı ile atlanır, varsayılan korunur.
+
+    Dönüş:
+        dict: ayar -> {"value": ..., "source": "profile" | "env"}
+    """
+    path = path or AppConfig.PERFORMANCE_PROFILE_FILE
+    try:
+        with open(path, encoding="utf-8") as f:
+            settings = json.load(f).get("settings", {})
+    except (OSError, ValueError, AttributeError):
+        settings = {}
+
+    applied = {}
+    for name in AppConfig.TUNABLE_SETTINGS:
+        default = getattr(AppConfig, name)
+        env_value = os.environ.get(f"IMAGEPROC_{name}")
+
+        if env_value is not None:
+            raw, source = env_value, "env"
+        elif name in settings:
+            raw, source = settings[name], "profile"
+        else:
+            continue
+
+        try:
+            value = type(default)(raw)
+        except (TypeError, ValueError):
+            logging.getLogger("ImageProcessingApp.config").warning(
+                "Ignoring invalid %s value for %s: %r (keeping %r)", source, name, raw, default
+            )
+            continue
+
+        setattr(AppConfig, name, value)
+        applied[name] = {"value": value, "source": source}
+
+    AppConfig.PERFORMANCE_PROFILE_APPLIED = applied
+    return applied
+
+
+apply_performance_profile()
@@ -0,0 +1,247 @@
+# ======================== dedup.py ========================
+"""
+Algısal hash (perceptual hash) ile tekrar eden girdilerin tespiti
+
+Gelen görüntülerin bir kısmı birebir aynı (yeniden yükleme) veya
+neredeyse aynıdır (yeniden boyutlandırılmış kopya). Bunların her biri
+reçetenin tamamından geçmek zorunda değildir.
+
+Bu dosya:
+- küçültülmüş (reduced) decode üzerinden aHash / dHash / pHash hesaplamayı
+- hash'leri Hamming mesafesi ile hızlı sorgulanan bir indekste tutmayı
+- dosyanın birebir aynısını (byte düzeyinde) tespit etmeyi
+sağlar.
+"""
+
+import hashlib
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from config import AppConfig
+
+
+# 0-255 arası her byte'taki 1 bit sayısı (np.bitwise_count olmayan
+# NumPy sürümleri için)
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount64(values: np.ndarray) -> np.ndarray:
+    """uint64 dizisindeki her elemanın 1 bit sayısını vektörel olarak hesaplar"""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+
+    as_bytes = values.view(np.uint8).reshape(-1, 8)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=1)
+
+
+def _pack_bits(bits: np.ndarray) -> np.ndarray:
+    """(N, 64) bool dizisini N adet uint64 hash'e çevirir"""
+    packed = np.packbits(bits.reshape(len(bits), -1), axis=1)
+    return packed.view(">u8").astype(np.uint64).ravel()
+
+
+class PerceptualHasher:
+    """
+    aHash, dHash ve pHash hesaplayan sınıf.
+
+    Hash'ler toplu (N görüntü birden) hesaplanabilir; tüm işlemler
+    NumPy üzerinde vektöreldir.
+    """
+
+    METHODS = ("ahash", "dhash", "phash")
+
+    # 8x8 = 64 bit; hash tek bir uint64 içinde tutulur
+    HASH_SIZE = 8
+
+    def __init__(self, method: str = AppConfig.DEDUP_HASH_METHOD):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown hash method: {method}")
+        self.method = method
+
+    # ------------------------------------------------------------------
+    # Görüntü hazırlama
+    # ------------------------------------------------------------------
+    @staticmethod
+    def load_reduced(file_path: str, size: int = AppConfig.DEDUP_DECODE_SIZE):
+        """
+        Görüntüyü küçültülmüş olarak açar ve gri tonlamaya çevirir.
+
+        JPEG için draft() decode aşamasında 1/2, 1/4, 1/8 ölçekleme yapar;
+        tam çözünürlükte decode edilmez.
+        """
+        with Image.open(file_path) as image:
+            image.draft("L", (size, size))
+            image = image.convert("L")
+            image.thumbnail((size, size), Image.Resampling.BOX, reducing_gap=2.0)
+            return image
+
+    def _grid_shape(self):
+        """Yöntem için gereken gri ızgara boyutu (yükseklik, genişlik)"""
+        if self.method == "dhash":
+            return self.HASH_SIZE, self.HASH_SIZE + 1
+        if self.method == "phash":
+            return self.HASH_SIZE * 4, self.HASH_SIZE * 4
+        return self.HASH_SIZE, self.HASH_SIZE
+
+    def prepare(self, image: Image.Image) -> np.ndarray:
+        """Görüntüyü hash ızgarasına küçültür (float32 dizi)"""
+        height, width = self._grid_shape()
+        gray = image if image.mode == "L" else image.convert("L")
+        small = gray.resize((width, height), Image.Resampling.BOX)
+        return np.asarray(small, dtype=np.float32)
+
+    # ------------------------------------------------------------------
+    # Hash hesaplama
+    # ------------------------------------------------------------------
+    def hash_grids(self, grids: np.ndarray) -> np.ndarray:
+        """
+        (N, yükseklik, genişlik) ızgaralardan N adet uint64 hash üretir.
+        """
+        grids = np.asarray(grids, dtype=np.float32)
+
+        if self.method == "ahash":
+            mean = grids.mean(axis=(1, 2), keepdims=True)
+            bits = grids > mean
+
+        elif self.method == "dhash":
+            bits = grids[:, :, 1:] > grids[:, :, :-1]
+
+        else:
+            n = self.HASH_SIZE
+            low = np.stack([cv2.dct(grid)[:n, :n] for grid in grids])
+            flat = low.reshape(len(low), -1)
+            # DC bileşeni (ortalama parlaklık) medyana katılmaz
+            median = np.median(flat[:, 1:], axis=1, keepdims=True)
+            bits = flat > median
+
+        return _pack_bits(bits)
+
+    def hash_image(self, image: Image.Image) -> int:
+        """Tek bir PIL görüntüsünün hash'i"""
+        return int(self.hash_grids(self.prepare(image)[None])[0])
+
+    def hash_images(self, images) -> np.ndarray:
+        """Birden fazla görüntünün hash'lerini tek seferde hesaplar"""
+        grids = np.stack([self.prepare(image) for image in images])
+        return self.hash_grids(grids)
+
+    def hash_file(self, file_path: str) -> int:
+        """Dosyayı küçültülmüş decode ile açarak hash'ini hesaplar"""
+        return self.hash_image(self.load_reduced(file_path))
+
+
+def sha256_file(file_path: str) -> str:
+    """Dosya içeriğinin sha256 özeti (parça parça okunur)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint_file(file_path: str, method: str = AppConfig.DEDUP_HASH_METHOD) -> dict:
+    """
+    Dosyanın birebir (sha256) ve algısal (pHash vb.) parmak izi.
+
+    Process havuzunda çalıştırılabilmesi için modül seviyesinde tanımlıdır.
+    Okunamayan dosyada iki iz de None döner; dosya tekrar sayılmaz ve
+    işlenirken "failed" olarak raporlanır.
+    """
+    try:
+        digest = sha256_file(file_path)
+    except OSError:
+        return {"path": file_path, "sha256": None, "phash": None}
+
+    try:
+        perceptual = PerceptualHasher(method).hash_file(file_path)
+    except Exception:
+        # Açılamayan dosya yine de işlenir (hata orada raporlanır)
+        perceptual = None
+
+    return {"path": file_path, "sha256": digest, "phash": perceptual}
+
+
+class HashIndex:
+    """
+    Hash'leri Hamming mesafesiyle sorgulanabilir şekilde tutan indeks.
+
+    Hash'ler tek bir uint64 NumPy dizisinde tutulur; sorgu tüm indekse
+    karşı XOR + popcount ile vektörel olarak yapılır.
+    """
+
+    def __init__(self):
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._keys = []
+        self._size = 0
+
+    def add(self, hash_value: int, key):
+        """Hash'i ilişkili anahtar (örn: dosya yolu) ile ekler"""
+        if self._size == len(self._hashes):
+            # Dizi büyütmeleri amortize edilsin diye kapasite ikiye katlanır
+            grown = np.empty(max(16, len(self._hashes) * 2), dtype=np.uint64)
+            grown[:self._size] = self._hashes[:self._size]
+            self._hashes = grown
+
+        self._hashes[self._size] = np.uint64(hash_value)
+        self._keys.append(key)
+        self._size += 1
+
+    def query(self, hash_value: int, max_distance: int = AppConfig.DEDUP_NEAR_DISTANCE):
+        """
+        Verilen hash'e max_distance veya daha yakın kayıtları döner.
+
+        Dönüş:
+            list[(key, distance)]: Mesafeye göre sıralı
+        """
+        if self._size == 0:
+            return []
+
+        distances = popcount64(self._hashes[:self._size] ^ np.uint64(hash_value))
+        matches = np.flatnonzero(distances <= max_distance)
+        order = matches[np.argsort(distances[matches], kind="stable")]
+
+        return [(self._keys[i], int(distances[i])) for i in order]
+
+    def __len__(self):
+        return self._size
+
+
+class DuplicateDetector:
+    """
+    Batch girdilerini birebir ve yakın tekrarlara göre sınıflandırır.
+
+    Birebir tekrar (aynı byte'lar): önceki çıktı tekrar kullanılır
+    Yakın tekrar (küçük Hamming mesafesi): işlenir ama raporlanır
+    """
+
+    def __init__(self, max_distance: int = AppConfig.DEDUP_NEAR_DISTANCE):
+        self.max_distance = max_distance
+        self.index = HashIndex()
+        self._by_digest = {}
+
+    def classify(self, fingerprint: dict) -> dict:
+        """
+        Dönüş:
+            {"duplicate_of": yol | None, "near_duplicates": [{"input", "distance"}]}
+        """
+        if fingerprint["sha256"] is None:
+            # Okunamayan dosya: karşılaştırılamaz, tek başına işlenir
+            return {"duplicate_of": None, "near_duplicates": []}
+
+        original = self._by_digest.get(fingerprint["sha256"])
+        if original is not None:
+            return {"duplicate_of": original, "near_duplicates": []}
+
+        self._by_digest[fingerprint["sha256"]] = fingerprint["path"]
+
+        near = []
+        if fingerprint["phash"] is not None:
+            near = [
+                {"input": key, "distance": distance}
+                for key, distance in self.index.query(fingerprint["phash"], self.max_distance)
+            ]
+            self.index.add(fingerprint["phash"], fingerprint["path"])
+
+        return {"duplicate_of": None, "near_duplicates": near}
@@ -0,0 +1,224 @@
+# ======================== derived_planes.py ========================
+"""
+Görüntüden türetilen ara düzlemlerin (derived planes) paylaşılan önbelleği
+
+Zincirdeki işlemciler aynı pikseller üzerinde aynı dönüşümleri tekrar
+tekrar yapıyordu: Canny RGB'yi griye çevirir, ImageEnhance.Contrast
+ortalama için görüntüyü L'ye çevirir, Grayscale aynı dönüşümü yeniden
+yapar; GUI'de kaydırıcıyla Sharpness denerken her değerde aynı SMOOTH
+katmanı yeniden hesaplanır.
+
+Bu dosya:
+- parlaklık (luminance, L), YCbCr ve HSV düzlemlerini
+- parlaklık histogramını ve ortalamasını
+- keskinleştirmede kullanılan yumuşatılmış (SMOOTH) taban katmanını
+görüntü başına bir kez hesaplayıp önbellekte tutmayı sağlar.
+
+Kayıtlar görüntü nesnesine bağlıdır: işlemciler her zaman yeni görüntü
+döndüğü için yeni sürüm yeni nesnedir ve eski kayıtlar görüntü bellekten
+silinince kendiliğinden düşer. Görüntüyü yerinde değiştiren kod (örn:
+ImageManager.commit_region) invalidate() çağırır.
+
+Dönen düzlemler paylaşılır; çağıran değiştirmemeli, gerekiyorsa kopyalamalıdır.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+from config import AppConfig
+from memory_manager import image_nbytes
+
+
+def _plane_nbytes(plane) -> int:
+    if isinstance(plane, Image.Image):
+        return image_nbytes(plane)
+    if isinstance(plane, np.ndarray):
+        return plane.nbytes
+    return 0
+
+
+class DerivedPlaneCache:
+    """
+    Görüntü nesnesi + düzlem adı anahtarlı, bayt sınırlı LRU önbellek.
+
+    Kullanım:
+        gray = DerivedPlaneCache.instance().get(image, "luminance",
+                                                lambda: image.convert("L"))
+
+    Düzlemler yeniden hesaplanabilir olduğu için bütçe aşılınca diske
+    taşınmaz, en eski kullanılan silinir.
+    """
+
+    _instance = None
+
+    def __init__(self, max_bytes: int = None):
+        if max_bytes is None:
+            max_bytes = AppConfig.DERIVED_PLANE_CACHE_MB * 1024 * 1024
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        # (id(görüntü), düzlem adı) -> (düzlem, bayt)
+        self._entries = OrderedDict()
+        # id(görüntü) -> weakref.finalize; görüntü silinince kayıtları düşürür
+        self._finalizers = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Uygulama genelinde paylaşılan önbellek"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get(self, image: Image.Image, name: str, compute):
+        """
+        Görüntünün name düzlemini döner; yoksa compute() ile hesaplar.
+
+        Hesaplama kilit dışında yapılır; iki thread aynı düzlemi aynı anda
+        isterse ikisi de hesaplar, biri saklanır.
+        """
+        key = (id(image), name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[0]
+            self.stats["misses"] += 1
+
+        plane = compute()
+        nbytes = _plane_nbytes(plane)
+        if nbytes > self.max_bytes:
+            return plane
+
+        with self._lock:
+            if key not in self._entries:
+                if id(image) not in self._finalizers:
+                    self._finalizers[id(image)] = weakref.finalize(
+                        image, self._forget, id(image)
+                    )
+                self._entries[key] = (plane, nbytes)
+                self.nbytes += nbytes
+                self._evict()
+        return plane
+
+    def peek(self, image: Image.Image, name: str):
+        """Hesaplamadan, sadece önbellekteki düzlemi döner (yoksa None)"""
+        with self._lock:
+            entry = self._entries.get((id(image), name))
+        return None if entry is None else entry[0]
+
+    def invalidate(self, image: Image.Image):
+        """Görüntü yerinde değiştiğinde ona ait tüm düzlemleri siler"""
+        finalizer = self._finalizers.get(id(image))
+        if finalizer is not None:
+            # detach: görüntü yaşamaya devam eder, finalizer'a gerek kalmaz
+            finalizer.detach()
+        self._forget(id(image))
+
+    def clear(self):
+        with self._lock:
+            image_ids = list(self._finalizers)
+        for image_id in image_ids:
+            finalizer = self._finalizers.get(image_id)
+            if finalizer is not None:
+                finalizer.detach()
+            self._forget(image_id)
+
+    def _forget(self, image_id: int):
+        with self._lock:
+            self._finalizers.pop(image_id, None)
+            for key in [key for key in self._entries if key[0] == image_id]:
+                self.nbytes -= self._entries.pop(key)[1]
+
+    def _evict(self):
+        """Bütçe aşıldıysa en eski kullanılan düzlemleri siler (kilit içinde)"""
+        while self.nbytes > self.max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+            self.stats["evictions"] += 1
+
+    def usage(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "images": len(self._finalizers),
+                "bytes": self.nbytes,
+                **self.stats,
+            }
+
+
+# ----------------------------------------------------------------------
+# Düzlemler
+# ----------------------------------------------------------------------
+def luminance(image: Image.Image) -> Image.Image:
+    """
+    Parlaklık düzlemi (L). PIL'in convert("L") dönüşümüdür; ImageOps.grayscale
+    ve ImageEnhance ile aynı sonucu verir. L görüntü kendisini döner.
+    """
+    if image.mode == "L":
+        return image
+    return DerivedPlaneCache.instance().get(image, "luminance", lambda: image.convert("L"))
+
+
+def luminance_array(image: Image.Image) -> np.ndarray:
+    """Parlaklık düzlemi, salt okunur uint8 dizi olarak (kopyalanmaz)"""
+    return np.asarray(luminance(image))
+
+
+def luminance_histogram(image: Image.Image) -> list:
+    """Parlaklık düzleminin 256 kutulu histogramı"""
+    return DerivedPlaneCache.instance().get(
+        image, "histogram", lambda: luminance(image).histogram()
+    )
+
+
+def mean_luminance(image: Image.Image) -> int:
+    """
+    Ortalama parlaklık, ImageEnhance.Contrast'ın kullandığı gibi en yakın
+    tam sayıya yuvarlanmış (ImageStat.Stat(...).mean ile aynı).
+    """
+    histogram = luminance_histogram(image)
+    count = sum(histogram)
+    if count == 0:
+        return 0
+    total = sum(value * frequency for value, frequency in enumerate(histogram))
+    return int(total / count + 0.5)
+
+
+def ycbcr(image: Image.Image) -> Image.Image:
+    """YCbCr düzlemleri (parlaklık / renk farkı); RGB dışı modlar önce RGB'ye çevrilir"""
+    if image.mode == "YCbCr":
+        return image
+    return DerivedPlaneCache.instance().get(
+        image, "ycbcr", lambda: image.convert("RGB").convert("YCbCr")
+    )
+
+
+def hsv(image: Image.Image) -> Image.Image:
+    """HSV düzlemleri; RGB dışı modlar önce RGB'ye çevrilir"""
+    if image.mode == "HSV":
+        return image
+    return DerivedPlaneCache.instance().get(
+        image, "hsv", lambda: image.convert("RGB").convert("HSV")
+    )
+
+
+def smoothed(image: Image.Image) -> Image.Image:
+    """
+    3x3 SMOOTH ile yumuşatılmış taban katmanı (ImageEnhance.Sharpness'ın
+    "degenerate" görüntüsü); alfa kanalı kaynaktan korunur.
+    """
+    def compute():
+        base = image.filter(ImageFilter.SMOOTH)
+        if "A" in image.getbands():
+            base.putalpha(image.getchannel("A"))
+        return base
+
+    return DerivedPlaneCache.instance().get(image, "smoothed", compute)
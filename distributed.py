@@ -0,0 +1,406 @@
+# ======================== distributed.py ========================
+"""
+Paylaşılan dosya sistemi üzerinden çok makineli iş dağıtımı
+
+Arşivin yeniden işlenmesi tek makineye sığmıyor. Aynı dosya sistemini
+(NFS, SMB...) gören herhangi sayıda işçi process, tek makinede veya
+birden fazla makinede, ortak bir kuyruktan iş çeker.
+
+Kuyruk bir dizindir (SQLite ağ dosya sistemlerinde kilitleme garantisi
+vermediği için dizin tabanlı seçilmiştir):
+
+    <kuyruk>/job.json                   son gönderilen işin ayarları
+    <kuyruk>/pending/<parti>.json       bekleyen girdi partileri (girdiler ve
+                                        partinin ait olduğu işin reçete /
+                                        çıktı ayarları)
+    <kuyruk>/leased/<parti>@<işçi>.json kiralanmış (işlenen) partiler
+    <kuyruk>/done/<parti>.json          parti sonuçları
+
+Bu dosya:
+- partiyi atomik rename ile kiralamayı (iki işçi aynı partiyi alamaz)
+- işlerken dosya zamanını arka plan thread'inde güncelleyerek kirayı
+  tazelemeyi (heartbeat); kira kaybedilince partinin bırakılmasını
+- süresi dolan kiraları (ölü işçiler) kuyruğa geri koymayı
+- koordinatör (parti oluşturma, ilerleme takibi) ve işçi döngüsünü
+sağlar.
+
+Bir parti en az bir kez işlenir: kirası dolan parti başka bir işçiye
+verilebilir; çıktılar aynı olduğu için tekrar işlemek zararsızdır.
+
+İş ayarları her partinin içinde taşındığı için sürekli çalışan işçiler
+koordinatörden önce başlatılabilir ve aynı kuyruğa sonradan gönderilen
+yeni işleri de doğru ayarlarla işler.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+from batch_processor import BatchProcessor, process_file
+from config import AppConfig
+from logger import log_event
+from recipe import Recipe
+
+
+logger = logging.getLogger("ImageProcessingApp.distributed")
+
+JOB_FILE = "job.json"
+CLOCK_FILE = ".clock"
+STATE_DIRS = ("pending", "leased", "done")
+
+
+def _write_json(path: str, payload):
+    """JSON'u geçici dosyaya yazıp yerine taşır (okuyan yarım dosya görmez)"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(temp_path, path)
+
+
+def _read_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class LeaseQueue:
+    """
+    Dizin tabanlı, kiralamalı (lease) iş kuyruğu.
+
+    Kira süresi, dosya sunucusunun saatine göre ölçülür (bkz. fs_now);
+    makineler arasındaki saat farkı kiraları etkilemez.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        for name in STATE_DIRS:
+            os.makedirs(os.path.join(root, name), exist_ok=True)
+
+    def _dir(self, state: str) -> str:
+        return os.path.join(self.root, state)
+
+    def fs_now(self) -> float:
+        """Dosya sisteminin saati: bir dosyaya dokunup mtime'ı okunur"""
+        path = os.path.join(self.root, CLOCK_FILE)
+        with open(path, "a"):
+            os.utime(path)
+        return os.stat(path).st_mtime
+
+    # ------------------------------------------------------------------
+    # Koordinatör tarafı
+    # ------------------------------------------------------------------
+    def enqueue(self, batches, job: dict = None) -> list:
+        """
+        Girdi partilerini kuyruğa ekler, parti kimliklerini döner.
+
+        job (reçete adımları, çıktı ayarları) her partiye yazılır.
+        """
+        batch_ids = []
+        for index, inputs in enumerate(batches):
+            batch_id = f"{index:06d}-{uuid.uuid4().hex[:8]}"
+            _write_json(
+                os.path.join(self._dir("pending"), batch_id + ".json"),
+                {"inputs": inputs, "job": job},
+            )
+            batch_ids.append(batch_id)
+        return batch_ids
+
+    def requeue_expired(self, lease_seconds: float) -> int:
+        """Kirası dolmuş partileri bekleyenlere geri taşır"""
+        now = self.fs_now()
+        requeued = 0
+
+        for name in os.listdir(self._dir("leased")):
+            path = os.path.join(self._dir("leased"), name)
+            try:
+                if now - os.stat(path).st_mtime < lease_seconds:
+                    continue
+                batch_id = name.split("@", 1)[0]
+                os.rename(path, os.path.join(self._dir("pending"), batch_id + ".json"))
+            except OSError:
+                # İşçi tam bu sırada bitirdi veya başka biri geri taşıdı
+                continue
+
+            requeued += 1
+            log_event(logger, "lease_expired", level=logging.WARNING, batch=batch_id, lease=name)
+
+        return requeued
+
+    def counts(self) -> dict:
+        counts = {
+            state: sum(1 for name in os.listdir(self._dir(state)) if name.endswith(".json"))
+            for state in STATE_DIRS
+        }
+        counts["total"] = sum(counts.values())
+        return counts
+
+    def is_finished(self) -> bool:
+        counts = self.counts()
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def results(self) -> list:
+        """Tamamlanan partilerin sonuçları (girdi başına bir sözlük)"""
+        results = []
+        for name in sorted(os.listdir(self._dir("done"))):
+            if name.endswith(".json"):
+                results.extend(_read_json(os.path.join(self._dir("done"), name))["results"])
+        return results
+
+    # ------------------------------------------------------------------
+    # İşçi tarafı
+    # ------------------------------------------------------------------
+    def lease(self, worker_id: str):
+        """
+        Bekleyen bir partiyi kiralar.
+
+        Dönüş:
+            dict | None: {"batch_id", "inputs", "job", "path"} veya kuyruk boşsa None
+        """
+        for name in sorted(os.listdir(self._dir("pending"))):
+            if not name.endswith(".json"):
+                continue
+
+            batch_id = name[:-len(".json")]
+            leased_path = os.path.join(self._dir("leased"), f"{batch_id}@{worker_id}.json")
+            try:
+                # rename atomiktir: aynı partiyi sadece bir işçi alabilir
+                os.rename(os.path.join(self._dir("pending"), name), leased_path)
+            except OSError:
+                continue
+
+            # Kira süresi şimdiden başlasın (rename mtime'ı değiştirmez)
+            os.utime(leased_path)
+            batch = _read_json(leased_path)
+            return {
+                "batch_id": batch_id,
+                "inputs": batch["inputs"],
+                "job": batch.get("job"),
+                "path": leased_path,
+            }
+
+        return None
+
+    @staticmethod
+    def heartbeat(lease: dict) -> bool:
+        """Kirayı tazeler; kira kaybedildiyse (geri alındıysa) False"""
+        try:
+            os.utime(lease["path"])
+            return True
+        except OSError:
+            return False
+
+    def complete(self, lease: dict, results: list):
+        """Sonuçları yazar ve kirayı kapatır"""
+        _write_json(
+            os.path.join(self._dir("done"), lease["batch_id"] + ".json"),
+            {"results": results},
+        )
+        try:
+            os.remove(lease["path"])
+        except OSError:
+            # Kira dolmuş ve parti geri alınmış; başka işçi tekrar işleyebilir
+            pass
+
+
+class LeaseHeartbeat:
+    """
+    Kirayı arka plan thread'inde düzenli aralıklarla tazeler.
+
+    Böylece kira süresinden uzun süren tek bir görüntü (örn: büyük arşiv
+    TIFF'i) işlenirken parti başka bir işçiye verilmez. Kira kaybedilirse
+    (parti geri alındıysa) lost True olur.
+
+    Kullanım:
+        with LeaseHeartbeat(lease, interval) as heartbeat:
+            ...
+            if heartbeat.lost: ...
+    """
+
+    def __init__(self, lease: dict, interval: float):
+        self.lease = lease
+        self.interval = interval
+        self.lost = False
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-heartbeat", daemon=True)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            if not LeaseQueue.heartbeat(self.lease):
+                self.lost = True
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stopped.set()
+        self._thread.join()
+
+
+class Coordinator:
+    """
+    Girdileri partilere bölüp kuyruğa koyan ve ilerlemeyi izleyen taraf.
+
+    Kullanım:
+        coordinator = Coordinator("/mnt/shared/queue", "blur,sepia", "/mnt/shared/out")
+        coordinator.submit(paths)
+        summary = coordinator.wait()
+    """
+
+    def __init__(self, queue_dir: str, recipe: str, output_dir: str,
+                 output_format: str = None, batch_size: int = None,
+                 lease_seconds: float = None):
+        self.queue = LeaseQueue(queue_dir)
+        self.recipe = recipe
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.batch_size = batch_size or AppConfig.DISTRIBUTED_BATCH_SIZE
+        self.lease_seconds = lease_seconds or AppConfig.DISTRIBUTED_LEASE_SECONDS
+
+    def submit(self, input_paths) -> int:
+        """İşi tanımlar ve girdileri partiler halinde kuyruğa ekler"""
+        # Tüm makineler aynı yolları görsün diye mutlak yollar kullanılır
+        input_paths = [os.path.abspath(path) for path in input_paths]
+
+        # Bilinmeyen adımlar işçilerde değil burada hata versin
+        steps = Recipe(self.recipe).steps
+
+        job = {
+            "steps": steps,
+            "output_dir": os.path.abspath(self.output_dir),
+            "output_format": self.output_format,
+            "lease_seconds": self.lease_seconds,
+        }
+        _write_json(os.path.join(self.queue.root, JOB_FILE), job)
+
+        batches = [
+            input_paths[start:start + self.batch_size]
+            for start in range(0, len(input_paths), self.batch_size)
+        ]
+        self.queue.enqueue(batches, job)
+        return len(batches)
+
+    def wait(self, poll_interval: float = None, timeout: float = None, on_progress=None) -> dict:
+        """
+        Tüm partiler bitene kadar bekler; bu sırada ölü işçilerin
+        partilerini kuyruğa geri koyar.
+
+        Dönüş:
+            dict: counts, done, failed, seconds
+        """
+        poll_interval = poll_interval or AppConfig.DISTRIBUTED_POLL_SECONDS
+        start = time.monotonic()
+
+        while not self.queue.is_finished():
+            self.queue.requeue_expired(self.lease_seconds)
+            if on_progress is not None:
+                on_progress(self.queue.counts())
+            if timeout is not None and time.monotonic() - start > timeout:
+                raise TimeoutError(f"Queue not finished after {timeout} s: {self.queue.counts()}")
+            time.sleep(poll_interval)
+
+        return self.summary(time.monotonic() - start)
+
+    def summary(self, seconds: float = None) -> dict:
+        results = self.queue.results()
+        return {
+            "counts": self.queue.counts(),
+            "done": sum(1 for r in results if r["status"] == "done"),
+            "failed": [r for r in results if r["status"] != "done"],
+            "workers": sorted({r["worker"] for r in results}),
+            "seconds": seconds,
+        }
+
+
+class Worker:
+    """
+    Kuyruktan parti kiralayıp reçeteyi uygulayan işçi.
+
+    Her makinede çekirdek sayısı kadar işçi process başlatılabilir;
+    işçiler birbirinden habersizdir, sadece kuyruk dizinini paylaşır.
+    İş ayarları her kiralanan partiden okunur (bkz. LeaseQueue.enqueue).
+    """
+
+    def __init__(self, queue_dir: str, worker_id: str = None):
+        self.queue = LeaseQueue(queue_dir)
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.processed = 0
+
+    def _lease_seconds(self) -> float:
+        """Son gönderilen işin kira süresi; henüz iş yoksa varsayılan"""
+        try:
+            return _read_json(os.path.join(self.queue.root, JOB_FILE))["lease_seconds"]
+        except (OSError, ValueError, KeyError):
+            return AppConfig.DISTRIBUTED_LEASE_SECONDS
+
+    def process_lease(self, lease: dict):
+        """
+        Partinin girdilerini işler. Kira işlem sürerken arka planda ve her
+        girdiden sonra tazelenir.
+
+        Dönüş:
+            list | None: sonuçlar; kira kaybedildiyse None (parti başka bir
+                         işçiye verilmiştir, kalan girdiler işlenmez)
+        """
+        job = lease["job"]
+        interval = job["lease_seconds"] / AppConfig.DISTRIBUTED_HEARTBEATS_PER_LEASE
+
+        results = []
+        with LeaseHeartbeat(lease, interval) as heartbeat:
+            for input_path in lease["inputs"]:
+                if heartbeat.lost or not self.queue.heartbeat(lease):
+                    log_event(
+                        logger, "lease_lost", level=logging.WARNING,
+                        batch=lease["batch_id"], worker=self.worker_id,
+                        processed=len(results),
+                    )
+                    return None
+
+                output_path = BatchProcessor.output_path_for(
+                    input_path, job["output_dir"], job["output_format"]
+                )
+                result = process_file(input_path, output_path, job["steps"])
+                result["worker"] = self.worker_id
+                results.append(result)
+        return results
+
+    def run(self, exit_when_idle: bool = True, poll_interval: float = None) -> int:
+        """
+        Kuyruk bitene kadar parti işler.
+
+        exit_when_idle=False ise kuyruk boşken beklemeye devam eder
+        (sürekli çalışan işçi). Dönüş: işlenen girdi sayısı.
+        """
+        poll_interval = poll_interval or AppConfig.DISTRIBUTED_POLL_SECONDS
+
+        while True:
+            lease = self.queue.lease(self.worker_id)
+            if lease is None:
+                # Koordinatör yokken de ölü işçilerin partileri kurtarılır
+                if self.queue.requeue_expired(self._lease_seconds()):
+                    continue
+                if exit_when_idle and self.queue.is_finished():
+                    return self.processed
+                time.sleep(poll_interval)
+                continue
+
+            results = self.process_lease(lease)
+            if results is None:
+                # Kirayı alan işçi partiyi baştan işleyip tamamlar
+                continue
+            self.queue.complete(lease, results)
+            self.processed += len(results)
+
+            log_event(
+                logger, "batch_completed",
+                batch=lease["batch_id"], worker=self.worker_id, images=len(results),
+            )
+
+
+def run_worker(queue_dir: str, worker_id: str = None, exit_when_idle: bool = True) -> int:
+    """Ayrı process'te başlatmak için (multiprocessing / cli) giriş noktası"""
+    return Worker(queue_dir, worker_id).run(exit_when_idle=exit_when_idle)
@@ -6,10 +6,16 @@ Enhancement sınıfları:
 - ImageEnhancement soyut sınıfından türetilir
 - Ortak process() arayüzünü kullanır
 - Factor parametresi ile esnek şekilde ayarlanabilir
+
+Contrast, Color ve Sharpness, ImageEnhance ile aynı sonucu üretir; ama
+karıştırdıkları "degenerate" görüntüyü (ortalama gri, gri ton, yumuşatılmış
+katman) paylaşılan düzlem önbelleğinden alır (bkz. derived_planes.py).
+Aynı görüntüde farklı factor denemek tekrar dönüşüm yapmaz.
 """
 
-from PIL import ImageEnhance
+from PIL import Image, ImageEnhance
 from base_classes import ImageEnhancement
+from derived_planes import luminance, mean_luminance, smoothed
 
 
 class BrightnessEnhancement(ImageEnhancement):
@@ -17,6 +23,9 @@ class BrightnessEnhancement(ImageEnhancement):
     Görüntü parlaklığını ayarlayan sınıf.
     """
 
+    # Her piksel siyahla karıştırılır; komşu piksellere bakılmaz
+    POINT_OPERATION = True
+
     def __init__(self, factor: float = 1.3):
         """
         factor:
@@ -39,15 +48,23 @@ class ContrastEnhancement(ImageEnhancement):
     Görüntü kontrastını ayarlayan sınıf.
     """
 
+    # Parlaklık modunda renk doygunluğu değişmez
+    LUMA_MODE = "merge"
+
     def __init__(self, factor: float = 1.3):
         super().__init__("Contrast", factor)
 
     def process(self, image):
         """
-        PIL ImageEnhance.Contrast kullanılarak kontrast ayarlanır.
+        Kontrast, görüntünün ortalama parlaklıktaki düz gri ile
+        karıştırılmasıyla ayarlanır (ImageEnhance.Contrast ile aynı).
         """
-        enhancer = ImageEnhance.Contrast(image)
-        return enhancer.enhance(self.factor)
+        degenerate = Image.new("L", image.size, mean_luminance(image))
+        if degenerate.mode != image.mode:
+            degenerate = degenerate.convert(image.mode)
+        if "A" in image.getbands():
+            degenerate.putalpha(image.getchannel("A"))
+        return Image.blend(degenerate, image, self.factor)
 
 
 class ColorEnhancement(ImageEnhancement):
@@ -55,15 +72,24 @@ class ColorEnhancement(ImageEnhancement):
     Görüntünün renk doygunluğunu (saturation) ayarlayan sınıf.
     """
 
+    # Her piksel kendi gri tonuyla karıştırılır
+    POINT_OPERATION = True
+
     def __init__(self, factor: float = 1.3):
         super().__init__("Color", factor)
 
     def process(self, image):
         """
-        PIL ImageEnhance.Color kullanılarak renk doygunluğu ayarlanır.
+        Renk doygunluğu, görüntünün gri tonuyla karıştırılmasıyla ayarlanır
+        (ImageEnhance.Color ile aynı).
         """
-        enhancer = ImageEnhance.Color(image)
-        return enhancer.enhance(self.factor)
+        if "A" in image.getbands():
+            enhancer = ImageEnhance.Color(image)
+            return enhancer.enhance(self.factor)
+        degenerate = luminance(image)
+        if degenerate.mode != image.mode:
+            degenerate = degenerate.convert(image.mode)
+        return Image.blend(degenerate, image, self.factor)
 
 
 class SharpnessEnhancement(ImageEnhancement):
@@ -71,12 +97,16 @@ class SharpnessEnhancement(ImageEnhancement):
     Görüntü keskinliğini (sharpness) ayarlayan sınıf.
     """
 
+    # ImageEnhance.Sharpness 3x3 SMOOTH çekirdeği ile karıştırır
+    HALO = 1
+    LUMA_MODE = "merge"
+
     def __init__(self, factor: float = 1.3):
         super().__init__("Sharpness", factor)
 
     def process(self, image):
         """
-        PIL ImageEnhance.Sharpness kullanılarak keskinlik ayarlanır.
+        Keskinlik, görüntünün yumuşatılmış katmanla karıştırılmasıyla
+        ayarlanır (ImageEnhance.Sharpness ile aynı).
         """
-        enhancer = ImageEnhance.Sharpness(image)
-        return enhancer.enhance(self.factor)
+        return Image.blend(smoothed(image), image, self.factor)
@@ -15,6 +15,14 @@ from filters import (
     SepiaFilter,
     InvertFilter,
     SharpenFilter,
+    EdgeDetectionFilter,
+    EmbossFilter,
+    SolarizeFilter,
+    GaussianBlurFilter,
+    FastGaussianBlurFilter,
+    MotionBlurFilter,
+    CannyEdgeFilter,
+    MedianFilter,
 )
 
 from enhancements import (
@@ -24,15 +32,35 @@ from enhancements import (
     SharpnessEnhancement,
 )
 
+from base_classes import LumaProcessor
 from exceptions import FilterError, EnhancementError
 from config import AppConfig
 
 
+# Reçete adımının sonuna eklenince işlem sadece parlaklık (Y) düzlemine
+# uygulanır (örn: "sharpen:luma", "gaussian_blur:3:luma")
+LUMA_SUFFIX = ":luma"
+
+
+def wrap_luma(processor, step_name: str, error_class):
+    """İşlemciyi LumaProcessor ile sarar; desteklemiyorsa error_class fırlatır"""
+    if processor.LUMA_MODE is None:
+        raise error_class(f"{step_name} does not support luma mode")
+    return LumaProcessor(processor)
+
+
 class FilterFactory:
     """
     Filtre nesnelerini oluşturan factory sınıfı.
     """
 
+    # Reçetede "isim:değer" şeklinde verilebilen parametreler
+    # (örn: "gaussian_blur:120", "median_filter:9")
+    STEP_PARAMETERS = {
+        "gaussian_blur": ("radius", float),
+        "median_filter": ("kernel_size", int),
+    }
+
     def __init__(self):
         """
         Filtre isimleri ile filtre sınıfları arasındaki eşleştirme
@@ -48,18 +76,94 @@ class FilterFactory:
             "sepia": SepiaFilter,
             "invert": InvertFilter,
             "sharpen": SharpenFilter,
+            "edge_detect": EdgeDetectionFilter,
+            "emboss": EmbossFilter,
+            "solarize": SolarizeFilter,
+            "gaussian_blur": GaussianBlurFilter,
+            "motion_blur": MotionBlurFilter,
+            "canny_edge": CannyEdgeFilter,
+            "median_filter": MedianFilter,
         }
 
-    def create_filter(self, filter_name: str):
+    def create_filter(self, filter_name: str, backend: str = None, luma: bool = False, **params):
         """
         Verilen isme göre ilgili filtre nesnesini oluşturur.
+
+        backend verilirse filtre otomatik seçim yerine
+        bu backend ile çalışır (debug amaçlı).
+
+        luma=True ise filtre sadece parlaklık düzlemine uygulanır
+        (bkz. base_classes.LumaProcessor).
+
+        params filtre sınıfına aktarılır (örn: radius=120).
         """
         try:
             filter_class = self.filters[filter_name.lower()]
-            return filter_class()
         except KeyError:
             raise FilterError(f"Unknown filter: {filter_name}")
 
+        if filter_class is GaussianBlurFilter:
+            filter_obj = self.create_gaussian_blur(
+                params.pop("radius", AppConfig.GAUSSIAN_BLUR_RADIUS), backend
+            )
+        else:
+            try:
+                filter_obj = filter_class(backend=backend, **params)
+            except TypeError:
+                raise FilterError(f"Invalid parameters for {filter_name}: {params}")
+
+        if backend and backend not in filter_obj.BACKENDS:
+            raise FilterError(
+                f"Unknown backend for {filter_name}: {backend}"
+            )
+
+        if luma:
+            return wrap_luma(filter_obj, filter_name, FilterError)
+        return filter_obj
+
+    @staticmethod
+    def create_gaussian_blur(radius, backend: str = None):
+        """
+        Yarıçapa göre Gaussian blur implementasyonu seçer.
+
+        Büyük yarıçaplarda (AppConfig.FAST_GAUSSIAN_MIN_RADIUS) süresi
+        yarıçaptan bağımsız olan FastGaussianBlurFilter kullanılır.
+        Zorlanan backend sadece birinde varsa o sınıf seçilir.
+        """
+        if backend and backend not in FastGaussianBlurFilter.BACKENDS:
+            return GaussianBlurFilter(radius, backend=backend)
+
+        if radius >= AppConfig.FAST_GAUSSIAN_MIN_RADIUS or (
+            backend and backend not in GaussianBlurFilter.BACKENDS
+        ):
+            return FastGaussianBlurFilter(radius, backend=backend)
+
+        return GaussianBlurFilter(radius, backend=backend)
+
+    def parse_step(self, step: str):
+        """
+        Reçete adımını (isim, parametreler) çiftine ayırır.
+
+        Örnek:
+            "gaussian_blur:120" -> ("gaussian_blur", {"radius": 120.0})
+            "sharpen:luma" -> ("sharpen", {"luma": True})
+        """
+        params = {}
+        if step.endswith(LUMA_SUFFIX):
+            params["luma"] = True
+            step = step[:-len(LUMA_SUFFIX)]
+
+        name, _, value = step.partition(":")
+        if not value:
+            return name, params
+
+        try:
+            param, cast = self.STEP_PARAMETERS[name]
+            params[param] = cast(value)
+            return name, params
+        except (KeyError, ValueError):
+            raise FilterError(f"Invalid recipe step: {step}")
+
     def get_available_filters(self):
         """
         GUI tarafında gösterilmek üzere mevcut filtre isimlerini döner.
@@ -104,17 +208,23 @@ class EnhancementFactory:
             ),
         }
 
-    def create_enhancement(self, enhancement_name: str):
+    def create_enhancement(self, enhancement_name: str, luma: bool = False):
         """
         Verilen isme göre enhancement nesnesi oluşturur.
+
+        luma=True ise sadece parlaklık düzlemine uygulanır.
         """
         try:
-            return self.enhancements[enhancement_name.lower()]()
+            enhancement = self.enhancements[enhancement_name.lower()]()
         except KeyError:
             raise EnhancementError(
                 f"Unknown enhancement: {enhancement_name}"
             )
 
+        if luma:
+            return wrap_luma(enhancement, enhancement_name, EnhancementError)
+        return enhancement
+
     def get_available_enhancements(self):
         """
         GUI tarafında gösterilmek üzere enhancement isimlerini döner.
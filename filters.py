@@ -4,8 +4,11 @@ Bu dosya, projede kullanılan somut (concrete) filtre implementasyonlarını iç
 
 Her filtre:
 - Filter soyut sınıfından türetilir
-- process(image) metodunu implemente eder
+- Desteklediği her backend için _process_<backend>(image) metodunu implemente eder
 - GUI ve ImageManager tarafından polimorfik olarak kullanılır
+
+Aynı filtrenin backend'leri eşdeğer sonuç üretir (yuvarlama farkları hariç).
+Hangisinin çalışacağına BackendDispatcher karar verir.
 """
 
 from PIL import Image, ImageFilter, ImageOps
@@ -14,171 +17,635 @@ import numpy as np
 
 from base_classes import Filter
 from config import AppConfig
+from derived_planes import luminance, luminance_array
 from exceptions import FilterError
 
 
+# OpenCV / NumPy backend'lerinin doğrudan çalışabildiği PIL modları
+ARRAY_MODES = ("L", "RGB", "RGBA")
+
+
+def _apply_kernel_cv2(image, size, kernel, scale=1, offset=0):
+    """
+    PIL ImageFilter.Kernel davranışını OpenCV ile uygular.
+
+    PIL:
+    - çekirdeği satır bazında ters çevirerek uygular
+    - kenardaki (çekirdek yarıçapı kadar) pikselleri değiştirmeden bırakır
+    Aynı sonucu almak için OpenCV tarafında da bu ikisi yapılır.
+    """
+    width, height = size
+    pixels = np.asarray(image)
+
+    kernel = np.asarray(kernel, dtype=np.float32).reshape(height, width)
+    kernel = np.flipud(kernel) / scale
+
+    result = cv2.filter2D(
+        pixels, -1, kernel, delta=offset, borderType=cv2.BORDER_REPLICATE
+    )
+
+    ry, rx = height // 2, width // 2
+    result[:ry] = pixels[:ry]
+    result[-ry:] = pixels[-ry:]
+    result[:, :rx] = pixels[:, :rx]
+    result[:, -rx:] = pixels[:, -rx:]
+
+    return Image.fromarray(result, image.mode)
+
+
+def _apply_builtin_cv2(image, builtin_filter):
+    """PIL'in hazır çekirdek filtrelerini (BLUR, SHARPEN...) OpenCV ile uygular"""
+    size, scale, offset, kernel = builtin_filter.filterargs
+    return _apply_kernel_cv2(image, size, kernel, scale, offset)
+
+
 class BlurFilter(Filter):
     """Basit bulanıklaştırma filtresi"""
 
-    def __init__(self):
-        super().__init__("Blur")
+    # ImageFilter.BLUR 5x5 çekirdektir
+    HALO = 2
+    LUMA_MODE = "merge"
 
-    def process(self, image):
+    BACKENDS = ("pil", "opencv")
+    BACKEND_MODES = {"opencv": ARRAY_MODES}
+
+    def __init__(self, backend=None):
+        super().__init__("Blur", backend)
+
+    def _process_pil(self, image):
         return image.filter(ImageFilter.BLUR)
 
+    def _process_opencv(self, image):
+        return _apply_builtin_cv2(image, ImageFilter.BLUR)
+
 
 class SharpenFilter(Filter):
     """Görüntü keskinleştirme filtresi"""
 
-    def __init__(self):
-        super().__init__("Sharpen")
+    HALO = 1
+    LUMA_MODE = "merge"
 
-    def process(self, image):
+    BACKENDS = ("pil", "opencv")
+    BACKEND_MODES = {"opencv": ARRAY_MODES}
+
+    def __init__(self, backend=None):
+        super().__init__("Sharpen", backend)
+
+    def _process_pil(self, image):
         return image.filter(ImageFilter.SHARPEN)
 
+    def _process_opencv(self, image):
+        return _apply_builtin_cv2(image, ImageFilter.SHARPEN)
+
 
 class EdgeDetectionFilter(Filter):
     """Kenar tespiti filtresi"""
 
-    def __init__(self):
-        super().__init__("Edge Detection")
+    HALO = 1
+    # Kenar haritası renk taşımaz; parlaklık modunda sonuç L kalır
+    LUMA_MODE = "plane"
 
-    def process(self, image):
+    BACKENDS = ("pil", "opencv")
+    BACKEND_MODES = {"opencv": ARRAY_MODES}
+
+    def __init__(self, backend=None):
+        super().__init__("Edge Detection", backend)
+
+    def _process_pil(self, image):
         return image.filter(ImageFilter.FIND_EDGES)
 
+    def _process_opencv(self, image):
+        return _apply_builtin_cv2(image, ImageFilter.FIND_EDGES)
+
 
 class EmbossFilter(Filter):
     """Kabartma (emboss) efekti"""
 
-    def __init__(self):
-        super().__init__("Emboss")
+    HALO = 1
 
-    def process(self, image):
+    BACKENDS = ("pil", "opencv")
+    BACKEND_MODES = {"opencv": ARRAY_MODES}
+
+    def __init__(self, backend=None):
+        super().__init__("Emboss", backend)
+
+    def _process_pil(self, image):
         return image.filter(ImageFilter.EMBOSS)
 
+    def _process_opencv(self, image):
+        return _apply_builtin_cv2(image, ImageFilter.EMBOSS)
+
 
 class GrayscaleFilter(Filter):
-    """Görüntüyü gri tonlamaya çevirir"""
+    """
+    Görüntüyü gri tonlamaya çevirir.
 
-    def __init__(self):
-        super().__init__("Grayscale")
+    Sonuç tek kanallı (L) kalır; sonraki filtreler 3 kat daha az veri
+    işler. RGB'ye genişletme sadece ekranda (ImageDisplay) yapılır.
+    """
 
-    def process(self, image):
-        # PIL ImageOps.grayscale L moduna çevirir,
-        # GUI uyumu için tekrar RGB'ye dönülür
-        gray = ImageOps.grayscale(image)
-        return gray.convert("RGB")
+    POINT_OPERATION = True
+
+    BACKENDS = ("pil", "opencv")
+    BACKEND_MODES = {"opencv": ARRAY_MODES}
+
+    def __init__(self, backend=None):
+        super().__init__("Grayscale", backend)
+
+    def _process_pil(self, image):
+        # ImageOps.grayscale ile aynı dönüşüm; zincirde daha önce hesaplandıysa
+        # önbellekteki düzlem kopyalanır
+        return luminance(image).copy()
+
+    def _process_opencv(self, image):
+        pixels = np.asarray(image)
+
+        if image.mode == "L":
+            gray = pixels.copy()
+        elif image.mode == "RGBA":
+            gray = cv2.cvtColor(pixels, cv2.COLOR_RGBA2GRAY)
+        else:
+            gray = cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY)
+
+        return Image.fromarray(gray, "L")
 
 
 class SepiaFilter(Filter):
     """Sepya (eski fotoğraf) efekti"""
 
-    def __init__(self):
-        super().__init__("Sepia")
+    POINT_OPERATION = True
+    # numpy backend'i: float64 matris çarpımı ve clip kopyası (2 x 8 bayt/kanal)
+    MEMORY_EXPANSION = 18.0
+
+    BACKENDS = ("numpy", "opencv")
+    BACKEND_MODES = {"numpy": ("L", "RGB"), "opencv": ("L", "RGB")}
+
+    SEPIA_MATRIX = np.array([
+        [0.393, 0.769, 0.189],
+        [0.349, 0.686, 0.168],
+        [0.272, 0.534, 0.131],
+    ])
+
+    def __init__(self, backend=None):
+        super().__init__("Sepia", backend)
+
+    def _sepia_from_gray(self, image):
+        """
+        Tek kanallı (L) görüntü için sepya.
+
+        Gri pikselde R = G = B olduğundan matris çarpımı her kanal için
+        tek bir katsayıya iner; 3 kanal 256 elemanlı tablolarla (LUT) üretilir.
+        """
+        tables = [
+            [min(255, int(value * coefficient)) for value in range(256)]
+            for coefficient in self.SEPIA_MATRIX.sum(axis=1)
+        ]
+        return Image.merge("RGB", [image.point(table) for table in tables])
+
+    def _process_numpy(self, image):
+        if image.mode == "L":
+            return self._sepia_from_gray(image)
 
-    def process(self, image):
         try:
             pixels = np.array(image)
 
-            sepia_matrix = np.array([
-                [0.393, 0.769, 0.189],
-                [0.349, 0.686, 0.168],
-                [0.272, 0.534, 0.131],
-            ])
-
-            sepia_img = pixels.dot(sepia_matrix.T)
+            sepia_img = pixels.dot(self.SEPIA_MATRIX.T)
             sepia_img = np.clip(sepia_img, 0, 255).astype(np.uint8)
 
             return Image.fromarray(sepia_img)
         except Exception as e:
             raise FilterError(f"Sepia filter failed: {e}")
 
+    def _process_opencv(self, image):
+        if image.mode == "L":
+            return self._sepia_from_gray(image)
+
+        try:
+            # cv2.transform her piksel için matris çarpımı yapar,
+            # uint8'e doyurarak (saturate) döner
+            sepia_img = cv2.transform(np.asarray(image), self.SEPIA_MATRIX)
+            return Image.fromarray(sepia_img)
+        except Exception as e:
+            raise FilterError(f"Sepia filter failed: {e}")
+
 
 class InvertFilter(Filter):
     """Renkleri tersine çevirir"""
 
-    def __init__(self):
-        super().__init__("Invert")
+    POINT_OPERATION = True
 
-    def process(self, image):
+    BACKENDS = ("pil", "numpy", "opencv")
+    BACKEND_MODES = {"numpy": ("L", "RGB"), "opencv": ("L", "RGB")}
+
+    def __init__(self, backend=None):
+        super().__init__("Invert", backend)
+
+    def _process_pil(self, image):
         return ImageOps.invert(image)
 
+    def _process_numpy(self, image):
+        return Image.fromarray(255 - np.asarray(image), image.mode)
+
+    def _process_opencv(self, image):
+        return Image.fromarray(cv2.bitwise_not(np.asarray(image)), image.mode)
+
 
 class SolarizeFilter(Filter):
     """Solarizasyon efekti"""
 
-    def __init__(self):
-        super().__init__("Solarize")
+    POINT_OPERATION = True
+    # numpy backend'i: np.where ve astype ara dizileri
+    MEMORY_EXPANSION = 3.0
 
-    def process(self, image):
+    BACKENDS = ("pil", "numpy")
+    BACKEND_MODES = {"numpy": ("L", "RGB")}
+
+    def __init__(self, backend=None):
+        super().__init__("Solarize", backend)
+
+    def _process_pil(self, image):
         return ImageOps.solarize(
             image, threshold=AppConfig.SOLARIZE_THRESHOLD
         )
 
+    def _process_numpy(self, image):
+        pixels = np.asarray(image)
+        result = np.where(
+            pixels < AppConfig.SOLARIZE_THRESHOLD, pixels, 255 - pixels
+        )
+        return Image.fromarray(result.astype(np.uint8), image.mode)
+
 
 class GaussianBlurFilter(Filter):
     """Gaussian blur filtresi"""
 
-    def __init__(self, radius=AppConfig.GAUSSIAN_BLUR_RADIUS):
-        super().__init__("Gaussian Blur")
+    LUMA_MODE = "merge"
+
+    BACKENDS = ("pil", "opencv")
+    BACKEND_MODES = {"opencv": ARRAY_MODES}
+
+    def __init__(self, radius=AppConfig.GAUSSIAN_BLUR_RADIUS, backend=None):
+        super().__init__("Gaussian Blur", backend)
         self.radius = radius
 
-    def process(self, image):
+    def backend_key(self):
+        # OpenCV'nin süresi yarıçapla büyür, PIL'inki büyümez
+        return f"{type(self).__name__}[{self.radius}]"
+
+    def band_halo(self):
+        # OpenCV çekirdeği 8 bit için ~3 sigma, PIL'in kutu geçişleri daha
+        # kısa uzanır; 4 sigma ikisini de kapsar
+        return int(np.ceil(4 * self.radius)) + 2
+
+    def _process_pil(self, image):
         return image.filter(ImageFilter.GaussianBlur(self.radius))
 
+    def _process_opencv(self, image):
+        # PIL'deki radius, Gaussian'ın standart sapmasına karşılık gelir
+        blurred = cv2.GaussianBlur(
+            np.asarray(image), (0, 0), self.radius,
+            borderType=cv2.BORDER_REPLICATE
+        )
+        return Image.fromarray(blurred, image.mode)
+
+
+def box_sizes_for_gaussian(sigma, passes):
+    """
+    Art arda uygulandığında standart sapması sigma olan Gaussian'a
+    yaklaşan kutu (box) genişlikleri (tek sayılar).
+
+    Kovesi, "Fast Almost-Gaussian Filtering": genişlikler wl ve wl + 2
+    arasında seçilir, m tanesi wl olur ki toplam varyans 12 * sigma^2 olsun.
+    """
+    ideal = np.sqrt(12 * sigma * sigma / passes + 1)
+    lower = int(np.floor(ideal))
+    if lower % 2 == 0:
+        lower -= 1
+    lower = max(lower, 1)
+    upper = lower + 2
+
+    lower_count = round(
+        (12 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes)
+        / (-4 * lower - 4)
+    )
+    lower_count = min(max(lower_count, 0), passes)
+    return [lower] * lower_count + [upper] * (passes - lower_count)
+
+
+def _box_blur_numpy(pixels, width, axis):
+    """Kümülatif toplam (integral) ile kutu ortalaması; süre genişlikten bağımsızdır"""
+    radius = width // 2
+    pad = [(0, 0)] * pixels.ndim
+    pad[axis] = (radius + 1, radius)
+    sums = np.cumsum(np.pad(pixels, pad, mode="edge"), axis=axis, dtype=np.float64)
+
+    length = pixels.shape[axis]
+    upper = np.take(sums, np.arange(width, width + length), axis=axis)
+    lower = np.take(sums, np.arange(0, length), axis=axis)
+    return ((upper - lower) / width).astype(np.float32)
+
+
+class FastGaussianBlurFilter(Filter):
+    """
+    Büyük yarıçaplar için sabit süreli Gaussian blur.
+
+    Gaussian, art arda uygulanan kutu (box) bulanıklaştırmalarıyla yaklaşık
+    olarak hesaplanır. Kutu filtresi kayan toplamla çalıştığı için süre
+    yarıçaptan bağımsızdır; 150 px yarıçap 5 px kadar sürer.
+
+    passes (doğruluk seviyesi): kutu geçişi sayısı. 3 geçişte sonuç gerçek
+    Gaussian'dan birkaç gri seviyesi sapar (PIL de 3 geçiş kullanır), her
+    ek geçiş hatayı azaltır ve süreyi doğrusal artırır.
+    """
+
+    BACKENDS = ("opencv", "numpy")
+    BACKEND_MODES = {"opencv": ARRAY_MODES, "numpy": ARRAY_MODES}
+    LUMA_MODE = "merge"
+    # float32 kopya ve geçiş sonuçları; numpy backend'inde float64 kümülatif toplamlar
+    MEMORY_EXPANSION = 32.0
+
+    def __init__(self, radius=AppConfig.GAUSSIAN_BLUR_RADIUS,
+                 passes=AppConfig.FAST_GAUSSIAN_PASSES, backend=None):
+        super().__init__("Gaussian Blur", backend)
+        self.radius = radius
+        self.passes = passes
+
+    def box_sizes(self):
+        return box_sizes_for_gaussian(self.radius, self.passes)
+
+    def band_halo(self):
+        return sum(width // 2 for width in self.box_sizes())
+
+    def _process_opencv(self, image):
+        # Ara geçişlerde yuvarlama hatası birikmesin diye float32 çalışılır
+        pixels = np.asarray(image).astype(np.float32)
+        for width in self.box_sizes():
+            pixels = cv2.blur(pixels, (width, width), borderType=cv2.BORDER_REPLICATE)
+
+        return Image.fromarray(
+            np.clip(np.rint(pixels), 0, 255).astype(np.uint8), image.mode
+        )
+
+    def _process_numpy(self, image):
+        pixels = np.asarray(image).astype(np.float32)
+        for width in self.box_sizes():
+            pixels = _box_blur_numpy(pixels, width, axis=1)
+            pixels = _box_blur_numpy(pixels, width, axis=0)
+
+        return Image.fromarray(
+            np.clip(np.rint(pixels), 0, 255).astype(np.uint8), image.mode
+        )
+
 
 class CannyEdgeFilter(Filter):
     """OpenCV kullanarak Canny kenar algılama"""
 
-    def __init__(self):
-        super().__init__("Canny Edge")
+    # PIL'de Canny karşılığı olmadığı için tek backend vardır
+    BACKENDS = ("opencv",)
+    # 2: gri tonlama cv2.cvtColor yerine PIL dönüşümüyle (parlaklık düzlemi)
+    CACHE_VERSION = 2
 
-    def process(self, image):
-        # PIL → NumPy
-        img_np = np.array(image)
+    def __init__(self, backend=None):
+        super().__init__("Canny Edge", backend)
 
-        # RGB → Grayscale
-        gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY)
+    def _process_opencv(self, image):
+        # Gri tonlama paylaşılan parlaklık düzleminden alınır (zaten L ise
+        # dönüşüm yapılmaz)
+        gray = luminance_array(image)
 
-        # Canny edge detection
+        # Canny edge detection; sonuç tek kanallı (L) döner
         edges = cv2.Canny(gray, 100, 200)
 
-        # Tek kanallı görüntüyü RGB'ye çevir
-        edges_rgb = cv2.cvtColor(edges, cv2.COLOR_GRAY2RGB)
+        return Image.fromarray(edges, "L")
+
+
+# Median filtrenin dizi tabanlı backend'lerinin desteklediği modlar
+# ("1" L olarak işlenip geri çevrilir, LA gibi 2 kanallılar kanal kanal)
+MEDIAN_MODES = ("1", "L", "LA", "RGB", "RGBA", "CMYK")
+
+
+def median_histogram(pixels, kernel_size):
+    """
+    Histogram tabanlı median filtre (Perreault & Hébert, "Median Filtering
+    in Constant Time").
+
+    Her sütun için kernel yüksekliğindeki piksellerin histogramı tutulur;
+    bir satır aşağı inerken sütun başına sadece bir değer çıkar, bir değer
+    girer. Kernel histogramı sütun histogramlarının pencere toplamıdır ve
+    kayan toplamla (cv2.boxFilter) hesaplanır. Median önce 16'lık kaba
+    histogramda, sonra seçilen bloğun 16 ince kutusunda aranır.
+
+    Satır başına iş kernel boyutundan bağımsızdır; tüm sütunlar ve kanallar
+    NumPy ile birlikte işlenir. Kenarlar BORDER_REPLICATE gibi uzatılır.
+
+    Parametreler:
+        pixels (np.ndarray): uint8, (H, W) veya (H, W, C) - C herhangi bir sayı
+        kernel_size (int): Tek sayı kernel boyutu
+    """
+    if kernel_size % 2 == 0:
+        raise FilterError(f"Median kernel size must be odd: {kernel_size}")
+
+    radius = kernel_size // 2
+    rank = (kernel_size * kernel_size) // 2
+
+    squeeze = pixels.ndim == 2
+    if squeeze:
+        pixels = pixels[:, :, None]
+    height, width, channels = pixels.shape
+
+    padded = np.pad(pixels, ((radius, radius), (radius, radius), (0, 0)), mode="edge")
+    padded_width = width + 2 * radius
+
+    # Satırlar sütun konumu, kolonlar (kanal, değer) çiftleridir. Bir sütun
+    # histogramındaki sayı kernel_size'ı geçmediği için uint16 yeterlidir.
+    fine = np.zeros((padded_width, channels * 256), np.uint16)
+    coarse = np.zeros((padded_width, channels * 16), np.uint16)
+    columns = np.arange(padded_width)[:, None]
+    fine_offsets = np.arange(channels) * 256
+    coarse_offsets = np.arange(channels) * 16
+
+    def add(row):
+        values = row.astype(np.intp)
+        fine[columns, values + fine_offsets] += 1
+        coarse[columns, (values >> 4) + coarse_offsets] += 1
+
+    def remove(row):
+        values = row.astype(np.intp)
+        fine[columns, values + fine_offsets] -= 1
+        coarse[columns, (values >> 4) + coarse_offsets] -= 1
+
+    def window_sums(histograms):
+        # Pencere toplamları float32'de tamsayı olarak kesindir (k*k < 2^24)
+        sums = cv2.boxFilter(
+            histograms, cv2.CV_32F, (1, kernel_size),
+            normalize=False, borderType=cv2.BORDER_CONSTANT,
+        )
+        return sums[radius:radius + width]
+
+    for y in range(kernel_size):
+        add(padded[y])
 
-        return Image.fromarray(edges_rgb)
+    result = np.empty((height, width, channels), np.uint8)
+    zeros = np.zeros((width, channels, 1), np.float32)
 
+    for y in range(height):
+        if y:
+            remove(padded[y - 1])
+            add(padded[y + kernel_size - 1])
 
-class MedianFilter(Filter):
-    """Gürültü azaltmak için median filtre"""
+        # Kaba histogramda median'ın düştüğü 16'lık blok
+        coarse_cumulative = np.cumsum(
+            window_sums(coarse).reshape(width, channels, 16), axis=2
+        )
+        block = (coarse_cumulative <= rank).sum(axis=2)
+        below = np.take_along_axis(
+            np.concatenate([zeros, coarse_cumulative], axis=2), block[..., None], axis=2
+        )
+
+        # Bloğun ince histogramında kalan sıra
+        fine_window = window_sums(fine).reshape(width, channels, 16, 16)
+        bins = np.take_along_axis(fine_window, block[..., None, None], axis=2)[:, :, 0]
+        fine_cumulative = np.cumsum(bins, axis=2) + below
 
-    def __init__(self, kernel_size=AppConfig.MEDIAN_FILTER_KERNEL):
-        super().__init__("Median Filter")
+        result[y] = (block << 4) + (fine_cumulative <= rank).sum(axis=2)
+
+    return result[:, :, 0] if squeeze else result
+
+
+class MedianFilter(Filter):
+    """
+    Gürültü azaltmak için median filtre.
+
+    Backend'ler:
+    - opencv: cv2.medianBlur (1, 3, 4 kanal; 2 kanallı görüntüler kanal kanal)
+    - histogram: median_histogram, süresi kernel boyutundan bağımsız
+    - pil: ImageFilter.MedianFilter, diğer tüm modlar için
+
+    Hiçbir backend'in doğrudan işleyemediği modlar önce dönüştürülür:
+    paletli (P / PA) görüntüler RGB / RGBA olarak işlenir ve öyle döner
+    (palet indislerinin median'ı anlamsızdır); 16 bit (I;16*) görüntüler
+    32 bit "I" olarak PIL ile işlenip kayıpsızca aynı moda geri çevrilir.
+
+    Hangisinin daha hızlı olduğu kernel boyutuna bağlıdır; kalibrasyon
+    kernel sınıfı başına yapılır (bkz. backend_key).
+    """
+
+    BACKENDS = ("opencv", "histogram", "pil")
+    BACKEND_MODES = {"opencv": MEDIAN_MODES, "histogram": MEDIAN_MODES}
+    LUMA_MODE = "merge"
+    # histogram backend'i: kenarları genişletilmiş kopya ve sonuç dizisi
+    MEMORY_EXPANSION = 3.0
+
+    def __init__(self, kernel_size=AppConfig.MEDIAN_FILTER_KERNEL, backend=None):
+        super().__init__("Median Filter", backend)
         self.kernel_size = kernel_size
 
+    def band_halo(self):
+        return self.kernel_size // 2
+
     def process(self, image):
-        img_np = np.array(image)
-        filtered = cv2.medianBlur(img_np, self.kernel_size)
-        return Image.fromarray(filtered)
+        if image.mode in ("P", "PA"):
+            transparent = image.mode == "PA" or "transparency" in image.info
+            return super().process(image.convert("RGBA" if transparent else "RGB"))
+        if image.mode.startswith("I;16"):
+            return super().process(image.convert("I")).convert(image.mode)
+        return super().process(image)
+
+    def _median_array(self, image, function):
+        """
+        Görüntüyü diziye çevirip function(pixels) uygular.
+
+        "1" modu 0 / 255 değerli L olarak işlenir; median yine 0 veya 255
+        olduğu için geri çevirme kayıpsızdır.
+        """
+        source = image.convert("L") if image.mode == "1" else image
+        result = Image.fromarray(function(np.asarray(source)), source.mode)
+
+        if image.mode == "1":
+            return result.convert("1", dither=Image.Dither.NONE)
+        return result
+
+    def _process_opencv(self, image):
+        def median(pixels):
+            if pixels.ndim == 3 and pixels.shape[2] not in (3, 4):
+                return np.dstack([
+                    cv2.medianBlur(np.ascontiguousarray(pixels[:, :, channel]), self.kernel_size)
+                    for channel in range(pixels.shape[2])
+                ])
+            return cv2.medianBlur(pixels, self.kernel_size)
+
+        return self._median_array(image, median)
+
+    def _process_histogram(self, image):
+        return self._median_array(
+            image, lambda pixels: median_histogram(pixels, self.kernel_size)
+        )
+
+    def _process_pil(self, image):
+        return image.filter(ImageFilter.MedianFilter(self.kernel_size))
+
+    def calibration_backends(self, mode: str):
+        # PIL'in median'ı kernel alanıyla büyür (k=31'de MP başına onlarca
+        # saniye); 5'ten büyük kernellerde diğer backend'ler varken ölçülmez
+        backends = self.supported_backends(mode)
+        if self.kernel_size > 5 and len(backends) > 1:
+            backends = [backend for backend in backends if backend != "pil"]
+        return backends
+
+    def backend_key(self):
+        # Kernel boyutu büyüdükçe backend'lerin sıralaması değişebilir
+        return f"{type(self).__name__}[{self.kernel_class(self.kernel_size)}]"
+
+    @staticmethod
+    def kernel_class(kernel_size: int) -> str:
+        """Kernel boyutunu AppConfig.MEDIAN_KERNEL_CLASSES sınıflarından birine koyar"""
+        for name, limit in AppConfig.MEDIAN_KERNEL_CLASSES:
+            if kernel_size <= limit:
+                return name
+        return AppConfig.MEDIAN_KERNEL_CLASSES[-1][0]
 
 
 class MotionBlurFilter(Filter):
     """Hareket bulanıklığı efekti"""
 
-    def __init__(self):
-        super().__init__("Motion Blur")
+    # PIL ImageFilter.Kernel sadece 3x3 ve 5x5 çekirdekleri desteklediği
+    # için 9x9 çekirdek OpenCV veya NumPy ile uygulanır
+    BACKENDS = ("opencv", "numpy")
+    BACKEND_MODES = {"opencv": ARRAY_MODES, "numpy": ARRAY_MODES}
 
-    def process(self, image):
-        # 9x9 hareket bulanıklığı çekirdeği
-        kernel_size = 9
+    # 9x9 hareket bulanıklığı çekirdeği
+    KERNEL_SIZE = 9
+    HALO = KERNEL_SIZE // 2
+    # numpy backend'i: uint32 kümülatif toplamlar ve float64 ortalama
+    MEMORY_EXPANSION = 30.0
+
+    def __init__(self, backend=None):
+        super().__init__("Motion Blur", backend)
+
+    def _kernel(self):
+        kernel_size = self.KERNEL_SIZE
         kernel = np.zeros((kernel_size, kernel_size))
         kernel[int((kernel_size - 1) / 2), :] = np.ones(kernel_size)
-        kernel = kernel / kernel_size
-
-        return image.filter(
-            ImageFilter.Kernel(
-                size=(kernel_size, kernel_size),
-                kernel=kernel.flatten(),
-                scale=1
-            )
+        return kernel / kernel_size
+
+    def _process_opencv(self, image):
+        kernel_size = self.KERNEL_SIZE
+        return _apply_kernel_cv2(
+            image, (kernel_size, kernel_size), self._kernel().flatten()
         )
+
+    def _process_numpy(self, image):
+        # Çekirdek tek satır olduğu için yatay kayan ortalamaya eşittir
+        pixels = np.asarray(image)
+        radius = self.KERNEL_SIZE // 2
+
+        sums = np.cumsum(pixels, axis=1, dtype=np.uint32)
+        sums = np.insert(sums, 0, 0, axis=1)
+        window = sums[:, self.KERNEL_SIZE:] - sums[:, :-self.KERNEL_SIZE]
+
+        result = pixels.copy()
+        result[radius:-radius, radius:-radius] = np.rint(
+            window[radius:-radius] / self.KERNEL_SIZE
+        ).astype(np.uint8)
+
+        return Image.fromarray(result, image.mode)
@@ -9,9 +9,14 @@ Bu dosya:
 yöneten yardımcı sınıfları içerir.
 """
 
+import itertools
 import tkinter as tk
+from collections import OrderedDict
+
 from PIL import Image, ImageTk
 
+from config import AppConfig
+
 
 class MenuManager:
     """
@@ -113,57 +118,232 @@ class MenuManager:
         )
 
 
+class ScaledImageCache:
+    """
+    Ekran boyutuna küçültülmüş görüntülerin önbelleği.
+
+    Anahtar: (görüntü sürümü, hedef genişlik, hedef yükseklik).
+    Her kayıt hızlı (taslak) veya kaliteli (LANCZOS) olabilir; taslak
+    kayıt kaliteli olanı hesaplanınca güncellenir.
+    """
+
+    DRAFT = "draft"
+    FINAL = "final"
+
+    def __init__(self, max_entries: int = AppConfig.DISPLAY_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def fit_size(image_size, max_width, max_height):
+        """Görüntünün oranını koruyarak alana sığan boyut (büyütme yapılmaz)"""
+        w, h = image_size
+        ratio = min(max_width / w, max_height / h, 1.0)
+        return max(1, int(w * ratio)), max(1, int(h * ratio))
+
+    @staticmethod
+    def scale(image, size, quality):
+        """
+        Görüntüyü hedef boyuta getirir ve Tk'nin gösterebileceği moda çevirir.
+
+        Taslak: reducing_gap ile önce tam sayı oranında hızlı küçültme,
+        sonra BILINEAR. Kaliteli: LANCZOS.
+        """
+        if image.size != size:
+            if quality == ScaledImageCache.DRAFT:
+                image = image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            else:
+                image = image.resize(size, Image.Resampling.LANCZOS)
+
+        # Tek kanallı (L) görüntüler işlem hattında tek kanallı kalır;
+        # RGB'ye genişletme sadece ekran çözünürlüğünde burada yapılır
+        if image.mode in ("RGB", "RGBA"):
+            return image
+        if "A" in image.getbands() or image.info.get("transparency") is not None:
+            return image.convert("RGBA")
+        return image.convert("RGB")
+
+    def get(self, key):
+        """(bitmap, kalite) veya None döner"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, bitmap, quality):
+        self._entries[key] = (bitmap, quality)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class ImageDisplay:
     """
     Canvas üzerinde görüntü gösterimini yöneten sınıf.
     Resize ve merkezleme işlemlerini kapsüller.
+
+    Aynı görüntü sürümü aynı canvas boyutunda tekrar gösterilirken
+    önbellekteki bitmap kullanılır. İlk gösterimde hızlı bir taslak
+    çizilir, kaliteli (LANCZOS) küçültme Tk boşta kalınca yapılır.
+    Mevcut PhotoImage boyutu uyuyorsa yeniden oluşturulmaz, paste
+    ile güncellenir.
     """
 
+    # Canvas kenarlarında bırakılan boşluk (px)
+    PADDING = 20
+
     def __init__(self, canvas, title="Image"):
         self.canvas = canvas
         self.title = title
         self.photo_image = None  # GC'yi önlemek için referans tutulur
 
-    def display_image(self, image):
-        """PIL.Image nesnesini canvas üzerinde gösterir"""
+        self.cache = ScaledImageCache()
+        self._image = None
+        self._version = None
+        self._anonymous_versions = itertools.count()
+        self._photo_mode = None
+        self._item = None
+        self._shown_key = None
+        self._quality_job = None
+        self._resize_job = None
+
+        # Canvas gerçekten yeniden boyutlandığında (debounce ile) yeniden çizilir
+        self.canvas.bind("<Configure>", self._on_configure, add="+")
+
+    def display_image(self, image, version=None):
+        """
+        PIL.Image nesnesini canvas üzerinde gösterir.
+
+        version: Görüntünün sürüm numarası (ImageManager.*_version).
+                 Verilmezse aynı nesne tekrar gösterildiğinde aynı sürüm sayılır.
+        """
         if image is None:
             return
 
-        canvas_width = max(self.canvas.winfo_width(), 500)
-        canvas_height = max(self.canvas.winfo_height(), 400)
+        if version is None:
+            if image is self._image and isinstance(self._version, tuple):
+                version = self._version
+            else:
+                version = ("anonymous", next(self._anonymous_versions))
 
-        image = self._resize_for_display(
-            image,
-            canvas_width - 20,
-            canvas_height - 20
-        )
+        self._image = image
+        self._version = version
+        self._render()
 
-        self.photo_image = ImageTk.PhotoImage(image)
+    def _canvas_size(self):
+        """Canvas'ın gerçek boyutu (henüz çizilmediyse yapılandırılan boyut)"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
 
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            canvas_width // 2,
-            canvas_height // 2,
-            image=self.photo_image,
-            anchor=tk.CENTER
+        if width <= 1 or height <= 1:
+            width = int(self.canvas.cget("width"))
+            height = int(self.canvas.cget("height"))
+
+        return width, height
+
+    def _render(self):
+        if self._image is None:
+            return
+
+        canvas_width, canvas_height = self._canvas_size()
+        size = ScaledImageCache.fit_size(
+            self._image.size,
+            max(1, canvas_width - self.PADDING),
+            max(1, canvas_height - self.PADDING),
         )
+        key = (self._version, size)
 
-    def _resize_for_display(self, image, max_width, max_height):
-        """Canvas boyutlarına göre orantılı resize yapar"""
-        w, h = image.size
-        ratio = min(max_width / w, max_height / h, 1.0)
+        self._cancel_quality_pass()
+
+        entry = self.cache.get(key)
+        if entry is None:
+            bitmap = ScaledImageCache.scale(self._image, size, ScaledImageCache.DRAFT)
+            quality = ScaledImageCache.DRAFT
+            self.cache.put(key, bitmap, quality)
+        else:
+            bitmap, quality = entry
+
+        self._show(key, bitmap, canvas_width, canvas_height)
+
+        if quality == ScaledImageCache.DRAFT and bitmap.size != self._image.size:
+            self._quality_job = self.canvas.after_idle(self._quality_pass, key)
+
+    def _quality_pass(self, key):
+        """Tk boştayken taslak bitmap'i LANCZOS ile yeniden hesaplar"""
+        self._quality_job = None
+        if self._image is None or key[0] != self._version:
+            return
+
+        bitmap = ScaledImageCache.scale(self._image, key[1], ScaledImageCache.FINAL)
+        self.cache.put(key, bitmap, ScaledImageCache.FINAL)
+
+        if self._shown_key == key:
+            self._shown_key = None
+            canvas_width, canvas_height = self._canvas_size()
+            self._show(key, bitmap, canvas_width, canvas_height)
 
-        if ratio < 1.0:
-            return image.resize(
-                (int(w * ratio), int(h * ratio)),
-                Image.Resampling.LANCZOS
+    def _show(self, key, bitmap, canvas_width, canvas_height):
+        """Bitmap'i canvas'a koyar; PhotoImage mümkünse yeniden kullanılır"""
+        center = (canvas_width // 2, canvas_height // 2)
+
+        if self._item is not None:
+            self.canvas.coords(self._item, *center)
+
+        if key == self._shown_key:
+            return
+
+        photo = self.photo_image
+        if (
+            photo is not None
+            and (photo.width(), photo.height()) == bitmap.size
+            and self._photo_mode == bitmap.mode
+        ):
+            photo.paste(bitmap)
+        else:
+            self.photo_image = ImageTk.PhotoImage(bitmap)
+            self._photo_mode = bitmap.mode
+
+        if self._item is None:
+            self._item = self.canvas.create_image(
+                *center, image=self.photo_image, anchor=tk.CENTER
             )
-        return image
+        else:
+            self.canvas.itemconfigure(self._item, image=self.photo_image)
+
+        self._shown_key = key
+
+    def _on_configure(self, event):
+        if self._resize_job is not None:
+            self.canvas.after_cancel(self._resize_job)
+        self._resize_job = self.canvas.after(
+            AppConfig.DISPLAY_RESIZE_DEBOUNCE_MS, self._on_resized
+        )
+
+    def _on_resized(self):
+        self._resize_job = None
+        self._render()
+
+    def _cancel_quality_pass(self):
+        if self._quality_job is not None:
+            self.canvas.after_cancel(self._quality_job)
+            self._quality_job = None
 
     def clear_display(self):
         """Canvas içeriğini temizler"""
+        self._cancel_quality_pass()
         self.canvas.delete("all")
         self.photo_image = None
+        self._photo_mode = None
+        self._image = None
+        self._version = None
+        self._item = None
+        self._shown_key = None
 
 
 class StatusManager:
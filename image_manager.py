@@ -8,105 +8,295 @@ Bu sınıf görüntünün:
 - geri alınması (undo)
 - kaydedilmesi
 işlevlerini yönetir.
+
+Tüm görüntü tamponları MemoryAccountant'a kaydedilir; bellek bütçesi
+aşılınca eski geçmiş kayıtları ve orijinal görüntü diske taşınır,
+ihtiyaç olduğunda geri yüklenir.
 """
 
 from PIL import Image
+import functools
+import itertools
 import os
 
+from config import AppConfig
+from derived_planes import DerivedPlaneCache
+from memory_manager import MemoryAccountant
+from profiling import MemoryProfiler, profiled_process
+
+
+def _profiled(method):
+    """Profil açıksa metodun tepe bellek kullanımını ölçer (bkz. profiling.py)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with MemoryProfiler.instance().measure(method.__name__, "image_manager"):
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class ImageManager:
     """Manages image loading, processing, and saving"""
 
-    def __init__(self):
-        # İlk yüklenen, hiç değişmeyen görüntü
-        self.original_image = None
+    def __init__(self, accountant: MemoryAccountant = None):
+        self.memory = accountant or MemoryAccountant.instance()
+
+        # İlk yüklenen, hiç değişmeyen görüntü (yönetilen tampon)
+        self._original = None
+        self._original_format = None
 
-        # Üzerinde işlem yapılan aktif görüntü
-        self.processed_image = None
+        # Üzerinde işlem yapılan aktif görüntü (diske taşınmaz)
+        self._processed = None
+
+        # Görüntüler her değiştiğinde artan sürüm numaraları;
+        # ekran önbelleği (ImageDisplay) bu numaralarla anahtarlanır
+        self._versions = itertools.count(1)
+        self.original_version = 0
+        self.processed_version = 0
 
         # Dosya yolu
         self.image_path = None
 
-        # Undo işlemleri için görüntü geçmişi
+        # Undo işlemleri için görüntü geçmişi (yönetilen tamponlar)
         self.image_history = []
 
+    # ------------------------------------------------------------------
+    # Yönetilen görüntüler
+    # ------------------------------------------------------------------
+    @property
+    def original_image(self):
+        return self._original.get() if self._original is not None else None
+
+    @original_image.setter
+    def original_image(self, image):
+        if self._original is not None:
+            self._original.release()
+        self._original = self.memory.register(image, "original") if image is not None else None
+        self.original_version = next(self._versions)
+
+    @property
+    def processed_image(self):
+        return self._processed.get() if self._processed is not None else None
+
+    @processed_image.setter
+    def processed_image(self, image):
+        if self._processed is not None:
+            self._processed.release()
+        self._processed = (
+            self.memory.register(image, "processed", pinned=True) if image is not None else None
+        )
+        self.processed_version = next(self._versions)
+
+    def _reset_history(self, image):
+        """Geçmişi tek bir başlangıç durumu ile yeniden başlatır"""
+        for handle in self.image_history:
+            handle.release()
+        self.image_history = [self.memory.register(image, "history")]
+
+    def get_memory_usage(self):
+        """Bellek muhasebecisinin anlık kullanım raporu"""
+        return self.memory.usage()
+
+    @_profiled
     def load_image(self, file_path):
         """Load an image from file"""
         try:
             image = Image.open(file_path)
 
             self.image_path = file_path
+            self._original_format = image.format
             self.original_image = image.copy()
             self.processed_image = image.copy()
+            self._share_original_version()
 
             # Undo için başlangıç durumu
-            self.image_history = [self.processed_image.copy()]
+            self._reset_history(self.processed_image.copy())
 
             return True
 
         except Exception as e:
             raise RuntimeError(f"Failed to load image: {e}")
 
-    def apply_processor(self, processor):
-        """Apply an image processor (Filter / Enhancement)"""
+    def apply_processor(self, processor, roi=None, mask=None):
+        """
+        Apply an image processor (Filter / Enhancement)
+
+        roi (sol, üst, sağ, alt) ve / veya mask verilirse sadece o bölge
+        işlenir (bkz. ImageProcessor.process_region); geçmişe sadece
+        değişen bölge yazılır.
+        """
         if self.processed_image is None:
             raise RuntimeError("No image loaded")
 
         try:
             # İşlem her zaman son durum üzerinden uygulanır
-            result = processor.process(self.processed_image)
+            if roi is None and mask is None:
+                result = profiled_process(processor, self.processed_image)
+                return self.commit_result(result)
 
-            self.processed_image = result
-            self.image_history.append(result.copy())
-
-            return True
+            patch, box = processor.process_region(
+                self.processed_image, roi, mask,
+                process=lambda image: profiled_process(processor, image),
+            )
+            if patch is None:
+                return False
+            return self.commit_region(patch, box)
 
         except Exception as e:
             raise RuntimeError(f"Image processing failed: {e}")
 
+    @_profiled
+    def commit_result(self, result):
+        """
+        Başka bir thread'de hesaplanmış işlem sonucunu aktif görüntü yapar.
+
+        GUI, işlemi arka planda çalıştırıp sonucu Tk thread'inde
+        bu metot ile kaydeder.
+        """
+        self.processed_image = result
+        self.image_history.append(self.memory.register(result.copy(), "history"))
+
+        return True
+
+    @_profiled
+    def commit_region(self, patch, box):
+        """
+        Bölge sonucunu aktif görüntüye yapıştırır.
+
+        Aktif görüntü kopyalanmadan yerinde güncellenir; geçmişe sadece
+        bölgenin yeni içeriği (yama) eklenir. Böylece büyük görüntüde küçük
+        bir bölge düzenlemesinin maliyeti bölgenin boyutuyla orantılıdır.
+        """
+        self.processed_image.paste(patch, box[:2])
+        self._changed_in_place()
+
+        handle = self.memory.register(patch.copy(), "history")
+        handle.box = tuple(box)
+        self.image_history.append(handle)
+
+        return True
+
+    def _share_original_version(self):
+        """
+        Aktif görüntü orijinalin birebir kopyası: aynı sürüm numarasını
+        alır, böylece ekranda ölçeklenmiş bitmap (bkz. ImageDisplay)
+        yüklemede ve reset'te yeniden hesaplanmaz.
+        """
+        self.processed_version = self.original_version
+
+    def _changed_in_place(self):
+        """
+        Aktif görüntü nesnesi yerinde değişti: yeni sürüm numarası alır ve
+        ondan türetilmiş düzlemler (bkz. derived_planes.py) geçersiz olur.
+        """
+        self.processed_version = next(self._versions)
+        DerivedPlaneCache.instance().invalidate(self.processed_image)
+
+    def _last_full_index(self):
+        """Geçmişteki son tam görüntü kaydının sırası"""
+        return max(i for i, handle in enumerate(self.image_history) if handle.box is None)
+
+    def _history_region(self, box):
+        """
+        Geçmişteki son durumun box bölgesi: son tam kayıttan kırpılır,
+        sonraki yamalar sırayla üzerine yapıştırılır.
+        """
+        index = self._last_full_index()
+        left, top = box[:2]
+        region = self.image_history[index].get().crop(box)
+        for patch in self.image_history[index + 1:]:
+            region.paste(patch.get(), (patch.box[0] - left, patch.box[1] - top))
+        return region
+
+    @_profiled
     def reset_image(self):
         """Reset image to original"""
         if self.original_image is None:
             return False
 
         self.processed_image = self.original_image.copy()
-        self.image_history = [self.processed_image.copy()]
+        self._share_original_version()
+        self._reset_history(self.processed_image.copy())
 
         return True
 
-    def save_image(self, file_path):
-        """Save the processed image"""
-        if self.processed_image is None:
+    @_profiled
+    def save_image(self, file_path, image=None):
+        """
+        Save the processed image
+
+        image verilirse (arka planda kaydederken alınan anlık kopya)
+        aktif görüntü yerine o kaydedilir.
+        """
+        image = image if image is not None else self.processed_image
+        if image is None:
             raise RuntimeError("No processed image to save")
 
         try:
-            self.processed_image.save(file_path)
+            self.prepare_for_save(image, file_path).save(file_path)
             return True
 
         except Exception as e:
             raise RuntimeError(f"Failed to save image: {e}")
 
+    @staticmethod
+    def prepare_for_save(image, file_path, policy=None):
+        """
+        Görüntüyü çıktı modu politikasına göre kaydedilecek moda getirir.
+
+        Gri (L) görüntüler varsayılan olarak L kaydedilir; sadece formatın
+        yazamadığı modlar (örn: JPEG için RGBA) dönüştürülür.
+        """
+        policy = (policy or AppConfig.SAVE_OUTPUT_MODE).lower()
+        if policy not in AppConfig.SAVE_OUTPUT_MODES:
+            raise ValueError(f"Unknown save output mode: {policy}")
+
+        if policy == "keep":
+            return image
+        if policy == "rgb":
+            return image if image.mode == "RGB" else image.convert("RGB")
+
+        ext = os.path.splitext(file_path)[1].lower()
+        file_format = Image.registered_extensions().get(ext)
+        supported = AppConfig.SAVE_FORMAT_MODES.get(file_format)
+
+        if supported is None or image.mode in supported:
+            return image
+
+        # Alfa kanalı atılır; gri görüntü gri kalır
+        target = "L" if image.mode in ("LA", "I", "F", "1") and "L" in supported else "RGB"
+        return image.convert(target)
+
     def get_image_info(self):
         """Get image information"""
-        if self.original_image is None:
+        if self._original is None:
             return None
 
+        # Bilgiler tampondan okunur; diske taşınmış görüntü geri yüklenmez
         return {
             "filename": os.path.basename(self.image_path),
-            "size": self.original_image.size,
-            "mode": self.original_image.mode,
-            "format": self.original_image.format
+            "size": self._original.size,
+            "mode": self._original.mode,
+            "format": self._original_format
         }
 
+    @_profiled
     def undo(self):
         """Undo last operation"""
         if len(self.image_history) <= 1:
             return False
 
         # Son işlemi sil
-        self.image_history.pop()
+        last = self.image_history.pop()
+        last.release()
+
+        if last.box is not None:
+            # Bölge işlemi: sadece o bölge önceki haline döndürülür
+            self.processed_image.paste(self._history_region(last.box), last.box[:2])
+            self._changed_in_place()
+            return True
 
-        # Bir önceki duruma dön
-        self.processed_image = self.image_history[-1].copy()
+        # Bir önceki duruma dön (diske taşınmışsa geri yüklenir)
+        width, height = self.image_history[self._last_full_index()].size
+        self.processed_image = self._history_region((0, 0, width, height))
 
         return True
@@ -0,0 +1,243 @@
+# ======================== job_journal.py ========================
+"""
+Kaldığı yerden devam edebilen toplu iş günlüğü (job journal)
+
+Saatler süren bir toplu iş %80'de çökerse ilerleme hiçbir yerde
+kaydedilmediği için baştan başlamak gerekiyordu.
+
+Bu dosya:
+- her işin (job) reçetesini, çıktı ve işleme ayarlarını (--stream, --cache)
+- her girdinin durumunu (pending / running / done / failed), çıktı yolunu,
+  sürelerini ve hata metnini
+yerel bir SQLite veritabanında saklar.
+
+Yazmalar tamponlanır ve tek transaction içinde executemany ile yapılır;
+saniyede binlerce sonuçta bile günlük darboğaz olmaz. WAL modu sayesinde
+iş sürerken başka bir process durumu okuyabilir.
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+from config import AppConfig
+
+
+STATES = ("pending", "running", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    recipe TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    output_format TEXT,
+    options TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    input TEXT NOT NULL,
+    output TEXT,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    started_at REAL,
+    finished_at REAL,
+    seconds REAL,
+    error TEXT,
+    PRIMARY KEY (job_id, input)
+);
+CREATE INDEX IF NOT EXISTS items_state ON items (job_id, state);
+"""
+
+
+class JobJournal:
+    """
+    SQLite tabanlı iş günlüğü.
+
+    Kullanım:
+        journal = JobJournal("jobs.sqlite3")
+        job = journal.start_job("nightly", "blur,sepia", "out/", None, inputs)
+        for path in journal.unfinished(job["id"]):
+            ...
+            journal.record(job["id"], result)
+        journal.close()
+
+    Nesne tek thread'den (koordinatör) kullanılmak üzere tasarlanmıştır.
+    """
+
+    def __init__(self, path: str = None, batch_size: int = None,
+                 flush_seconds: float = None):
+        """
+        Parametreler:
+            path (str): Veritabanı dosyası (varsayılan: AppConfig.JOURNAL_FILE)
+            batch_size (int): Bu kadar sonuç birikince diske yazılır
+            flush_seconds (float): Son yazmadan bu kadar süre geçince yazılır
+        """
+        self.path = path or AppConfig.JOURNAL_FILE
+        self.batch_size = batch_size or AppConfig.JOURNAL_BATCH_SIZE
+        self.flush_seconds = (
+            AppConfig.JOURNAL_FLUSH_SECONDS if flush_seconds is None else flush_seconds
+        )
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # WAL ile NORMAL: her commit'te fsync yapılmaz, çökmede veritabanı
+        # bozulmaz (en fazla son transaction kaybolur)
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        # options sütunu olmadan oluşturulmuş eski günlükler
+        columns = {row["name"] for row in self.connection.execute("PRAGMA table_info(jobs)")}
+        if "options" not in columns:
+            with self.connection:
+                self.connection.execute("ALTER TABLE jobs ADD COLUMN options TEXT")
+
+        self._pending_results = []
+        self._last_flush = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # İşler
+    # ------------------------------------------------------------------
+    def start_job(self, name: str, recipe: str, output_dir: str,
+                  output_format: str = None, inputs=(), output_paths=None,
+                  options: dict = None) -> dict:
+        """
+        İşi oluşturur veya (aynı isimle) mevcut işi açar.
+
+        Yeni girdiler "pending" olarak eklenir; daha önce eklenmiş girdilerin
+        durumu değişmez. Aynı isimli iş farklı reçeteyle açılamaz.
+
+        Parametreler:
+            output_paths (list[str]): Girdilerle aynı sırada çıktı yolları
+            options (dict): Devam ettirirken kullanılacak işleme ayarları
+                (JSON olarak saklanır; sadece iş ilk oluşturulurken yazılır)
+        """
+        job = self.get_job(name)
+        if job is None:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT INTO jobs (name, recipe, output_dir, output_format, options, "
+                    "created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (name, recipe, output_dir, output_format, json.dumps(options or {}),
+                     time.time()),
+                )
+            job = self.get_job(name)
+        elif job["recipe"] != recipe:
+            raise ValueError(
+                f"Job '{name}' was created with recipe '{job['recipe']}', not '{recipe}'"
+            )
+
+        inputs = list(inputs)
+        output_paths = output_paths or [None] * len(inputs)
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO items (job_id, input, output) VALUES (?, ?, ?)",
+                [(job["id"], path, output) for path, output in zip(inputs, output_paths)],
+            )
+        return job
+
+    def get_job(self, name: str):
+        """İsme göre iş kaydı (dict, options çözülmüş); yoksa None"""
+        row = self.connection.execute("SELECT * FROM jobs WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["options"] = json.loads(job["options"] or "{}")
+        return job
+
+    # ------------------------------------------------------------------
+    # Girdiler
+    # ------------------------------------------------------------------
+    def unfinished(self, job_id: int, retry_failed: bool = False) -> list:
+        """
+        İşlenmesi gereken girdiler.
+
+        "running" durumundakiler de dahildir: süreç çöktüğünde bitmemiş
+        girdiler bu durumda kalır.
+        """
+        states = ("pending", "running", "failed") if retry_failed else ("pending", "running")
+        rows = self.connection.execute(
+            f"SELECT input FROM items WHERE job_id = ? AND state IN ({','.join('?' * len(states))}) "
+            "ORDER BY rowid",
+            (job_id, *states),
+        ).fetchall()
+        return [row["input"] for row in rows]
+
+    def items(self, job_id: int, state: str = None) -> list:
+        """Girdi kayıtları (dict); state verilirse sadece o durumdakiler"""
+        query = "SELECT * FROM items WHERE job_id = ?"
+        params = [job_id]
+        if state is not None:
+            query += " AND state = ?"
+            params.append(state)
+        return [dict(row) for row in self.connection.execute(query + " ORDER BY rowid", params)]
+
+    def mark_running(self, job_id: int, inputs):
+        """Girdileri işçilere gönderildi olarak işaretler (tek transaction)"""
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE items SET state = 'running', started_at = ?, attempts = attempts + 1 "
+                "WHERE job_id = ? AND input = ?",
+                [(now, job_id, path) for path in inputs],
+            )
+
+    def record(self, job_id: int, result: dict):
+        """
+        process_file sonucunu tampona ekler; tampon dolunca veya
+        flush_seconds geçince diske yazılır.
+        """
+        state = "done" if result["status"] in ("done", "duplicate") else "failed"
+        self._pending_results.append((
+            state,
+            result.get("output"),
+            time.time(),
+            result.get("seconds"),
+            result.get("error"),
+            job_id,
+            result["input"],
+        ))
+
+        if (len(self._pending_results) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_seconds):
+            self.flush()
+
+    def flush(self):
+        """Tampondaki sonuçları tek transaction ile yazar"""
+        if self._pending_results:
+            with self.connection:
+                self.connection.executemany(
+                    "UPDATE items SET state = ?, output = COALESCE(?, output), "
+                    "finished_at = ?, seconds = ?, error = ? "
+                    "WHERE job_id = ? AND input = ?",
+                    self._pending_results,
+                )
+            self._pending_results = []
+        self._last_flush = time.monotonic()
+
+    def summary(self, job_id: int) -> dict:
+        """Durum başına girdi sayısı"""
+        counts = dict.fromkeys(STATES, 0)
+        for row in self.connection.execute(
+            "SELECT state, COUNT(*) AS count FROM items WHERE job_id = ? GROUP BY state",
+            (job_id,),
+        ):
+            counts[row["state"]] = row["count"]
+        counts["total"] = sum(counts[state] for state in STATES)
+        return counts
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -8,28 +8,227 @@ Uygulama genelinde:
 - uyarı
 - debug
 loglarını merkezi olarak yönetir.
+
+Batch işlerinde görüntü / parça başına log atıldığında dosya yazma ve
+formatlama hesaplama döngüsünü yavaşlatmasın diye:
+- asenkron mod: kayıtlar kuyruğa atılır, yazma işini ayrı bir thread yapar
+- JSON formatı: processor, boyut, süre gibi alanlar yapısal olarak yazılır
+- hız sınırı / örnekleme: çok sık tekrarlanan olaylar seyreltilir
+- işçi process'ler loglarını kuyruk üzerinden ana process'e iletir
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+import threading
+import time
+
+
+# LogRecord'un kendi alanları; bunların dışındaki alanlar JSON'a eklenir
+_STANDARD_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def log_event(logger, event: str, level: int = logging.DEBUG, **fields):
+    """
+    Yapısal (structured) olay kaydı atar.
+
+    Örnek:
+        log_event(logger, "filter_applied", processor="Blur",
+                  width=4000, height=3000, seconds=0.12)
+
+    Seviye kapalıysa hiçbir şey hesaplanmaz (hot path maliyeti sıfıra yakın).
+    """
+    if not logger.isEnabledFor(level):
+        return
+
+    message = event
+    if fields:
+        message += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+
+    logger.log(level, message, extra={"event": event, "fields": fields})
+
+
+class JsonFormatter(logging.Formatter):
+    """Her kaydı tek satırlık bir JSON nesnesi olarak yazar"""
+
+    def format(self, record):
+        payload = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "process": record.processName,
+            "message": record.getMessage(),
+        }
+
+        event = getattr(record, "event", None)
+        if event is not None:
+            payload["event"] = event
+            payload.update(getattr(record, "fields", {}))
+
+        for key, value in vars(record).items():
+            if key.startswith("_") or key in ("event", "fields"):
+                continue
+            if key not in _STANDARD_RECORD_FIELDS:
+                payload[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Yüksek frekanslı olayları seyrelten filtre.
+
+    Sadece log_event ile atılan (event alanı olan) kayıtlara uygulanır:
+    - sample_rate: olayların bu oranı geçer (örn: 0.1 → her 10 olaydan biri)
+    - max_per_second: aynı olay saniyede en fazla bu kadar geçer
+
+    Atlanan kayıt sayısı bir sonraki geçen kayda "suppressed" alanı olarak
+    eklenir; böylece veri kaybı görünür olur.
+    """
+
+    def __init__(self, max_per_second: float = None, sample_rate: float = 1.0):
+        super().__init__()
+        self.max_per_second = max_per_second
+        self.sample_every = max(1, round(1.0 / sample_rate)) if sample_rate > 0 else None
+
+        self._lock = threading.Lock()
+        self._state = {}
+
+    def filter(self, record):
+        event = getattr(record, "event", None)
+        if event is None:
+            return True
+
+        # Aynı kayıt birden fazla handler'dan geçerse tekrar sayılmaz
+        decided = getattr(record, "_rate_limit_passed", None)
+        if decided is not None:
+            return decided
+
+        with self._lock:
+            state = self._state.setdefault(
+                event, {"seen": 0, "suppressed": 0, "tokens": None, "updated": None}
+            )
+            state["seen"] += 1
+
+            allowed = self._sample(state) and self._take_token(state)
+            record._rate_limit_passed = allowed
+            if not allowed:
+                state["suppressed"] += 1
+                return False
+
+            if state["suppressed"]:
+                record.fields = dict(getattr(record, "fields", {}), suppressed=state["suppressed"])
+                state["suppressed"] = 0
+
+        return True
+
+    def _sample(self, state):
+        if self.sample_every is None:
+            return False
+        return (state["seen"] - 1) % self.sample_every == 0
+
+    def _take_token(self, state):
+        """Token bucket: saniyede max_per_second token dolar"""
+        if self.max_per_second is None:
+            return True
+
+        now = time.monotonic()
+        if state["tokens"] is None:
+            state["tokens"] = self.max_per_second
+        else:
+            elapsed = now - state["updated"]
+            state["tokens"] = min(self.max_per_second, state["tokens"] + elapsed * self.max_per_second)
+        state["updated"] = now
+
+        if state["tokens"] < 1:
+            return False
+
+        state["tokens"] -= 1
+        return True
+
+
+def configure_worker_logging(log_queue, settings: dict = None):
+    """
+    İşçi process'te çağrılır: tüm loglar ana process'teki kuyruğa gönderilir.
+
+    ConcurrencyController.process_pool(initializer=configure_worker_logging,
+    initargs=(log_queue, app_logger.worker_settings())) şeklinde kullanılır.
+
+    settings ana process'teki seviye ve hız sınırıdır. Seviye kapalı olan
+    olaylar hiç oluşturulmaz; hız sınırı kuyruğa atmadan önce uygulanır,
+    böylece atlanacak kayıtlar pickle edilip taşınmaz. Sınır her işçide
+    ayrı sayılır.
+    """
+    settings = settings or {}
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    app_logger = logging.getLogger(AppLogger.LOGGER_NAME)
+    for handler in list(app_logger.handlers):
+        app_logger.removeHandler(handler)
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    max_per_second = settings.get("max_per_second")
+    sample_rate = settings.get("sample_rate", 1.0)
+    if max_per_second is not None or sample_rate < 1.0:
+        queue_handler.addFilter(RateLimitFilter(max_per_second, sample_rate))
+
+    app_logger.addHandler(queue_handler)
+    app_logger.setLevel(settings.get("level", logging.DEBUG))
+    app_logger.propagate = False
 
 
 class AppLogger:
     """Application logger"""
 
-    def __init__(self, log_file: str = "image_processing.log"):
-        self.log_file = log_file
-        self.logger = self._setup_logger()
+    LOGGER_NAME = "ImageProcessingApp"
 
-    def _setup_logger(self):
-        """Setup logger configuration"""
-        logger = logging.getLogger("ImageProcessingApp")
-        logger.setLevel(logging.DEBUG)
+    # Handler'ları kuran (etkin) AppLogger; aynı ayarlarla tekrar
+    # oluşturulan AppLogger onun handler'larını paylaşır
+    _active = None
 
-        # Aynı logger tekrar oluşturulmasın diye kontrol
-        if logger.handlers:
-            return logger
+    def __init__(self, log_file: str = "image_processing.log", asynchronous: bool = False,
+                 json_format: bool = False, max_per_second: float = None,
+                 sample_rate: float = 1.0):
+        """
+        Parametreler:
+            log_file (str): Log dosyası
+            asynchronous (bool): True ise kayıtlar kuyruğa atılır, dosyaya ve
+                                 konsola yazma ayrı bir thread'de yapılır
+            json_format (bool): Dosyaya JSON satırları yazılır
+            max_per_second / sample_rate: Yüksek frekanslı olaylar için
+                                          hız sınırı ve örnekleme (RateLimitFilter)
+        """
+        self.log_file = log_file
+        self.asynchronous = asynchronous
+        self.json_format = json_format
+        self.max_per_second = max_per_second
+        self.sample_rate = sample_rate
+        self.rate_filter = None
+        if max_per_second is not None or sample_rate < 1.0:
+            self.rate_filter = RateLimitFilter(max_per_second, sample_rate)
 
+        self._config = (
+            os.path.abspath(log_file), asynchronous, json_format, max_per_second, sample_rate
+        )
+        self._listeners = []
+        self._worker_queue = None
+        self._handlers = []
+        self.logger = self._setup_logger()
+
+    def _create_handlers(self):
+        """Dosya ve konsol handler'larını oluşturur"""
         # Log klasörü yoksa oluştur
         log_dir = os.path.dirname(self.log_file)
         if log_dir and not os.path.exists(log_dir):
@@ -49,14 +248,113 @@ class AppLogger:
             datefmt="%Y-%m-%d %H:%M:%S"
         )
 
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(JsonFormatter() if self.json_format else formatter)
         console_handler.setFormatter(formatter)
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        return [file_handler, console_handler]
+
+    def _setup_logger(self):
+        """Setup logger configuration"""
+        logger = logging.getLogger(self.LOGGER_NAME)
+        logger.setLevel(logging.DEBUG)
+
+        active = AppLogger._active
+        if logger.handlers:
+            if active is None:
+                # Handler'ları başka biri kurmuş (örn: işçi process'te
+                # configure_worker_logging); olduğu gibi kullanılır
+                return logger
+            if active._config == self._config:
+                # Aynı ayarlar: handler'lar ve listener'lar paylaşılır
+                self.rate_filter = active.rate_filter
+                self._listeners = active._listeners
+                self._handlers = active._handlers
+                self._worker_queue = active._worker_queue
+                return logger
+            # Farklı ayarlar: eski handler'lar kapatılıp yenileri kurulur
+            active._remove_handlers()
+
+        AppLogger._active = self
+        handlers = self._create_handlers()
+
+        if not self.asynchronous:
+            for handler in handlers:
+                if self.rate_filter is not None:
+                    handler.addFilter(self.rate_filter)
+                logger.addHandler(handler)
+            self._handlers = handlers
+            return logger
+
+        # Asenkron mod: logger sadece kuyruğa yazar, handler'lar listener
+        # thread'inde çalışır
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        if self.rate_filter is not None:
+            # Filtre kuyruğa atmadan önce uygulanır; atlanan kayıt hiç
+            # formatlanmaz
+            queue_handler.addFilter(self.rate_filter)
+        logger.addHandler(queue_handler)
+
+        self._handlers = handlers
+        self._start_listener(log_queue)
+        atexit.register(self.stop)
 
         return logger
 
+    def _start_listener(self, log_queue):
+        listener = logging.handlers.QueueListener(
+            log_queue, *self._handlers, respect_handler_level=True
+        )
+        listener.start()
+        self._listeners.append(listener)
+
+    def _remove_handlers(self):
+        """Bu AppLogger'ın kurduğu handler'ları durdurur, kapatır ve kaldırır"""
+        self.stop()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+        for handler in self._handlers:
+            handler.close()
+        if AppLogger._active is self:
+            AppLogger._active = None
+
+    def worker_queue(self):
+        """
+        İşçi process'lerin loglarını iletebileceği process'ler arası kuyruk.
+
+        configure_worker_logging ile birlikte kullanılır. Kayıtlar ana
+        process'te aynı handler'lara (ve hız sınırına) yazılır.
+        """
+        if self._worker_queue is None:
+            if not self._listeners:
+                raise RuntimeError("Worker log forwarding requires asynchronous=True")
+
+            self._worker_queue = multiprocessing.Queue()
+            listener = logging.handlers.QueueListener(
+                self._worker_queue, _ForwardHandler(self.logger), respect_handler_level=True
+            )
+            listener.start()
+            self._listeners.append(listener)
+
+        return self._worker_queue
+
+    def worker_settings(self) -> dict:
+        """
+        İşçi process'lere verilecek log ayarları (bkz. configure_worker_logging):
+        logger'ın etkin seviyesi ve hız sınırı / örnekleme.
+        """
+        return {
+            "level": self.logger.getEffectiveLevel(),
+            "max_per_second": self.max_per_second,
+            "sample_rate": self.sample_rate,
+        }
+
+    def stop(self):
+        """Kuyruktaki kayıtları yazar ve listener thread'lerini durdurur"""
+        while self._listeners:
+            self._listeners.pop().stop()
+
     def info(self, message: str):
         """Log info message"""
         self.logger.info(message)
@@ -72,3 +370,18 @@ class AppLogger:
     def debug(self, message: str):
         """Log debug message"""
         self.logger.debug(message)
+
+    def event(self, event: str, level: int = logging.DEBUG, **fields):
+        """Structured event (bkz. log_event)"""
+        log_event(self.logger, event, level, **fields)
+
+
+class _ForwardHandler(logging.Handler):
+    """İşçilerden gelen kayıtları ana process'teki logger'a aktarır"""
+
+    def __init__(self, logger):
+        super().__init__()
+        self.target = logger
+
+    def emit(self, record):
+        self.target.handle(record)
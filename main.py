@@ -9,11 +9,15 @@ Filtreleri uygulamak için butonlar eklenmiştir.
 
 import tkinter as tk
 from main_app import ImageProcessingApplication
+from concurrency import ConcurrencyController
 from filters import EdgeDetectionFilter, CannyEdgeFilter, SepiaFilter, InvertFilter
 from PIL import Image, ImageTk
 
 
 def main():
+    # GUI tek görüntüde düşük gecikme ister (varsayılan: "latency" profili)
+    ConcurrencyController.from_preset().apply()
+
     # Tkinter root nesnesi oluştur
     root = tk.Tk()
     root.title("OOP Image Processing Project")
@@ -12,9 +12,21 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 
+from config import AppConfig
 from image_manager import ImageManager
 from factories import FilterFactory, EnhancementFactory
 from gui_components import MenuManager, ImageDisplay, StatusManager
+from profiling import profiled_process
+from scheduler import JobScheduler
+
+
+def _process_steps(processors, image):
+    """İşlemcileri sırayla uygular; her adımın sonucunu döndürür"""
+    results = []
+    for processor in processors:
+        image = profiled_process(processor, image)
+        results.append(image)
+    return results
 
 
 class ImageProcessingApplication:
@@ -29,6 +41,13 @@ class ImageProcessingApplication:
         self.filter_factory = FilterFactory()
         self.enhancement_factory = EnhancementFactory()
 
+        # İşlemler Tk thread'ini bloklamasın diye arka planda çalışır
+        self.scheduler = JobScheduler(workers=AppConfig.SCHEDULER_WORKERS)
+        # Henüz kaydedilmemiş önizleme adımları ve üzerinde çalıştıkları görüntü
+        self._preview_future = None
+        self._preview_base = None
+        self._preview_steps = []
+
         # GUI helpers
         self.original_display = None
         self.processed_display = None
@@ -180,8 +199,10 @@ class ImageProcessingApplication:
             self.image_manager.load_image(file_path)
 
             self.file_path_var.set(f"Selected: {os.path.basename(file_path)}")
-            self.original_display.display_image(self.image_manager.original_image)
-            self.processed_display.display_image(self.image_manager.processed_image)
+            self.original_display.display_image(
+                self.image_manager.original_image, self.image_manager.original_version
+            )
+            self._show_processed()
 
             info = self.image_manager.get_image_info()
             self.status_manager.set_status(
@@ -195,12 +216,7 @@ class ImageProcessingApplication:
     def apply_filter(self, filter_name):
         try:
             processor = self.filter_factory.create_filter(filter_name)
-            self.status_manager.set_processing(processor.name)
-
-            self.image_manager.apply_processor(processor)
-            self.processed_display.display_image(self.image_manager.processed_image)
-
-            self.status_manager.set_status(f"{processor.name} filter applied")
+            self._submit_preview(processor, f"{processor.name} filter applied")
 
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -209,20 +225,112 @@ class ImageProcessingApplication:
     def apply_enhancement(self, enhancement_name):
         try:
             processor = self.enhancement_factory.create_enhancement(enhancement_name)
-            self.status_manager.set_processing(processor.name)
-
-            self.image_manager.apply_processor(processor)
-            self.processed_display.display_image(self.image_manager.processed_image)
-
-            self.status_manager.set_status(f"{processor.name} adjustment applied")
+            self._submit_preview(processor, f"{processor.name} adjustment applied")
 
         except Exception as e:
             messagebox.showerror("Error", str(e))
             self.status_manager.set_error(e)
 
+    def _submit_preview(self, processor, done_message):
+        """
+        İşlemciyi arka planda (interactive öncelikle) çalıştırır.
+
+        Önceki önizleme henüz kaydedilmediyse yeni adım onun üzerine
+        zincirlenir: önceki iş iptal edilir, adımları yeni işte sırayla
+        yeniden çalıştırılır. Böylece art arda tıklamalarda hiçbir
+        düzenleme kaybolmaz ve sadece en son işin sonucu uygulanır.
+        """
+        base = self.image_manager.processed_image
+        if base is None:
+            raise RuntimeError("No image loaded")
+
+        # Reset veya yeni görüntüden sonra eski adımlar zincire eklenmez
+        if self._preview_base is not base:
+            self._preview_steps = []
+        steps = self._preview_steps + [processor]
+
+        self.status_manager.set_processing(", ".join(step.name for step in steps))
+
+        future = self.scheduler.submit_interactive("processed", _process_steps, steps, base)
+        self._preview_future = future
+        self._preview_base = base
+        self._preview_steps = steps
+
+        def on_success(results):
+            # Yerini alan iş bu adımları da içerir; durumu o günceller
+            if future is not self._preview_future:
+                return
+            self._end_preview()
+
+            # Bu arada reset veya yeni görüntü geldiyse sonuç atılır
+            if base is not self.image_manager.processed_image:
+                self.status_manager.set_status("Preview discarded: image changed")
+                return
+
+            for result in results:
+                self.image_manager.commit_result(result)
+            self._show_processed()
+            self.status_manager.set_status(
+                done_message if len(results) == 1 else f"{len(results)} edits applied"
+            )
+
+        def on_failure(error):
+            if future is not self._preview_future:
+                return
+            self._end_preview()
+
+            if error is None:
+                self.status_manager.set_ready()
+            else:
+                self._show_error(error)
+
+        self._when_done(future, on_success, on_failure)
+
+    def _end_preview(self):
+        self._preview_future = None
+        self._preview_base = None
+        self._preview_steps = []
+
+    def _show_processed(self):
+        """İşlenmiş görüntüyü sürüm numarasıyla gösterir (değişmediyse önbellekten)"""
+        self.processed_display.display_image(
+            self.image_manager.processed_image, self.image_manager.processed_version
+        )
+
+    def _when_done(self, future, on_success, on_failure=None):
+        """
+        Future tamamlandığında sonucu Tk thread'inde işler.
+
+        Tkinter thread-safe olmadığı için sonuç root.after ile yoklanır.
+        on_failure verilirse hata (iptalde None) ile çağrılır; verilmezse
+        hata gösterilir, iptal edilen işin durum mesajı temizlenir.
+        """
+        def poll():
+            if not future.done():
+                self.root.after(AppConfig.SCHEDULER_POLL_MS, poll)
+                return
+
+            error = None if future.cancelled() else future.exception()
+            if future.cancelled() or error is not None:
+                if on_failure is not None:
+                    on_failure(error)
+                elif error is None:
+                    self.status_manager.set_ready()
+                else:
+                    self._show_error(error)
+                return
+
+            on_success(future.result())
+
+        poll()
+
+    def _show_error(self, error):
+        messagebox.showerror("Error", str(error))
+        self.status_manager.set_error(error)
+
     def reset_image(self):
         if self.image_manager.reset_image():
-            self.processed_display.display_image(self.image_manager.processed_image)
+            self._show_processed()
             self.status_manager.set_status("Image reset")
 
     def save_image(self):
@@ -238,13 +346,17 @@ class ImageProcessingApplication:
         if not file_path:
             return
 
-        try:
-            self.image_manager.save_image(file_path)
+        # Dışa aktarma arka plan işi olarak çalışır; o anki görüntü kaydedilir
+        snapshot = self.image_manager.processed_image
+        future = self.scheduler.submit_background(
+            self.image_manager.save_image, file_path, snapshot
+        )
+
+        def on_success(_):
             messagebox.showinfo("Success", "Image saved successfully")
             self.status_manager.set_status(f"Image saved: {os.path.basename(file_path)}")
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._when_done(future, on_success)
 
     def show_about(self):
         messagebox.showinfo(
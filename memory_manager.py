@@ -0,0 +1,264 @@
+# ======================== memory_manager.py ========================
+"""
+Merkezi bellek muhasebesi (memory accounting) ve diske taşma (spill)
+
+image_history, original_image ve processed_image tam çözünürlüklü
+kareler tutar; uzun oturumlarda bellek kontrolsüz büyür.
+
+Bu dosya:
+- uygulamanın sahip olduğu her görüntü tamponunun boyutunu takip etmeyi
+- ayarlanabilir bir üst sınırı aşınca soğuk (uzun süredir kullanılmayan)
+  tamponları ham (raw) formatta geçici dizine yazmayı
+- gerektiğinde bu tamponları diskten geri yüklemeyi
+- anlık bellek kullanımını raporlamayı
+sağlar.
+"""
+
+import atexit
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from PIL import Image
+
+from config import AppConfig
+
+
+def image_nbytes(image: Image.Image) -> int:
+    """PIL görüntüsünün piksel verisinin yaklaşık bellek boyutu"""
+    width, height = image.size
+    bytes_per_pixel = {"1": 1, "L": 1, "P": 1, "I;16": 2}.get(image.mode, 4)
+    return width * height * bytes_per_pixel
+
+
+class ManagedImage:
+    """
+    MemoryAccountant tarafından takip edilen tek bir görüntü tamponu.
+
+    Tampon bellekte (resident) veya diskte (spilled) olabilir;
+    get() her iki durumda da görüntüyü döner.
+    """
+
+    def __init__(self, accountant, image: Image.Image, category: str, pinned: bool):
+        self.accountant = accountant
+        self.category = category
+        self.pinned = pinned
+
+        self.mode = image.mode
+        self.size = image.size
+        self.nbytes = image_nbytes(image)
+        self.palette = image.getpalette() if image.mode == "P" else None
+
+        self.last_access = time.monotonic()
+        self.spill_path = None
+        self._image = image
+
+        # Geçmiş yaması ise görüntüdeki yeri (sol, üst, sağ, alt);
+        # tam görüntüler için None (bkz. ImageManager.commit_region)
+        self.box = None
+
+    @property
+    def is_spilled(self) -> bool:
+        return self._image is None
+
+    def get(self) -> Image.Image:
+        """Görüntüyü döner; diske taşınmışsa geri yükler"""
+        self.last_access = time.monotonic()
+
+        image = self._image
+        if image is not None:
+            return image
+
+        return self.accountant._reload(self)
+
+    def release(self):
+        """Tamponu muhasebeden çıkarır ve varsa disk dosyasını siler"""
+        self.accountant.unregister(self)
+
+    # Disk işlemleri MemoryAccountant kilidi altında çağrılır
+    def _write_to_disk(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self._image.tobytes())
+        self.spill_path = path
+        self._image = None
+
+    def _read_from_disk(self) -> Image.Image:
+        with open(self.spill_path, "rb") as f:
+            image = Image.frombytes(self.mode, self.size, f.read())
+        if self.palette is not None:
+            image.putpalette(self.palette)
+        return image
+
+    def __repr__(self):
+        state = "spilled" if self.is_spilled else "resident"
+        return f"ManagedImage({self.category}, {self.size}, {self.mode}, {state})"
+
+
+class MemoryAccountant:
+    """
+    Görüntü tamponlarının toplam boyutunu takip eden ve bütçe aşılınca
+    en uzun süredir kullanılmayan tamponları diske taşıyan sınıf.
+
+    pinned=True tamponlar (örn: ekrandaki aktif görüntü) hiçbir zaman
+    diske taşınmaz ama kullanımda sayılır.
+    """
+
+    _instance = None
+
+    def __init__(self, budget_bytes: int = None, scratch_dir: str = None):
+        if budget_bytes is None:
+            budget_bytes = AppConfig.MEMORY_BUDGET_MB * 1024 * 1024
+
+        self.budget_bytes = budget_bytes
+        self._scratch_root = scratch_dir or AppConfig.MEMORY_SCRATCH_DIR
+        self._scratch_dir = None
+
+        self._buffers = set()
+        self._lock = threading.RLock()
+        self._counter = itertools.count()
+        self.spill_count = 0
+        self.reload_count = 0
+
+        atexit.register(self.cleanup)
+
+    @classmethod
+    def instance(cls):
+        """Uygulama genelinde paylaşılan muhasebeci"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # Kayıt
+    # ------------------------------------------------------------------
+    def register(self, image: Image.Image, category: str, pinned: bool = False) -> ManagedImage:
+        """
+        Görüntüyü muhasebeye ekler ve yönetilen tamponu döner.
+
+        category: "history", "original", "processed", "cache" gibi
+                  raporlamada kullanılan grup adı
+        """
+        handle = ManagedImage(self, image, category, pinned)
+
+        with self._lock:
+            self._buffers.add(handle)
+            self.enforce()
+
+        return handle
+
+    def unregister(self, handle: ManagedImage):
+        """Tamponu muhasebeden çıkarır"""
+        with self._lock:
+            self._buffers.discard(handle)
+            if handle.spill_path and os.path.exists(handle.spill_path):
+                os.remove(handle.spill_path)
+            handle.spill_path = None
+
+    def set_pinned(self, handle: ManagedImage, pinned: bool):
+        """Tamponun diske taşınabilirliğini değiştirir"""
+        with self._lock:
+            handle.pinned = pinned
+            if not pinned:
+                self.enforce()
+
+    # ------------------------------------------------------------------
+    # Bütçe
+    # ------------------------------------------------------------------
+    @property
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(b.nbytes for b in self._buffers if not b.is_spilled)
+
+    def enforce(self, keep: ManagedImage = None):
+        """
+        Bütçe aşıldıysa en eski erişimli, sabitlenmemiş (unpinned)
+        tamponları diske yazar.
+
+        keep: O anda kullanılan (örn: yeni geri yüklenen) tampon taşınmaz
+        """
+        with self._lock:
+            resident = self.resident_bytes
+            if resident <= self.budget_bytes:
+                return
+
+            candidates = sorted(
+                (
+                    b for b in self._buffers
+                    if not b.pinned and not b.is_spilled and b is not keep
+                ),
+                key=lambda b: b.last_access,
+            )
+
+            for handle in candidates:
+                if resident <= self.budget_bytes:
+                    break
+                self._spill(handle)
+                resident -= handle.nbytes
+
+    def _spill(self, handle: ManagedImage):
+        path = os.path.join(self._scratch(), f"{next(self._counter)}.raw")
+        handle._write_to_disk(path)
+        self.spill_count += 1
+
+    def _reload(self, handle: ManagedImage) -> Image.Image:
+        """Diske taşınmış tamponu belleğe geri alır"""
+        with self._lock:
+            if handle._image is None:
+                handle._image = handle._read_from_disk()
+                os.remove(handle.spill_path)
+                handle.spill_path = None
+                self.reload_count += 1
+
+                # Geri yüklenen tampon için yer açmak üzere başka
+                # tamponlar taşınabilir
+                self.enforce(keep=handle)
+
+            return handle._image
+
+    def _scratch(self) -> str:
+        """Bu process'e özel geçici dizin (ilk taşımada oluşturulur)"""
+        if self._scratch_dir is None:
+            os.makedirs(self._scratch_root, exist_ok=True)
+            self._scratch_dir = tempfile.mkdtemp(
+                prefix=f"{os.getpid()}-", dir=self._scratch_root
+            )
+        return self._scratch_dir
+
+    def cleanup(self):
+        """Geçici dizini ve içindeki taşınmış tamponları siler"""
+        with self._lock:
+            if self._scratch_dir and os.path.isdir(self._scratch_dir):
+                shutil.rmtree(self._scratch_dir, ignore_errors=True)
+            self._scratch_dir = None
+
+    # ------------------------------------------------------------------
+    # Raporlama
+    # ------------------------------------------------------------------
+    def usage(self) -> dict:
+        """
+        Anlık bellek kullanımı.
+
+        Örnek:
+            {"budget_bytes": ..., "resident_bytes": ..., "spilled_bytes": ...,
+             "categories": {"history": {"resident": .., "spilled": .., "count": ..}}}
+        """
+        with self._lock:
+            categories = {}
+            for handle in self._buffers:
+                entry = categories.setdefault(
+                    handle.category, {"resident": 0, "spilled": 0, "count": 0}
+                )
+                entry["count"] += 1
+                entry["spilled" if handle.is_spilled else "resident"] += handle.nbytes
+
+            return {
+                "budget_bytes": self.budget_bytes,
+                "resident_bytes": sum(c["resident"] for c in categories.values()),
+                "spilled_bytes": sum(c["spilled"] for c in categories.values()),
+                "spill_count": self.spill_count,
+                "reload_count": self.reload_count,
+                "categories": categories,
+            }
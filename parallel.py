@@ -0,0 +1,200 @@
+# ======================== parallel.py ========================
+"""
+Tek bir görüntünün bant paralel (band-parallel) işlenmesi
+
+PIL'in filter() çağrıları ve OpenCV fonksiyonları GIL'i bırakır, ama her
+filtre tek thread'de tüm kare üzerinde çalışır. GUI'de önemli olan tek
+büyük görüntünün gecikmesidir (latency).
+
+Bu dosya:
+- görüntüyü yatay bantlara bölmeyi
+- çekirdek (kernel) filtreleri için bantlara komşu satırları (halo) eklemeyi
+- bantları thread havuzunda aynı anda işlemeyi
+- sonuçları önceden ayrılmış tek çıktı görüntüsüne yapıştırmayı
+sağlar.
+
+Hangi işlemin bölünebileceğine işlemcinin band_halo() değeri karar verir
+(bkz. base_classes.ImageProcessor). Bölünemeyen işlemler (kontrast, Canny)
+ve küçük görüntüler olduğu gibi process() ile çalışır.
+"""
+
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+from PIL import Image
+
+from backends import BackendDispatcher
+from base_classes import Filter
+from config import AppConfig
+from exceptions import FilterError
+
+
+# Bantlara bölünebilen PIL modları (kırpma / yapıştırma kayıpsızdır)
+BAND_MODES = ("L", "RGB", "RGBA")
+
+
+class _BandOutput:
+    """Bantların yapıştırıldığı çıktı; ilk biten bant modu belirler"""
+
+    def __init__(self, size):
+        self.size = size
+        self.image = None
+        self._lock = threading.Lock()
+
+    def paste(self, piece, y):
+        if self.image is None:
+            with self._lock:
+                if self.image is None:
+                    self.image = Image.new(piece.mode, self.size)
+
+        if piece.mode != self.image.mode:
+            raise FilterError(
+                f"Band results differ in mode ({piece.mode} != {self.image.mode})"
+            )
+        # Bantlar çakışmadığı için yapıştırma kilitsiz yapılabilir
+        self.image.paste(piece, (0, y))
+
+
+class BandParallelExecutor:
+    """
+    İşlemciyi görüntünün yatay bantlarına paralel uygulayan sınıf.
+
+    Kullanım:
+        executor = BandParallelExecutor.instance()
+        result = executor.process(SharpenFilter(), image)
+
+    Sonuç, aynı işlemin tüm görüntüye uygulanmasıyla birebir aynıdır:
+    her bant halo kadar komşu satırla birlikte işlenir ve halo satırları
+    atılır.
+    """
+
+    _instance = None
+
+    def __init__(self, threads: int = None, min_pixels: int = None,
+                 bands_per_thread: int = None):
+        """
+        Parametreler:
+            threads (int): Thread sayısı (varsayılan: AppConfig.PARALLEL_THREADS,
+                           o da 0 ise cv2.getNumThreads())
+            min_pixels (int): Bundan küçük görüntüler bölünmez
+            bands_per_thread (int): Yük dengesi için thread başına bant sayısı
+        """
+        self.threads = threads
+        self.min_pixels = (
+            AppConfig.PARALLEL_MIN_PIXELS if min_pixels is None else min_pixels
+        )
+        self.bands_per_thread = bands_per_thread or AppConfig.PARALLEL_BANDS_PER_THREAD
+        self._pool = None
+        self._pool_size = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """Uygulama genelinde paylaşılan executor"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def thread_count(self) -> int:
+        """
+        Kullanılacak thread sayısı.
+
+        cv2.getNumThreads(), ConcurrencyController'ın process'e uyguladığı
+        sınırı yansıtır: "throughput" işçileri (1 thread) bölme yapmaz.
+        """
+        return max(1, self.threads or AppConfig.PARALLEL_THREADS or cv2.getNumThreads())
+
+    def _get_pool(self, threads):
+        with self._lock:
+            if self._pool is None or self._pool_size != threads:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = ThreadPoolExecutor(
+                    max_workers=threads, thread_name_prefix="imageproc-band"
+                )
+                self._pool_size = threads
+            return self._pool
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+                self._pool_size = 0
+
+    # ------------------------------------------------------------------
+    # Bölme
+    # ------------------------------------------------------------------
+    @staticmethod
+    def band_ranges(height: int, bands: int, halo: int):
+        """
+        [0, height) aralığını en fazla `bands` adet (başlangıç, bitiş)
+        aralığına böler. Bantlar halo'nun 4 katından kısa olmaz; aksi
+        halde tekrar işlenen satırlar kazancı yer.
+        """
+        rows = max(math.ceil(height / max(1, bands)), 4 * halo, 1)
+        return [(y, min(y + rows, height)) for y in range(0, height, rows)]
+
+    def can_split(self, processor, image) -> bool:
+        """İşlemci ve görüntü bantlara bölünerek işlenebilir mi?"""
+        width, height = image.size
+        return (
+            image.mode in BAND_MODES
+            and processor.band_halo() is not None
+            and width * height >= self.min_pixels
+            and self.thread_count() > 1
+        )
+
+    # ------------------------------------------------------------------
+    # İşleme
+    # ------------------------------------------------------------------
+    def process(self, processor, image):
+        """processor.process(image) ile aynı sonucu, bantları paralel işleyerek üretir"""
+        if not self.can_split(processor, image):
+            return processor.process(image)
+
+        threads = self.thread_count()
+        halo = processor.band_halo()
+        ranges = self.band_ranges(image.height, threads * self.bands_per_thread, halo)
+        if len(ranges) < 2:
+            return processor.process(image)
+
+        function = self._band_function(processor, image)
+        output = _BandOutput(image.size)
+
+        pool = self._get_pool(threads)
+        futures = [
+            pool.submit(self._process_band, function, image, start, stop, halo, output)
+            for start, stop in ranges
+        ]
+        for future in futures:
+            future.result()
+
+        return output.image
+
+    @staticmethod
+    def _band_function(processor, image):
+        """
+        Filtrelerde backend tüm görüntüye göre bir kez seçilir; aksi halde
+        bantlar boyut sınıfına göre farklı backend'lere düşebilirdi.
+        """
+        if isinstance(processor, Filter):
+            backend = BackendDispatcher.instance().select(processor, image)
+            return processor.backend_function(backend)
+        return processor.process
+
+    @staticmethod
+    def _process_band(function, image, start, stop, halo, output):
+        width, height = image.size
+        top = max(0, start - halo)
+        bottom = min(height, stop + halo)
+
+        band = image.crop((0, top, width, bottom))
+        result = function(band)
+        if result.size != band.size:
+            raise FilterError("Band-parallel processing requires size-preserving operations")
+
+        offset = start - top
+        output.paste(result.crop((0, offset, width, offset + stop - start)), start)
@@ -0,0 +1,262 @@
+# ======================== pipeline.py ========================
+"""
+Üç aşamalı (decode → compute → encode) boru hattı ile toplu işleme
+
+process_file ile her işçi dosyayı sırayla okur, işler ve yazar; disk
+okuma / yazma sırasında CPU boşta kalır.
+
+Bu dosya:
+- okuma + decode için I/O thread'lerini
+- reçete zinciri için process havuzunu (görüntüler paylaşımlı bellekle taşınır)
+- save (encode + yazma) için ayrı thread'leri
+- aşamalar arasında sınırlı kuyruklarla geri basıncı (backpressure)
+- aşama başına doluluk (utilisation) ölçümünü
+sağlar.
+
+Doluluğu 1'e yakın olan aşama darboğazdır; diğer aşamaların "bekleme"
+süreleri havuzların nasıl boyutlandırılacağını gösterir.
+"""
+
+import os
+import queue
+import threading
+import time
+
+from config import AppConfig
+from image_manager import ImageManager
+from shared_memory_transport import SharedMemoryExecutor
+
+
+class StageStats:
+    """Bir aşamanın çalışma ve bekleme sürelerini toplar (thread-safe)"""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.waiting_input_seconds = 0.0
+        self.blocked_output_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, busy: float = 0.0, waiting_input: float = 0.0,
+            blocked_output: float = 0.0, items: int = 0):
+        with self._lock:
+            self.busy_seconds += busy
+            self.waiting_input_seconds += waiting_input
+            self.blocked_output_seconds += blocked_output
+            self.items += items
+
+    def as_dict(self, wall_seconds: float) -> dict:
+        capacity = wall_seconds * self.workers
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy_seconds": self.busy_seconds,
+            "utilisation": self.busy_seconds / capacity if capacity > 0 else 0.0,
+            "waiting_input_seconds": self.waiting_input_seconds,
+            "blocked_output_seconds": self.blocked_output_seconds,
+        }
+
+
+def format_stage_stats(stats: dict) -> str:
+    """PipelineExecutor.stats için okunabilir tablo"""
+    lines = [f"{'stage':<8} {'workers':>7} {'items':>6} {'busy':>6} {'wait in':>8} {'blocked':>8}"]
+    for name, stage in stats["stages"].items():
+        lines.append(
+            f"{name:<8} {stage['workers']:>7} {stage['items']:>6} "
+            f"{stage['utilisation']:>6.0%} {stage['waiting_input_seconds']:>7.1f}s "
+            f"{stage['blocked_output_seconds']:>7.1f}s"
+        )
+    lines.append(f"bottleneck: {stats['bottleneck']} ({stats['seconds']:.2f} s wall)")
+    return "\n".join(lines)
+
+
+class PipelineExecutor:
+    """
+    Dosyaları decode / compute / encode aşamalarından geçiren executor.
+
+    Kullanım:
+        executor = PipelineExecutor(BatchProcessor("blur,sepia", controller))
+        results = executor.run(paths, "out/")
+        print(format_stage_stats(executor.stats))
+
+    Bellekte aynı anda en fazla queue_size decode edilmiş kare ve
+    queue_size işlenmiş (yazılmayı bekleyen) kare bulunur.
+    """
+
+    def __init__(self, batch_processor, decode_threads: int = None,
+                 encode_threads: int = None, queue_size: int = None):
+        """
+        Parametreler:
+            batch_processor (BatchProcessor): Reçete ve process havuzu kaynağı
+            decode_threads (int): Okuma thread sayısı (varsayılan: controller io_threads)
+            encode_threads (int): Yazma thread sayısı (varsayılan: controller io_threads)
+            queue_size (int): Aşamalar arasındaki kuyruk kapasitesi
+        """
+        config = batch_processor.controller.config
+        self.batch_processor = batch_processor
+        self.decode_threads = decode_threads or AppConfig.PIPELINE_DECODE_THREADS or config.io_threads
+        self.encode_threads = encode_threads or AppConfig.PIPELINE_ENCODE_THREADS or config.io_threads
+        self.compute_workers = config.worker_processes
+        self.queue_size = queue_size or AppConfig.PIPELINE_QUEUE_SIZE
+        self.stats = None
+
+    def run(self, input_paths, output_dir: str, output_format: str = None) -> list:
+        """
+        Dosyaları işler; sonuçlar process_file ile aynı biçimde ve girdi
+        sırasıyla döner. Aşama istatistikleri self.stats'e yazılır.
+        """
+        # Döngüsel import olmasın: batch_processor bu modülü kullanır
+        from batch_processor import _load_image
+
+        input_paths = list(input_paths)
+        steps = self.batch_processor.recipe.steps
+        results = [None] * len(input_paths)
+        started = [None] * len(input_paths)
+
+        paths = queue.Queue()
+        for index, path in enumerate(input_paths):
+            paths.put((index, path))
+        decoded = queue.Queue(maxsize=self.queue_size)
+        computed = queue.Queue()
+
+        # compute_slots: havuza aynı anda verilen kare sayısı (işçi sayısı kadar);
+        # encode_slots: işlenmiş ama henüz yazılmamış kare sayısı
+        compute_slots = threading.Semaphore(self.compute_workers)
+        encode_slots = threading.Semaphore(self.queue_size)
+
+        decode_stats = StageStats("decode", self.decode_threads)
+        compute_stats = StageStats("compute", self.compute_workers)
+        encode_stats = StageStats("encode", self.encode_threads)
+
+        def fail(index, error):
+            results[index] = self._result(
+                input_paths[index], output_dir, output_format, started[index], error
+            )
+
+        def decode_worker():
+            while True:
+                try:
+                    index, path = paths.get_nowait()
+                except queue.Empty:
+                    break
+
+                started[index] = time.perf_counter()
+                try:
+                    image = _load_image(path)
+                except Exception as e:
+                    fail(index, e)
+                    continue
+                finally:
+                    decode_stats.add(busy=time.perf_counter() - started[index], items=1)
+
+                wait_start = time.perf_counter()
+                decoded.put((index, image))
+                decode_stats.add(blocked_output=time.perf_counter() - wait_start)
+            decoded.put(None)
+
+        def encode_worker():
+            while True:
+                wait_start = time.perf_counter()
+                item = computed.get()
+                encode_stats.add(waiting_input=time.perf_counter() - wait_start)
+                if item is None:
+                    break
+
+                index, future = item
+                start = time.perf_counter()
+                try:
+                    output_path = self.batch_processor.output_path_for(
+                        input_paths[index], output_dir, output_format
+                    )
+                    image = future.result()
+                    ImageManager.prepare_for_save(image, output_path).save(output_path)
+                    error = None
+                except Exception as e:
+                    error = e
+                encode_stats.add(busy=time.perf_counter() - start, items=1)
+
+                results[index] = self._result(
+                    input_paths[index], output_dir, output_format, started[index], error
+                )
+                encode_slots.release()
+
+        def on_computed(index, submitted, future):
+            compute_stats.add(busy=time.perf_counter() - submitted, items=1)
+            compute_slots.release()
+            computed.put((index, future))
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        wall_start = time.perf_counter()
+        decoders = self._start_threads(decode_worker, self.decode_threads, "imageproc-decode")
+        encoders = self._start_threads(encode_worker, self.encode_threads, "imageproc-encode")
+
+        with SharedMemoryExecutor(self.batch_processor._process_pool()) as executor:
+            finished_decoders = 0
+            while finished_decoders < len(decoders):
+                wait_start = time.perf_counter()
+                item = decoded.get()
+                compute_stats.add(waiting_input=time.perf_counter() - wait_start)
+                if item is None:
+                    finished_decoders += 1
+                    continue
+
+                index, image = item
+                wait_start = time.perf_counter()
+                encode_slots.acquire()
+                compute_stats.add(blocked_output=time.perf_counter() - wait_start)
+                compute_slots.acquire()
+
+                submitted = time.perf_counter()
+                try:
+                    future = executor.submit(image, steps)
+                except Exception as e:
+                    compute_slots.release()
+                    encode_slots.release()
+                    fail(index, e)
+                    continue
+                future.add_done_callback(
+                    lambda done, index=index, submitted=submitted: on_computed(index, submitted, done)
+                )
+
+            # Tüm encode yuvaları geri alındığında her kare yazılmıştır
+            for _ in range(self.queue_size):
+                encode_slots.acquire()
+
+        for _ in encoders:
+            computed.put(None)
+        for thread in decoders + encoders:
+            thread.join()
+
+        wall = time.perf_counter() - wall_start
+        stages = {
+            stats.name: stats.as_dict(wall)
+            for stats in (decode_stats, compute_stats, encode_stats)
+        }
+        self.stats = {
+            "seconds": wall,
+            "stages": stages,
+            "bottleneck": max(stages, key=lambda name: stages[name]["utilisation"]),
+        }
+        return results
+
+    @staticmethod
+    def _start_threads(target, count, name):
+        threads = [
+            threading.Thread(target=target, name=f"{name}-{index}", daemon=True)
+            for index in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _result(self, input_path, output_dir, output_format, started, error) -> dict:
+        return {
+            "input": input_path,
+            "output": self.batch_processor.output_path_for(input_path, output_dir, output_format),
+            "status": "done" if error is None else "failed",
+            "error": None if error is None else f"{type(error).__name__}: {error}",
+            "seconds": time.perf_counter() - started if started is not None else 0.0,
+        }
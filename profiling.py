@@ -0,0 +1,248 @@
+# ======================== profiling.py ========================
+"""
+İşlemci (processor) başına bellek profili
+
+Hangi filtrenin ne kadar bellek kullandığı bilinmeden işçi process'lerin
+bellek sınırı tahminle belirlenir.
+
+Bu dosya (isteğe bağlı / opt-in):
+- her process() çağrısı ve ImageManager işlemi için tracemalloc ile
+  izlenen en yüksek (peak) ayırmayı
+- aynı süredeki RSS (process'in gerçek bellek kullanımı) farkını
+- reçete bazında sıralanmış bir raporu
+sağlar.
+
+Not: tracemalloc Python ve NumPy ayırmalarını görür, PIL'in C tarafında
+ayırdığı piksel tamponlarını görmez. Bu yüzden RSS farkı da raporlanır.
+"""
+
+import contextlib
+import os
+import threading
+import time
+import tracemalloc
+
+from config import AppConfig
+from parallel import BandParallelExecutor
+
+
+def current_rss():
+    """
+    Process'in anlık RSS değeri (byte). Ölçülemiyorsa None.
+
+    psutil opsiyoneldir; yoksa Linux'ta /proc kullanılır.
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class _Frame:
+    """Devam eden tek bir ölçüm"""
+
+    def __init__(self, label, category, recipe):
+        self.label = label
+        self.category = category
+        self.recipe = recipe
+        self.start_current = tracemalloc.get_traced_memory()[0]
+        self.peak = self.start_current
+        self.start_rss = current_rss()
+        self.start_time = time.perf_counter()
+
+
+class MemoryProfiler:
+    """
+    Bellek ölçümlerini toplayan sınıf.
+
+    Kullanım:
+        profiler = MemoryProfiler.instance()
+        profiler.start()
+        with profiler.recipe("sepia,canny_edge"):
+            Recipe("sepia,canny_edge").apply(image)
+        print(profiler.format_report())
+
+    Kapalıyken measure() boş bir context döner; ek maliyet yoktur.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+
+    @classmethod
+    def instance(cls):
+        """Uygulama genelinde paylaşılan profilci (AppConfig.PROFILE_MEMORY ile açılır)"""
+        if cls._instance is None:
+            cls._instance = cls()
+            if AppConfig.PROFILE_MEMORY:
+                cls._instance.start()
+        return cls._instance
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+        return self
+
+    def stop(self):
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+
+    # ------------------------------------------------------------------
+    # Ölçüm
+    # ------------------------------------------------------------------
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextlib.contextmanager
+    def recipe(self, name: str):
+        """Bu blokta alınan ölçümler verilen reçete adıyla gruplanır"""
+        previous = getattr(self._local, "recipe", None)
+        self._local.recipe = name
+        try:
+            yield
+        finally:
+            self._local.recipe = previous
+
+    def measure(self, label: str, category: str = "processor"):
+        """Blok boyunca en yüksek ayırmayı ve RSS farkını ölçer"""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._measure(label, category)
+
+    @contextlib.contextmanager
+    def _measure(self, label, category):
+        stack = self._stack()
+
+        # İç içe ölçümlerde dıştaki ölçümün o ana kadarki tepe değeri
+        # korunur, sonra tepe sayacı içteki ölçüm için sıfırlanır
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+        frame = _Frame(label, category, getattr(self._local, "recipe", None))
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+            end_rss = current_rss()
+
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+
+            record = {
+                "label": frame.label,
+                "category": frame.category,
+                "recipe": frame.recipe,
+                "peak_bytes": peak - frame.start_current,
+                "rss_delta": (
+                    end_rss - frame.start_rss
+                    if end_rss is not None and frame.start_rss is not None else None
+                ),
+                "seconds": time.perf_counter() - frame.start_time,
+            }
+            with self._lock:
+                self.records.append(record)
+
+    # ------------------------------------------------------------------
+    # Rapor
+    # ------------------------------------------------------------------
+    def report(self, recipe: str = None):
+        """
+        (reçete, işlem) bazında toplanmış ölçümler, en yüksek tepe
+        ayırmaya göre azalan sırada.
+        """
+        groups = {}
+        with self._lock:
+            records = list(self.records)
+
+        for record in records:
+            if recipe is not None and record["recipe"] != recipe:
+                continue
+
+            key = (record["recipe"], record["category"], record["label"])
+            group = groups.setdefault(key, {
+                "recipe": record["recipe"],
+                "category": record["category"],
+                "label": record["label"],
+                "calls": 0,
+                "peak_max": 0,
+                "peak_total": 0,
+                "rss_delta_max": None,
+                "seconds": 0.0,
+            })
+            group["calls"] += 1
+            group["peak_max"] = max(group["peak_max"], record["peak_bytes"])
+            group["peak_total"] += record["peak_bytes"]
+            group["seconds"] += record["seconds"]
+            if record["rss_delta"] is not None:
+                group["rss_delta_max"] = max(group["rss_delta_max"] or 0, record["rss_delta"])
+
+        rows = list(groups.values())
+        for row in rows:
+            row["peak_avg"] = row.pop("peak_total") / row["calls"]
+
+        rows.sort(key=lambda row: row["peak_max"], reverse=True)
+        return rows
+
+    def format_report(self, recipe: str = None) -> str:
+        """Raporu reçete başına gruplanmış okunabilir tablo olarak döner"""
+        rows = self.report(recipe)
+        if not rows:
+            return "No memory measurements recorded."
+
+        def mb(value):
+            return "-" if value is None else f"{value / (1024 * 1024):.1f}"
+
+        lines = []
+        for name in dict.fromkeys(row["recipe"] for row in rows):
+            lines.append(f"Recipe: {name or '(none)'}")
+            lines.append(f"  {'operation':<28}{'calls':>6}{'peak MB':>10}{'avg MB':>9}{'RSS +MB':>9}{'sec':>8}")
+            for row in rows:
+                if row["recipe"] != name:
+                    continue
+                label = f"{row['category']}:{row['label']}"
+                lines.append(
+                    f"  {label:<28}{row['calls']:>6}{mb(row['peak_max']):>10}"
+                    f"{mb(row['peak_avg']):>9}{mb(row['rss_delta_max']):>9}{row['seconds']:>8.3f}"
+                )
+            lines.append("")
+
+        return "\n".join(lines).rstrip()
+
+
+def profiled_process(processor, image):
+    """
+    processor.process(image); profil açıksa ölçülerek çağrılır.
+
+    Büyük görüntüler bantlara bölünerek paralel işlenir (bkz. parallel.py).
+    """
+    with MemoryProfiler.instance().measure(processor.name, "processor"):
+        return BandParallelExecutor.instance().process(processor, image)
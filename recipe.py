@@ -0,0 +1,118 @@
+# ======================== recipe.py ========================
+"""
+İşlem reçetesi (recipe)
+
+Reçete, sırayla uygulanacak filtre / enhancement isimlerinden oluşur:
+    "blur,contrast_up,sepia"
+
+Bazı filtreler "isim:değer" şeklinde parametre alır:
+    "gaussian_blur:120,brightness_down"
+
+Kernel filtreleri ve kontrast / keskinlik, sonuna ":luma" eklenerek sadece
+parlaklık düzlemine uygulanabilir:
+    "gaussian_blur:3:luma,sharpen:luma,contrast_up:luma"
+
+Bu dosya:
+- reçete metnini adımlara ayırmayı
+- adımları FilterFactory / EnhancementFactory ile nesneye çevirmeyi
+- zinciri bir görüntüye uygulamayı
+sağlar.
+
+Reçete sadece isimlerden oluştuğu için process'ler arasında
+kolayca (pickle ile) taşınabilir.
+"""
+
+import logging
+import time
+
+from factories import FilterFactory, EnhancementFactory
+from exceptions import FilterError
+from logger import log_event
+from profiling import profiled_process
+
+
+logger = logging.getLogger("ImageProcessingApp.recipe")
+
+
+class Recipe:
+    """Sırayla uygulanacak işlemci (processor) zinciri"""
+
+    # İşçi process'lerinde aynı reçete tekrar tekrar oluşturulmasın diye
+    _cache = {}
+
+    def __init__(self, steps):
+        """
+        Parametreler:
+            steps (str | list[str]): "blur,sepia" veya ["blur", "sepia"]
+        """
+        if isinstance(steps, str):
+            steps = [step.strip() for step in steps.split(",")]
+
+        self.steps = [step.lower() for step in steps if step]
+        self.processors = self._create_processors()
+
+    @classmethod
+    def cached(cls, steps):
+        """Aynı adımlar için daha önce oluşturulmuş reçeteyi döner"""
+        if isinstance(steps, str):
+            steps = steps.split(",")
+
+        key = tuple(steps)
+        if key not in cls._cache:
+            cls._cache[key] = cls(list(steps))
+        return cls._cache[key]
+
+    def _create_processors(self):
+        """Adım isimlerini factory'ler üzerinden nesneye çevirir"""
+        filter_factory = FilterFactory()
+        enhancement_factory = EnhancementFactory()
+
+        processors = []
+        for step in self.steps:
+            name, params = filter_factory.parse_step(step)
+            if name in filter_factory.filters:
+                processors.append(filter_factory.create_filter(name, **params))
+            elif name in enhancement_factory.enhancements:
+                processors.append(enhancement_factory.create_enhancement(name, **params))
+            else:
+                raise FilterError(f"Unknown recipe step: {step}")
+
+        return processors
+
+    def apply(self, image):
+        """Zinciri sırayla uygular ve son görüntüyü döner"""
+        for index in range(len(self.processors)):
+            image = self.apply_step(index, image)
+        return image
+
+    def apply_step(self, index: int, image):
+        """Zincirin index. adımını uygular (bkz. ResultStore.apply)"""
+        processor = self.processors[index]
+
+        # Adım başına olay kaydı sadece DEBUG açıkken hesaplanır
+        if not logger.isEnabledFor(logging.DEBUG):
+            return profiled_process(processor, image)
+
+        start = time.perf_counter()
+        image = profiled_process(processor, image)
+        log_event(
+            logger, "step_applied",
+            processor=processor.name,
+            width=image.width, height=image.height, mode=image.mode,
+            seconds=round(time.perf_counter() - start, 6),
+        )
+        return image
+
+    @property
+    def is_point_chain(self) -> bool:
+        """Tüm adımlar nokta işlemi mi (bant bant uygulanabilir mi)"""
+        return all(processor.POINT_OPERATION for processor in self.processors)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __str__(self):
+        return ",".join(self.steps)
+
+    def __repr__(self):
+        return f"Recipe({str(self)!r})"
@@ -0,0 +1,317 @@
+# ======================== result_store.py ========================
+"""
+İçerik adresli (content-addressed) sonuç deposu
+
+Gece çalışan bir toplu işte reçetenin tek adımı değişince bütün
+görüntüler baştan hesaplanıyordu.
+
+Bu dosya:
+- her sonucu girdi dosyasının özeti + reçete önekinin özeti ile anahtarlamayı
+- son (ve istenirse ara) sonuçları ham (raw) veya kayıpsız (PNG) formatta
+  diske yazmayı
+- toplam boyut sınırı aşılınca en uzun süredir kullanılmayanları silmeyi (LRU)
+- reçeteyi uygularken en uzun hazır öneki kullanıp kalan adımları
+  hesaplamayı (make benzeri artımlı işleme)
+sağlar.
+
+Önek anahtarı zincir halinde hesaplanır:
+    k0 = sha256(girdi baytları)
+    ki = sha256(k(i-1) + processor_i.cache_key())
+Böylece "blur,sepia,invert" ile "blur,sepia,solarize" ilk iki adımı paylaşır.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+
+from PIL import Image
+
+from config import AppConfig
+
+
+MB = 1024 * 1024
+
+# Ham format dosya başlığı: sihirli baytlar + JSON başlık uzunluğu
+RAW_MAGIC = b"IPRS"
+RAW_EXTENSION = ".raw"
+PNG_EXTENSION = ".png"
+
+
+def chain_keys(input_digest: str, processors) -> list:
+    """
+    Zincirin her öneki için depo anahtarı.
+
+    Dönüş:
+        list[str]: i. eleman ilk i+1 adımın sonucunun anahtarıdır
+    """
+    keys = []
+    current = input_digest
+    for processor in processors:
+        current = hashlib.sha256(
+            f"{current}|{processor.cache_key()}".encode("utf-8")
+        ).hexdigest()
+        keys.append(current)
+    return keys
+
+
+class ResultStore:
+    """
+    Reçete sonuçlarını diskte tutan depo.
+
+    Kullanım:
+        store = ResultStore.for_directory("~/.cache/results")
+        image, info = store.apply(recipe, lambda: Image.open(path), sha256_file(path))
+
+    Aynı dizini birden fazla process paylaşabilir: dosyalar geçici adla
+    yazılıp yerine taşınır (atomik), LRU için dosya erişim zamanı
+    (mtime) kullanılır.
+    """
+
+    # Process başına dizin -> depo (işçiler her dosyada yeniden taramasın)
+    _stores = {}
+
+    def __init__(self, root: str = None, max_bytes: int = None,
+                 keep_intermediate: bool = None, storage_format: str = None):
+        """
+        Parametreler:
+            root (str): Depo dizini (varsayılan: AppConfig.RESULT_STORE_DIR)
+            max_bytes (int): Toplam boyut sınırı
+            keep_intermediate (bool): Ara adım sonuçları da yazılsın mı
+            storage_format (str): "raw" veya "png"
+        """
+        self.root = root or AppConfig.RESULT_STORE_DIR
+        self.max_bytes = (
+            AppConfig.RESULT_STORE_MAX_MB * MB if max_bytes is None else max_bytes
+        )
+        self.keep_intermediate = (
+            AppConfig.RESULT_STORE_INTERMEDIATE
+            if keep_intermediate is None else keep_intermediate
+        )
+        self.storage_format = storage_format or AppConfig.RESULT_STORE_FORMAT
+        if self.storage_format not in ("raw", "png"):
+            raise ValueError(f"Unknown result store format: {self.storage_format}")
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.root, exist_ok=True)
+        self._bytes = sum(size for _, size, _ in self._entries())
+
+    @classmethod
+    def for_directory(cls, root: str, **options):
+        """Bu process'te dizin için daha önce oluşturulmuş depoyu döner"""
+        key = (os.path.abspath(root), tuple(sorted(options.items())))
+        if key not in cls._stores:
+            cls._stores[key] = cls(root, **options)
+        return cls._stores[key]
+
+    # ------------------------------------------------------------------
+    # Dosya yolları
+    # ------------------------------------------------------------------
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.root, key[:2], key + extension)
+
+    def _existing_path(self, key: str):
+        """Anahtarın (herhangi bir formattaki) dosyası; yoksa None"""
+        for extension in (RAW_EXTENSION, PNG_EXTENSION):
+            path = self._path(key, extension)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _entries(self):
+        """(yol, boyut, son erişim) üçlüleri"""
+        entries = []
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith((RAW_EXTENSION, PNG_EXTENSION)):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    # ------------------------------------------------------------------
+    # Okuma / yazma
+    # ------------------------------------------------------------------
+    def contains(self, key: str) -> bool:
+        return self._existing_path(key) is not None
+
+    def get(self, key: str):
+        """Anahtarın görüntüsünü döner; yoksa None"""
+        path = self._existing_path(key)
+        if path is None:
+            self.misses += 1
+            return None
+
+        try:
+            image = self._read(path)
+            # LRU: erişim zamanı güncellenir
+            os.utime(path)
+        except (OSError, ValueError):
+            # Başka process silmiş veya dosya bozuk
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return image
+
+    def put(self, key: str, image: Image.Image):
+        """Görüntüyü anahtarla yazar, sınır aşılırsa eski kayıtları siler"""
+        extension = RAW_EXTENSION if self.storage_format == "raw" else PNG_EXTENSION
+        path = self._path(key, extension)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self._write(image, temp_path, self.storage_format)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        with self._lock:
+            self._bytes += os.path.getsize(path)
+            if self._bytes > self.max_bytes:
+                self.evict()
+
+    @staticmethod
+    def _write(image: Image.Image, path: str, storage_format: str):
+        if storage_format == "png":
+            # Hız için düşük sıkıştırma; PNG her zaman kayıpsızdır
+            image.save(path, format="PNG", compress_level=1)
+            return
+
+        header = json.dumps({
+            "mode": image.mode,
+            "size": list(image.size),
+            "palette": image.getpalette() if image.mode == "P" else None,
+        }).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(RAW_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(image.tobytes())
+
+    @staticmethod
+    def _read(path: str) -> Image.Image:
+        if path.endswith(PNG_EXTENSION):
+            with Image.open(path) as image:
+                image.load()
+                return image
+
+        with open(path, "rb") as f:
+            if f.read(len(RAW_MAGIC)) != RAW_MAGIC:
+                raise ValueError(f"Not a result store file: {path}")
+            (length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(length).decode("utf-8"))
+            image = Image.frombytes(header["mode"], tuple(header["size"]), f.read())
+
+        if header["palette"] is not None:
+            image.putpalette(header["palette"])
+        return image
+
+    # ------------------------------------------------------------------
+    # LRU temizliği
+    # ------------------------------------------------------------------
+    def evict(self, target_bytes: int = None):
+        """
+        Toplam boyut hedefin altına inene kadar en eski kayıtları siler.
+
+        Diğer process'lerin yazdıkları da sayılsın diye dizin yeniden taranır.
+        """
+        if target_bytes is None:
+            target_bytes = self.max_bytes
+
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+
+        for path, size, _ in entries:
+            if total <= target_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+        self._bytes = total
+
+    def clear(self):
+        """Depodaki tüm kayıtları siler"""
+        with self._lock:
+            self.evict(target_bytes=0)
+
+    # ------------------------------------------------------------------
+    # Reçete uygulama
+    # ------------------------------------------------------------------
+    def longest_prefix(self, keys):
+        """
+        Depoda bulunan en uzun önek.
+
+        Dönüş:
+            (int, Image | None): hazır adım sayısı ve o adımın sonucu
+        """
+        for index in range(len(keys) - 1, -1, -1):
+            if self.contains(keys[index]):
+                image = self.get(keys[index])
+                if image is not None:
+                    return index + 1, image
+        self.misses += 1
+        return 0, None
+
+    def apply(self, recipe, load_image, input_digest: str):
+        """
+        Reçeteyi en uzun hazır önekten devam ederek uygular.
+
+        Parametreler:
+            recipe (Recipe): Uygulanacak reçete
+            load_image: Girdi görüntüsünü döndüren fonksiyon; sadece hiçbir
+                        önek hazır değilse çağrılır (decode atlanır)
+            input_digest (str): Girdi dosyasının sha256 özeti
+
+        Dönüş:
+            (Image, dict): sonuç ve {"reused_steps", "computed_steps", "seconds"}
+        """
+        start = time.perf_counter()
+        keys = chain_keys(input_digest, recipe.processors)
+        reused, image = self.longest_prefix(keys)
+
+        if image is None:
+            image = load_image()
+
+        for index in range(reused, len(keys)):
+            image = recipe.apply_step(index, image)
+
+            is_last = index == len(keys) - 1
+            if is_last or self.keep_intermediate:
+                self.put(keys[index], image)
+
+        return image, {
+            "reused_steps": reused,
+            "computed_steps": len(keys) - reused,
+            "seconds": time.perf_counter() - start,
+        }
+
+    def stats(self) -> dict:
+        """Depo durumu"""
+        entries = self._entries()
+        return {
+            "root": self.root,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
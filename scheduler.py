@@ -0,0 +1,294 @@
+# ======================== scheduler.py ========================
+"""
+Öncelikli iş zamanlayıcı (job scheduler)
+
+İşlemler Tk thread'inden alındığında, kullanıcının tıklamasıyla gelen
+önizleme işleri (interactive) uzun süren arka plan işleriyle (dışa aktarma,
+tam çözünürlük render, thumbnail üretimi) yarışır.
+
+Bu dosya:
+- öncelik sınıflarına göre sıralanan bir iş kuyruğunu
+- aynı görüntü için eskimiş önizleme işlerinin iptalini
+- arka plan işleri için eşzamanlılık bütçesini
+- kuyruk derinliği ve bekleme süresi istatistiklerini
+sağlar.
+
+Arka plan işleri hiçbir zaman tüm işçileri dolduramaz; en az bir işçi
+interactive işler için ayrılır. Böylece 10 dakikalık bir dışa aktarma
+sürerken bile kullanıcının tıklaması sıradaki ilk iş olur.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+
+logger = logging.getLogger("ImageProcessingApp.scheduler")
+
+
+def _cancel_future(future):
+    """
+    Future'ı iptal eder ve bekleyenleri bilgilendirir.
+
+    Birden fazla kez çağrılması güvenlidir (zaten iptal edilmiş / bildirilmiş
+    Future için hata vermez).
+    """
+    if future.cancelled():
+        return
+    if future.cancel():
+        future.set_running_or_notify_cancel()
+
+
+class JobPriority:
+    """Öncelik sınıfları (küçük değer = yüksek öncelik)"""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+    NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+
+class Job:
+    """Kuyruktaki tek bir iş"""
+
+    def __init__(self, priority, func, args, kwargs, key=None):
+        self.priority = priority
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.future = Future()
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+
+        # Çalışırken yerine daha yeni bir iş gelirse sonucu atılır
+        self.stale = False
+
+
+class JobScheduler:
+    """
+    Thread havuzu üzerinde çalışan öncelikli iş zamanlayıcı.
+
+    Dönen Future nesneleri iş çalışırken PENDING durumunda kalır;
+    bu sayede eskiyen bir iş bittiğinde Future'ı iptal edilebilir ve
+    bekleyen taraf sonucu hiç görmez.
+    """
+
+    def __init__(self, workers: int = 2, background_budget: int = None):
+        """
+        Parametreler:
+            workers (int): Toplam işçi thread sayısı (en az 2; biri
+                           interactive işler için ayrılır)
+            background_budget (int): Aynı anda çalışabilecek en fazla
+                                     arka plan işi (varsayılan: workers - 1)
+        """
+        self.workers = max(2, workers)
+
+        if background_budget is None:
+            background_budget = self.workers - 1
+        # En az bir işçi her zaman interactive işler için boş kalır
+        self.background_budget = max(0, min(background_budget, self.workers - 1))
+
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._shutdown = False
+
+        self._running = {JobPriority.INTERACTIVE: 0, JobPriority.BACKGROUND: 0}
+        self._latest_by_key = {}
+        self._wait_stats = {
+            priority: {"count": 0, "total": 0.0, "max": 0.0}
+            for priority in JobPriority.NAMES
+        }
+
+        self._threads = [
+            threading.Thread(
+                target=self._worker_loop, name=f"imageproc-scheduler-{i}", daemon=True
+            )
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ------------------------------------------------------------------
+    # İş gönderme
+    # ------------------------------------------------------------------
+    def submit_interactive(self, key, func, *args, **kwargs) -> Future:
+        """
+        Önizleme işi gönderir.
+
+        Aynı key (örn: görüntü kimliği) için bekleyen eski işler iptal edilir,
+        çalışan eski işlerin sonucu atılır. Sadece en son iş geçerlidir.
+        """
+        job = Job(JobPriority.INTERACTIVE, func, args, kwargs, key)
+
+        with self._condition:
+            previous = self._latest_by_key.get(key)
+            if previous is not None:
+                self._cancel_locked(previous)
+            self._latest_by_key[key] = job
+            self._push_locked(job)
+
+        return job.future
+
+    def submit_background(self, func, *args, **kwargs) -> Future:
+        """Uzun süren arka plan işi gönderir (dışa aktarma, render...)"""
+        job = Job(JobPriority.BACKGROUND, func, args, kwargs)
+
+        with self._condition:
+            self._push_locked(job)
+
+        return job.future
+
+    def _push_locked(self, job):
+        if self._shutdown:
+            raise RuntimeError("Scheduler is shut down")
+
+        heapq.heappush(self._queue, (job.priority, next(self._counter), job))
+        self._condition.notify_all()
+
+    def _cancel_locked(self, job):
+        """Bekleyen işi iptal eder, çalışan işi eskimiş olarak işaretler"""
+        job.stale = True
+        if job.started_at is None:
+            _cancel_future(job.future)
+
+    # ------------------------------------------------------------------
+    # İşçi döngüsü
+    # ------------------------------------------------------------------
+    def _next_job_locked(self):
+        """
+        Çalıştırılabilecek en yüksek öncelikli işi kuyruktan alır.
+
+        Arka plan bütçesi doluysa arka plan işleri kuyrukta bekler,
+        interactive işler ise her zaman alınabilir.
+        """
+        deferred = []
+        job = None
+
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            candidate = entry[2]
+
+            if candidate.future.cancelled():
+                # Kullanıcı tarafından iptal edilmiş olabilir
+                _cancel_future(candidate.future)
+                continue
+
+            if (
+                candidate.priority == JobPriority.BACKGROUND
+                and self._running[JobPriority.BACKGROUND] >= self.background_budget
+            ):
+                deferred.append(entry)
+                continue
+
+            job = candidate
+            break
+
+        for entry in deferred:
+            heapq.heappush(self._queue, entry)
+
+        return job
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                job = self._next_job_locked()
+                while job is None:
+                    if self._shutdown:
+                        return
+                    self._condition.wait()
+                    job = self._next_job_locked()
+
+                job.started_at = time.perf_counter()
+                self._running[job.priority] += 1
+                self._record_wait_locked(job)
+
+            try:
+                result = job.func(*job.args, **job.kwargs)
+                error = None
+            except Exception as e:
+                result, error = None, e
+
+            with self._condition:
+                self._running[job.priority] -= 1
+                if self._latest_by_key.get(job.key) is job:
+                    del self._latest_by_key[job.key]
+                self._condition.notify_all()
+
+            try:
+                self._finish(job, result, error)
+            except Exception:
+                # İşçi thread'i ölürse sonraki işler sonsuza kadar bekler
+                logger.exception("Could not complete job %r", job.func)
+
+    @staticmethod
+    def _finish(job, result, error):
+        """Future'ı sonuçlandırır; eskimiş veya iptal edilmiş işin sonucu atılır"""
+        if job.stale:
+            _cancel_future(job.future)
+            return
+
+        # Tek adımda: çağıran bu arada iptal ettiyse False döner; RUNNING
+        # durumundaki Future artık iptal edilemez, sonuç güvenle yazılır
+        if not job.future.set_running_or_notify_cancel():
+            return
+
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(result)
+
+    # ------------------------------------------------------------------
+    # İstatistikler
+    # ------------------------------------------------------------------
+    def _record_wait_locked(self, job):
+        wait = job.started_at - job.submitted_at
+        stats = self._wait_stats[job.priority]
+        stats["count"] += 1
+        stats["total"] += wait
+        stats["max"] = max(stats["max"], wait)
+
+    def stats(self) -> dict:
+        """
+        Kuyruk derinliği, çalışan iş sayısı ve bekleme süreleri.
+
+        Örnek:
+            {"interactive": {"queued": 0, "running": 1,
+                             "avg_wait": 0.001, "max_wait": 0.004}, ...}
+        """
+        with self._condition:
+            queued = {priority: 0 for priority in JobPriority.NAMES}
+            for _, _, job in self._queue:
+                if not job.future.cancelled():
+                    queued[job.priority] += 1
+
+            report = {}
+            for priority, name in JobPriority.NAMES.items():
+                waits = self._wait_stats[priority]
+                report[name] = {
+                    "queued": queued[priority],
+                    "running": self._running[priority],
+                    "started": waits["count"],
+                    "avg_wait": waits["total"] / waits["count"] if waits["count"] else 0.0,
+                    "max_wait": waits["max"],
+                }
+
+            return report
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = True):
+        """Zamanlayıcıyı durdurur; bekleyen işler istenirse iptal edilir"""
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for _, _, job in self._queue:
+                    self._cancel_locked(job)
+                self._queue.clear()
+            self._condition.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,331 @@
+# ======================== shared_memory_transport.py ========================
+"""
+Process'ler arası paylaşımlı bellek (shared memory) ile görüntü taşıma
+
+Process havuzuna gönderilen görüntüler normalde pickle ile kopyalanır:
+her kare hem gidişte hem dönüşte serileştirilir.
+
+Bu dosya:
+- görüntüyü multiprocessing.shared_memory segmentine yazmayı
+- kuyruk üzerinden sadece küçük bir tanımlayıcı (FrameDescriptor) göndermeyi
+- segmentlerin ömrünü (oluşturma / serbest bırakma / temizlik) yönetmeyi
+sağlar.
+
+Sahiplik kuralı:
+- Koordinatörün oluşturduğu girdi segmentlerini koordinatör siler
+- İşçinin oluşturduğu çıktı segmentinin sahipliği koordinatöre geçer,
+  koordinatör okuduktan sonra siler
+"""
+
+import atexit
+import threading
+from concurrent.futures import Future
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from PIL import Image
+
+from exceptions import ImageProcessingError
+from recipe import Recipe
+
+
+class FrameDescriptor:
+    """
+    Paylaşımlı bellekteki bir karenin küçük (pickle edilebilir) tanımı.
+
+    Kuyruktan sadece bu nesne geçer, piksel verisi geçmez.
+    """
+
+    __slots__ = ("name", "shape", "dtype", "mode")
+
+    def __init__(self, name: str, shape: tuple, dtype: str, mode: str = None):
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.mode = mode
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    def __getstate__(self):
+        return (self.name, self.shape, self.dtype, self.mode)
+
+    def __setstate__(self, state):
+        self.name, self.shape, self.dtype, self.mode = state
+
+    def __repr__(self):
+        return f"FrameDescriptor({self.name}, {self.shape}, {self.dtype}, {self.mode})"
+
+
+# Ham piksel olarak birebir taşınabilen modlar. "P" / "1" gibi modlar
+# NumPy'a çevrilirken paleti / bit paketlemeyi kaybettiği için önce dönüştürülür.
+TRANSPORT_MODES = ("L", "RGB", "RGBA", "I", "F")
+
+
+# ----------------------------------------------------------------------
+# Düşük seviye yardımcılar (hem koordinatör hem işçi tarafında kullanılır)
+# ----------------------------------------------------------------------
+def transportable(image: Image.Image) -> Image.Image:
+    """Görüntüyü ham piksel olarak taşınabilir bir moda çevirir"""
+    if image.mode in TRANSPORT_MODES:
+        return image
+    return image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+
+def write_array(array: np.ndarray, mode: str = None):
+    """
+    Diziyi yeni bir segmente kopyalar.
+
+    Dönüş:
+        (SharedMemory, FrameDescriptor)
+    """
+    array = np.ascontiguousarray(array)
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+    view[...] = array
+    del view
+
+    return segment, FrameDescriptor(segment.name, array.shape, array.dtype.str, mode)
+
+
+def write_image(image: Image.Image):
+    """PIL görüntüsünü yeni bir segmente yazar"""
+    image = transportable(image)
+    return write_array(np.asarray(image), image.mode)
+
+
+def read_array(descriptor: FrameDescriptor) -> np.ndarray:
+    """Segmentteki kareyi kopyalayarak NumPy dizisi olarak okur"""
+    segment = shared_memory.SharedMemory(name=descriptor.name)
+    try:
+        view = np.ndarray(descriptor.shape, dtype=descriptor.dtype, buffer=segment.buf)
+        array = view.copy()
+        del view
+        return array
+    finally:
+        segment.close()
+
+
+def read_image(descriptor: FrameDescriptor) -> Image.Image:
+    """
+    Segmentteki kareyi PIL görüntüsü olarak okur.
+
+    Image.frombytes veriyi doğrudan PIL'in kendi belleğine kopyalar,
+    arada ek bir NumPy kopyası oluşmaz.
+    """
+    height, width = descriptor.shape[:2]
+    segment = shared_memory.SharedMemory(name=descriptor.name)
+    try:
+        with segment.buf[:descriptor.nbytes] as data:
+            return Image.frombytes(descriptor.mode, (width, height), data)
+    finally:
+        segment.close()
+
+
+def unlink(descriptor: FrameDescriptor):
+    """Segmenti sistemden siler (zaten silinmişse sessizce geçer)"""
+    try:
+        segment = shared_memory.SharedMemory(name=descriptor.name)
+    except FileNotFoundError:
+        return
+
+    segment.close()
+    segment.unlink()
+
+
+# ----------------------------------------------------------------------
+# İşçi tarafı görev fonksiyonu
+# ----------------------------------------------------------------------
+def process_shared_frame(descriptor: FrameDescriptor, steps) -> FrameDescriptor:
+    """
+    İşçi process'te çalışır: girdiyi paylaşımlı bellekten okur,
+    reçeteyi uygular, sonucu yeni bir segmente yazar.
+
+    Çıktı segmentinin sahipliği koordinatöre geçer.
+    """
+    image = read_image(descriptor)
+    result = Recipe.cached(steps).apply(image)
+
+    segment, result_descriptor = write_image(result)
+    segment.close()
+
+    return result_descriptor
+
+
+# ----------------------------------------------------------------------
+# Koordinatör tarafı
+# ----------------------------------------------------------------------
+class SharedFrameTransport:
+    """
+    Koordinatör tarafında segmentlerin ömrünü yöneten sınıf.
+
+    Oluşturulan / sahiplenilen tüm segmentler takip edilir;
+    close() (veya program kapanışı) kalanların hepsini siler.
+    """
+
+    def __init__(self):
+        self._segments = {}
+        # İşçi sonuçları havuzun yönetim thread'inde işlendiği için
+        # segment tablosu kilitle korunur
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+        # İşçiler başlamadan önce resource tracker çalışıyor olmalı ki
+        # işçilerle aynı tracker paylaşılsın. Aksi halde işçinin oluşturup
+        # koordinatörün sildiği segmentler "sızmış" gibi raporlanır.
+        resource_tracker.ensure_running()
+
+    def put_array(self, array: np.ndarray, mode: str = None) -> FrameDescriptor:
+        """Diziyi paylaşımlı belleğe yazar ve tanımlayıcısını döner"""
+        segment, descriptor = write_array(array, mode)
+        with self._lock:
+            self._segments[descriptor.name] = segment
+        return descriptor
+
+    def put_image(self, image: Image.Image) -> FrameDescriptor:
+        """PIL görüntüsünü paylaşımlı belleğe yazar"""
+        image = transportable(image)
+        return self.put_array(np.asarray(image), image.mode)
+
+    def adopt(self, descriptor: FrameDescriptor):
+        """İşçinin oluşturduğu segmentin sahipliğini alır"""
+        with self._lock:
+            self._segments.setdefault(descriptor.name, None)
+
+    def get_image(self, descriptor: FrameDescriptor, release: bool = True):
+        """Segmenti görüntü olarak okur, istenirse hemen siler"""
+        image = read_image(descriptor)
+        if release:
+            self.release(descriptor)
+        return image
+
+    def get_array(self, descriptor: FrameDescriptor, release: bool = True):
+        """Segmenti NumPy dizisi olarak okur, istenirse hemen siler"""
+        array = read_array(descriptor)
+        if release:
+            self.release(descriptor)
+        return array
+
+    def release(self, descriptor: FrameDescriptor):
+        """Segmenti kapatır ve siler"""
+        with self._lock:
+            segment = self._segments.pop(descriptor.name, None)
+
+        if segment is None:
+            unlink(descriptor)
+            return
+
+        segment.close()
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        """Takip edilen bütün segmentleri siler"""
+        with self._lock:
+            names = list(self._segments)
+
+        for name in names:
+            self.release(FrameDescriptor(name, (0,), "u1"))
+
+    @property
+    def open_segments(self) -> int:
+        return len(self._segments)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class SharedMemoryExecutor:
+    """
+    Process havuzu üzerine paylaşımlı bellek taşıması ekleyen sarmalayıcı.
+
+    submit(image, steps) bir Future[PIL.Image] döner. Hem batch
+    işlemlerinde hem de GUI arka plan işçisinde aynı şekilde kullanılır.
+    """
+
+    def __init__(self, pool, transport: SharedFrameTransport = None):
+        """
+        Parametreler:
+            pool: concurrent.futures.ProcessPoolExecutor
+                  (genellikle ConcurrencyController.process_pool())
+        """
+        self.pool = pool
+        self.transport = transport or SharedFrameTransport()
+
+    def submit(self, image: Image.Image, steps) -> Future:
+        """Görüntüyü paylaşımlı belleğe koyar ve reçeteyi işçide çalıştırır"""
+        descriptor = self.transport.put_image(image)
+        result = Future()
+
+        try:
+            worker_future = self.pool.submit(
+                process_shared_frame, descriptor, list(steps)
+            )
+        except Exception:
+            self.transport.release(descriptor)
+            raise
+
+        def _on_done(done):
+            # Girdi segmenti her durumda serbest bırakılır
+            self.transport.release(descriptor)
+
+            if done.cancelled():
+                result.cancel()
+                result.set_running_or_notify_cancel()
+                return
+
+            error = done.exception()
+            if error is None:
+                output = done.result()
+                self.transport.adopt(output)
+
+            # Tek adımda: çağıran iptal ettiyse False döner; RUNNING durumundaki
+            # Future artık iptal edilemez, sonuç güvenle yazılır
+            if not result.set_running_or_notify_cancel():
+                if error is None:
+                    self.transport.release(output)
+                return
+
+            if error is not None:
+                result.set_exception(
+                    error if isinstance(error, ImageProcessingError)
+                    else ImageProcessingError(f"Worker processing failed: {error}")
+                )
+                return
+
+            try:
+                result.set_result(self.transport.get_image(output))
+            except Exception as e:
+                result.set_exception(e)
+
+        worker_future.add_done_callback(_on_done)
+
+        # Sonuç iptal edilirse henüz başlamamış işçi görevi de iptal edilir
+        result.add_done_callback(
+            lambda done: done.cancelled() and worker_future.cancel()
+        )
+        return result
+
+    def map(self, images, steps):
+        """Görüntü listesini işler, sonuçları aynı sırayla döner"""
+        futures = [self.submit(image, steps) for image in images]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True):
+        self.pool.shutdown(wait=wait)
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
@@ -0,0 +1,523 @@
+# ======================== streaming.py ========================
+"""
+Satır bantları (row bands) ile sabit bellekte akış (streaming) işleme
+
+Invert, solarize, parlaklık, sepya, gri tonlama gibi nokta işlemlerinde
+(POINT_OPERATION) çıktı pikseli sadece aynı konumdaki girdi pikseline
+bağlıdır; görüntünün tamamını bellekte tutmaya gerek yoktur.
+
+Bu dosya:
+- girdiyi satır bantları halinde okumayı
+  (.npy: ham satırlar, TIFF: sıkıştırılmamış şeritler, PNG: IDAT akışı)
+- nokta işlemi zincirini her banda uygulamayı
+- bantları çıktıya artımlı olarak yazmayı (.npy, .tif, .png)
+sağlar. Bellek kullanımı görüntü yüksekliğinden bağımsızdır.
+
+Bant halinde okunamayan girdiler (JPEG, sıkıştırılmış TIFF, Paeth
+filtreli PNG...) bir kere tam decode edilir; yazma yine bant bant yapılır.
+"""
+
+import os
+import struct
+import time
+import zlib
+
+import numpy as np
+from PIL import Image
+
+from config import AppConfig
+from exceptions import FilterError
+from recipe import Recipe
+
+
+# Bant halinde işlenebilen görüntü modları ve kanal sayıları
+STREAM_MODES = {"L": 1, "RGB": 3, "RGBA": 4}
+
+_MODE_FOR_CHANNELS = {channels: mode for mode, channels in STREAM_MODES.items()}
+
+
+def _band_to_image(array):
+    channels = 1 if array.ndim == 2 else array.shape[2]
+    return Image.fromarray(np.ascontiguousarray(array), _MODE_FOR_CHANNELS[channels])
+
+
+# ======================================================================
+# Okuyucular (readers)
+# ======================================================================
+class NpyBandReader:
+    """
+    .npy dosyasından sadece istenen satırları okur.
+
+    memmap yerine dosyadan doğrudan okunur; memmap'te okunan sayfalar
+    process'in RSS'inde kalır ve bellek görüntü boyutuyla büyür.
+    """
+
+    streaming = True
+
+    def __init__(self, file_path: str, band_rows: int):
+        self._file = open(file_path, "rb")
+        version = np.lib.format.read_magic(self._file)
+        read_header = (
+            np.lib.format.read_array_header_1_0 if version == (1, 0)
+            else np.lib.format.read_array_header_2_0
+        )
+        shape, fortran_order, dtype = read_header(self._file)
+
+        if dtype != np.uint8 or fortran_order or len(shape) not in (2, 3):
+            self._file.close()
+            raise ValueError("Only C-ordered uint8 (H, W) or (H, W, C) arrays can be streamed")
+
+        self.shape = shape
+        self.height, self.width = shape[:2]
+        self.row_items = int(np.prod(shape[1:]))
+        self.band_rows = band_rows
+
+    def bands(self):
+        for top in range(0, self.height, self.band_rows):
+            rows = min(self.band_rows, self.height - top)
+            band = np.fromfile(self._file, dtype=np.uint8, count=rows * self.row_items)
+            yield _band_to_image(band.reshape((rows,) + tuple(self.shape[1:])))
+
+    def close(self):
+        self._file.close()
+
+
+class TiffStripReader:
+    """
+    Sıkıştırılmamış (raw) TIFF şeritlerinden doğrudan satır okur.
+
+    Satırın dosyadaki yeri şerit başlangıcı + satır * satır_uzunluğu
+    olduğundan her bant için sadece o satırların byte'ları okunur.
+    """
+
+    streaming = True
+
+    def __init__(self, file_path: str, band_rows: int):
+        with Image.open(file_path) as image:
+            self.width, self.height = image.size
+            self.mode = image.mode
+            tiles = list(image.tile)
+
+        if self.mode not in STREAM_MODES or not tiles:
+            raise ValueError("Unsupported TIFF mode")
+
+        self.stride = self.width * STREAM_MODES[self.mode]
+        self.strips = []
+        for tile in tiles:
+            codec, (x0, y0, x1, y1), offset, args = tile
+            rawmode = args[0] if isinstance(args, tuple) else args
+            orientation = args[2] if isinstance(args, tuple) and len(args) > 2 else 1
+            if codec != "raw" or rawmode != self.mode or orientation != 1:
+                raise ValueError("TIFF is compressed or not stored as plain strips")
+            if x0 != 0 or x1 != self.width:
+                raise ValueError("Tiled TIFF cannot be read in row bands")
+            self.strips.append((y0, y1, offset))
+
+        self.band_rows = band_rows
+        self._file = open(file_path, "rb")
+
+    def _read_rows(self, top, bottom):
+        data = bytearray()
+        for y0, y1, offset in self.strips:
+            start, end = max(top, y0), min(bottom, y1)
+            if start >= end:
+                continue
+            self._file.seek(offset + (start - y0) * self.stride)
+            data += self._file.read((end - start) * self.stride)
+        return bytes(data)
+
+    def bands(self):
+        for top in range(0, self.height, self.band_rows):
+            bottom = min(top + self.band_rows, self.height)
+            yield Image.frombytes(
+                self.mode, (self.width, bottom - top), self._read_rows(top, bottom)
+            )
+
+    def close(self):
+        self._file.close()
+
+
+class PngRowReader:
+    """
+    PNG IDAT akışını zlib ile parça parça açarak satır bantları üretir.
+
+    Satır filtrelerinden None / Sub / Up vektörel olarak geri alınabilir.
+    Average / Paeth filtreli satırlar piksel piksel bağımlılık içerdiğinden
+    bu dosyalar (ön taramada tespit edilip) tam decode ile okunur.
+    """
+
+    streaming = True
+
+    SIGNATURE = b"\x89PNG\r\n\x1a\n"
+    COLOR_TYPES = {0: "L", 2: "RGB", 6: "RGBA"}
+    STREAMABLE_FILTERS = (0, 1, 2)
+
+    def __init__(self, file_path: str, band_rows: int):
+        self.file_path = file_path
+        self.band_rows = band_rows
+
+        with open(file_path, "rb") as f:
+            if f.read(8) != self.SIGNATURE:
+                raise ValueError("Not a PNG file")
+            length, chunk_type = struct.unpack(">I4s", f.read(8))
+            header = f.read(length)
+
+        if chunk_type != b"IHDR":
+            raise ValueError("Invalid PNG header")
+
+        width, height, bit_depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", header)
+        if bit_depth != 8 or color_type not in self.COLOR_TYPES or interlace:
+            raise ValueError("Only 8-bit, non-interlaced L/RGB/RGBA PNGs can be streamed")
+
+        self.width, self.height = width, height
+        self.mode = self.COLOR_TYPES[color_type]
+        self.bpp = STREAM_MODES[self.mode]
+        self.stride = width * self.bpp
+
+        if not self._filters_streamable():
+            raise ValueError("PNG uses Average/Paeth row filters")
+
+    def _idat_data(self):
+        """IDAT chunk'larının sıkıştırılmış içeriğini sırayla verir"""
+        with open(self.file_path, "rb") as f:
+            f.seek(8)
+            while True:
+                head = f.read(8)
+                if len(head) < 8:
+                    return
+                length, chunk_type = struct.unpack(">I4s", head)
+                if chunk_type == b"IDAT":
+                    yield f.read(length)
+                    f.seek(4, os.SEEK_CUR)
+                else:
+                    f.seek(length + 4, os.SEEK_CUR)
+                if chunk_type == b"IEND":
+                    return
+
+    def _raw_rows(self):
+        """(filtre tipi, filtrelenmiş satır) çiftlerini sırayla verir"""
+        decompressor = zlib.decompressobj()
+        buffer = bytearray()
+        row_size = self.stride + 1
+        produced = 0
+
+        for data in self._idat_data():
+            while data:
+                # Çıktı sınırlandırılır: çok iyi sıkışmış küçük bir chunk
+                # bile belleği bir bant boyutundan fazla büyütmez
+                buffer += decompressor.decompress(data, row_size * self.band_rows)
+                data = decompressor.unconsumed_tail
+
+                rows = min(len(buffer) // row_size, self.height - produced)
+                for index in range(rows):
+                    start = index * row_size
+                    yield buffer[start], bytes(buffer[start + 1:start + row_size])
+                del buffer[:rows * row_size]
+                produced += rows
+
+    def _filters_streamable(self):
+        """Ön tarama: sadece açma (decompress) yapılır, bellek sabittir"""
+        return all(
+            filter_type in self.STREAMABLE_FILTERS for filter_type, _ in self._raw_rows()
+        )
+
+    def bands(self):
+        previous = np.zeros(self.stride, dtype=np.uint8)
+        band = []
+
+        for filter_type, data in self._raw_rows():
+            row = np.frombuffer(data, dtype=np.uint8)
+
+            if filter_type == 1:
+                # Sub: soldaki piksele göre fark → kanal başına kümülatif toplam
+                row = np.cumsum(row.reshape(-1, self.bpp), axis=0, dtype=np.uint8).ravel()
+            elif filter_type == 2:
+                # Up: üstteki satıra göre fark (uint8 taşması mod 256 yapar)
+                row = row + previous
+
+            band.append(row)
+            previous = row
+
+            if len(band) == self.band_rows:
+                yield self._band_image(band)
+                band = []
+
+        if band:
+            yield self._band_image(band)
+
+    def _band_image(self, rows):
+        return Image.frombytes(self.mode, (self.width, len(rows)), np.stack(rows).tobytes())
+
+    def close(self):
+        pass
+
+
+class FullDecodeReader:
+    """Bant halinde okunamayan formatlar: bir kere tam decode edilir"""
+
+    streaming = False
+
+    def __init__(self, file_path: str, band_rows: int):
+        with Image.open(file_path) as image:
+            image.load()
+            self.image = image if image.mode in STREAM_MODES else image.convert("RGB")
+
+        self.width, self.height = self.image.size
+        self.band_rows = band_rows
+
+    def bands(self):
+        for top in range(0, self.height, self.band_rows):
+            bottom = min(top + self.band_rows, self.height)
+            yield self.image.crop((0, top, self.width, bottom))
+
+    def close(self):
+        self.image = None
+
+
+_READERS = {
+    ".npy": NpyBandReader,
+    ".tif": TiffStripReader,
+    ".tiff": TiffStripReader,
+    ".png": PngRowReader,
+}
+
+
+def open_band_reader(file_path: str, band_rows: int):
+    """Dosya için bant okuyucu; bant okunamıyorsa tam decode okuyucusu döner"""
+    reader_class = _READERS.get(os.path.splitext(file_path)[1].lower())
+
+    if reader_class is not None:
+        try:
+            return reader_class(file_path, band_rows)
+        except ValueError:
+            pass
+
+    return FullDecodeReader(file_path, band_rows)
+
+
+# ======================================================================
+# Yazıcılar (writers)
+# ======================================================================
+class NpyBandWriter:
+    """
+    Bantları .npy dosyasına sırayla ekler.
+
+    Okuyucudaki gibi memmap kullanılmaz: yazılan sayfalar kirli (dirty)
+    olarak process'te kalır ve bellek görüntü yüksekliğiyle büyürdü.
+    Başlık baştan yazılır, bantlar düz dosya yazımıyla eklenir.
+    """
+
+    def __init__(self, file_path, width, height, mode, rows_per_strip):
+        channels = STREAM_MODES[mode]
+        shape = (height, width) if channels == 1 else (height, width, channels)
+
+        self._file = open(file_path, "wb")
+        np.lib.format.write_array_header_1_0(self._file, {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(np.uint8)),
+            "fortran_order": False,
+            "shape": shape,
+        })
+
+    def write(self, band):
+        self._file.write(band.tobytes())
+
+    def close(self):
+        self._file.close()
+
+
+class TiffStripWriter:
+    """
+    Sıkıştırılmamış, şeritli (strip) baseline TIFF yazar.
+
+    Her bant bir şerittir. Şerit konumları bilindiğinde IFD dosyanın
+    sonuna yazılır ve başlıktaki IFD adresi güncellenir.
+    """
+
+    PHOTOMETRIC = {"L": 1, "RGB": 2, "RGBA": 2}
+
+    def __init__(self, file_path, width, height, mode, rows_per_strip):
+        self.width, self.height, self.mode = width, height, mode
+        self.channels = STREAM_MODES[mode]
+        self.rows_per_strip = rows_per_strip
+
+        self.offsets = []
+        self.byte_counts = []
+
+        self._file = open(file_path, "wb")
+        # Little-endian başlık; IFD adresi kapanışta yazılır
+        self._file.write(b"II*\x00" + struct.pack("<I", 0))
+
+    def write(self, band):
+        data = band.tobytes()
+        self.offsets.append(self._file.tell())
+        self.byte_counts.append(len(data))
+        self._file.write(data)
+
+    def _write_array(self, values):
+        """Birden fazla değerli tag için veriyi yazar, adresini döner"""
+        if self._file.tell() % 2:
+            self._file.write(b"\x00")
+        offset = self._file.tell()
+        self._file.write(struct.pack(f"<{len(values)}I", *values))
+        return offset
+
+    def close(self):
+        SHORT, LONG = 3, 4
+        strip_count = len(self.offsets)
+
+        offsets_value = self.offsets[0] if strip_count == 1 else self._write_array(self.offsets)
+        counts_value = (
+            self.byte_counts[0] if strip_count == 1 else self._write_array(self.byte_counts)
+        )
+
+        bits_value = 8
+        if self.channels > 1:
+            # BitsPerSample kanal başına bir değer ister
+            if self._file.tell() % 2:
+                self._file.write(b"\x00")
+            bits_value = self._file.tell()
+            self._file.write(struct.pack(f"<{self.channels}H", *([8] * self.channels)))
+
+        tags = [
+            (256, LONG, 1, self.width),
+            (257, LONG, 1, self.height),
+            (258, SHORT, self.channels, bits_value),
+            (259, SHORT, 1, 1),
+            (262, SHORT, 1, self.PHOTOMETRIC[self.mode]),
+            (273, LONG, strip_count, offsets_value),
+            (277, SHORT, 1, self.channels),
+            (278, LONG, 1, self.rows_per_strip),
+            (279, LONG, strip_count, counts_value),
+            (284, SHORT, 1, 1),
+        ]
+        if self.mode == "RGBA":
+            # Ek kanal: ilişkilendirilmemiş (unassociated) alfa
+            tags.append((338, SHORT, 1, 2))
+
+        if self._file.tell() % 2:
+            self._file.write(b"\x00")
+        ifd_offset = self._file.tell()
+
+        self._file.write(struct.pack("<H", len(tags)))
+        for tag, field_type, count, value in tags:
+            if field_type == SHORT and count == 1:
+                self._file.write(struct.pack("<HHIHH", tag, field_type, count, value, 0))
+            else:
+                self._file.write(struct.pack("<HHII", tag, field_type, count, value))
+        self._file.write(struct.pack("<I", 0))
+
+        self._file.seek(4)
+        self._file.write(struct.pack("<I", ifd_offset))
+        self._file.close()
+
+
+class PngRowWriter:
+    """
+    PNG'yi satır satır yazar; sıkıştırma zlib akışı ile artımlı yapılır.
+
+    Satırlar "Up" filtresi ile yazılır: hem kodlama hem çözme vektöreldir,
+    böylece çıktı PngRowReader ile tekrar bant halinde okunabilir.
+    """
+
+    COLOR_TYPES = {"L": 0, "RGB": 2, "RGBA": 6}
+
+    def __init__(self, file_path, width, height, mode, rows_per_strip):
+        self.stride = width * STREAM_MODES[mode]
+        self.previous = np.zeros(self.stride, dtype=np.uint8)
+        self.compressor = zlib.compressobj(AppConfig.STREAM_PNG_COMPRESSION)
+
+        self._file = open(file_path, "wb")
+        self._file.write(PngRowReader.SIGNATURE)
+        self._chunk(b"IHDR", struct.pack(
+            ">IIBBBBB", width, height, 8, self.COLOR_TYPES[mode], 0, 0, 0
+        ))
+
+    def _chunk(self, chunk_type, data):
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type + data)
+        self._file.write(struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+    def write(self, band):
+        rows = np.asarray(band).reshape(band.height, self.stride)
+
+        above = np.empty_like(rows)
+        above[0] = self.previous
+        above[1:] = rows[:-1]
+        self.previous = rows[-1].copy()
+
+        filtered = np.empty((band.height, self.stride + 1), dtype=np.uint8)
+        filtered[:, 0] = 2
+        filtered[:, 1:] = rows - above
+
+        data = self.compressor.compress(filtered.tobytes())
+        if data:
+            self._chunk(b"IDAT", data)
+
+    def close(self):
+        self._chunk(b"IDAT", self.compressor.flush())
+        self._chunk(b"IEND", b"")
+        self._file.close()
+
+
+_WRITERS = {
+    ".npy": NpyBandWriter,
+    ".tif": TiffStripWriter,
+    ".tiff": TiffStripWriter,
+    ".png": PngRowWriter,
+}
+
+
+# ======================================================================
+# Akış
+# ======================================================================
+def can_stream(steps, output_path: str) -> bool:
+    """Reçete sadece nokta işlemlerinden oluşuyor ve çıktı formatı yazılabiliyorsa True"""
+    ext = os.path.splitext(output_path)[1].lower()
+    return ext in _WRITERS and Recipe.cached(steps).is_point_chain
+
+
+def stream_recipe(input_path: str, output_path: str, steps,
+                  band_rows: int = AppConfig.STREAM_BAND_ROWS) -> dict:
+    """
+    Nokta işlemi reçetesini girdiye bant bant uygular ve çıktıya yazar.
+
+    Dönüş:
+        dict: bands (bant sayısı), streamed_input (girdi bant halinde
+              okunduysa True), seconds
+    """
+    start = time.perf_counter()
+    recipe = Recipe.cached(steps)
+    if not recipe.is_point_chain:
+        raise FilterError(f"Streaming requires point operations only: {recipe}")
+
+    writer_class = _WRITERS.get(os.path.splitext(output_path)[1].lower())
+    if writer_class is None:
+        raise ValueError(f"Streaming output format not supported: {output_path}")
+
+    reader = open_band_reader(input_path, band_rows)
+    writer = None
+    count = 0
+
+    try:
+        for band in reader.bands():
+            result = recipe.apply(band)
+            if result.mode not in STREAM_MODES:
+                result = result.convert("RGB")
+
+            if writer is None:
+                # Çıktı modu (örn: grayscale → L) ilk banttan belirlenir
+                writer = writer_class(
+                    output_path, reader.width, reader.height, result.mode, band.height
+                )
+            writer.write(result)
+            count += 1
+    finally:
+        reader.close()
+        if writer is not None:
+            writer.close()
+
+    return {
+        "bands": count,
+        "streamed_input": reader.streaming,
+        "seconds": time.perf_counter() - start,
+    }
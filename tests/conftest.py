@@ -0,0 +1,14 @@
+"""
+Test oturumu ayarları
+
+Geliştiricinin kendi performans profili (bkz. autotune.py) testlerdeki
+AppConfig değerlerini değiştirmesin diye profil yolu, config import
+edilmeden önce var olmayan bir dosyaya yönlendirilir.
+"""
+
+import os
+import tempfile
+
+os.environ["IMAGEPROC_PERFORMANCE_PROFILE"] = os.path.join(
+    tempfile.gettempdir(), f"imageproc-test-profile-{os.getpid()}", "missing.json"
+)
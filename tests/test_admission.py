@@ -0,0 +1,124 @@
+"""
+Bellek bütçesine göre iş kabulünün (admission.py) testleri
+
+Bu dosyada:
+- Tepe bellek tahmininin başlıktan ve MEMORY_EXPANSION'dan hesaplanması
+- Bütçeye sığmayan işlerin aynı anda başlatılmaması
+- Küçük işlerin büyük işin etrafından araya alınması (backfill)
+- Sıradaki büyük işin sonsuza kadar atlanmaması
+- Bütçeden büyük işin tek başına çalışması
+kontrol edilir.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from admission import AdmissionController, estimate_peak_bytes
+from batch_processor import BatchProcessor
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from filters import InvertFilter, SepiaFilter
+
+
+class _Tracker:
+    """Aynı anda çalışan görevlerin bayt toplamını izler"""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.order = []
+        self._lock = threading.Lock()
+
+    def task(self, key, size, seconds=0.02):
+        with self._lock:
+            self.current += size
+            self.peak = max(self.peak, self.current)
+            self.order.append(key)
+        time.sleep(seconds)
+        with self._lock:
+            self.current -= size
+        return key
+
+
+def test_estimate_uses_header_and_expansion(tmp_path):
+    path = tmp_path / "a.png"
+    Image.new("RGB", (100, 50)).save(path)
+
+    # PIL RGB pikseli 4 bayt tutar
+    assert estimate_peak_bytes(str(path), [InvertFilter()]) == 100 * 50 * 4 * 3
+    assert estimate_peak_bytes(str(path), [InvertFilter(), SepiaFilter()]) == 100 * 50 * 4 * 20
+
+
+def test_running_tasks_stay_within_budget():
+    tracker = _Tracker()
+    sizes = [60, 60, 30, 10, 60, 10]
+    tasks = [(index, size, tracker.task, (index, size)) for index, size in enumerate(sizes)]
+
+    admission = AdmissionController(budget_bytes=100)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = dict(admission.run(pool, tasks, slots=6))
+
+    assert sorted(results) == list(range(6))
+    assert tracker.peak <= 100
+    assert admission.stats["peak_reserved_bytes"] <= 100
+    assert admission.reserved_bytes == 0
+
+
+def test_small_tasks_backfill_around_large_one():
+    tracker = _Tracker()
+    tasks = [
+        ("large-a", 80, tracker.task, ("large-a", 80, 0.1)),
+        ("large-b", 80, tracker.task, ("large-b", 80)),
+        ("small", 10, tracker.task, ("small", 10)),
+    ]
+
+    admission = AdmissionController(budget_bytes=100)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(admission.run(pool, tasks, slots=3))
+
+    # large-b sığmazken small onun önüne geçer
+    assert tracker.order.index("small") < tracker.order.index("large-b")
+    assert admission.stats["backfilled"] == 1
+
+
+def test_head_task_is_not_starved():
+    tracker = _Tracker()
+    tasks = [("first", 60, tracker.task, ("first", 60, 0.05)), ("big", 80, tracker.task, ("big", 80))]
+    tasks += [(f"small{i}", 30, tracker.task, (f"small{i}", 30, 0.05)) for i in range(6)]
+
+    admission = AdmissionController(budget_bytes=100, max_bypass=1)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(admission.run(pool, tasks, slots=4))
+
+    # En fazla bir küçük iş büyük işin önüne geçer
+    assert tracker.order.index("big") <= 3
+
+
+def test_oversized_task_runs_alone():
+    tracker = _Tracker()
+    tasks = [("huge", 500, tracker.task, ("huge", 500)), ("small", 10, tracker.task, ("small", 10))]
+
+    admission = AdmissionController(budget_bytes=100)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(admission.run(pool, tasks, slots=2))
+
+    assert tracker.peak == 500
+    assert admission.stats["oversized"] == 1
+
+
+def test_batch_with_memory_budget(tmp_path):
+    inputs = []
+    for index, size in enumerate([(400, 300), (20, 20), (20, 20)]):
+        path = tmp_path / f"in{index}.png"
+        Image.new("RGB", size, (index * 50, 0, 0)).save(path)
+        inputs.append(str(path))
+
+    controller = ConcurrencyController(ConcurrencyConfig(worker_processes=2, name="test"))
+    processor = BatchProcessor("sepia", controller)
+    results = processor.process_files(inputs, str(tmp_path / "out"), memory_budget=1024 * 1024)
+
+    assert [r["status"] for r in results] == ["done"] * 3
+    assert processor.admission_stats["admitted"] == 3
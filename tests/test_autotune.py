@@ -0,0 +1,126 @@
+"""
+Performans profilinin (autotune.py, config.apply_performance_profile) testleri
+
+Bu dosyada:
+- Profilin AppConfig'e uygulanması ve ortam değişkenlerinin önceliği
+- Bozuk / eksik profil dosyasında ve geçersiz ortam değişkeninde
+  varsayılanlara dönülmesi
+- Ölçüm sonuçlarından seçim kuralı
+- Kısa bir autotune çalıştırmasının yüklenebilir profil üretmesi
+- --quick kalibrasyonunun küçük boyutlar ve tek tekrarla yapılması
+kontrol edilir.
+"""
+
+import json
+import logging
+
+import pytest
+
+from autotune import Autotuner, _prefer_smaller
+from config import AppConfig, ConcurrencyConfig, apply_performance_profile
+
+
+@pytest.fixture(autouse=True)
+def restore_config():
+    saved = {name: getattr(AppConfig, name) for name in AppConfig.TUNABLE_SETTINGS}
+    applied = AppConfig.PERFORMANCE_PROFILE_APPLIED
+    yield
+    for name, value in saved.items():
+        setattr(AppConfig, name, value)
+    AppConfig.PERFORMANCE_PROFILE_APPLIED = applied
+
+
+def _write_profile(path, settings):
+    path.write_text(json.dumps({"settings": settings}), encoding="utf-8")
+    return str(path)
+
+
+def test_profile_is_applied_and_env_wins(tmp_path, monkeypatch):
+    path = _write_profile(tmp_path / "profile.json", {
+        "STREAM_BAND_ROWS": 512, "IO_THREADS": 6, "THROUGHPUT_WORKER_PROCESSES": 3,
+    })
+    monkeypatch.setenv("IMAGEPROC_IO_THREADS", "4")
+
+    applied = apply_performance_profile(path)
+
+    assert AppConfig.STREAM_BAND_ROWS == 512
+    assert AppConfig.IO_THREADS == 4
+    assert applied["IO_THREADS"]["source"] == "env"
+    assert applied["STREAM_BAND_ROWS"]["source"] == "profile"
+
+    config = ConcurrencyConfig.from_preset("throughput")
+    assert (config.worker_processes, config.io_threads) == (3, 4)
+    # Çekirdek sayısı açıkça verilirse ölçülmüş işçi sayısı kullanılmaz
+    assert ConcurrencyConfig.from_preset("throughput", cpu_count=8).worker_processes == 8
+
+
+def test_broken_profile_is_ignored(tmp_path):
+    path = tmp_path / "profile.json"
+    path.write_text("{not json", encoding="utf-8")
+    rows = AppConfig.STREAM_BAND_ROWS
+
+    assert apply_performance_profile(str(path)) == {}
+    assert apply_performance_profile(str(tmp_path / "missing.json")) == {}
+    assert AppConfig.STREAM_BAND_ROWS == rows
+
+
+def test_invalid_env_value_keeps_default(tmp_path, monkeypatch, caplog):
+    path = _write_profile(tmp_path / "profile.json", {"IO_THREADS": 6})
+    monkeypatch.setenv("IMAGEPROC_IO_THREADS", "abc")
+    monkeypatch.setenv("IMAGEPROC_STREAM_BAND_ROWS", "512")
+    threads = AppConfig.IO_THREADS
+
+    with caplog.at_level(logging.WARNING, logger="ImageProcessingApp.config"):
+        applied = apply_performance_profile(path)
+
+    assert AppConfig.IO_THREADS == threads
+    assert "IO_THREADS" not in applied
+    assert AppConfig.STREAM_BAND_ROWS == 512
+    assert "IO_THREADS" in caplog.text
+
+
+def test_prefer_smaller_needs_real_gain():
+    assert _prefer_smaller({1: 1.0, 2: 0.95, 4: 0.93}) == 1
+    assert _prefer_smaller({1: 1.0, 2: 0.55, 4: 0.52}) == 2
+    assert _prefer_smaller({1: 1.0, 2: 0.55, 4: 0.3}) == 4
+
+
+def test_cache_sizes_follow_memory_and_disk():
+    settings = Autotuner.tune_cache_sizes(memory_mb=16384, free_disk_mb=50_000)
+
+    assert settings["MEMORY_BUDGET_MB"] == 4096
+    assert settings["ADMISSION_BUDGET_MB"] == int(16384 * 0.6)
+    assert settings["RESULT_STORE_MAX_MB"] == 5000
+    assert settings["DISPLAY_CACHE_ENTRIES"] == 16
+
+
+def test_quick_run_writes_loadable_profile(tmp_path):
+    tuner = Autotuner(megapixels=0.05, repeats=1, cpu_count=2)
+    profile = tuner.run(backends=False)
+    path = Autotuner.save(profile, str(tmp_path / "profile.json"))
+
+    assert set(profile["settings"]) <= set(AppConfig.TUNABLE_SETTINGS)
+    assert profile["settings"]["PARALLEL_THREADS"] in (1, 2)
+    assert profile["settings"]["STREAM_BAND_ROWS"] in (64, 128)
+
+    applied = apply_performance_profile(path)
+    assert set(applied) == set(profile["settings"])
+
+
+@pytest.mark.parametrize("quick, size_classes, repeats", [
+    (True, AppConfig.AUTOTUNE_QUICK_CALIBRATION_SIZES, 1),
+    (False, None, None),
+])
+def test_quick_backend_calibration_is_reduced(tmp_path, monkeypatch, quick, size_classes, repeats):
+    import backends
+
+    calls = []
+    monkeypatch.setattr(
+        backends.BackendDispatcher, "calibrate",
+        lambda self, filters, size_classes=None, modes=None, repeats=None:
+            calls.append((size_classes, repeats)),
+    )
+    monkeypatch.setattr(backends.BackendDispatcher, "_instance", None)
+
+    Autotuner(cpu_count=2).tune_backends(str(tmp_path / "calibration.json"), quick=quick)
+    assert calls == [(size_classes, repeats)]
@@ -0,0 +1,140 @@
+"""
+Filtre backend'lerinin ve BackendDispatcher'ın testleri
+
+Bu dosyada:
+- Aynı filtrenin backend'lerinin eşdeğer sonuç üretmesi
+- Kalibrasyon tablosuna göre backend seçimi
+- Backend zorlama (debug)
+- Kalibrasyonda kazanamayacak backend'lerin atlanması
+kontrol edilir.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from backends import BackendDispatcher
+from config import AppConfig
+from exceptions import FilterError
+from factories import FilterFactory
+from filters import BlurFilter, MedianFilter
+
+
+@pytest.fixture
+def noise_image():
+    """Backend farklarını görünür kılan rastgele RGB görüntü"""
+    rng = np.random.default_rng(42)
+    return Image.fromarray(rng.integers(0, 256, (48, 64, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("filter_name", FilterFactory().get_available_filters())
+def test_backends_give_equivalent_results(filter_name, noise_image):
+    """
+    Her backend, varsayılan backend ile (yuvarlama farkı hariç)
+    aynı görüntüyü üretmelidir.
+    """
+    filter_obj = FilterFactory().create_filter(filter_name)
+    backends = filter_obj.supported_backends(noise_image.mode)
+
+    reference = np.asarray(
+        filter_obj.backend_function(backends[0])(noise_image), dtype=int
+    )
+
+    for backend in backends[1:]:
+        result = np.asarray(
+            filter_obj.backend_function(backend)(noise_image), dtype=int
+        )
+        assert result.shape == reference.shape
+
+        difference = np.abs(result - reference)
+        if filter_name == "gaussian_blur":
+            # PIL kutu bulanıklığı yaklaşımı kullanır, ortalama fark küçüktür
+            assert difference.mean() <= 1.0
+        else:
+            assert difference.max() <= 1
+
+
+def test_size_class_boundaries():
+    assert BackendDispatcher.size_class(100, 100) == "small"
+    assert BackendDispatcher.size_class(1280, 960) == "medium"
+    assert BackendDispatcher.size_class(4000, 3000) == "large"
+    assert BackendDispatcher.size_class(10000, 8000) == "huge"
+
+
+def test_calibration_table_drives_selection(tmp_path, noise_image):
+    dispatcher = BackendDispatcher(str(tmp_path / "calibration.json"))
+    blur = BlurFilter()
+
+    # Kalibrasyon yokken varsayılan backend seçilir
+    assert dispatcher.select(blur, noise_image) == "pil"
+
+    dispatcher.table["BlurFilter|small|RGB"] = "opencv"
+    assert dispatcher.select(blur, noise_image) == "opencv"
+
+    # "huge" kalibre edilmediğinde daha küçük sınıfın sonucu kullanılır
+    dispatcher.table = {"BlurFilter|large|RGB": "opencv"}
+    huge = Image.new("RGB", (5000, 4000))
+    assert dispatcher.select(blur, huge) == "opencv"
+
+
+def test_unsupported_mode_is_not_selected(tmp_path):
+    dispatcher = BackendDispatcher(str(tmp_path / "calibration.json"))
+    dispatcher.table["MedianFilter[5]|small|P"] = "opencv"
+
+    palette_image = Image.new("P", (32, 32))
+    assert dispatcher.select(MedianFilter(), palette_image) == "pil"
+
+
+def test_forced_backend(tmp_path, noise_image, monkeypatch):
+    dispatcher = BackendDispatcher(str(tmp_path / "calibration.json"))
+
+    assert dispatcher.select(BlurFilter(backend="opencv"), noise_image) == "opencv"
+
+    monkeypatch.setenv(AppConfig.FORCED_BACKEND_ENV, "opencv")
+    assert dispatcher.select(BlurFilter(), noise_image) == "opencv"
+
+    with pytest.raises(FilterError):
+        FilterFactory().create_filter("blur", backend="cuda")
+
+
+def test_calibration_is_persisted(tmp_path):
+    path = tmp_path / "calibration.json"
+    dispatcher = BackendDispatcher(str(path))
+
+    report = dispatcher.calibrate(
+        [BlurFilter()], size_classes=["small"], modes=["RGB"], repeats=1
+    )
+
+    assert "BlurFilter|small|RGB" in report
+    assert path.exists()
+
+    reloaded = BackendDispatcher(str(path))
+    assert reloaded.table == dispatcher.table
+
+
+def test_calibration_skips_backends_that_cannot_win():
+    assert "pil" not in MedianFilter(31).calibration_backends("RGB")
+    assert "pil" in MedianFilter(5).calibration_backends("RGB")
+    # Sadece PIL'in desteklediği modda PIL ölçülmeye devam eder
+    assert MedianFilter(31).calibration_backends("P") == ["pil"]
+
+
+def test_slow_backend_repeats_are_aborted(tmp_path, noise_image):
+    calls = {"pil": 0, "opencv": 0}
+    blur = BlurFilter()
+
+    def timed(backend, seconds):
+        def run(image):
+            calls[backend] += 1
+            start = time.perf_counter()
+            while time.perf_counter() - start < seconds:
+                pass
+        return run
+
+    blur.backend_function = lambda backend: timed(backend, 0.02 if backend == "opencv" else 0.0)
+    timings = BackendDispatcher._time_backends(blur, noise_image, repeats=3)
+
+    assert calls == {"pil": 3, "opencv": 1}
+    assert min(timings, key=timings.get) == "pil"
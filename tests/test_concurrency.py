@@ -0,0 +1,66 @@
+"""
+Eşzamanlılık yapılandırmasının testleri
+
+Bu dosyada:
+- Hazır profillerin çekirdek sayısını aşmaması
+- Ayarların işçi process'lerde uygulanması
+kontrol edilir.
+"""
+
+import os
+
+import cv2
+import pytest
+
+from concurrency import ConcurrencyController, BLAS_THREAD_ENV_VARS
+from config import ConcurrencyConfig
+
+
+def _worker_thread_settings(_):
+    """İşçi process içindeki thread ayarlarını döner"""
+    return cv2.getNumThreads(), os.environ["OMP_NUM_THREADS"]
+
+
+@pytest.mark.parametrize("preset", ConcurrencyConfig.PRESETS)
+@pytest.mark.parametrize("cores", [1, 4, 16])
+def test_presets_do_not_oversubscribe(preset, cores):
+    config = ConcurrencyConfig.from_preset(preset, cpu_count=cores)
+    assert config.worker_processes * config.threads_per_worker <= cores
+
+
+def test_preset_from_environment(monkeypatch):
+    monkeypatch.setenv(ConcurrencyConfig.PRESET_ENV, "throughput")
+    config = ConcurrencyConfig.from_preset(cpu_count=8)
+
+    assert config.name == "throughput"
+    assert config.worker_processes == 8
+    assert config.opencv_threads == 1
+
+
+def test_unknown_preset_raises():
+    with pytest.raises(ValueError):
+        ConcurrencyConfig.from_preset("turbo")
+
+
+def test_workers_apply_settings_on_start():
+    config = ConcurrencyConfig(
+        worker_processes=2, opencv_threads=1, blas_threads=1, name="test"
+    )
+    controller = ConcurrencyController(config)
+
+    with controller.process_pool() as pool:
+        results = list(pool.map(_worker_thread_settings, range(2)))
+
+    assert results == [(1, "1"), (1, "1")]
+
+
+def test_apply_limits_coordinator_when_pool_is_used(monkeypatch):
+    monkeypatch.setattr(ConcurrencyController, "_active", None)
+    for name in BLAS_THREAD_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+    config = ConcurrencyConfig(worker_processes=4, opencv_threads=1, blas_threads=1)
+    ConcurrencyController(config).apply()
+
+    assert os.environ["OPENBLAS_NUM_THREADS"] == "1"
+    assert ConcurrencyController.active().config is config
@@ -0,0 +1,95 @@
+"""
+Algısal hash ve tekrar tespiti testleri
+
+Bu dosyada:
+- Yeniden boyutlandırılmış kopyanın yakın tekrar olarak bulunması
+- Farklı görüntülerin ayrışması
+- Batch modunda birebir tekrarın çıktısının yeniden kullanılması
+- Okunamayan girdinin batch'i durdurmadan "failed" raporlanması
+kontrol edilir.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from batch_processor import BatchProcessor
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from dedup import HashIndex, PerceptualHasher, popcount64
+
+
+def _gradient_image(seed):
+    """Düşük frekanslı (fotoğrafa benzer) rastgele görüntü"""
+    rng = np.random.default_rng(seed)
+    small = rng.integers(0, 256, (6, 6, 3), dtype=np.uint8)
+    return Image.fromarray(small).resize((240, 180), Image.Resampling.BICUBIC)
+
+
+@pytest.mark.parametrize("method", PerceptualHasher.METHODS)
+def test_resized_copy_is_near_and_other_image_is_far(method):
+    hasher = PerceptualHasher(method)
+    original = _gradient_image(1)
+
+    resized = original.resize((120, 90), Image.Resampling.LANCZOS)
+    different = _gradient_image(2)
+
+    h_original = hasher.hash_image(original)
+    h_resized = hasher.hash_image(resized)
+    h_different = hasher.hash_image(different)
+
+    assert bin(h_original ^ h_resized).count("1") <= 6
+    assert bin(h_original ^ h_different).count("1") > 12
+
+
+def test_batch_hashing_matches_single_hashing():
+    hasher = PerceptualHasher("phash")
+    images = [_gradient_image(seed) for seed in range(4)]
+
+    batch = hasher.hash_images(images)
+    assert [int(h) for h in batch] == [hasher.hash_image(image) for image in images]
+
+
+def test_popcount_and_index_query():
+    values = np.array([0, 1, 0xFF, 2**64 - 1], dtype=np.uint64)
+    assert popcount64(values).tolist() == [0, 1, 8, 64]
+
+    index = HashIndex()
+    for i in range(100):
+        index.add(i << 8, f"image-{i}")
+
+    matches = index.query(5 << 8, max_distance=1)
+    assert matches[0] == ("image-5", 0)
+    assert all(distance <= 1 for _, distance in matches)
+
+
+def test_batch_reuses_output_of_exact_duplicates(tmp_path):
+    first = tmp_path / "a.png"
+    _gradient_image(3).save(first)
+    copy = tmp_path / "b.png"
+    copy.write_bytes(first.read_bytes())
+    resized = tmp_path / "c.png"
+    _gradient_image(3).resize((200, 150)).save(resized)
+
+    controller = ConcurrencyController(ConcurrencyConfig(worker_processes=2))
+    results = BatchProcessor("invert", controller).process_files(
+        [str(first), str(copy), str(resized)], str(tmp_path / "out"), deduplicate=True
+    )
+
+    assert [r["status"] for r in results] == ["done", "duplicate", "done"]
+    assert results[1]["duplicate_of"] == str(first)
+    assert (tmp_path / "out" / "b.png").read_bytes() == (tmp_path / "out" / "a.png").read_bytes()
+    assert results[2]["near_duplicates"][0]["input"] == str(first)
+
+
+def test_unreadable_input_fails_without_aborting_batch(tmp_path):
+    first = tmp_path / "a.png"
+    _gradient_image(3).save(first)
+    missing = tmp_path / "missing.png"
+
+    controller = ConcurrencyController(ConcurrencyConfig(worker_processes=2))
+    results = BatchProcessor("invert", controller).process_files(
+        [str(first), str(missing)], str(tmp_path / "out"), deduplicate=True
+    )
+
+    assert [r["status"] for r in results] == ["done", "failed"]
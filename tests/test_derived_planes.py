@@ -0,0 +1,124 @@
+"""
+Türetilmiş düzlem önbelleğinin testleri
+
+Bu dosyada:
+- Contrast / Color / Sharpness sonuçlarının ImageEnhance ile birebir aynı olması
+- Zincirdeki işlemcilerin parlaklık düzlemini bir kez hesaplaması
+- Görüntü silinince ve yerinde değişince kayıtların düşmesi
+- Bayt sınırının aşılınca eski düzlemlerin silinmesi
+kontrol edilir.
+"""
+
+import gc
+
+import numpy as np
+import pytest
+from PIL import Image, ImageEnhance
+
+import derived_planes
+from derived_planes import DerivedPlaneCache
+from enhancements import ColorEnhancement, ContrastEnhancement, SharpnessEnhancement
+from filters import CannyEdgeFilter, GrayscaleFilter
+from image_manager import ImageManager
+from memory_manager import MemoryAccountant
+
+
+def _noise(size=(80, 60), mode="RGB"):
+    rng = np.random.default_rng(5)
+    pixels = rng.integers(0, 256, (size[1], size[0], 4), dtype=np.uint8)
+    return Image.fromarray(pixels, "RGBA").convert(mode)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = DerivedPlaneCache(max_bytes=1 << 30)
+    monkeypatch.setattr(DerivedPlaneCache, "_instance", cache)
+    return cache
+
+
+@pytest.mark.parametrize("mode", ["L", "LA", "RGB", "RGBA", "CMYK"])
+@pytest.mark.parametrize("processor, reference", [
+    (ContrastEnhancement(1.6), ImageEnhance.Contrast),
+    (ColorEnhancement(0.4), ImageEnhance.Color),
+    (SharpnessEnhancement(2.0), ImageEnhance.Sharpness),
+])
+def test_enhancements_match_image_enhance(cache, mode, processor, reference):
+    image = _noise(mode=mode)
+    expected = reference(image).enhance(processor.factor)
+
+    for _ in range(2):  # ikinci çağrı önbellekten
+        result = processor.process(image)
+        assert result.mode == expected.mode
+        assert result.tobytes() == expected.tobytes()
+
+
+def test_chain_computes_luminance_once(cache, monkeypatch):
+    image = _noise()
+    conversions = []
+    convert = Image.Image.convert
+
+    def counting_convert(self, mode=None, *args, **kwargs):
+        if self is image and mode == "L":
+            conversions.append(mode)
+        return convert(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(Image.Image, "convert", counting_convert)
+
+    gray = GrayscaleFilter(backend="pil").process(image)
+    CannyEdgeFilter().process(image)
+    ContrastEnhancement(1.3).process(image)
+    ContrastEnhancement(0.7).process(image)
+
+    assert conversions == ["L"]
+    assert gray.tobytes() == convert(image, "L").tobytes()
+    # Grayscale sonucu paylaşılan düzlem değil, kopyasıdır
+    assert gray is not cache.peek(image, "luminance")
+
+
+def test_entries_dropped_when_image_is_freed(cache):
+    image = _noise()
+    derived_planes.luminance(image)
+    derived_planes.smoothed(image)
+    assert cache.usage()["entries"] == 2
+
+    del image
+    gc.collect()
+    usage = cache.usage()
+    assert (usage["entries"], usage["images"], usage["bytes"]) == (0, 0, 0)
+
+
+def test_in_place_edit_invalidates_planes(cache, tmp_path):
+    path = tmp_path / "input.png"
+    _noise().save(path)
+    accountant = MemoryAccountant(budget_bytes=1 << 30, scratch_dir=str(tmp_path / "scratch"))
+    manager = ImageManager(accountant)
+    manager.load_image(str(path))
+
+    image = manager.processed_image
+    before = derived_planes.mean_luminance(image)
+    patch = Image.new("RGB", (40, 30), (255, 255, 255))
+    manager.commit_region(patch, (0, 0, 40, 30))
+
+    assert manager.processed_image is image
+    assert cache.peek(image, "histogram") is None
+    assert derived_planes.mean_luminance(image) > before
+
+    manager.undo()
+    assert derived_planes.mean_luminance(image) == before
+    accountant.cleanup()
+
+
+def test_byte_limit_evicts_least_recently_used():
+    image = _noise(mode="L")
+    cache = DerivedPlaneCache(max_bytes=2 * 80 * 60 + 100)
+
+    for name in ("a", "b", "c"):
+        cache.get(image, name, lambda: image.copy())
+    assert cache.peek(image, "a") is None
+    assert cache.peek(image, "c") is not None
+    assert cache.stats["evictions"] == 1
+
+    # Bütçeden büyük düzlem hesaplanır ama saklanmaz
+    large = _noise(size=(200, 200), mode="L")
+    cache.get(large, "big", lambda: large.copy())
+    assert cache.peek(large, "big") is None
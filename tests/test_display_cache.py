@@ -0,0 +1,66 @@
+"""
+Ekran önbelleğinin (ScaledImageCache) testleri
+
+Tk penceresi gerektirmeyen kısımlar test edilir:
+- Alana sığan boyut hesabı
+- Taslak / kaliteli küçültme ve RGB'ye genişletme
+- LRU tahliyesi
+- ImageManager sürüm numaraları (reset'te orijinalin sürümüne dönülmesi)
+"""
+
+from PIL import Image
+
+from gui_components import ScaledImageCache
+from image_manager import ImageManager
+
+
+def test_fit_size_never_upscales():
+    assert ScaledImageCache.fit_size((4000, 3000), 480, 380) == (480, 360)
+    assert ScaledImageCache.fit_size((200, 100), 480, 380) == (200, 100)
+
+
+def test_scale_expands_gray_after_resize():
+    gray = Image.new("L", (800, 600), 90)
+
+    for quality in (ScaledImageCache.DRAFT, ScaledImageCache.FINAL):
+        bitmap = ScaledImageCache.scale(gray, (400, 300), quality)
+        assert bitmap.size == (400, 300)
+        assert bitmap.mode == "RGB"
+        assert bitmap.getpixel((10, 10)) == (90, 90, 90)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ScaledImageCache(max_entries=2)
+    bitmap = Image.new("RGB", (4, 4))
+
+    cache.put((1, (4, 4)), bitmap, ScaledImageCache.DRAFT)
+    cache.put((2, (4, 4)), bitmap, ScaledImageCache.FINAL)
+    cache.get((1, (4, 4)))
+    cache.put((3, (4, 4)), bitmap, ScaledImageCache.FINAL)
+
+    assert cache.get((2, (4, 4))) is None
+    assert cache.get((1, (4, 4)))[1] == ScaledImageCache.DRAFT
+    assert len(cache) == 2
+
+
+def test_image_manager_versions_change_only_on_edit(tmp_path):
+    path = tmp_path / "input.png"
+    Image.new("RGB", (32, 32), "red").save(path)
+
+    manager = ImageManager()
+    manager.load_image(str(path))
+    original, processed = manager.original_version, manager.processed_version
+
+    # Yüklenen görüntü orijinalin kopyası: ekranda aynı bitmap kullanılır
+    assert processed == original
+
+    manager.commit_result(Image.new("RGB", (32, 32), "blue"))
+
+    assert manager.original_version == original
+    assert manager.processed_version > processed
+
+    # Reset: işlenmiş panel yüklemede hesaplanan bitmap'i tekrar kullanır
+    manager.reset_image()
+    assert manager.processed_version == original
+    manager.commit_region(Image.new("RGB", (4, 4), "green"), (0, 0, 4, 4))
+    assert manager.processed_version > original
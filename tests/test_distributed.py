@@ -0,0 +1,167 @@
+"""
+Paylaşılan dosya sistemi kuyruğunun (distributed.py) testleri
+
+Bu dosyada:
+- Aynı makinede başlatılan birden fazla işçi process'in kuyruğu bitirmesi
+- Bir partinin aynı anda sadece bir işçiye kiralanması
+- Ölü işçinin kirası dolunca partinin kuyruğa geri konması
+- Kiranın uzun süren görüntü sırasında tazelenmesi, kaybedilince
+  partinin bırakılması
+- Koordinatörden önce başlayan işçinin sonradan gönderilen işleri
+  kendi ayarlarıyla işlemesi
+kontrol edilir.
+"""
+
+import multiprocessing
+import os
+import time
+
+from PIL import Image
+
+import distributed
+from distributed import Coordinator, LeaseQueue, Worker, run_worker
+from recipe import Recipe
+
+
+def _inputs(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / "in" / f"img{index}.png"
+        path.parent.mkdir(exist_ok=True)
+        Image.new("RGB", (16, 12), (index * 20, 10, 200)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def test_local_worker_processes_finish_queue(tmp_path):
+    inputs = _inputs(tmp_path, 9)
+    coordinator = Coordinator(
+        str(tmp_path / "queue"), "invert,grayscale", str(tmp_path / "out"), batch_size=2,
+    )
+    assert coordinator.submit(inputs) == 5
+
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(str(tmp_path / "queue"), f"w{index}"))
+        for index in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    summary = coordinator.wait(poll_interval=0.05, timeout=60)
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert summary["done"] == 9 and summary["failed"] == []
+    assert summary["counts"] == {"pending": 0, "leased": 0, "done": 5, "total": 5}
+
+    expected = Recipe("invert,grayscale").apply(Image.open(inputs[3]))
+    with Image.open(tmp_path / "out" / "img3.png") as output:
+        assert output.tobytes() == expected.tobytes()
+
+
+def test_batch_is_leased_only_once(tmp_path):
+    queue = LeaseQueue(str(tmp_path / "queue"))
+    queue.enqueue([["a.png"]])
+
+    lease = queue.lease("w1")
+    assert lease["inputs"] == ["a.png"]
+    assert queue.lease("w2") is None
+    assert queue.counts()["leased"] == 1
+
+
+def test_expired_lease_is_requeued_and_finished(tmp_path):
+    inputs = _inputs(tmp_path, 3)
+    coordinator = Coordinator(
+        str(tmp_path / "queue"), "invert", str(tmp_path / "out"), batch_size=3, lease_seconds=30,
+    )
+    coordinator.submit(inputs)
+
+    # İşçi partiyi alıp ölüyor: kira tazelenmiyor
+    lease = coordinator.queue.lease("dead-worker")
+    assert coordinator.queue.requeue_expired(30) == 0
+
+    stale = coordinator.queue.fs_now() - 60
+    os.utime(lease["path"], (stale, stale))
+    assert coordinator.queue.requeue_expired(30) == 1
+    assert coordinator.queue.counts()["pending"] == 1
+
+    assert Worker(str(tmp_path / "queue"), "w2").run() == 3
+    summary = coordinator.summary()
+    assert summary["done"] == 3
+    assert summary["workers"] == ["w2"]
+
+    # Ölü işçi geri dönüp bitirmeye çalışırsa kira kaybedilmiştir
+    assert not LeaseQueue.heartbeat(lease)
+
+
+def test_failed_inputs_are_reported(tmp_path):
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+
+    coordinator = Coordinator(str(tmp_path / "queue"), "invert", str(tmp_path / "out"))
+    coordinator.submit([str(broken)])
+    Worker(str(tmp_path / "queue"), "w1").run()
+
+    summary = coordinator.summary()
+    assert summary["done"] == 0
+    assert summary["failed"][0]["input"] == str(broken)
+    assert summary["failed"][0]["worker"] == "w1"
+
+
+def test_worker_started_before_coordinator_follows_each_job(tmp_path):
+    inputs = _inputs(tmp_path, 2)
+    queue_dir = str(tmp_path / "queue")
+
+    # Kuyrukta henüz iş yok (job.json da yok)
+    worker = Worker(queue_dir, "early")
+    assert worker.run() == 0
+
+    Coordinator(queue_dir, "invert", str(tmp_path / "first")).submit(inputs[:1])
+    Coordinator(queue_dir, "grayscale", str(tmp_path / "second"), output_format="bmp").submit(
+        inputs[1:]
+    )
+    assert worker.run() == 2
+
+    with Image.open(inputs[0]) as source, Image.open(tmp_path / "first" / "img0.png") as output:
+        assert output.tobytes() == Recipe("invert").apply(source).tobytes()
+    with Image.open(inputs[1]) as source, Image.open(tmp_path / "second" / "img1.bmp") as output:
+        assert output.tobytes() == Recipe("grayscale").apply(source).tobytes()
+
+
+def test_lease_is_refreshed_while_an_image_is_processed(tmp_path, monkeypatch):
+    inputs = _inputs(tmp_path, 1)
+    coordinator = Coordinator(
+        str(tmp_path / "queue"), "invert", str(tmp_path / "out"), lease_seconds=0.2,
+    )
+    coordinator.submit(inputs)
+    lease = coordinator.queue.lease("w1")
+
+    process_file = distributed.process_file
+
+    def slow_process_file(*args):
+        # Kira süresinden uzun süren tek görüntü
+        stale = coordinator.queue.fs_now() - 60
+        os.utime(lease["path"], (stale, stale))
+        time.sleep(0.4)
+        assert coordinator.queue.requeue_expired(0.2) == 0
+        return process_file(*args)
+
+    monkeypatch.setattr(distributed, "process_file", slow_process_file)
+    results = Worker(str(tmp_path / "queue"), "w1").process_lease(lease)
+    assert [r["status"] for r in results] == ["done"]
+
+
+def test_lost_lease_stops_the_batch(tmp_path):
+    inputs = _inputs(tmp_path, 3)
+    coordinator = Coordinator(str(tmp_path / "queue"), "invert", str(tmp_path / "out"))
+    coordinator.submit(inputs)
+
+    lease = coordinator.queue.lease("slow-worker")
+    # Kira dolmuş ve parti geri alınmış
+    stale = coordinator.queue.fs_now() - 3600
+    os.utime(lease["path"], (stale, stale))
+    coordinator.queue.requeue_expired(120)
+
+    assert Worker(str(tmp_path / "queue"), "slow-worker").process_lease(lease) is None
+    assert not (tmp_path / "out").exists()
+    assert coordinator.queue.counts()["pending"] == 1
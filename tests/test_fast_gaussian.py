@@ -0,0 +1,80 @@
+"""
+Sabit süreli (kutu geçişli) Gaussian blur testleri
+
+Bu dosyada:
+- Kutu genişliklerinin istenen varyansı vermesi
+- Sonucun gerçek Gaussian'a yakın olması ve backend'lerin uyuşması
+- Factory'nin büyük yarıçapları hızlı filtreye yönlendirmesi
+- Reçetede "gaussian_blur:<yarıçap>" parametresi
+kontrol edilir.
+"""
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from exceptions import FilterError
+from factories import FilterFactory
+from filters import FastGaussianBlurFilter, GaussianBlurFilter, box_sizes_for_gaussian
+from parallel import BandParallelExecutor
+from recipe import Recipe
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(3)
+    return Image.fromarray(rng.integers(0, 256, (400, 360, 3), dtype=np.uint8), "RGB")
+
+
+@pytest.mark.parametrize("sigma", [3, 25, 150])
+@pytest.mark.parametrize("passes", [3, 5])
+def test_box_sizes_match_gaussian_variance(sigma, passes):
+    sizes = box_sizes_for_gaussian(sigma, passes)
+
+    assert len(sizes) == passes and all(width % 2 == 1 for width in sizes)
+    variance = sum((width * width - 1) / 12 for width in sizes)
+    # Tek sayı genişlikler yüzünden küçük sigma'larda sapma daha büyüktür
+    assert variance == pytest.approx(sigma * sigma, rel=0.15)
+
+
+def test_result_is_close_to_true_gaussian(image):
+    radius = 12
+    reference = cv2.GaussianBlur(
+        np.asarray(image, dtype=np.float64), (0, 0), radius, borderType=cv2.BORDER_REPLICATE
+    )
+    inner = slice(5 * radius, -5 * radius)
+
+    opencv = np.asarray(FastGaussianBlurFilter(radius, backend="opencv").process(image))
+    numpy = np.asarray(FastGaussianBlurFilter(radius, backend="numpy").process(image))
+
+    error = np.abs(opencv - reference)[inner, inner]
+    assert error.mean() < 0.5 and error.max() < 2
+    assert np.abs(opencv.astype(int) - numpy).max() <= 1
+
+
+def test_factory_routes_large_radii(image):
+    factory = FilterFactory()
+
+    assert type(factory.create_filter("gaussian_blur")) is GaussianBlurFilter
+    assert type(factory.create_filter("gaussian_blur", radius=80)) is FastGaussianBlurFilter
+    # PIL zorlanırsa (kendisi de sabit süreli) tam Gaussian kalır
+    assert type(factory.create_filter("gaussian_blur", radius=80, backend="pil")) is GaussianBlurFilter
+
+    step = Recipe("gaussian_blur:120,invert").processors[0]
+    assert isinstance(step, FastGaussianBlurFilter) and step.radius == 120
+
+    with pytest.raises(FilterError):
+        Recipe("blur:3")
+
+
+def test_bands_match_full_frame(image):
+    blur = FastGaussianBlurFilter(20)
+    executor = BandParallelExecutor(threads=3, min_pixels=0)
+
+    try:
+        result = executor.process(blur, image)
+    finally:
+        executor.shutdown()
+
+    assert np.array_equal(np.asarray(result), np.asarray(blur.process(image)))
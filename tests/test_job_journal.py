@@ -0,0 +1,177 @@
+"""
+İş günlüğünün (job journal) testleri
+
+Bu dosyada:
+- Çöken işin sadece bitmemiş girdilerle devam etmesi
+- Başarısız girdilerin istenirse tekrar denenmesi ve hata metninin saklanması
+- Tamponlu yazmaların toplu (batched) yapılması
+- --stream / --cache ayarlarının saklanıp resume'da kullanılması
+- --journal ile desteklenmeyen seçeneklerin ve farklı reçeteli aynı işin reddi
+kontrol edilir.
+"""
+
+import os
+import time
+
+import pytest
+from PIL import Image
+
+import cli
+from batch_processor import BatchProcessor
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from job_journal import JobJournal
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.sqlite3"))
+    yield journal
+    journal.close()
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"in{index}.png"
+        Image.new("RGB", (12, 10), (index * 40, 0, 0)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def keep_thread_limits(monkeypatch):
+    # cli, test process'inin OpenCV / BLAS thread sayısını değiştirmesin
+    monkeypatch.setattr(cli.ConcurrencyController, "apply", lambda self: self)
+
+
+def _processor():
+    controller = ConcurrencyController(ConcurrencyConfig(worker_processes=1, name="test"))
+    return BatchProcessor("invert", controller)
+
+
+def test_resume_processes_only_unfinished(tmp_path, journal, inputs):
+    job = journal.start_job("nightly", "invert", str(tmp_path / "out"), None, inputs)
+
+    # İlk çalıştırma iki girdiden sonra "çöküyor": ikisi bitti, biri yolda kaldı
+    journal.mark_running(job["id"], inputs[:3])
+    for path in inputs[:2]:
+        journal.record(job["id"], {"input": path, "status": "done", "output": None,
+                                   "seconds": 0.1, "error": None})
+    journal.flush()
+    assert journal.unfinished(job["id"]) == inputs[2:]
+
+    results = _processor().process_job(journal, "nightly", inputs, str(tmp_path / "out"))
+
+    assert sorted(r["input"] for r in results) == inputs[2:]
+    assert journal.summary(job["id"])["done"] == 4
+    assert journal.unfinished(job["id"]) == []
+
+
+def test_failed_items_are_retried_selectively(tmp_path, journal, inputs):
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+    paths = inputs[:2] + [str(broken)]
+
+    _processor().process_job(journal, "job", paths, str(tmp_path / "out"))
+    job = journal.get_job("job")
+    failed = journal.items(job["id"], "failed")
+
+    assert [item["input"] for item in failed] == [str(broken)]
+    assert "UnidentifiedImageError" in failed[0]["error"]
+    assert journal.unfinished(job["id"]) == []
+
+    # Dosya düzeltilince sadece başarısız girdi tekrar işlenir
+    Image.new("RGB", (5, 5)).save(broken, format="PNG")
+    results = _processor().process_job(journal, "job", [], job["output_dir"], retry_failed=True)
+
+    assert [r["input"] for r in results] == [str(broken)]
+    assert journal.summary(job["id"]) == {
+        "pending": 0, "running": 0, "done": 3, "failed": 0, "total": 3,
+    }
+    assert journal.items(job["id"], "done")[-1]["attempts"] == 2
+
+
+def test_recipe_mismatch_is_rejected(journal):
+    journal.start_job("job", "invert", "out")
+    with pytest.raises(ValueError):
+        journal.start_job("job", "blur", "out")
+
+
+def test_results_are_written_in_batches(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.sqlite3"), batch_size=1000, flush_seconds=60)
+    inputs = [f"img{index}.png" for index in range(5000)]
+    job = journal.start_job("bulk", "invert", "out", None, inputs)
+    journal.mark_running(job["id"], inputs)
+
+    start = time.perf_counter()
+    for path in inputs:
+        journal.record(job["id"], {"input": path, "status": "done", "output": None,
+                                   "seconds": 0.0, "error": None})
+    journal.flush()
+    elapsed = time.perf_counter() - start
+
+    assert journal.summary(job["id"])["done"] == 5000
+    # Binlerce sonuç / saniye hedefinin çok üzerinde olmalı
+    assert elapsed < 2.0
+    journal.close()
+
+
+def test_resume_restores_stream_and_cache_options(tmp_path, inputs, monkeypatch,
+                                                  keep_thread_limits):
+    # Göreli önbellek dizini iş kaydına mutlak yol olarak yazılır
+    monkeypatch.chdir(tmp_path)
+    database = str(tmp_path / "jobs.sqlite3")
+    with JobJournal(database) as journal:
+        _processor().process_job(
+            journal, "job", inputs[:1], str(tmp_path / "out"), stream=True,
+            result_store={"root": "cache", "keep_intermediate": True},
+        )
+        # Çökmeden önce eklenmiş ama işlenmemiş girdiler
+        journal.start_job("job", "invert", str(tmp_path / "out"), None, inputs[1:])
+        assert journal.get_job("job")["options"] == {
+            "stream": True,
+            "result_store": {"root": str(tmp_path / "cache"), "keep_intermediate": True},
+        }
+
+    calls = []
+    monkeypatch.setattr(
+        cli.BatchProcessor, "process_job",
+        lambda self, journal, name, inputs, output_dir, output_format, **options:
+            calls.append(options),
+    )
+
+    assert cli.main(["resume", "job", "--journal", database]) == 1
+    assert calls == [{
+        "retry_failed": False,
+        "stream": True,
+        "result_store": {"root": str(tmp_path / "cache"), "keep_intermediate": True},
+    }]
+
+
+@pytest.mark.parametrize("option", [["--dedup"], ["--memory-budget", "512"]])
+def test_journal_rejects_unsupported_options(tmp_path, inputs, option, capsys,
+                                            keep_thread_limits):
+    argv = [
+        "batch", "--journal", str(tmp_path / "jobs.sqlite3"), "--recipe", "invert",
+        "--output", str(tmp_path / "out"), *option, *inputs,
+    ]
+
+    assert cli.main(argv) == 2
+    assert "--journal cannot be combined" in capsys.readouterr().err
+    assert not (tmp_path / "jobs.sqlite3").exists()
+
+
+def test_batch_with_different_recipe_for_existing_job_fails_cleanly(tmp_path, inputs, capsys,
+                                                                     keep_thread_limits):
+    database = str(tmp_path / "jobs.sqlite3")
+    with JobJournal(database) as journal:
+        journal.start_job("nightly", "invert", str(tmp_path / "out"))
+
+    argv = [
+        "batch", "--journal", database, "--job", "nightly", "--recipe", "blur",
+        "--output", str(tmp_path / "out"), *inputs,
+    ]
+    assert cli.main(argv) == 2
+    assert "was created with recipe 'invert'" in capsys.readouterr().err
@@ -0,0 +1,131 @@
+"""
+Yapısal ve asenkron loglamanın testleri
+
+Bu dosyada:
+- JSON satırlarında olay alanlarının bulunması
+- Hız sınırı / örnekleme ile olayların seyreltilmesi
+- Asenkron modda işçi process loglarının ana dosyaya ulaşması
+- İşçide seviye ve hız sınırının kuyruğa atmadan önce uygulanması
+- Farklı ayarlarla oluşturulan AppLogger'ın handler'ları yeniden kurması
+kontrol edilir.
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+from PIL import Image
+
+from batch_processor import BatchProcessor
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from logger import (
+    AppLogger, JsonFormatter, RateLimitFilter, configure_worker_logging, log_event,
+)
+
+
+@pytest.fixture
+def clean_logger():
+    app_logger = logging.getLogger(AppLogger.LOGGER_NAME)
+    level, propagate = app_logger.level, app_logger.propagate
+    yield
+    for handler in list(app_logger.handlers):
+        app_logger.removeHandler(handler)
+        handler.close()
+    app_logger.setLevel(level)
+    app_logger.propagate = propagate
+    AppLogger._active = None
+
+
+def _make_event(fields):
+    record = logging.makeLogRecord({"msg": "tile_done", "levelno": logging.DEBUG})
+    record.event = "tile_done"
+    record.fields = fields
+    return record
+
+
+def test_json_formatter_includes_event_fields():
+    line = JsonFormatter().format(_make_event({"processor": "Blur", "width": 640, "seconds": 0.5}))
+    payload = json.loads(line)
+
+    assert payload["event"] == "tile_done"
+    assert payload["processor"] == "Blur"
+    assert payload["width"] == 640
+
+
+def test_rate_limit_samples_and_reports_suppressed():
+    sampled = RateLimitFilter(sample_rate=0.25)
+    passed = [sampled.filter(_make_event({})) for _ in range(8)]
+    assert passed == [True, False, False, False, True, False, False, False]
+
+    limited = RateLimitFilter(max_per_second=2)
+    records = [_make_event({}) for _ in range(5)]
+    assert [limited.filter(r) for r in records] == [True, True, False, False, False]
+
+    # Normal (olay olmayan) kayıtlar etkilenmez
+    assert limited.filter(logging.makeLogRecord({"msg": "plain"}))
+
+
+def test_async_logger_forwards_worker_events(tmp_path, clean_logger):
+    log_file = tmp_path / "run.log"
+    app_logger = AppLogger(str(log_file), asynchronous=True, json_format=True)
+    log_event(app_logger.logger, "parent_event", processor="Blur", width=10)
+
+    image_path = tmp_path / "in.png"
+    Image.new("RGB", (16, 16), "red").save(image_path)
+    controller = ConcurrencyController(ConcurrencyConfig(worker_processes=1, name="test"))
+    processor = BatchProcessor(
+        "grayscale", controller, app_logger.worker_queue(), app_logger.worker_settings()
+    )
+    processor.process_files([str(image_path)], str(tmp_path / "out"))
+
+    app_logger.stop()
+
+    events = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    by_name = {event.get("event"): event for event in events}
+
+    assert by_name["parent_event"]["processor"] == "Blur"
+    assert by_name["image_processed"]["status"] == "done"
+    assert by_name["step_applied"]["processor"] == "Grayscale"
+    assert by_name["image_processed"]["process"] != by_name["parent_event"]["process"]
+
+
+def test_worker_applies_level_and_rate_limit_before_queueing(clean_logger):
+    records = queue.SimpleQueue()
+    configure_worker_logging(records, {"level": logging.DEBUG, "max_per_second": 2})
+    logger = logging.getLogger(AppLogger.LOGGER_NAME)
+
+    for _ in range(10):
+        log_event(logger, "step_applied", processor="Blur")
+    assert records.qsize() == 2
+
+    configure_worker_logging(records, {"level": logging.INFO})
+    assert not logger.isEnabledFor(logging.DEBUG)
+    log_event(logger, "step_applied", processor="Blur")
+    assert records.qsize() == 2
+
+
+def test_worker_settings_follow_logger(tmp_path, clean_logger):
+    app_logger = AppLogger(str(tmp_path / "run.log"), max_per_second=5, sample_rate=0.5)
+    assert app_logger.worker_settings() == {
+        "level": logging.DEBUG, "max_per_second": 5, "sample_rate": 0.5,
+    }
+
+
+def test_new_settings_replace_existing_handlers(tmp_path, clean_logger):
+    first = AppLogger(str(tmp_path / "plain.log"))
+    same = AppLogger(str(tmp_path / "plain.log"))
+    assert same.logger.handlers == first.logger.handlers
+
+    log_file = tmp_path / "run.log"
+    app_logger = AppLogger(str(log_file), asynchronous=True, json_format=True)
+    assert len(app_logger.logger.handlers) == 1
+    assert app_logger.worker_queue() is not None
+
+    log_event(app_logger.logger, "after_reconfigure", width=3)
+    app_logger.stop()
+
+    events = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert events[-1]["event"] == "after_reconfigure"
+    assert "after_reconfigure" not in (tmp_path / "plain.log").read_text(encoding="utf-8")
@@ -0,0 +1,108 @@
+"""
+Parlaklık (":luma") modunun testleri
+
+Bu dosyada:
+- Reçetede ":luma" son ekinin ayrıştırılması ve desteklemeyen adımların reddi
+- İşlemin sadece Y düzlemine uygulanması, renk düzlemlerinin korunması
+- RGBA'da alfanın korunması, L görüntünün doğrudan işlenmesi
+- Kenar tespitinin parlaklık modunda L döndürmesi
+- Halo ve önbellek anahtarının sarılan işlemciden gelmesi
+kontrol edilir.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from base_classes import LumaProcessor
+from enhancements import ContrastEnhancement
+from exceptions import EnhancementError, FilterError
+from factories import FilterFactory
+from filters import GaussianBlurFilter, SharpenFilter
+from recipe import Recipe
+
+
+def _photo(size=(90, 70), mode="RGB"):
+    # Doygunluğu düşük renkler: YCbCr -> RGB dönüşümünde kırpma olmaz
+    rng = np.random.default_rng(2)
+    pixels = rng.integers(96, 160, (size[1], size[0], 4), dtype=np.uint8)
+    return Image.fromarray(pixels, "RGBA").convert(mode)
+
+
+def _planes(image):
+    return [np.asarray(band, dtype=np.int16) for band in image.convert("YCbCr").split()]
+
+
+def test_parse_step_luma_suffix():
+    factory = FilterFactory()
+    assert factory.parse_step("sharpen:luma") == ("sharpen", {"luma": True})
+    assert factory.parse_step("gaussian_blur:3:luma") == (
+        "gaussian_blur", {"radius": 3.0, "luma": True}
+    )
+    assert factory.parse_step("gaussian_blur:3") == ("gaussian_blur", {"radius": 3.0})
+
+
+def test_recipe_wraps_luma_steps():
+    recipe = Recipe("gaussian_blur:3:luma,sharpen,contrast_up:luma")
+    first, second, third = recipe.processors
+
+    assert isinstance(first, LumaProcessor) and isinstance(first.processor, GaussianBlurFilter)
+    assert isinstance(second, SharpenFilter)
+    assert isinstance(third, LumaProcessor) and isinstance(third.processor, ContrastEnhancement)
+    assert first.name == "Gaussian Blur (luma)"
+
+
+@pytest.mark.parametrize("step, error", [
+    ("sepia:luma", FilterError),
+    ("brightness_up:luma", EnhancementError),
+])
+def test_unsupported_steps_are_rejected(step, error):
+    with pytest.raises(error):
+        Recipe(step)
+
+
+@pytest.mark.parametrize("processor", [SharpenFilter(), GaussianBlurFilter(2), ContrastEnhancement(1.5)])
+def test_only_luma_plane_changes(processor):
+    image = _photo()
+    y, cb, cr = _planes(image)
+
+    result = LumaProcessor(processor).process(image)
+    assert result.mode == "RGB"
+
+    result_y, result_cb, result_cr = _planes(result)
+    expected_y = np.asarray(processor.process(image.convert("YCbCr").split()[0]), dtype=np.int16)
+    # YCbCr -> RGB -> YCbCr gidiş-dönüşündeki yuvarlama payı
+    assert np.abs(result_y - expected_y).max() <= 2
+    assert np.abs(result_cb - cb).max() <= 2
+    assert np.abs(result_cr - cr).max() <= 2
+
+
+def test_rgba_keeps_alpha_and_l_is_processed_directly():
+    processor = LumaProcessor(SharpenFilter())
+
+    rgba = _photo(mode="RGBA")
+    result = processor.process(rgba)
+    assert result.mode == "RGBA"
+    assert result.getchannel("A").tobytes() == rgba.getchannel("A").tobytes()
+
+    gray = _photo(mode="L")
+    assert processor.process(gray).tobytes() == SharpenFilter().process(gray).tobytes()
+
+
+def test_edge_detect_luma_returns_plane():
+    image = _photo()
+    result = Recipe("edge_detect:luma").apply(image)
+
+    assert result.mode == "L"
+    expected = FilterFactory().create_filter("edge_detect").process(image.convert("YCbCr").split()[0])
+    assert result.tobytes() == expected.tobytes()
+
+
+def test_halo_and_cache_key_follow_wrapped_processor():
+    blur = GaussianBlurFilter(3)
+    luma = LumaProcessor(blur)
+
+    assert luma.band_halo() == blur.band_halo()
+    assert LumaProcessor(ContrastEnhancement(1.3)).band_halo() is None
+    assert blur.cache_key() in luma.cache_key()
+    assert luma.cache_key() != LumaProcessor(GaussianBlurFilter(4)).cache_key()
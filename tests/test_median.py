@@ -0,0 +1,92 @@
+"""
+Median filtre testleri
+
+Bu dosyada:
+- Histogram (sabit süreli) median'ın OpenCV ve PIL ile aynı sonucu vermesi
+- "1", "LA", "CMYK" gibi modların korunması
+- Paletli (P / PA) ve 16 bit (I;16) görüntülerin dönüştürülerek işlenmesi
+- Kalibrasyon anahtarının kernel sınıfına göre oluşması
+kontrol edilir.
+"""
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from exceptions import FilterError
+from filters import MedianFilter, median_histogram
+
+
+def _image(mode, size=(83, 61), seed=2):
+    rng = np.random.default_rng(seed)
+    width, height = size
+    if mode == "1":
+        return Image.fromarray(rng.integers(0, 2, (height, width), dtype=np.uint8) * 255).convert("1")
+    data = rng.integers(0, 256, width * height * len(mode), dtype=np.uint8)
+    return Image.frombytes(mode, size, data.tobytes())
+
+
+@pytest.mark.parametrize("mode", ["1", "L", "LA", "RGB", "RGBA", "CMYK"])
+@pytest.mark.parametrize("kernel_size", [3, 11, 31])
+def test_histogram_matches_opencv(mode, kernel_size):
+    image = _image(mode)
+
+    expected = MedianFilter(kernel_size, backend="opencv").process(image)
+    result = MedianFilter(kernel_size, backend="histogram").process(image)
+
+    assert result.mode == expected.mode == mode
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+
+def test_histogram_matches_pil_reference():
+    image = _image("RGB", seed=7)
+    expected = MedianFilter(5, backend="pil").process(image)
+    result = MedianFilter(5, backend="histogram").process(image)
+
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+
+@pytest.mark.parametrize("mode, expected_mode", [("P", "RGB"), ("PA", "RGBA")])
+@pytest.mark.parametrize("kernel_size", [5, 15])
+def test_palette_images_are_processed_as_rgb(mode, expected_mode, kernel_size):
+    rgb = _image(expected_mode)
+    image = rgb.convert(mode) if mode == "P" else rgb.convert("P").convert("PA")
+
+    result = MedianFilter(kernel_size).process(image)
+    expected = MedianFilter(kernel_size, backend="opencv").process(image.convert(expected_mode))
+
+    assert result.mode == expected_mode
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+
+@pytest.mark.parametrize("kernel_size", [5, 15])
+def test_16_bit_images_keep_their_depth(kernel_size):
+    pixels = np.random.default_rng(4).integers(0, 65536, (61, 83), dtype=np.uint16)
+    image = Image.fromarray(pixels)
+    assert image.mode == "I;16"
+
+    result = MedianFilter(kernel_size).process(image)
+
+    assert result.mode == "I;16"
+    # Her değer kendi penceresinden gelir; uint8'e indirgeme olmaz
+    assert np.asarray(result).max() > 255
+    if kernel_size == 5:
+        assert np.array_equal(np.asarray(result), cv2.medianBlur(pixels, 5))
+
+
+def test_kernel_larger_than_image():
+    pixels = np.random.default_rng(0).integers(0, 256, (6, 9), dtype=np.uint8)
+    result = median_histogram(pixels, 21)
+
+    # Pencere çoğunlukla uzatılmış kenar piksellerinden oluşur
+    assert np.array_equal(result, cv2.medianBlur(pixels, 21))
+
+    with pytest.raises(FilterError):
+        median_histogram(pixels, 4)
+
+
+def test_backend_key_uses_kernel_class():
+    assert MedianFilter(3).backend_key() == "MedianFilter[k5]"
+    assert MedianFilter(15).backend_key() == "MedianFilter[k15]"
+    assert MedianFilter(99).backend_key() == "MedianFilter[k31+]"
@@ -0,0 +1,85 @@
+"""
+Bellek muhasebecisinin testleri
+
+Bu dosyada:
+- Bütçe aşılınca eski tamponların diske taşınması
+- Taşınan tamponların birebir geri yüklenmesi
+- Sabitlenmiş (pinned) tamponların bellekte kalması
+- ImageManager geçmişinin bütçeye uyması
+kontrol edilir.
+"""
+
+import os
+
+from PIL import Image
+
+from image_manager import ImageManager
+from memory_manager import MemoryAccountant, image_nbytes
+
+
+def _frame(value, mode="RGB", size=(64, 64)):
+    return Image.new(mode, size, (value, 0, 255 - value) if mode == "RGB" else value)
+
+
+def test_cold_buffers_are_spilled_and_reloaded(tmp_path):
+    frame_bytes = image_nbytes(_frame(0))
+    accountant = MemoryAccountant(budget_bytes=frame_bytes * 2, scratch_dir=str(tmp_path))
+
+    handles = [accountant.register(_frame(i * 40), "history") for i in range(4)]
+
+    usage = accountant.usage()
+    assert usage["resident_bytes"] <= accountant.budget_bytes
+    assert handles[0].is_spilled and handles[1].is_spilled
+    assert os.path.exists(handles[0].spill_path)
+
+    # Geri yükleme birebir aynı pikselleri döner
+    assert handles[0].get().tobytes() == _frame(0).tobytes()
+    assert not handles[0].is_spilled
+    assert accountant.usage()["reload_count"] == 1
+
+    accountant.cleanup()
+
+
+def test_pinned_and_palette_buffers(tmp_path):
+    accountant = MemoryAccountant(budget_bytes=0, scratch_dir=str(tmp_path))
+
+    active = accountant.register(_frame(10), "processed", pinned=True)
+    palette = _frame(0).convert("P", palette=Image.Palette.ADAPTIVE)
+    spilled = accountant.register(palette, "cache")
+
+    assert not active.is_spilled
+    assert spilled.is_spilled
+
+    restored = spilled.get()
+    assert restored.mode == "P"
+    assert restored.convert("RGB").tobytes() == palette.convert("RGB").tobytes()
+
+    spilled.release()
+    assert "cache" not in accountant.usage()["categories"]
+
+    accountant.cleanup()
+
+
+def test_image_manager_history_stays_within_budget(tmp_path):
+    path = tmp_path / "input.png"
+    _frame(100).save(path)
+
+    frame_bytes = image_nbytes(_frame(0))
+    accountant = MemoryAccountant(budget_bytes=frame_bytes * 3, scratch_dir=str(tmp_path / "scratch"))
+    manager = ImageManager(accountant)
+    manager.load_image(str(path))
+
+    for i in range(6):
+        manager.commit_result(_frame(i * 30))
+
+    usage = manager.get_memory_usage()
+    assert usage["resident_bytes"] <= accountant.budget_bytes
+    assert usage["categories"]["history"]["spilled"] > 0
+
+    # Undo ile diske taşınmış geçmiş kayıtlarına dönülebilir
+    while manager.undo():
+        pass
+    assert manager.processed_image.tobytes() == _frame(100).tobytes()
+    assert manager.get_image_info()["format"] == "PNG"
+
+    accountant.cleanup()
@@ -0,0 +1,62 @@
+"""
+Tek kanallı (L) görüntülerin işlem hattındaki davranışının testleri
+
+Bu dosyada:
+- Grayscale / Canny çıktısının L kalması
+- Sepya'nın L girdiyi kendisi RGB'ye genişletmesi
+- Kaydetme sırasındaki çıktı modu politikası
+kontrol edilir.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from factories import FilterFactory
+from image_manager import ImageManager
+from recipe import Recipe
+
+
+@pytest.fixture
+def color_image():
+    rng = np.random.default_rng(3)
+    return Image.fromarray(rng.integers(0, 256, (60, 80, 3), dtype=np.uint8), "RGB")
+
+
+@pytest.mark.parametrize("backend", ["pil", "opencv"])
+def test_grayscale_emits_single_channel(color_image, backend):
+    result = FilterFactory().create_filter("grayscale", backend=backend).process(color_image)
+    assert result.mode == "L"
+    assert result.size == color_image.size
+
+
+def test_grayscale_recipe_stays_single_channel(color_image):
+    result = Recipe("grayscale,blur,canny_edge").apply(color_image)
+    assert result.mode == "L"
+
+
+@pytest.mark.parametrize("backend", ["numpy", "opencv"])
+def test_sepia_expands_gray_input(color_image, backend):
+    gray = color_image.convert("L")
+    sepia = FilterFactory().create_filter("sepia", backend=backend)
+
+    from_gray = np.asarray(sepia.process(gray), dtype=np.int16)
+    from_rgb = np.asarray(sepia.process(gray.convert("RGB")), dtype=np.int16)
+
+    assert from_gray.shape == from_rgb.shape
+    assert np.abs(from_gray - from_rgb).max() <= 1
+
+
+def test_save_policy(color_image, tmp_path):
+    gray = color_image.convert("L")
+    rgba = color_image.convert("RGBA")
+
+    assert ImageManager.prepare_for_save(gray, "out.png").mode == "L"
+    assert ImageManager.prepare_for_save(gray, "out.png", "rgb").mode == "RGB"
+    assert ImageManager.prepare_for_save(rgba, "out.jpg").mode == "RGB"
+    assert ImageManager.prepare_for_save(rgba, "out.jpg", "keep").mode == "RGBA"
+
+    path = tmp_path / "gray.jpg"
+    ImageManager().save_image(str(path), gray)
+    with Image.open(path) as saved:
+        assert saved.mode == "L"
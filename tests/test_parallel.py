@@ -0,0 +1,73 @@
+"""
+Bant paralel işlemenin testleri
+
+Bu dosyada:
+- Bantlara bölünerek işlenen filtrelerin tüm görüntü sonucuyla birebir
+  aynı olması (halo satırları)
+- Görüntünün tamamına bağlı işlemlerin bölünmemesi
+- Küçük görüntülerin ve tek thread'in bölmeyi kapatması
+kontrol edilir.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from enhancements import ContrastEnhancement, SharpnessEnhancement
+from filters import (
+    BlurFilter, CannyEdgeFilter, EdgeDetectionFilter, EmbossFilter, GaussianBlurFilter,
+    GrayscaleFilter, MedianFilter, MotionBlurFilter, SepiaFilter, SharpenFilter,
+)
+from parallel import BandParallelExecutor
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(5)
+    return Image.fromarray(rng.integers(0, 256, (301, 123, 3), dtype=np.uint8), "RGB")
+
+
+@pytest.fixture
+def executor():
+    executor = BandParallelExecutor(threads=4, min_pixels=0)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.parametrize("processor", [
+    BlurFilter(backend="pil"), BlurFilter(backend="opencv"),
+    SharpenFilter(backend="pil"), SharpenFilter(backend="opencv"),
+    EdgeDetectionFilter(), EmbossFilter(),
+    MedianFilter(5, backend="pil"), MedianFilter(7, backend="opencv"),
+    GaussianBlurFilter(3, backend="pil"), GaussianBlurFilter(3, backend="opencv"),
+    MotionBlurFilter(), SharpnessEnhancement(1.5),
+    GrayscaleFilter(), SepiaFilter(),
+], ids=lambda p: f"{type(p).__name__}-{getattr(p, 'backend', None)}")
+def test_band_result_matches_full_frame(executor, image, processor):
+    assert executor.can_split(processor, image)
+
+    expected = processor.process(image)
+    result = executor.process(processor, image)
+
+    assert result.mode == expected.mode
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+
+def test_global_operations_are_not_split(executor, image):
+    assert not executor.can_split(ContrastEnhancement(1.3), image)
+    assert not executor.can_split(CannyEdgeFilter(), image)
+
+    result = executor.process(ContrastEnhancement(1.3), image)
+    assert np.array_equal(np.asarray(result), np.asarray(ContrastEnhancement(1.3).process(image)))
+
+
+def test_small_images_and_single_thread_stay_serial(image):
+    assert not BandParallelExecutor(threads=4).can_split(SharpenFilter(), image)
+    assert not BandParallelExecutor(threads=1, min_pixels=0).can_split(SharpenFilter(), image)
+
+
+def test_band_ranges_cover_image_without_overlap():
+    ranges = BandParallelExecutor.band_ranges(1000, 8, halo=40)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 1000
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(stop - start >= 160 for start, stop in ranges[:-1])
@@ -0,0 +1,64 @@
+"""
+Üç aşamalı boru hattının (pipeline.py) testleri
+
+Bu dosyada:
+- Sonuçların process_files ile aynı olması ve girdi sırasıyla dönmesi
+- Bozuk dosyaların diğerlerini durdurmadan "failed" raporlanması
+- Aşama istatistiklerinin tutarlı olması
+kontrol edilir.
+"""
+
+from PIL import Image
+
+from batch_processor import BatchProcessor
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from pipeline import format_stage_stats
+from recipe import Recipe
+
+
+def _processor(recipe="blur,invert"):
+    controller = ConcurrencyController(ConcurrencyConfig(worker_processes=2, io_threads=2, name="test"))
+    return BatchProcessor(recipe, controller)
+
+
+def _inputs(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"in{index}.png"
+        Image.new("RGB", (40, 30), (index * 25, 100, 50)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def test_pipeline_matches_recipe(tmp_path):
+    inputs = _inputs(tmp_path, 7)
+    results, stats = _processor().process_pipelined(
+        inputs, str(tmp_path / "out"), queue_size=2
+    )
+
+    assert [r["input"] for r in results] == inputs
+    assert all(r["status"] == "done" for r in results)
+    for path, result in zip(inputs, results):
+        expected = Recipe("blur,invert").apply(Image.open(path))
+        with Image.open(result["output"]) as output:
+            assert output.tobytes() == expected.tobytes()
+
+    assert set(stats["stages"]) == {"decode", "compute", "encode"}
+    assert all(stage["items"] == 7 for stage in stats["stages"].values())
+    assert all(0.0 <= stage["utilisation"] <= 1.0 for stage in stats["stages"].values())
+    assert stats["bottleneck"] in stats["stages"]
+    assert "bottleneck" in format_stage_stats(stats)
+
+
+def test_pipeline_reports_failed_inputs(tmp_path):
+    inputs = _inputs(tmp_path, 3)
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+    inputs.insert(1, str(broken))
+
+    results, stats = _processor().process_pipelined(inputs, str(tmp_path / "out"))
+
+    assert [r["status"] for r in results] == ["done", "failed", "done", "done"]
+    assert results[1]["error"].startswith("UnidentifiedImageError")
+    assert stats["stages"]["compute"]["items"] == 3
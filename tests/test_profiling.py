@@ -0,0 +1,61 @@
+"""
+Bellek profilinin testleri
+
+Bu dosyada:
+- Kapalıyken ölçüm kaydedilmemesi
+- İç içe ölçümlerde tepe değerlerin doğru dağıtılması
+- Reçete bazında sıralı rapor
+kontrol edilir.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from profiling import MemoryProfiler, profiled_process
+from recipe import Recipe
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    profiler = MemoryProfiler()
+    monkeypatch.setattr(MemoryProfiler, "_instance", profiler)
+    yield profiler
+    profiler.stop()
+
+
+def test_disabled_profiler_records_nothing(profiler):
+    with profiler.measure("noop"):
+        np.ones(1000)
+    assert profiler.records == []
+
+
+def test_nested_measurements_keep_outer_peak(profiler):
+    profiler.start()
+
+    with profiler.measure("outer", "test"):
+        big = np.ones(4 * 1024 * 1024, dtype=np.uint8)
+        del big
+        with profiler.measure("inner", "test"):
+            small = np.ones(1024 * 1024, dtype=np.uint8)
+            del small
+
+    peaks = {r["label"]: r["peak_bytes"] for r in profiler.records}
+    assert peaks["inner"] >= 1024 * 1024
+    assert peaks["outer"] >= 4 * 1024 * 1024
+    assert peaks["inner"] < 4 * 1024 * 1024
+
+
+def test_report_ranks_processors_per_recipe(profiler):
+    profiler.start()
+    image = Image.new("RGB", (400, 300), "orange")
+
+    with profiler.recipe("sepia,invert"):
+        Recipe("sepia,invert").apply(image)
+    with profiler.recipe("blur"):
+        profiled_process(Recipe("blur").processors[0], image)
+
+    rows = profiler.report("sepia,invert")
+    assert [row["label"] for row in rows][0] == "Sepia"
+    assert {row["recipe"] for row in rows} == {"sepia,invert"}
+    assert "Recipe: blur" in profiler.format_report()
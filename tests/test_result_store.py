@@ -0,0 +1,111 @@
+"""
+İçerik adresli sonuç deposunun testleri
+
+Bu dosyada:
+- Önek anahtarlarının ortak adımlarda aynı, parametre değişince farklı olması
+- Tekrar çalıştırmada en uzun hazır önekin kullanılması (girdi decode edilmeden)
+- Ham / PNG formatlarında mod ve paletin korunması
+- Boyut sınırında en uzun süredir kullanılmayan kaydın silinmesi
+- Toplu işte reused_steps alanı
+kontrol edilir.
+"""
+
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from batch_processor import process_file
+from recipe import Recipe
+from result_store import ResultStore, chain_keys
+
+
+DIGEST = "0" * 64
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(8)
+    return Image.fromarray(rng.integers(0, 256, (40, 50, 3), dtype=np.uint8), "RGB")
+
+
+def test_chain_keys_share_common_prefix():
+    first = chain_keys(DIGEST, Recipe("blur,sepia,invert").processors)
+    second = chain_keys(DIGEST, Recipe("blur,sepia,solarize").processors)
+
+    assert first[:2] == second[:2]
+    assert first[2] != second[2]
+
+    radius_a = chain_keys(DIGEST, Recipe("gaussian_blur:12").processors)
+    radius_b = chain_keys(DIGEST, Recipe("gaussian_blur:14").processors)
+    assert radius_a != radius_b
+    assert chain_keys("1" * 64, Recipe("blur").processors) != chain_keys(DIGEST, Recipe("blur").processors)
+
+
+def test_rerun_reuses_longest_prefix(tmp_path, image):
+    store = ResultStore(str(tmp_path / "store"), keep_intermediate=True)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return image
+
+    result, info = store.apply(Recipe("blur,sepia,invert"), load, DIGEST)
+    assert info["reused_steps"] == 0 and len(loads) == 1
+
+    again, info = store.apply(Recipe("blur,sepia,invert"), load, DIGEST)
+    assert info["reused_steps"] == 3 and len(loads) == 1
+    assert np.array_equal(np.asarray(again), np.asarray(result))
+
+    changed, info = store.apply(Recipe("blur,sepia,solarize"), load, DIGEST)
+    assert info["reused_steps"] == 2 and info["computed_steps"] == 1
+    assert np.array_equal(
+        np.asarray(changed), np.asarray(Recipe("blur,sepia,solarize").apply(image))
+    )
+
+
+@pytest.mark.parametrize("storage_format", ["raw", "png"])
+def test_formats_keep_mode_and_palette(tmp_path, storage_format):
+    store = ResultStore(str(tmp_path), storage_format=storage_format)
+    palette_image = Image.new("P", (7, 5))
+    palette_image.putpalette([value % 256 for value in range(768)])
+    palette_image.putpixel((3, 2), 200)
+
+    store.put("ab" * 32, palette_image)
+    loaded = store.get("ab" * 32)
+
+    assert loaded.mode == "P"
+    assert loaded.getpalette() == palette_image.getpalette()
+    assert np.array_equal(np.asarray(loaded), np.asarray(palette_image))
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path, image):
+    entry_size = len(image.tobytes()) + 200
+    store = ResultStore(str(tmp_path), max_bytes=int(entry_size * 2.5))
+
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for age, key in enumerate(keys[:2]):
+        store.put(key, image)
+        os.utime(store._existing_path(key), (1000 + age, 1000 + age))
+
+    # İlk kayıt okununca en yeni olur; yer açmak için ikincisi silinir
+    assert store.get(keys[0]) is not None
+    store.put(keys[2], image)
+
+    assert store.contains(keys[0]) and store.contains(keys[2])
+    assert not store.contains(keys[1])
+    assert store.stats()["evictions"] == 1
+
+
+def test_process_file_reports_reused_steps(tmp_path, image):
+    source = tmp_path / "in.png"
+    image.save(source)
+    options = {"root": str(tmp_path / "store")}
+
+    first = process_file(str(source), str(tmp_path / "a.png"), ["invert", "grayscale"], result_store=options)
+    second = process_file(str(source), str(tmp_path / "b.png"), ["invert", "grayscale"], result_store=options)
+
+    assert first["reused_steps"] == 0 and second["reused_steps"] == 2
+    with Image.open(tmp_path / "a.png") as a, Image.open(tmp_path / "b.png") as b:
+        assert np.array_equal(np.asarray(a), np.asarray(b))
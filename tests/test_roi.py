@@ -0,0 +1,119 @@
+"""
+Bölge (ROI) işlemenin testleri
+
+Bu dosyada:
+- Bölge içindeki sonucun tüm görüntüye uygulanan işlemle aynı olması
+- Sadece bölge + halo kadar pikselin işlenmesi
+- Yumuşak maske ile karıştırma
+- Geçmişe sadece değişen bölgenin yazılması ve undo'nun birebir dönmesi
+kontrol edilir.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from enhancements import ContrastEnhancement
+from filters import BlurFilter, GaussianBlurFilter, InvertFilter, MedianFilter, SharpenFilter
+from image_manager import ImageManager
+from memory_manager import MemoryAccountant, image_nbytes
+
+
+def _noise(size=(120, 90), mode="RGB"):
+    rng = np.random.default_rng(3)
+    shape = (size[1], size[0]) if mode == "L" else (size[1], size[0], len(mode))
+    return Image.fromarray(rng.integers(0, 256, shape, dtype=np.uint8), mode)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    path = tmp_path / "input.png"
+    _noise().save(path)
+    accountant = MemoryAccountant(budget_bytes=1 << 30, scratch_dir=str(tmp_path / "scratch"))
+    manager = ImageManager(accountant)
+    manager.load_image(str(path))
+    yield manager
+    accountant.cleanup()
+
+
+@pytest.mark.parametrize("processor", [
+    BlurFilter(), SharpenFilter(), MedianFilter(5), GaussianBlurFilter(3), InvertFilter(),
+], ids=lambda p: type(p).__name__)
+def test_region_matches_full_frame(processor):
+    image = _noise()
+    box = (30, 20, 70, 60)
+
+    patch, result_box = processor.process_region(image, box)
+
+    assert result_box == box
+    assert patch.tobytes() == processor.process(image).crop(box).tobytes()
+
+
+def test_only_region_and_halo_are_processed():
+    seen = []
+    processor = BlurFilter()
+
+    def record(image):
+        seen.append(image.size)
+        return processor.process(image)
+
+    processor.process_region(_noise((400, 300)), (100, 100, 140, 130), process=record)
+
+    halo = processor.band_halo()
+    assert seen == [(40 + 2 * halo, 30 + 2 * halo)]
+
+
+def test_global_operation_sees_only_region():
+    image = _noise()
+    box = (10, 10, 50, 40)
+    patch, _ = ContrastEnhancement(1.5).process_region(image, box)
+
+    assert patch.tobytes() == ContrastEnhancement(1.5).process(image.crop(box)).tobytes()
+
+
+def test_soft_mask_blends_result():
+    image = Image.new("L", (40, 40), 100)
+    mask = Image.new("L", (40, 40), 0)
+    mask.paste(255, (0, 0, 10, 10))
+    mask.paste(128, (10, 0, 20, 10))
+
+    patch, box = InvertFilter().process_region(image, mask=mask)
+
+    assert box == (0, 0, 20, 10)
+    assert patch.getpixel((5, 5)) == 155
+    assert abs(patch.getpixel((15, 5)) - (155 * 128 + 100 * 127) / 255) <= 1
+
+    assert InvertFilter().process_region(image, mask=Image.new("L", (40, 40))) == (None, None)
+
+
+def test_history_stores_region_and_undo_restores(manager):
+    states = [manager.processed_image.copy()]
+
+    manager.apply_processor(BlurFilter(), roi=(10, 10, 40, 30))
+    states.append(manager.processed_image.copy())
+    manager.apply_processor(InvertFilter())
+    states.append(manager.processed_image.copy())
+    manager.apply_processor(SharpenFilter(), roi=(20, 15, 60, 50))
+    states.append(manager.processed_image.copy())
+    manager.apply_processor(MedianFilter(3), roi=(0, 0, 25, 25))
+
+    patch = manager.image_history[-1]
+    assert patch.box == (0, 0, 25, 25)
+    assert patch.nbytes == image_nbytes(Image.new("RGB", (25, 25)))
+
+    # Bölge dışı değişmez
+    before, after = np.asarray(states[-1]), np.asarray(manager.processed_image)
+    assert (before[25:] == after[25:]).all() and (before[:, 25:] == after[:, 25:]).all()
+
+    for expected in reversed(states):
+        assert manager.undo()
+        assert manager.processed_image.tobytes() == expected.tobytes()
+    assert not manager.undo()
+
+
+def test_region_edit_bumps_version(manager):
+    version = manager.processed_version
+    manager.apply_processor(InvertFilter(), roi=(0, 0, 5, 5))
+    assert manager.processed_version > version
+
+    assert manager.apply_processor(InvertFilter(), roi=(500, 500, 600, 600)) is False
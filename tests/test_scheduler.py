@@ -0,0 +1,128 @@
+"""
+Öncelikli iş zamanlayıcının testleri
+
+Bu dosyada:
+- Arka plan işleri sürerken önizleme işinin hemen çalışması
+- Aynı görüntü için eskimiş önizleme işlerinin iptali
+- Kuyruk istatistikleri
+- Sonuç yazılırken iptal edilen işin ve hatalı bitirmenin işçiyi öldürmemesi
+kontrol edilir.
+"""
+
+import threading
+from concurrent.futures import Future, wait
+
+import pytest
+
+from scheduler import Job, JobPriority, JobScheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(workers=2)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_interactive_job_is_served_while_background_runs(scheduler):
+    release = threading.Event()
+
+    # Uzun süren iki dışa aktarma işi: bütçe 1 olduğu için biri beklemede kalır
+    exports = [scheduler.submit_background(release.wait, 5) for _ in range(2)]
+
+    preview = scheduler.submit_interactive("image", lambda: "preview")
+    assert preview.result(timeout=2) == "preview"
+
+    stats = scheduler.stats()
+    assert stats["background"]["running"] == 1
+    assert stats["background"]["queued"] == 1
+
+    release.set()
+    assert all(export.result(timeout=5) for export in exports)
+
+
+def test_only_latest_preview_survives(scheduler, caplog):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_preview():
+        started.set()
+        release.wait(5)
+        return "old"
+
+    running = scheduler.submit_interactive("image", slow_preview)
+    started.wait(2)
+
+    # İkinci işçi meşgul edilir ki sıradaki önizleme kuyrukta beklesin
+    blocker = scheduler.submit_interactive("other", release.wait, 5)
+    queued = scheduler.submit_interactive("image", lambda: "queued")
+    latest = scheduler.submit_interactive("image", lambda: "latest")
+
+    assert queued.cancelled()
+
+    release.set()
+    assert latest.result(timeout=5) == "latest"
+    assert blocker.result(timeout=5)
+
+    # Çalışırken eskiyen işin sonucu atılır (işçi bitirene kadar beklenir)
+    wait([running], timeout=5)
+    assert running.cancelled()
+    # İptal edilen Future ikinci kez bildirilmez ("unexpected state" logu yok)
+    assert not [r for r in caplog.records if r.name == "concurrent.futures"]
+
+
+def test_errors_are_propagated(scheduler):
+    def failing():
+        raise ValueError("boom")
+
+    future = scheduler.submit_interactive("image", failing)
+
+    with pytest.raises(ValueError):
+        future.result(timeout=2)
+
+
+def test_wait_statistics_are_recorded(scheduler):
+    scheduler.submit_background(lambda: None).result(timeout=2)
+    scheduler.submit_interactive("image", lambda: None).result(timeout=2)
+
+    stats = scheduler.stats()
+    assert stats["interactive"]["started"] == 1
+    assert stats["background"]["started"] == 1
+    assert stats["interactive"]["max_wait"] >= 0.0
+
+
+class _CancelledDuringFinish(Future):
+    """Çağıran, işçi sonucu yazmadan hemen önce iptal eder"""
+
+    def set_running_or_notify_cancel(self):
+        self.cancel()
+        return super().set_running_or_notify_cancel()
+
+
+def test_cancel_while_finishing_discards_result():
+    job = Job(JobPriority.INTERACTIVE, None, (), {}, "image")
+    job.future = _CancelledDuringFinish()
+
+    JobScheduler._finish(job, "result", None)
+    assert job.future.cancelled()
+
+
+def test_worker_survives_failing_finish(monkeypatch):
+    finish = JobScheduler._finish
+    calls = []
+
+    def failing_twice(job, result, error):
+        calls.append(job)
+        if len(calls) <= 2:
+            raise RuntimeError("boom")
+        finish(job, result, error)
+
+    monkeypatch.setattr(JobScheduler, "_finish", staticmethod(failing_twice))
+    scheduler = JobScheduler(workers=2)
+    try:
+        for key in ("a", "b"):
+            scheduler.submit_interactive(key, lambda: "lost")
+        # İki işçi thread'i de hatadan sonra iş almaya devam eder
+        assert scheduler.submit_interactive("c", lambda: "ok").result(timeout=5) == "ok"
+    finally:
+        scheduler.shutdown()
@@ -0,0 +1,141 @@
+"""
+Paylaşımlı bellek taşıması ve batch işleme testleri
+
+Bu dosyada:
+- Görüntünün paylaşımlı bellekten bozulmadan geri okunması
+- İşçi process'te reçetenin uygulanması
+- Segmentlerin işlem sonunda temizlenmesi
+- İptal edilen işin işçi hatasının / sonucunun yok sayılması (sonuç
+  yazılırken gelen iptal dahil)
+kontrol edilir.
+"""
+
+import logging
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from batch_processor import BatchProcessor
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from recipe import Recipe
+import shared_memory_transport
+from shared_memory_transport import SharedFrameTransport, SharedMemoryExecutor
+
+
+@pytest.fixture
+def sample_image():
+    rng = np.random.default_rng(7)
+    return Image.fromarray(rng.integers(0, 256, (40, 30, 3), dtype=np.uint8))
+
+
+@pytest.fixture
+def controller():
+    return ConcurrencyController(ConcurrencyConfig(worker_processes=2, name="test"))
+
+
+def test_round_trip_preserves_pixels(sample_image):
+    with SharedFrameTransport() as transport:
+        descriptor = transport.put_image(sample_image)
+        restored = transport.get_image(descriptor)
+
+        assert restored.mode == "RGB"
+        assert restored.tobytes() == sample_image.tobytes()
+        assert transport.open_segments == 0
+
+
+def test_palette_image_is_converted_before_transport():
+    palette_image = Image.new("P", (8, 8))
+
+    with SharedFrameTransport() as transport:
+        restored = transport.get_image(transport.put_image(palette_image))
+
+    assert restored.mode == "RGB"
+
+
+def test_executor_applies_recipe_in_worker(sample_image, controller):
+    expected = Recipe("invert,blur").apply(sample_image)
+
+    with SharedMemoryExecutor(controller.process_pool()) as executor:
+        results = executor.map([sample_image, sample_image], ["invert", "blur"])
+        assert executor.transport.open_segments == 0
+
+    assert all(result.tobytes() == expected.tobytes() for result in results)
+
+
+def test_batch_process_files_reports_failures(tmp_path, sample_image, controller):
+    good = tmp_path / "good.png"
+    sample_image.save(good)
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+
+    processor = BatchProcessor("grayscale", controller)
+    results = processor.process_files([str(good), str(broken)], str(tmp_path / "out"))
+
+    assert [r["status"] for r in results] == ["done", "failed"]
+    assert (tmp_path / "out" / "good.png").exists()
+    assert results[1]["error"]
+
+
+class _ManualPool:
+    """submit() çağrısında işçi Future'ını dışarıdan tamamlanmak üzere döner"""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def test_worker_failure_after_cancel_is_ignored(sample_image, caplog):
+    pool = _ManualPool()
+    with SharedMemoryExecutor(pool) as executor:
+        result = executor.submit(sample_image, ["blur"])
+        assert result.cancel()
+
+        with caplog.at_level(logging.ERROR, logger="concurrent.futures"):
+            pool.futures[0].set_exception(RuntimeError("worker crashed"))
+
+        assert result.cancelled()
+        assert not caplog.records
+        assert executor.transport.open_segments == 0
+
+
+class _CancelledWhileCompleting(Future):
+    """Çağıran, sonuç yazılmadan hemen önce iptal eder"""
+
+    def cancelled(self):
+        was_cancelled = super().cancelled()
+        self.cancel()
+        return was_cancelled
+
+    def set_running_or_notify_cancel(self):
+        self.cancel()
+        return super().set_running_or_notify_cancel()
+
+
+@pytest.mark.parametrize("outcome", ["error", "result"])
+def test_cancel_while_completing_is_ignored(sample_image, caplog, monkeypatch, outcome):
+    monkeypatch.setattr(shared_memory_transport, "Future", _CancelledWhileCompleting)
+    pool = _ManualPool()
+    with SharedMemoryExecutor(pool) as executor:
+        result = executor.submit(sample_image, ["blur"])
+
+        with caplog.at_level(logging.ERROR, logger="concurrent.futures"):
+            if outcome == "error":
+                pool.futures[0].set_exception(RuntimeError("worker crashed"))
+            else:
+                output = executor.transport.put_image(sample_image)
+                pool.futures[0].set_result(output)
+
+        assert result.cancelled()
+        assert not caplog.records
+        assert executor.transport.open_segments == 0
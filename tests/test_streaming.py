@@ -0,0 +1,96 @@
+"""
+Bant halinde (streaming) işlemenin testleri
+
+Bu dosyada:
+- Bant halinde işlemenin tam görüntü işlemesiyle aynı sonucu vermesi
+  (.npy, TIFF şeritleri, PNG satırları)
+- Yazılan TIFF / PNG dosyalarının PIL ile okunabilmesi
+- Nokta işlemi olmayan reçetelerin reddedilmesi
+kontrol edilir.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from exceptions import FilterError
+from recipe import Recipe
+from streaming import (
+    FullDecodeReader, PngRowReader, TiffStripReader, can_stream, open_band_reader,
+    stream_recipe,
+)
+
+
+RECIPE = "invert,brightness_up,sepia"
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(11)
+    return Image.fromarray(rng.integers(0, 256, (203, 77, 3), dtype=np.uint8), "RGB")
+
+
+def _expected(image, recipe=RECIPE):
+    return np.asarray(Recipe(recipe).apply(image))
+
+
+def test_npy_to_tiff_matches_full_processing(tmp_path, image):
+    source = tmp_path / "in.npy"
+    np.save(source, np.asarray(image))
+    output = tmp_path / "out.tif"
+
+    info = stream_recipe(str(source), str(output), RECIPE, band_rows=32)
+
+    assert info["streamed_input"] and info["bands"] == 7
+    with Image.open(output) as result:
+        assert np.array_equal(np.asarray(result), _expected(image))
+
+
+def test_tiff_strips_to_png_roundtrip(tmp_path, image):
+    source = tmp_path / "in.tif"
+    image.save(source)
+    assert isinstance(open_band_reader(str(source), 16), TiffStripReader)
+
+    output = tmp_path / "out.png"
+    stream_recipe(str(source), str(output), "grayscale,invert", band_rows=50)
+
+    with Image.open(output) as result:
+        assert result.mode == "L"
+        assert np.array_equal(np.asarray(result), _expected(image, "grayscale,invert"))
+
+    # Akış ile yazılan PNG tekrar bant halinde okunabilir
+    reader = open_band_reader(str(output), 40)
+    assert isinstance(reader, PngRowReader)
+    bands = [np.asarray(band) for band in reader.bands()]
+    assert np.array_equal(np.vstack(bands), _expected(image, "grayscale,invert"))
+
+
+def test_unstreamable_input_falls_back_to_full_decode(tmp_path, image):
+    source = tmp_path / "in.jpg"
+    image.save(source, quality=95)
+    assert isinstance(open_band_reader(str(source), 16), FullDecodeReader)
+
+    output = tmp_path / "out.npy"
+    info = stream_recipe(str(source), str(output), "solarize", band_rows=64)
+    assert not info["streamed_input"]
+    assert np.load(output).shape == (203, 77, 3)
+
+
+@pytest.mark.parametrize("recipe", [RECIPE, "grayscale,invert"])
+def test_npy_output_matches_full_processing(tmp_path, image, recipe):
+    source = tmp_path / "in.npy"
+    np.save(source, np.asarray(image))
+
+    output = tmp_path / "out.npy"
+    stream_recipe(str(source), str(output), recipe, band_rows=32)
+    assert np.array_equal(np.load(output), _expected(image, recipe))
+
+
+def test_non_point_recipes_are_rejected(tmp_path, image):
+    source = tmp_path / "in.npy"
+    np.save(source, np.asarray(image))
+
+    assert not can_stream("blur", "out.png")
+    assert not can_stream("invert", "out.jpg")
+    with pytest.raises(FilterError):
+        stream_recipe(str(source), str(tmp_path / "out.png"), "invert,blur")
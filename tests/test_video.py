@@ -0,0 +1,77 @@
+"""
+Video işlemenin (video.py) testleri
+
+Bu dosyada:
+- Tüm karelerin sırayla işlenip kare hızının korunması
+- Sıralama tamponu küçük olsa da sonucun değişmemesi
+- Açılamayan dosyada anlaşılır hata verilmesi
+kontrol edilir.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from exceptions import ImageProcessingError
+from recipe import Recipe
+from video import VideoProcessor, frame_to_image, image_to_frame, write_test_video
+
+
+def _controller():
+    return ConcurrencyController(ConcurrencyConfig(worker_processes=2, name="test"))
+
+
+def _frames(path):
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+@pytest.mark.parametrize("window", [1, 8])
+def test_video_frames_processed_in_order(tmp_path, window):
+    source = str(tmp_path / "in.avi")
+    output = str(tmp_path / "out.avi")
+    write_test_video(source, frames=20, fps=12.0)
+
+    report = VideoProcessor("invert", _controller(), window=window, fourcc="MJPG").process(
+        source, output
+    )
+
+    assert report["frames"] == 20
+    assert report["source_fps"] == pytest.approx(12.0)
+    assert report["size"] == (160, 120)
+    assert cv2.VideoCapture(output).get(cv2.CAP_PROP_FPS) == pytest.approx(12.0)
+
+    recipe = Recipe("invert")
+    written = _frames(output)
+    assert len(written) == 20
+    for original, result in zip(_frames(source), written):
+        expected = image_to_frame(recipe.apply(frame_to_image(original))).astype(int)
+        # MJPG kayıplıdır; kare sırası karışsaydı fark çok daha büyük olurdu
+        assert np.abs(expected - result.astype(int)).mean() < 6
+
+
+def test_grayscale_recipe_writes_color_frames(tmp_path):
+    source = str(tmp_path / "in.avi")
+    write_test_video(source, frames=5)
+
+    report = VideoProcessor("grayscale", _controller(), fourcc="MJPG").process(
+        source, str(tmp_path / "out.avi")
+    )
+
+    assert report["frames"] == 5
+
+
+def test_missing_video_raises(tmp_path):
+    with pytest.raises(ImageProcessingError):
+        VideoProcessor("invert", _controller()).process(
+            str(tmp_path / "missing.mp4"), str(tmp_path / "out.mp4")
+        )
@@ -0,0 +1,104 @@
+"""
+Klasör izleme servisinin testleri
+
+Bu dosyada:
+- Boyutu değişmekte olan dosyanın beklenmesi
+- Hazır dosyaların işlenip indekse yazılması
+- Yeniden başlatmada işlenmiş dosyaların atlanması
+- Çöken işçinin dosyasının başarısız sayılması ve havuzun yenilenmesi
+kontrol edilir.
+"""
+
+import os
+
+import pytest
+from PIL import Image
+
+import watch_folder
+from batch_processor import process_file
+from concurrency import ConcurrencyController
+from config import ConcurrencyConfig
+from watch_folder import FolderIndex, StabilityTracker, WatchFolderDaemon
+
+
+@pytest.fixture
+def controller():
+    return ConcurrencyController(ConcurrencyConfig(worker_processes=1, name="test"))
+
+
+def test_growing_file_is_not_ready(tmp_path):
+    path = tmp_path / "a.png"
+    path.write_bytes(b"x" * 10)
+    tracker = StabilityTracker(stable_polls=1)
+
+    assert not tracker.observe("a.png", os.stat(path))
+
+    # Kopyalama sürüyor: boyut değişti, sayaç sıfırlanır
+    path.write_bytes(b"x" * 20)
+    assert not tracker.observe("a.png", os.stat(path))
+    assert tracker.observe("a.png", os.stat(path))
+
+
+def test_daemon_processes_new_files_once(tmp_path, controller):
+    incoming = tmp_path / "incoming"
+    output = tmp_path / "out"
+    incoming.mkdir()
+    Image.new("RGB", (40, 30), "red").save(incoming / "shot1.png")
+    (incoming / "notes.txt").write_text("ignored")
+
+    daemon = WatchFolderDaemon(
+        str(incoming), str(output), "grayscale", controller,
+        poll_interval=0, stable_polls=1,
+    )
+    daemon.run(max_polls=3)
+
+    assert (output / "shot1.png").exists()
+    metrics = daemon.metrics()
+    assert metrics["processed"] == 1
+    assert metrics["queue_length"] == 0
+
+    index = FolderIndex(str(output / WatchFolderDaemon.INDEX_FILE_NAME))
+    assert index.entries["shot1.png"]["status"] == "done"
+
+    # Yeniden başlatma: indeksteki dosya tekrar işlenmez, yeni dosya işlenir
+    Image.new("RGB", (40, 30), "blue").save(incoming / "shot2.png")
+    restarted = WatchFolderDaemon(
+        str(incoming), str(output), "grayscale", controller,
+        poll_interval=0, stable_polls=1,
+    )
+    restarted.run(max_polls=3)
+
+    assert restarted.metrics()["processed"] == 1
+    assert (output / "shot2.png").exists()
+
+
+def _crash_on_bad_name(input_path, output_path, steps):
+    # İşçi process'in çökmesi (örn: kütüphane segfault'u)
+    if "crash" in os.path.basename(input_path):
+        os._exit(1)
+    return process_file(input_path, output_path, steps)
+
+
+def test_worker_crash_fails_file_and_pool_is_recreated(tmp_path, controller, monkeypatch):
+    monkeypatch.setattr(watch_folder, "process_file", _crash_on_bad_name)
+    incoming = tmp_path / "incoming"
+    output = tmp_path / "out"
+    incoming.mkdir()
+    Image.new("RGB", (40, 30), "red").save(incoming / "crash.png")
+
+    daemon = WatchFolderDaemon(
+        str(incoming), str(output), "grayscale", controller,
+        poll_interval=0, stable_polls=1,
+    )
+    daemon.run(max_polls=3)
+
+    index = FolderIndex(str(output / WatchFolderDaemon.INDEX_FILE_NAME))
+    assert index.entries["crash.png"]["status"] == "failed"
+    assert "BrokenProcessPool" in index.entries["crash.png"]["error"]
+
+    Image.new("RGB", (40, 30), "blue").save(incoming / "good.png")
+    daemon.run(max_polls=3)
+
+    assert daemon.metrics()["failed"] == 1
+    assert daemon.metrics()["processed"] == 1
+    assert (output / "good.png").exists()
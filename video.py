@@ -0,0 +1,201 @@
+# ======================== video.py ========================
+"""
+Video dosyalarına reçete uygulama
+
+Filtre ve enhancement reçeteleri sadece tek karelik görüntülerde
+kullanılabiliyordu.
+
+Bu dosya:
+- kareleri cv2.VideoCapture ile okumayı
+- reçeteyi kareler üzerinde process havuzunda paralel çalıştırmayı
+  (kareler paylaşımlı bellekle taşınır)
+- sonuçları sınırlı bir sıralama tamponu (reorder buffer) üzerinden, kare
+  sırasıyla ayrı bir thread'de cv2.VideoWriter'a yazmayı
+- kare hızını (fps) korumayı ve işleme hızını raporlamayı
+sağlar.
+
+Bellekte aynı anda en fazla `window` kare bulunur; saatlerce süren
+videolarda da bellek kullanımı sabittir.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from concurrency import ConcurrencyController
+from config import AppConfig
+from exceptions import ImageProcessingError
+from logger import log_event
+from recipe import Recipe
+from shared_memory_transport import SharedMemoryExecutor
+
+
+logger = logging.getLogger("ImageProcessingApp.video")
+
+
+def frame_to_image(frame: np.ndarray) -> Image.Image:
+    """OpenCV BGR karesini PIL RGB görüntüsüne çevirir"""
+    return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+
+def image_to_frame(image: Image.Image) -> np.ndarray:
+    """PIL görüntüsünü VideoWriter'ın beklediği BGR karesine çevirir"""
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2BGR)
+
+
+class VideoProcessor:
+    """
+    Bir reçeteyi video karelerine uygulayan sınıf.
+
+    Kullanım:
+        processor = VideoProcessor("blur,sepia", ConcurrencyController.from_preset("throughput"))
+        report = processor.process("in.mp4", "out.mp4")
+        print(report["fps"])
+    """
+
+    def __init__(self, recipe, controller: ConcurrencyController = None,
+                 window: int = None, fourcc: str = None):
+        """
+        Parametreler:
+            recipe (Recipe | str | list[str]): Uygulanacak reçete
+            controller: Process havuzunu belirleyen eşzamanlılık kontrolcüsü
+            window (int): Sıralama tamponunun kare kapasitesi
+                          (varsayılan: işçi sayısı x AppConfig.VIDEO_FRAMES_PER_WORKER)
+            fourcc (str): Çıktı codec'i (varsayılan: AppConfig.VIDEO_FOURCC)
+        """
+        self.recipe = recipe if isinstance(recipe, Recipe) else Recipe(recipe)
+        self.controller = controller or ConcurrencyController.from_preset("throughput")
+        self.window = window or (
+            self.controller.config.worker_processes * AppConfig.VIDEO_FRAMES_PER_WORKER
+        )
+        self.fourcc = fourcc or AppConfig.VIDEO_FOURCC
+
+    def process(self, input_path: str, output_path: str, on_progress=None) -> dict:
+        """
+        Videoyu işler.
+
+        Parametreler:
+            on_progress: Her yazılan kareden sonra (kare_sayısı, toplam_kare)
+                         ile çağrılır; toplam bilinmiyorsa 0
+
+        Dönüş:
+            dict: frames, seconds, fps (işleme hızı), source_fps, size
+        """
+        capture = cv2.VideoCapture(input_path)
+        if not capture.isOpened():
+            raise ImageProcessingError(f"Cannot open video: {input_path}")
+
+        source_fps = capture.get(cv2.CAP_PROP_FPS) or AppConfig.VIDEO_DEFAULT_FPS
+        total_frames = int(capture.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+
+        # Sıralama tamponu: kare sırasıyla Future'lar. Dolunca okuma bekler
+        # (geri basınç); yazıcı her zaman en eski kareyi bekler
+        pending = queue.Queue(maxsize=self.window)
+        writer_state = {"writer": None, "frames": 0, "error": None, "size": None}
+        writer_thread = threading.Thread(
+            target=self._write_frames,
+            args=(pending, output_path, source_fps, writer_state, total_frames, on_progress),
+            name="imageproc-video-writer",
+            daemon=True,
+        )
+
+        start = time.perf_counter()
+        writer_thread.start()
+        try:
+            with SharedMemoryExecutor(self.controller.process_pool()) as executor:
+                while writer_state["error"] is None:
+                    ok, frame = capture.read()
+                    if not ok:
+                        break
+                    pending.put(executor.submit(frame_to_image(frame), self.recipe.steps))
+                pending.put(None)
+                writer_thread.join()
+        finally:
+            capture.release()
+            if writer_state["writer"] is not None:
+                writer_state["writer"].release()
+
+        if writer_state["error"] is not None:
+            raise writer_state["error"]
+
+        seconds = time.perf_counter() - start
+        report = {
+            "input": input_path,
+            "output": output_path,
+            "frames": writer_state["frames"],
+            "seconds": seconds,
+            "fps": writer_state["frames"] / seconds if seconds > 0 else 0.0,
+            "source_fps": source_fps,
+            "size": writer_state["size"],
+        }
+        log_event(logger, "video_processed", level=logging.INFO, **report)
+        return report
+
+    def _write_frames(self, pending, output_path, fps, state, total_frames, on_progress):
+        """Yazıcı thread: tampondaki kareleri sırayla VideoWriter'a yazar"""
+        while True:
+            future = pending.get()
+            if future is None:
+                return
+            if state["error"] is not None:
+                # Hata sonrası okuyucu bitene kadar tampon boşaltılır
+                future.cancel()
+                continue
+
+            try:
+                frame = image_to_frame(future.result())
+                height, width = frame.shape[:2]
+
+                if state["writer"] is None:
+                    state["size"] = (width, height)
+                    state["writer"] = cv2.VideoWriter(
+                        output_path, cv2.VideoWriter_fourcc(*self.fourcc), fps, (width, height)
+                    )
+                    if not state["writer"].isOpened():
+                        raise ImageProcessingError(
+                            f"Cannot open video writer for {output_path} ({self.fourcc})"
+                        )
+                elif (width, height) != state["size"]:
+                    raise ImageProcessingError("Video recipes must keep the frame size")
+
+                state["writer"].write(frame)
+                state["frames"] += 1
+            except Exception as e:
+                state["error"] = e
+                continue
+
+            if on_progress is not None:
+                on_progress(state["frames"], total_frames)
+
+
+def write_test_video(path: str, frames: int = 48, size=(160, 120), fps: float = 24.0,
+                     fourcc: str = "MJPG"):
+    """
+    Testler ve benchmark için sentetik video üretir: kayan renk gradyanı
+    ve hareket eden bir kare.
+    """
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), fps, (width, height))
+    if not writer.isOpened():
+        raise ImageProcessingError(f"Cannot open video writer for {path} ({fourcc})")
+
+    x = np.arange(width, dtype=np.uint16)
+    y = np.arange(height, dtype=np.uint16)[:, None]
+    try:
+        for index in range(frames):
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            frame[..., 0] = (x + index * 4) % 256
+            frame[..., 1] = (y * 2 + index) % 256
+            frame[..., 2] = 128
+            box = (index * 3) % max(1, width - 20)
+            frame[height // 3:height // 3 + 20, box:box + 20] = 255
+            writer.write(frame)
+    finally:
+        writer.release()
@@ -0,0 +1,379 @@
+# ======================== watch_folder.py ========================
+"""
+Klasör izleme (watch folder) servisi
+
+Kameradan dışa aktarılan dosyalar paylaşılan bir klasöre düşer ve
+sabit bir reçete ile otomatik işlenmesi gerekir.
+
+Bu dosya:
+- klasörü belirli aralıklarla tarayıp yeni dosyaları bulmayı
+- dosya boyutu birkaç tarama boyunca değişmeyince dosyayı "tamamlanmış"
+  saymayı (kopyalanması süren dosyalar işlenmez)
+- hazır dosyaları process havuzuna göndermeyi
+- işlenen dosyaları yerel bir JSON indekste saklamayı
+  (yeniden başlatmada aynı dosyalar tekrar işlenmez)
+- kuyruk uzunluğu ve gecikme metriklerini sunmayı
+sağlar.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from batch_processor import BatchProcessor, process_file
+from concurrency import ConcurrencyController
+from config import AppConfig
+from logger import configure_worker_logging
+from recipe import Recipe
+from utils import ImageValidator
+
+
+logger = logging.getLogger("ImageProcessingApp.watch")
+
+
+class FolderIndex:
+    """
+    İşlenmiş dosyaların kalıcı indeksi.
+
+    Anahtar dosya adıdır; boyut veya değiştirilme zamanı değişen dosya
+    (aynı isimle yeniden dışa aktarılmış) tekrar işlenir.
+    """
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.entries = {}
+
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def signature(stat) -> dict:
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def is_processed(self, name: str, stat) -> bool:
+        entry = self.entries.get(name)
+        if entry is None:
+            return False
+        return entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
+
+    def record(self, name: str, stat, result: dict):
+        entry = self.signature(stat)
+        entry.update({
+            "status": result["status"],
+            "output": result["output"],
+            "error": result["error"],
+            "finished_at": time.time(),
+        })
+        self.entries[name] = entry
+
+    def save(self):
+        """İndeksi atomik olarak yazar (yarım kalmış dosya oluşmaz)"""
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(temp_path, self.index_path)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class StabilityTracker:
+    """
+    Dosyanın yazılmasının bittiğini boyut kararlılığı ile tespit eder.
+
+    Boyut ve değiştirilme zamanı art arda stable_polls tarama boyunca
+    aynı kalan dosya hazır sayılır.
+    """
+
+    def __init__(self, stable_polls: int = AppConfig.WATCH_STABLE_POLLS):
+        self.stable_polls = max(1, stable_polls)
+        self._seen = {}
+
+    def observe(self, name: str, stat) -> bool:
+        """Taramada görülen dosyayı kaydeder; hazırsa True döner"""
+        signature = (stat.st_size, stat.st_mtime_ns)
+        previous = self._seen.get(name)
+
+        if previous is None or previous["signature"] != signature:
+            self._seen[name] = {
+                "signature": signature,
+                "count": 1,
+                "first_seen": previous["first_seen"] if previous else time.time(),
+            }
+        else:
+            previous["count"] += 1
+
+        entry = self._seen[name]
+        return stat.st_size > 0 and entry["count"] > self.stable_polls
+
+    def first_seen(self, name: str) -> float:
+        entry = self._seen.get(name)
+        return entry["first_seen"] if entry else time.time()
+
+    def forget(self, name: str):
+        self._seen.pop(name, None)
+
+    def prune(self, present_names):
+        """Klasörden silinmiş dosyaları unutur"""
+        for name in list(self._seen):
+            if name not in present_names:
+                del self._seen[name]
+
+
+class WatchFolderDaemon:
+    """
+    Klasörü izleyip yeni dosyalara reçeteyi uygulayan servis.
+
+    Kullanım:
+        daemon = WatchFolderDaemon("incoming/", "processed/", "blur,sepia")
+        daemon.run()              # stop() çağrılana kadar çalışır
+    """
+
+    INDEX_FILE_NAME = ".watch_index.json"
+
+    def __init__(self, input_dir: str, output_dir: str, recipe,
+                 controller: ConcurrencyController = None, output_format: str = None,
+                 index_path: str = None, poll_interval: float = AppConfig.WATCH_POLL_SECONDS,
+                 stable_polls: int = AppConfig.WATCH_STABLE_POLLS, log_queue=None,
+                 log_settings: dict = None):
+        """
+        Parametreler:
+            input_dir (str): İzlenen klasör
+            output_dir (str): Çıktıların yazıldığı klasör
+            recipe (Recipe | str | list[str]): Uygulanacak reçete
+            index_path (str): İşlenmiş dosya indeksi
+                              (varsayılan: output_dir/.watch_index.json)
+            poll_interval (float): Taramalar arası bekleme (saniye)
+            stable_polls (int): Dosyanın hazır sayılması için boyutunun
+                                değişmeden kalması gereken tarama sayısı
+            log_queue: İşçi loglarının iletileceği kuyruk
+                       (AppLogger(asynchronous=True).worker_queue())
+            log_settings (dict): İşçilerdeki log seviyesi ve hız sınırı
+                                 (AppLogger.worker_settings())
+        """
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.recipe = recipe if isinstance(recipe, Recipe) else Recipe(recipe)
+        self.controller = controller or ConcurrencyController.from_preset("throughput")
+        self.output_format = output_format
+        self.poll_interval = poll_interval
+        self.log_queue = log_queue
+        self.log_settings = log_settings
+
+        self.index = FolderIndex(index_path or os.path.join(output_dir, self.INDEX_FILE_NAME))
+        self.tracker = StabilityTracker(stable_polls)
+
+        self._pool = None
+        self._in_flight = {}
+        self._stop_event = threading.Event()
+
+        self._metrics = {
+            "processed": 0,
+            "failed": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+            "latency_last": 0.0,
+            "polls": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Tarama
+    # ------------------------------------------------------------------
+    def scan(self):
+        """
+        Klasörü tarar ve işlenmeye hazır yeni dosya adlarını döner.
+        """
+        ready = []
+        present = set()
+
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith("."):
+                    continue
+
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext not in ImageValidator.SUPPORTED_EXTENSIONS:
+                    continue
+
+                name = entry.name
+                present.add(name)
+
+                if name in self._in_flight:
+                    continue
+
+                stat = entry.stat()
+                if self.index.is_processed(name, stat):
+                    self.tracker.forget(name)
+                    continue
+
+                if self.tracker.observe(name, stat):
+                    ready.append((name, stat))
+
+        self.tracker.prune(present)
+        return ready
+
+    # ------------------------------------------------------------------
+    # Çalıştırma
+    # ------------------------------------------------------------------
+    def _ensure_pool(self):
+        if self._pool is None:
+            if self.log_queue is None:
+                self._pool = self.controller.process_pool()
+            else:
+                self._pool = self.controller.process_pool(
+                    initializer=configure_worker_logging,
+                    initargs=(self.log_queue, self.log_settings),
+                )
+        return self._pool
+
+    def _reset_pool(self):
+        """Çöken (broken) havuzu bırakır; sonraki turda yenisi oluşturulur"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def poll_once(self):
+        """Tek tarama turu: biten işleri toplar, hazır dosyaları kuyruğa ekler"""
+        self._collect(wait=False)
+        pool = self._ensure_pool()
+
+        for name, stat in self.scan():
+            input_path = os.path.join(self.input_dir, name)
+            output_path = BatchProcessor.output_path_for(
+                input_path, self.output_dir, self.output_format
+            )
+            try:
+                future = pool.submit(process_file, input_path, output_path, self.recipe.steps)
+            except BrokenProcessPool:
+                # Kalan dosyalar hazır kalır, sonraki turda yeni havuza gönderilir
+                logger.error("Worker pool is broken; recreating it")
+                self._reset_pool()
+                break
+            self._in_flight[name] = {
+                "future": future,
+                "input": input_path,
+                "output": output_path,
+                "stat": stat,
+                "detected_at": self.tracker.first_seen(name),
+            }
+            logger.debug("Queued %s", name)
+
+        self._metrics["polls"] += 1
+
+    def _collect(self, wait: bool):
+        """Biten işlerin sonuçlarını indekse yazar"""
+        finished = []
+        for name, job in self._in_flight.items():
+            if wait or job["future"].done():
+                finished.append(name)
+
+        if not finished:
+            return
+
+        broken = False
+        for name in finished:
+            job = self._in_flight.pop(name)
+            try:
+                result = job["future"].result()
+            except Exception as e:
+                # İşçi process çöktü (BrokenProcessPool) veya havuz hatası:
+                # dosya başarısız sayılır, servis çalışmaya devam eder
+                broken = broken or isinstance(e, BrokenProcessPool)
+                result = {
+                    "input": job["input"],
+                    "output": job["output"],
+                    "status": "failed",
+                    "error": f"{type(e).__name__}: {e}",
+                }
+
+            latency = time.time() - job["detected_at"]
+            self._metrics["latency_total"] += latency
+            self._metrics["latency_max"] = max(self._metrics["latency_max"], latency)
+            self._metrics["latency_last"] = latency
+
+            if result["status"] == "done":
+                self._metrics["processed"] += 1
+                logger.info("Processed %s in %.2fs", name, latency)
+            else:
+                self._metrics["failed"] += 1
+                logger.error("Failed %s: %s", name, result["error"])
+
+            self.index.record(name, job["stat"], result)
+            self.tracker.forget(name)
+
+        self.index.save()
+        if broken:
+            logger.error("Worker pool is broken; recreating it")
+            self._reset_pool()
+
+    def run(self, max_polls: int = None, on_poll=None):
+        """
+        stop() çağrılana (veya max_polls tarama yapılana) kadar çalışır.
+
+        on_poll: Her turdan sonra metrics() ile çağrılır (örn: metrik dosyası yazmak)
+        """
+        logger.info("Watching %s -> %s (recipe: %s)",
+                    self.input_dir, self.output_dir, ",".join(self.recipe.steps))
+        polls = 0
+
+        try:
+            while not self._stop_event.is_set():
+                self.poll_once()
+                polls += 1
+
+                if on_poll is not None:
+                    on_poll(self.metrics())
+
+                if max_polls is not None and polls >= max_polls:
+                    break
+
+                self._stop_event.wait(self.poll_interval)
+        finally:
+            self.close()
+
+    def drain(self):
+        """Kuyruktaki tüm işlerin bitmesini bekler"""
+        self._collect(wait=True)
+
+    def stop(self):
+        """run() döngüsünü durdurur (sinyal işleyiciden çağrılabilir)"""
+        self._stop_event.set()
+
+    def close(self):
+        """Kuyruktaki işleri bitirir ve havuzu kapatır"""
+        self.drain()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    # Metrikler
+    # ------------------------------------------------------------------
+    def metrics(self) -> dict:
+        """
+        Kuyruk ve gecikme metrikleri.
+
+        latency: dosyanın ilk görülmesinden çıktının yazılmasına kadar geçen süre
+        """
+        running = sum(1 for job in self._in_flight.values() if job["future"].running())
+        completed = self._metrics["processed"] + self._metrics["failed"]
+
+        return {
+            "queue_length": len(self._in_flight) - running,
+            "running": running,
+            "processed": self._metrics["processed"],
+            "failed": self._metrics["failed"],
+            "indexed": len(self.index),
+            "polls": self._metrics["polls"],
+            "latency_avg": self._metrics["latency_total"] / completed if completed else 0.0,
+            "latency_max": self._metrics["latency_max"],
+            "latency_last": self._metrics["latency_last"],
+        }